@@ -0,0 +1,228 @@
+"""
+Funciones en precisión arbitraria (módulo decimal)
+Versiones Decimal de las funciones del analizador. Cada una calcula con dígitos de guarda
+y redondea a la precisión del contexto actual (decimal.getcontext().prec), así que la misma
+expresión compilada sirve a 20 o a 500 dígitos. pi y e son llamadas: su valor depende de
+la precisión (ver compilador.compilar_decimal).
+Los errores de dominio se lanzan como ValueError, igual que en el módulo math.
+"""
+
+import decimal
+from decimal import Decimal, localcontext, ROUND_FLOOR, ROUND_CEILING
+
+DIGITOS_GUARDA = 10
+UNO = Decimal(1)
+INFINITO = Decimal('Infinity')
+
+def con_guarda(funcion):
+    """Evalúa con DIGITOS_GUARDA dígitos extra y redondea el resultado a la precisión actual"""
+    def envoltura(*argumentos):
+        with localcontext() as ctx:
+            ctx.prec += DIGITOS_GUARDA
+            resultado = funcion(*argumentos)
+        return +resultado
+    envoltura.__name__ = funcion.__name__
+    envoltura.__doc__ = funcion.__doc__
+    return envoltura
+
+def _sumar_serie(termino, siguiente):
+    """Suma términos hasta que dejan de cambiar la suma a la precisión actual"""
+    suma, k = termino, 0
+    while True:
+        k += 1
+        termino = siguiente(termino, k)
+        anterior, suma = suma, suma + termino
+        if suma == anterior:
+            return suma
+
+# Constantes, calculadas una vez por precisión (se vacía al llegar a MAX_CONSTANTES)
+_CONSTANTES = {}
+MAX_CONSTANTES = 64
+
+def _guardar_constante(clave, valor):
+    if len(_CONSTANTES) >= MAX_CONSTANTES:
+        _CONSTANTES.clear()
+    _CONSTANTES[clave] = valor
+
+def _atan_serie(x):
+    """atan(x) = x - x³/3 + x⁵/5 - ... (converge rápido para |x| pequeño)"""
+    x2 = x * x
+    potencia = [x]
+
+    def siguiente(_, k):
+        potencia[0] *= -x2
+        return potencia[0] / (2 * k + 1)
+
+    return _sumar_serie(x, siguiente)
+
+def pi_decimal():
+    """pi a la precisión actual (fórmula de Machin: 16·atan(1/5) - 4·atan(1/239))"""
+    clave = ('pi', decimal.getcontext().prec)
+    if clave not in _CONSTANTES:
+        with localcontext() as ctx:
+            ctx.prec += DIGITOS_GUARDA
+            valor = 16 * _atan_serie(UNO / 5) - 4 * _atan_serie(UNO / 239)
+        _guardar_constante(clave, +valor)
+    return _CONSTANTES[clave]
+
+def e_decimal():
+    clave = ('e', decimal.getcontext().prec)
+    if clave not in _CONSTANTES:
+        _guardar_constante(clave, UNO.exp())
+    return _CONSTANTES[clave]
+
+def _reducir(x):
+    """x módulo 2pi, en [-pi, pi] (con dígitos extra para los argumentos grandes)"""
+    decimal.getcontext().prec += max(0, x.adjusted())
+    dos_pi = 2 * pi_decimal()
+    return x - dos_pi * (x / dos_pi).to_integral_value()
+
+@con_guarda
+def sin(x):
+    r = _reducir(x)
+    r2 = r * r
+    return _sumar_serie(r, lambda termino, k: -termino * r2 / ((2 * k) * (2 * k + 1)))
+
+@con_guarda
+def cos(x):
+    r = _reducir(x)
+    r2 = r * r
+    return _sumar_serie(UNO, lambda termino, k: -termino * r2 / ((2 * k - 1) * (2 * k)))
+
+@con_guarda
+def tan(x):
+    return sin(x) / cos(x)
+
+def _no_nulo(valor, mensaje):
+    if valor == 0:
+        raise ValueError(mensaje)
+    return valor
+
+@con_guarda
+def csc(x):
+    return 1 / _no_nulo(sin(x), "Cosecante indefinida (sin(x) = 0)")
+
+@con_guarda
+def sec(x):
+    return 1 / _no_nulo(cos(x), "Secante indefinida (cos(x) = 0)")
+
+@con_guarda
+def cot(x):
+    return cos(x) / _no_nulo(sin(x), "Cotangente indefinida (sin(x) = 0)")
+
+@con_guarda
+def atan(x):
+    if x < 0:
+        return -atan(-x)
+    if x > 1:
+        return pi_decimal() / 2 - atan(1 / x)
+    # atan(x) = 2·atan(x / (1 + sqrt(1 + x²))): dos reducciones dejan x <= 0.2
+    for _ in range(2):
+        x = x / (1 + (1 + x * x).sqrt())
+    return 4 * _atan_serie(x)
+
+@con_guarda
+def asin(x):
+    if abs(x) > 1:
+        raise ValueError("math domain error")
+    if abs(x) == 1:
+        return x * pi_decimal() / 2
+    return atan(x / (1 - x * x).sqrt())
+
+@con_guarda
+def acos(x):
+    return pi_decimal() / 2 - asin(x)
+
+def exp(x):
+    return x.exp()
+
+@con_guarda
+def sinh(x):
+    if abs(x) < 1:
+        # Serie (sin la cancelación de (e^x - e^-x) / 2 cerca de 0)
+        x2 = x * x
+        return _sumar_serie(x, lambda termino, k: termino * x2 / ((2 * k) * (2 * k + 1)))
+    return (x.exp() - (-x).exp()) / 2
+
+@con_guarda
+def cosh(x):
+    return (x.exp() + (-x).exp()) / 2
+
+@con_guarda
+def tanh(x):
+    return sinh(x) / cosh(x)
+
+@con_guarda
+def asinh(x):
+    if x < 0:
+        return -asinh(-x)
+    decimal.getcontext().prec += max(0, -x.adjusted())  # ln(1 + algo pequeño)
+    return ln(x + (x * x + 1).sqrt())
+
+@con_guarda
+def acosh(x):
+    if x < 1:
+        raise ValueError("math domain error")
+    return ln(x + (x * x - 1).sqrt())
+
+@con_guarda
+def atanh(x):
+    if abs(x) >= 1:
+        raise ValueError("math domain error")
+    decimal.getcontext().prec += max(0, -x.adjusted())
+    return ln((1 + x) / (1 - x)) / 2
+
+def ln(x):
+    if x <= 0:
+        raise ValueError("math domain error")
+    return x.ln()
+
+def log10(x):
+    if x <= 0:
+        raise ValueError("math domain error")
+    return x.log10()
+
+@con_guarda
+def log2(x):
+    return ln(x) / ln(Decimal(2))
+
+@con_guarda
+def logb(x, base):
+    return ln(x) / ln(base)
+
+def sqrt(x):
+    if x < 0:
+        raise ValueError("math domain error")
+    return x.sqrt()
+
+@con_guarda
+def cbrt(x):
+    """Raíz cúbica real (negativa para x < 0)"""
+    if x == 0:
+        return x
+    raiz = abs(x) ** (UNO / 3)
+    return raiz if x > 0 else -raiz
+
+@con_guarda
+def root(x, n):
+    return x ** (1 / n)
+
+def floor(x):
+    return x.to_integral_value(rounding=ROUND_FLOOR)
+
+def ceil(x):
+    return x.to_integral_value(rounding=ROUND_CEILING)
+
+# Nombres permitidos en el código generado (números Decimal); pi y e son funciones
+ENTORNO_DECIMAL = {
+    "__builtins__": {},
+    "sin": sin, "cos": cos, "tan": tan,
+    "csc": csc, "sec": sec, "cot": cot,
+    "asin": asin, "acos": acos, "atan": atan,
+    "sinh": sinh, "cosh": cosh, "tanh": tanh,
+    "asinh": asinh, "acosh": acosh, "atanh": atanh,
+    "exp": exp, "ln": ln, "log10": log10, "log2": log2,
+    "logb": logb, "sqrt": sqrt, "cbrt": cbrt, "root": root,
+    "abs": abs, "floor": floor, "ceil": ceil,
+    "pi": pi_decimal, "e": e_decimal, "inf": INFINITO,
+}
@@ -0,0 +1,372 @@
+"""
+Analizador de expresiones matemáticas
+Tokenizador + parser descendente recursivo que produce un árbol de sintaxis (AST).
+El árbol lo consumen los back ends escalar, vectorizado y de derivadas.
+"""
+
+import math
+from dataclasses import dataclass
+
+# Funciones soportadas y su número de argumentos (las que insertan los botones de la interfaz)
+FUNCIONES = {
+    'sin': 1, 'cos': 1, 'tan': 1, 'csc': 1, 'sec': 1, 'cot': 1,
+    'asin': 1, 'acos': 1, 'atan': 1,
+    'sinh': 1, 'cosh': 1, 'tanh': 1,
+    'asinh': 1, 'acosh': 1, 'atanh': 1,
+    'exp': 1, 'ln': 1, 'log10': 1, 'log2': 1, 'logb': 2,
+    'sqrt': 1, 'cbrt': 1, 'root': 2,
+    'abs': 1, 'floor': 1, 'ceil': 1,
+}
+
+CONSTANTES = {'pi': math.pi, 'e': math.e, 'inf': math.inf}
+
+VARIABLES = ('x',)
+
+# Caracteres Unicode problemáticos y su equivalente ASCII
+REEMPLAZOS_UNICODE = {
+    '−': '-',  # U+2212 (minus sign) -> ASCII hyphen
+    '–': '-',  # U+2013 (en dash)
+    '—': '-',  # U+2014 (em dash)
+    '×': '*',  # U+00D7 (multiplication sign)
+    '÷': '/',  # U+00F7 (division sign)
+    '²': '^2', # U+00B2 (superscript 2)
+    '³': '^3', # U+00B3 (superscript 3)
+    '√': 'sqrt', # U+221A (square root)
+    'π': 'pi', # U+03C0 (pi)
+    '∞': 'inf', # U+221E (infinity)
+}
+
+TABLA_UNICODE = str.maketrans(REEMPLAZOS_UNICODE)
+
+# ---------------------------------------------------------------------------
+# Nodos del árbol
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class Numero:
+    valor: float
+
+@dataclass(frozen=True)
+class Constante:
+    nombre: str
+
+@dataclass(frozen=True)
+class Variable:
+    nombre: str
+
+@dataclass(frozen=True)
+class Unario:
+    op: str
+    operando: object
+
+@dataclass(frozen=True)
+class Binario:
+    op: str  # '+', '-', '*', '/', '^'
+    izquierdo: object
+    derecho: object
+
+@dataclass(frozen=True)
+class Llamada:
+    nombre: str
+    argumentos: tuple
+
+# ---------------------------------------------------------------------------
+# Tokenizador
+# ---------------------------------------------------------------------------
+
+NUM, CONST, VAR, FUNC, OP, LPAREN, RPAREN, COMA, FIN = (
+    'NUM', 'CONST', 'VAR', 'FUNC', 'OP', 'LPAREN', 'RPAREN', 'COMA', 'FIN')
+
+# str.isdigit() acepta '²' y '³', que aquí son potencias
+DIGITOS = frozenset('0123456789')
+
+# Tokens Unicode que se traducen directamente (sin pasar por str.replace)
+TOKENS_UNICODE = {
+    '−': [(OP, '-')], '–': [(OP, '-')], '—': [(OP, '-')],
+    '×': [(OP, '*')], '÷': [(OP, '/')],
+    '²': [(OP, '^'), (NUM, 2.0)], '³': [(OP, '^'), (NUM, 3.0)],
+    '√': [(FUNC, 'sqrt')], 'π': [(CONST, 'pi')], '∞': [(CONST, 'inf')],
+}
+
+def _nombres_conocidos(variables):
+    """Nombres reconocibles ordenados de mayor a menor longitud (coincidencia más larga)"""
+    nombres = [(n, FUNC) for n in FUNCIONES]
+    nombres += [(n, CONST) for n in CONSTANTES]
+    nombres += [(n, VAR) for n in variables]
+    return sorted(nombres, key=lambda par: -len(par[0]))
+
+NOMBRES = _nombres_conocidos(VARIABLES)
+
+def tokenizar(texto, nombres=NOMBRES):
+    """
+    Convierte el texto en una lista de tokens (tipo, valor, posicion) en una sola pasada.
+    Las letras consecutivas se separan en nombres conocidos: '2pix' -> 2, pi, x.
+    """
+    tokens = []
+    i = 0
+    n = len(texto)
+    while i < n:
+        c = texto[i]
+        if c.isspace():
+            i += 1
+        elif c in DIGITOS or (c == '.' and i + 1 < n and texto[i + 1] in DIGITOS):
+            inicio = i
+            while i < n and texto[i] in DIGITOS:
+                i += 1
+            if i < n and texto[i] == '.':
+                i += 1
+                while i < n and texto[i] in DIGITOS:
+                    i += 1
+            # Notación científica solo con dígitos inmediatos (1e5); '2e' y '1e-5' usan la constante e
+            if i + 1 < n and texto[i] in 'eE' and texto[i + 1] in DIGITOS:
+                i += 1
+                while i < n and texto[i] in DIGITOS:
+                    i += 1
+            tokens.append((NUM, float(texto[inicio:i]), inicio))
+        elif c.isalpha() and c.isascii():
+            for nombre, tipo in nombres:
+                if texto.startswith(nombre, i):
+                    fin = i + len(nombre)
+                    if tipo == FUNC:
+                        # Una función debe ir seguida de '('
+                        j = fin
+                        while j < n and texto[j].isspace():
+                            j += 1
+                        if j >= n or texto[j] != '(':
+                            continue
+                    tokens.append((tipo, nombre, i))
+                    i = fin
+                    break
+            else:
+                fin = i
+                while fin < n and texto[fin].isalnum():
+                    fin += 1
+                raise ValueError(f"Símbolo desconocido '{texto[i:fin]}' en la posición {i + 1}")
+        elif c in '+-*/^':
+            if c == '*' and texto.startswith('**', i):
+                tokens.append((OP, '^', i))
+                i += 2
+            else:
+                tokens.append((OP, c, i))
+                i += 1
+        elif c == '(':
+            tokens.append((LPAREN, c, i))
+            i += 1
+        elif c == ')':
+            tokens.append((RPAREN, c, i))
+            i += 1
+        elif c == ',':
+            tokens.append((COMA, c, i))
+            i += 1
+        elif c in TOKENS_UNICODE:
+            for tipo, valor in TOKENS_UNICODE[c]:
+                tokens.append((tipo, valor, i))
+            i += 1
+        else:
+            raise ValueError(f"Carácter no válido '{c}' en la posición {i + 1}")
+    tokens.append((FIN, None, n))
+    return tokens
+
+# ---------------------------------------------------------------------------
+# Parser descendente recursivo
+#
+#   expresion := termino (('+' | '-') termino)*
+#   termino   := unario (('*' | '/') unario | potencia)*    <- multiplicación implícita
+#   unario    := ('+' | '-') unario | potencia
+#   potencia  := primario ('^' unario)?                   <- asociativa a la derecha
+#   primario  := NUM | CONST | VAR | FUNC '(' args ')' | '(' expresion ')'
+# ---------------------------------------------------------------------------
+
+INICIO_PRIMARIO = (NUM, CONST, VAR, FUNC, LPAREN)
+
+class Parser:
+    """Parser de una lista de tokens"""
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.pos = 0
+
+    def actual(self):
+        return self.tokens[self.pos]
+
+    def avanzar(self):
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+    def esperar(self, tipo, descripcion):
+        token = self.actual()
+        if token[0] != tipo:
+            raise ValueError(f"Se esperaba {descripcion} en la posición {token[2] + 1}")
+        return self.avanzar()
+
+    def cerrar_parentesis(self):
+        tipo, valor, posicion = self.actual()
+        if tipo == RPAREN:
+            return self.avanzar()
+        if tipo == FIN:
+            raise ValueError("Paréntesis desbalanceados")
+        raise ValueError(f"Símbolo inesperado '{valor}' en la posición {posicion + 1}")
+
+    def parsear(self):
+        if self.actual()[0] == FIN:
+            raise ValueError("La expresión está vacía")
+        nodo = self.expresion()
+        token = self.actual()
+        if token[0] != FIN:
+            if token[0] == RPAREN:
+                raise ValueError("Paréntesis desbalanceados")
+            raise ValueError(f"Símbolo inesperado '{token[1]}' en la posición {token[2] + 1}")
+        return nodo
+
+    def expresion(self):
+        nodo = self.termino()
+        while self.actual()[0] == OP and self.actual()[1] in '+-':
+            op = self.avanzar()[1]
+            nodo = Binario(op, nodo, self.termino())
+        return nodo
+
+    def termino(self):
+        nodo = self.unario()
+        while True:
+            tipo, valor, posicion = self.actual()
+            if tipo == OP and valor in '*/':
+                self.avanzar()
+                nodo = Binario(valor, nodo, self.unario())
+            elif tipo in INICIO_PRIMARIO:
+                # Multiplicación implícita: 2x, 2(x+1), sin(x)cos(x), pix...
+                if tipo == NUM and self.tokens[self.pos - 1][0] == NUM:
+                    raise ValueError(f"Falta un operador entre números en la posición {posicion + 1}")
+                nodo = Binario('*', nodo, self.potencia())
+            else:
+                return nodo
+
+    def unario(self):
+        tipo, valor, _ = self.actual()
+        if tipo == OP and valor in '+-':
+            self.avanzar()
+            operando = self.unario()
+            return operando if valor == '+' else Unario('-', operando)
+        return self.potencia()
+
+    def potencia(self):
+        base = self.primario()
+        tipo, valor, _ = self.actual()
+        if tipo == OP and valor == '^':
+            self.avanzar()
+            return Binario('^', base, self.unario())
+        return base
+
+    def primario(self):
+        tipo, valor, posicion = self.avanzar()
+        if tipo == NUM:
+            return Numero(valor)
+        if tipo == CONST:
+            return Constante(valor)
+        if tipo == VAR:
+            return Variable(valor)
+        if tipo == FUNC:
+            self.esperar(LPAREN, f"'(' después de {valor}")
+            argumentos = [self.expresion()]
+            while self.actual()[0] == COMA:
+                self.avanzar()
+                argumentos.append(self.expresion())
+            self.cerrar_parentesis()
+            if len(argumentos) != FUNCIONES[valor]:
+                raise ValueError(f"{valor} requiere {FUNCIONES[valor]} argumento(s), "
+                                 f"se recibieron {len(argumentos)}")
+            return Llamada(valor, tuple(argumentos))
+        if tipo == LPAREN:
+            nodo = self.expresion()
+            self.cerrar_parentesis()
+            return nodo
+        if tipo == FIN:
+            raise ValueError("La expresión está incompleta")
+        raise ValueError(f"Símbolo inesperado '{valor}' en la posición {posicion + 1}")
+
+def validar_parametros(parametros):
+    """
+    Verifica los nombres de los parámetros (letras ASCII y dígitos, empezando con letra)
+    y que no choquen con x, una función o una constante. Lanza ValueError si no.
+    """
+    reservados = set(FUNCIONES) | set(CONSTANTES) | set(VARIABLES)
+    for nombre in parametros:
+        if not (nombre.isascii() and nombre.isalnum() and nombre[0].isalpha()):
+            raise ValueError(f"Nombre de parámetro no válido '{nombre}'")
+        if nombre in reservados:
+            raise ValueError(f"El parámetro '{nombre}' choca con un nombre reservado")
+    if len(set(parametros)) != len(parametros):
+        raise ValueError("Parámetros repetidos")
+
+def parsear(texto, parametros=()):
+    """
+    Convierte el texto de la función en un árbol de sintaxis
+    parametros: nombres (además de x) que se leen como Variable: 'x^2 - a' con ('a',)
+    """
+    if not parametros:
+        return Parser(tokenizar(texto)).parsear()
+    validar_parametros(parametros)
+    nombres = _nombres_conocidos(VARIABLES + tuple(parametros))
+    return Parser(tokenizar(texto, nombres)).parsear()
+
+# ---------------------------------------------------------------------------
+# Texto canónico
+# ---------------------------------------------------------------------------
+
+# Precedencias para decidir dónde hacen falta paréntesis
+PRECEDENCIA = {'+': 1, '-': 1, '*': 2, '/': 2, 'unario': 3, '^': 4}
+PRECEDENCIA_ATOMO = 5
+
+def formatear_numero(valor):
+    """Formatea un número sin notación científica (para que vuelva a leerse igual)"""
+    if math.isfinite(valor) and valor == int(valor) and abs(valor) < 1e16:
+        return str(int(valor))
+    texto = repr(valor)
+    if 'e' in texto:
+        from decimal import Decimal
+        texto = format(Decimal(texto), 'f')
+    return texto
+
+def precedencia(nodo):
+    if isinstance(nodo, Binario):
+        return PRECEDENCIA[nodo.op]
+    if isinstance(nodo, Unario) or (isinstance(nodo, Numero) and nodo.valor < 0):
+        return PRECEDENCIA['unario']
+    return PRECEDENCIA_ATOMO
+
+def a_texto(nodo, formato_numero=formatear_numero):
+    """
+    Texto canónico de un árbol: multiplicación explícita, '**' para potencias.
+    '2x', '2*x' y '2 x' producen el mismo texto '2*x'.
+    El mismo texto es código Python válido (lo usa el compilador con formato_numero=repr).
+    """
+    if isinstance(nodo, Numero):
+        return formato_numero(nodo.valor)
+    if isinstance(nodo, (Constante, Variable)):
+        return nodo.nombre
+    if isinstance(nodo, Llamada):
+        argumentos = ','.join(a_texto(a, formato_numero) for a in nodo.argumentos)
+        return f"{nodo.nombre}({argumentos})"
+    if isinstance(nodo, Unario):
+        texto = a_texto(nodo.operando, formato_numero)
+        if precedencia(nodo.operando) < PRECEDENCIA['unario']:
+            texto = f"({texto})"
+        return f"-{texto}"
+    # Binario
+    prec = PRECEDENCIA[nodo.op]
+    izquierdo = a_texto(nodo.izquierdo, formato_numero)
+    derecho = a_texto(nodo.derecho, formato_numero)
+    if nodo.op == '^':
+        # Asociativa a la derecha: la base necesita paréntesis si es potencia o unario
+        if precedencia(nodo.izquierdo) <= prec:
+            izquierdo = f"({izquierdo})"
+        if precedencia(nodo.derecho) < PRECEDENCIA['unario']:
+            derecho = f"({derecho})"
+        return f"{izquierdo}**{derecho}"
+    if precedencia(nodo.izquierdo) < prec:
+        izquierdo = f"({izquierdo})"
+    if precedencia(nodo.derecho) <= prec:
+        derecho = f"({derecho})"
+    if nodo.op in '+-':
+        return f"{izquierdo} {nodo.op} {derecho}"
+    return f"{izquierdo}{nodo.op}{derecho}"
@@ -0,0 +1,644 @@
+#!/usr/bin/env python3
+"""
+Benchmarks de rendimiento del motor de evaluación
+Uso: python benchmark.py
+"""
+
+import os
+import pickle
+import time
+import tracemalloc
+from decimal import Decimal
+import numpy as np
+from matematicas import (preprocesar_funcion, evaluar_funcion, compilar_funcion,
+                         compilar_funcion_vectorizada, validar_ecuacion,
+                         CACHE_EXPRESIONES, estadisticas_cache, obtener_expresion, ExpresionParametrica)
+from metodo_newton_raphson import (calcular_derivada_numerica, ejecutar_metodo_newton_raphson,
+                                   ejecutar_newton_multiarranque, iterar_newton_raphson,
+                                   ejecutar_newton_deflacion)
+from metodo_secante import ejecutar_metodo_secante
+from metodo_steffensen import ejecutar_metodo_steffensen, ejecutar_punto_fijo_aitken
+from metodo_hibrido import ejecutar_newton_protegido
+from metodo_brent import ejecutar_metodo_brent
+from metodo_householder import ejecutar_metodo_halley, ejecutar_metodo_householder
+from lote import resolver_lote
+from intervalos import regiones_con_raiz, acotar_rango, puede_tener_raiz
+from raices import raices_en_malla
+from polinomios import raices_polinomio
+from derivada_numerica import diferencia_central, derivada_richardson, derivada_paso_complejo
+from solucionadores import resolver
+from historial import HistorialIteraciones
+from metodo_alta_precision import iterar_newton_alta_precision
+from continuacion import ejecutar_barrido_parametro
+from cuencas import ejecutar_cuencas
+from iteraciones import recolectar_iteraciones
+from compilador import compilar_arbol, generar_codigo, ENTORNO_ESCALAR, ENTORNO_VECTORIZADO
+
+# Corpus de expresiones típicas ingresadas en la interfaz
+FUNCIONES = [
+    "x^3 - x - 2",
+    "sin(x) - x/2",
+    "exp(x) - 2*x - 1",
+    "x*sin(x) - 1",
+    "2pi*sin(2pix)+cos(2pix)^2",
+    "logb(x+20,2) + root(x+20,3) - cbrt(x)",
+]
+
+def medir(funcion, repeticiones=5):
+    """Retorna el mejor tiempo (segundos) de varias repeticiones"""
+    mejor = float('inf')
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+def puntos_muestra(num_puntos, x_min=-10, x_max=10):
+    """Genera los puntos de muestreo como lo hace plot_function"""
+    return [x_min + (x_max - x_min) * i / (num_puntos - 1) for i in range(num_puntos)]
+
+def evaluar_sin_error(funcion, x):
+    try:
+        return funcion(x)
+    except ValueError:
+        return None
+
+def benchmark_compilacion(num_puntos=1500):
+    """Compara evaluar_funcion punto a punto contra compilar_funcion una vez"""
+    print("Evaluación por punto: evaluar_funcion vs compilar_funcion")
+    print("-" * 60)
+    xs = puntos_muestra(num_puntos)
+
+    for func_str in FUNCIONES:
+        func_str_proc = preprocesar_funcion(func_str)
+
+        def por_punto():
+            for x in xs:
+                evaluar_sin_error(lambda v: evaluar_funcion(func_str_proc, v), x)
+
+        def compilada():
+            funcion = compilar_funcion(func_str_proc)
+            for x in xs:
+                evaluar_sin_error(funcion, x)
+
+        t_punto = medir(por_punto)
+        t_compilada = medir(compilada)
+        print(f"{func_str:<40} {t_punto / num_puntos * 1e6:8.2f} us/pt -> "
+              f"{t_compilada / num_puntos * 1e6:6.2f} us/pt  (x{t_punto / t_compilada:.1f})")
+    print()
+
+def benchmark_vectorizado(num_puntos=1500):
+    """Compara el bucle escalar compilado contra una sola pasada NumPy"""
+    print("Malla completa: bucle escalar vs evaluación vectorizada")
+    print("-" * 60)
+    xs = np.linspace(-10, 10, num_puntos)
+
+    for func_str in FUNCIONES:
+        func_str_proc = preprocesar_funcion(func_str)
+        funcion = compilar_funcion(func_str_proc)
+        funcion_vectorizada = compilar_funcion_vectorizada(func_str_proc)
+
+        def escalar():
+            y = []
+            for x in xs:
+                valor = evaluar_sin_error(funcion, x)
+                y.append(np.nan if valor is None else valor)
+            return np.array(y)
+
+        t_escalar = medir(escalar)
+        t_vectorizada = medir(lambda: funcion_vectorizada(xs))
+        print(f"{func_str:<40} {t_escalar * 1e3:8.3f} ms -> "
+              f"{t_vectorizada * 1e3:6.3f} ms  (x{t_escalar / t_vectorizada:.1f})")
+    print()
+
+def benchmark_cache(repeticiones=200):
+    """Flujo validar -> graficar -> resolver con y sin caché de expresiones"""
+    print("Caché de expresiones: validar + graficar + resolver")
+    print("-" * 60)
+
+    def flujo(limpiar):
+        for func_str in FUNCIONES:
+            for paso in (validar_ecuacion, preprocesar_funcion,
+                         compilar_funcion_vectorizada, compilar_funcion):
+                if limpiar:
+                    CACHE_EXPRESIONES.limpiar()
+                paso(func_str)
+
+    t_sin_cache = medir(lambda: [flujo(True) for _ in range(repeticiones)], 3)
+    CACHE_EXPRESIONES.limpiar()
+    t_con_cache = medir(lambda: [flujo(False) for _ in range(repeticiones)], 3)
+    n = repeticiones * len(FUNCIONES)
+    print(f"{'Sin caché':<40} {t_sin_cache / n * 1e6:8.1f} us/flujo")
+    print(f"{'Con caché':<40} {t_con_cache / n * 1e6:8.1f} us/flujo  "
+          f"(x{t_sin_cache / t_con_cache:.1f})")
+    stats = estadisticas_cache()
+    print(f"Aciertos: {stats['aciertos']}  Fallos: {stats['fallos']}  "
+          f"Entradas: {stats['entradas']}/{stats['max_entradas']}")
+    print()
+
+def benchmark_derivada(num_puntos=1500):
+    """Paso de Newton: f + derivada numérica (Richardson) vs kernel fusionado (f, f')"""
+    print("Paso de Newton: derivada numérica vs kernel fusionado (f, f')")
+    print("-" * 60)
+    xs = puntos_muestra(num_puntos, 0.5, 3)
+    
+    for func_str in FUNCIONES:
+        expresion = obtener_expresion(func_str)
+        funcion = expresion.escalar
+        fusionada = expresion.fusionada
+        
+        def numerica():
+            for x in xs:
+                funcion(x)
+                calcular_derivada_numerica(funcion, x)
+        
+        def simbolica():
+            for x in xs:
+                fusionada(x)
+        
+        # Error de la derivada numérica respecto a la simbólica
+        error = max(abs(calcular_derivada_numerica(funcion, x) - fusionada(x)[1])
+                    / max(1.0, abs(fusionada(x)[1])) for x in xs)
+        t_numerica = medir(numerica)
+        t_simbolica = medir(simbolica)
+        print(f"{func_str:<40} {t_numerica / num_puntos * 1e6:8.2f} us/paso -> "
+              f"{t_simbolica / num_puntos * 1e6:6.2f} us/paso  (x{t_numerica / t_simbolica:.1f}, "
+              f"error numérico {error:.1e})")
+    print()
+
+def benchmark_estrategias_derivada(num_puntos=500):
+    """Derivada numérica: diferencia central fija (h = 1e-8) vs Richardson vs paso complejo"""
+    print("Derivada numérica: error máximo respecto a la simbólica y tiempo por punto")
+    print("-" * 60)
+    xs = puntos_muestra(num_puntos, 0.5, 3)
+    
+    for func_str in FUNCIONES:
+        expresion = obtener_expresion(func_str)
+        funcion, compleja = expresion.escalar, expresion.compleja
+        exactas = [expresion.fusionada(x)[1] for x in xs]
+        estrategias = {
+            'central': lambda x: diferencia_central(funcion, x, 1e-8),
+            'Richardson': lambda x: derivada_richardson(funcion, x)[0],
+            'complejo': lambda x: derivada_paso_complejo(compleja, x),
+        }
+        columnas = []
+        for nombre, derivada in estrategias.items():
+            error = max(abs(derivada(x) - exacta) / max(1.0, abs(exacta)) for x, exacta in zip(xs, exactas))
+            tiempo = medir(lambda: [derivada(x) for x in xs])
+            columnas.append(f"{nombre} {error:.0e} {tiempo / num_puntos * 1e6:4.1f} us")
+        print(f"{func_str[:28]:<28} " + "  ".join(columnas))
+    print()
+
+def compilar_sin_optimizar(arbol, entorno):
+    """Lambda directa del árbol, sin plegado, temporales ni enlaces locales"""
+    return eval(compile(f"lambda x: {generar_codigo(arbol)}", "<funcion>", "eval"), entorno)
+
+def benchmark_optimizacion(num_puntos=1500):
+    """Código generado directo vs optimizado (plegado, temporales, locales, potencias)"""
+    print("Optimización del código generado (escalar / vectorizado)")
+    print("-" * 60)
+    xs = puntos_muestra(num_puntos, 0.5, 3)
+    xs_array = np.linspace(0.5, 3, 100000)
+    
+    for func_str in FUNCIONES:
+        expresion = obtener_expresion(func_str)
+        directa = compilar_sin_optimizar(expresion.arbol, ENTORNO_ESCALAR)
+        directa_vectorizada = compilar_sin_optimizar(expresion.arbol, ENTORNO_VECTORIZADO)
+        optimizada = compilar_arbol(expresion.arbol, ENTORNO_ESCALAR)
+        optimizada_vectorizada = compilar_arbol(expresion.arbol, ENTORNO_VECTORIZADO)
+        
+        t_directa = medir(lambda: [evaluar_sin_error(directa, x) for x in xs])
+        t_optimizada = medir(lambda: [evaluar_sin_error(optimizada, x) for x in xs])
+        with np.errstate(all='ignore'):
+            t_vec_directa = medir(lambda: directa_vectorizada(xs_array))
+            t_vec_optimizada = medir(lambda: optimizada_vectorizada(xs_array))
+        print(f"{func_str:<40} {t_directa / num_puntos * 1e6:6.2f} -> "
+              f"{t_optimizada / num_puntos * 1e6:5.2f} us/pt (x{t_directa / t_optimizada:.2f})  "
+              f"{t_vec_directa * 1e3:6.2f} -> {t_vec_optimizada * 1e3:5.2f} ms "
+              f"(x{t_vec_directa / t_vec_optimizada:.2f})")
+    print()
+
+def benchmark_intervalos():
+    """
+    Elección del rango: muestreo de 5 rangos x 200 puntos vs aritmética de intervalos.
+    Los intervalos usan unas decenas de cotas por rango (en Python puro) y a cambio
+    garantizan que las regiones descartadas no tienen raíces.
+    """
+    print("Rango automático: muestreo (1000 puntos) vs intervalos (<= 64 cotas/rango)")
+    print("-" * 60)
+    rangos = [(-10, 10), (-15, 15), (-8, 8), (-20, 20), (-5, 5)]
+    
+    for func_str in FUNCIONES:
+        expresion = obtener_expresion(func_str)
+        funcion = expresion.vectorizada
+        
+        def muestreo():
+            for x_min, x_max in rangos:
+                y = funcion(np.linspace(x_min, x_max, 200))
+                np.count_nonzero(y[:-1] * y[1:] < 0)
+                np.nanstd(y)
+        
+        def intervalos():
+            for x_min, x_max in rangos:
+                acotar_rango(expresion.arbol, x_min, x_max)
+                regiones_con_raiz(expresion.arbol, x_min, x_max)
+        
+        regiones = regiones_con_raiz(expresion.arbol, -10, 10)
+        t_muestreo = medir(muestreo)
+        t_intervalos = medir(intervalos)
+        print(f"{func_str:<40} {t_muestreo * 1e3:6.2f} ms -> {t_intervalos * 1e3:6.2f} ms  "
+              f"({len(regiones)} regiones con posible raíz en [-10, 10])")
+    print()
+
+def benchmark_multiarranque(num_arranques=1000):
+    """Newton desde muchos x0: bucle de llamadas escalares vs carriles vectorizados"""
+    print(f"Newton multiarranque ({num_arranques} puntos iniciales en [-10, 10])")
+    print("-" * 60)
+    x0s = np.linspace(-10, 10, num_arranques)
+    
+    for func_str in FUNCIONES:
+        t_escalar = medir(lambda: [ejecutar_metodo_newton_raphson(func_str, x0, 1e-10, 100)
+                                   for x0 in x0s.tolist()], 3)
+        t_vectorizado = medir(lambda: ejecutar_newton_multiarranque(func_str, x0s, 1e-10, 100), 3)
+        _, resultado, _ = ejecutar_newton_multiarranque(func_str, x0s, 1e-10, 100)
+        print(f"{func_str:<40} {t_escalar * 1e3:8.2f} ms -> {t_vectorizado * 1e3:6.2f} ms  "
+              f"(x{t_escalar / t_vectorizado:.1f}, {len(resultado['raices'])} raíces distintas)")
+    print()
+
+def benchmark_secante(x0=1.5, tolerancia=1e-12):
+    """
+    Newton (f y f' por iteración) vs métodos sin derivada: secante (solo f), Steffensen y
+    punto fijo con Aitken (f en dos puntos): evaluaciones y tiempo a igual tolerancia
+    """
+    metodos = [("Newton-Raphson", ejecutar_metodo_newton_raphson), ("Secante", ejecutar_metodo_secante),
+               ("Steffensen", ejecutar_metodo_steffensen), ("Aitken", ejecutar_punto_fijo_aitken)]
+    print(f"Newton-Raphson vs secante, Steffensen y Aitken (x0 = {x0}, tolerancia {tolerancia:g})")
+    print("-" * 60)
+    print(f"{'':<40} " + "   ".join(f"{nombre:>18}" for nombre, _ in metodos))
+    print(f"{'':<40} " + "   ".join(f"{'iter':>4} {'eval':>5} {'us':>7}" for _ in metodos))
+    
+    for func_str in FUNCIONES:
+        columnas = []
+        for _, ejecutar in metodos:
+            exito, resultado, _ = ejecutar(func_str, x0, tolerancia, 200)
+            if not exito or not resultado['convergio']:
+                columnas.append(f"{'sin convergencia':>18}")
+                continue
+            t = medir(lambda: ejecutar(func_str, x0, tolerancia, 200), 50)
+            columnas.append(f"{resultado['iteracion']:>4} {resultado['evaluaciones']:>5} {t * 1e6:>7.1f}")
+        print(f"{func_str:<40} " + "   ".join(columnas))
+    print()
+
+# Casos donde Newton sin protección cicla, diverge o encuentra f'(x) = 0
+CASOS_DIFICILES = [
+    ("x^3 - 2*x + 2", 0.0),
+    ("atan(x)", 3.0),
+    ("x^2 - 4", 0.0),
+    ("tanh(x) - 0.5", 5.0),
+    ("cbrt(x)", 1.0),
+    ("sin(x) - x/2", 1.5),
+]
+
+def describir_solucion(ejecutar, func_str, x0, max_iter, evaluaciones=False):
+    """Iteraciones (o evaluaciones), tiempo y estado de una resolución"""
+    exito, resultado, iteraciones = ejecutar(func_str, x0, 1e-10, max_iter)
+    t = medir(lambda: ejecutar(func_str, x0, 1e-10, max_iter), 3)
+    if not exito:
+        return f"{'error':>8} {'':>10} {'':<16}"
+    estado = f"raíz {resultado['raiz']:.6g}" if resultado['convergio'] else "sin convergencia"
+    cuenta = f"{resultado['evaluaciones']:>5} ev" if evaluaciones else f"{len(iteraciones):>5} it"
+    return f"{cuenta} {t * 1e3:7.2f} ms {estado:<16}"
+
+def benchmark_protegido(max_iter=10000):
+    """Newton vs Newton protegido en casos difíciles: iteraciones consumidas y tiempo"""
+    print(f"Newton vs Newton protegido (máx. {max_iter} iteraciones)")
+    print("-" * 60)
+    for func_str, x0 in CASOS_DIFICILES:
+        print(f"{func_str + f' (x0={x0:g})':<26} "
+              f"{describir_solucion(ejecutar_metodo_newton_raphson, func_str, x0, max_iter)}"
+              f" -> {describir_solucion(ejecutar_newton_protegido, func_str, x0, max_iter)}")
+    print()
+
+# Expresiones con derivada ruidosa o infinita cerca de la raíz (selección automática: Brent)
+CASOS_NO_SUAVES = [
+    ("cbrt(x) + x^3", 1.0),
+    ("cbrt(x - 1)", 3.0),
+    ("floor(x) + x - 2.5", 0.0),
+    ("abs(x - 1) + x - 3", 0.0),
+    ("root(x + 2, 3) - 1.5", 0.0),
+]
+
+def benchmark_brent(max_iter=10000):
+    """Newton vs Brent en expresiones no suaves: evaluaciones de f y tiempo"""
+    print(f"Newton vs Brent en expresiones no suaves (máx. {max_iter} iteraciones)")
+    print("-" * 60)
+    for func_str, x0 in CASOS_NO_SUAVES:
+        print(f"{func_str + f' (x0={x0:g})':<26} "
+              f"{describir_solucion(ejecutar_metodo_newton_raphson, func_str, x0, max_iter, True)}"
+              f" -> {describir_solucion(ejecutar_metodo_brent, func_str, x0, max_iter, True)}")
+    print()
+
+# Expresión cara de evaluar: las derivadas comparten casi todas sus subexpresiones con f
+FUNCION_COSTOSA = "exp(sin(x))*ln(x^2 + 1) + atan(x)*cosh(x/3) - sqrt(x^2 + 4)*cos(x/2) - 2"
+
+def benchmark_orden_superior(x0=1.5, tolerancia=1e-12, repeticiones=200):
+    """Newton vs Halley vs Householder: iteraciones y tiempo total hasta la misma tolerancia"""
+    print(f"Newton vs Halley vs Householder (x0 = {x0}, tolerancia {tolerancia:g})")
+    print("-" * 60)
+    metodos = [ejecutar_metodo_newton_raphson, ejecutar_metodo_halley, ejecutar_metodo_householder]
+    print(f"{'':<40} {'Newton':>13}   {'Halley':>13}   {'Householder':>13}")
+    
+    for func_str in FUNCIONES + [FUNCION_COSTOSA]:
+        columnas = []
+        for ejecutar in metodos:
+            exito, resultado, _ = ejecutar(func_str, x0, tolerancia, 200)
+            if not exito or not resultado['convergio']:
+                columnas.append(f"{'-':>13}")
+                continue
+            t = medir(lambda: [ejecutar(func_str, x0, tolerancia, 200) for _ in range(repeticiones)], 3)
+            columnas.append(f"{resultado['iteracion']:>2} it {t / repeticiones * 1e6:5.1f} us")
+        etiqueta = func_str if len(func_str) <= 40 else func_str[:37] + "..."
+        print(f"{etiqueta:<40} {'   '.join(columnas)}")
+    print()
+
+# Raíces simples, dobles (sin cambio de signo), polos y muchas raíces en el rango del gráfico
+CASOS_RAICES = FUNCIONES + ["(x - 2)^2*(x + 1)", "sin(x)^2", "tan(x)", "sin(10*x)"]
+
+def cruces_interpolados(expresion, x, y):
+    """Detección anterior de la interfaz: cruces por cero por interpolación lineal entre muestras"""
+    cruces = []
+    for i in np.nonzero(y[:-1] * y[1:] < 0)[0]:
+        if puede_tener_raiz(expresion.arbol, x[i], x[i + 1]):
+            cruces.append(x[i] - y[i] * (x[i + 1] - x[i]) / (y[i + 1] - y[i]))
+    return cruces
+
+def benchmark_raices(num_puntos=1500):
+    """Raíces del gráfico: cruces interpolados vs raices_en_malla (cantidad, residuo máximo y tiempo)"""
+    print(f"Raíces en [-10, 10] ({num_puntos} puntos): interpolación lineal vs malla + pulido")
+    print("-" * 60)
+    x = puntos_muestra(num_puntos)
+    
+    for func_str in CASOS_RAICES:
+        expresion = obtener_expresion(func_str)
+        y = expresion.vectorizada(x)
+        columnas = []
+        for detectar in (cruces_interpolados, raices_en_malla):
+            raices = detectar(expresion, x, y)
+            t = medir(lambda: detectar(expresion, x, y))
+            residuo = np.max(np.abs(expresion.vectorizada(np.array(raices)))) if raices else 0.0
+            columnas.append(f"{len(raices):>2} raíces |f| <= {residuo:7.1e} {t * 1e3:5.2f} ms")
+        etiqueta = func_str if len(func_str) <= 30 else func_str[:27] + "..."
+        print(f"{etiqueta:<30} {columnas[0]} -> {columnas[1]}")
+    print()
+
+# Polinomios típicos (densos, dispersos, con raíz doble)
+POLINOMIOS = [
+    "x^3 - 2x - 5",
+    "x^7 - 3x^5 + 2x^4 - x^3 + 4x^2 - x + 1",
+    "(x - 2)^2*(x + 1)",
+    "x^12 - 3x^4 + 1",
+]
+
+def benchmark_polinomios(num_puntos=1500, x0=1.5, tolerancia=1e-12):
+    """Polinomios: código general vs Horner (escalar y vectorizado) y Newton desde x0 vs desde la semilla"""
+    print(f"Polinomios: árbol general -> Horner ({num_puntos} puntos), Newton desde x0 = {x0} -> semilla")
+    print("-" * 60)
+    x = puntos_muestra(num_puntos)
+    x_array = np.array(x)
+    
+    for func_str in POLINOMIOS:
+        expresion = obtener_expresion(func_str)
+        general = compilar_arbol(expresion.arbol, ENTORNO_ESCALAR)
+        general_vectorizada = compilar_arbol(expresion.arbol, ENTORNO_VECTORIZADO)
+        horner = compilar_arbol(expresion.arbol_compilable(), ENTORNO_ESCALAR)
+        horner_vectorizada = compilar_arbol(expresion.arbol_compilable(), ENTORNO_VECTORIZADO)
+        
+        t_general = medir(lambda: [general(v) for v in x])
+        t_horner = medir(lambda: [horner(v) for v in x])
+        t_general_vec = medir(lambda: general_vectorizada(x_array))
+        t_horner_vec = medir(lambda: horner_vectorizada(x_array))
+        t_raices = medir(lambda: raices_polinomio(expresion.polinomio))
+        
+        _, desde_x0, _ = resolver('newton', func_str, x0, tolerancia, 200)
+        _, desde_semilla, _ = resolver('auto', func_str, x0, tolerancia, 200)
+        iteraciones = f"{desde_x0['iteracion']:>3} -> {desde_semilla['iteracion']} it" if 'iteracion' in desde_x0 else "-"
+        
+        etiqueta = func_str if len(func_str) <= 30 else func_str[:27] + "..."
+        print(f"{etiqueta:<30} escalar {t_general * 1e3:5.2f} -> {t_horner * 1e3:5.2f} ms  "
+              f"vector {t_general_vec * 1e6:5.1f} -> {t_horner_vec * 1e6:5.1f} us  "
+              f"raíces {t_raices * 1e6:5.0f} us  Newton {iteraciones}")
+    print()
+
+def benchmark_alta_precision(digitos=(50, 200, 1000)):
+    """Newton en decimal: precisión que se duplica por iteración vs precisión completa desde el inicio"""
+    print("Newton en alta precisión: precisión creciente vs completa en todos los pasos")
+    print("-" * 60)
+    casos = [("x^2 - 2", 1.0), ("cos(x) - x", 1.0), ("exp(x) - 2*x - 2", 2.0)]
+    
+    for n in digitos:
+        for func_str, x0 in casos:
+            def resolver_con(duplicar):
+                return recolectar_iteraciones(iterar_newton_alta_precision(
+                    func_str, x0, Decimal(10) ** -n, 100, duplicar_precision=duplicar))
+            
+            _, resultado, iteraciones = resolver_con(True)
+            t_creciente = medir(lambda: resolver_con(True), 3)
+            t_completa = medir(lambda: resolver_con(False), 3)
+            precisiones = [fila['precision'] for fila in iteraciones]
+            print(f"{func_str:<18} {n:>5} dígitos  {t_completa * 1e3:8.2f} ms -> {t_creciente * 1e3:7.2f} ms  "
+                  f"(x{t_completa / t_creciente:.1f}, precisiones {precisiones[-4:]})")
+    print()
+
+def benchmark_raices_multiples():
+    """Newton en raíces múltiples: paso fijo vs cambio a Newton modificado / cociente f / f'"""
+    print("Raíces múltiples: Newton vs detección de multiplicidad (iteraciones, error |x - raíz|)")
+    print("-" * 60)
+    casos = [("(x-1)^3", 2.0, 1.0), ("(x-1)^2", 3.0, 1.0), ("(x-1)^5*(x+2)", 2.0, 1.0),
+             ("sin(x)^2", 1.0, 0.0), ("(exp(x)-1)^4", 1.0, 0.0), ("x^3 - 3*x + 2", 0.0, 1.0)]
+    
+    for func_str, x0, raiz in casos:
+        def resolver_con(detectar):
+            return recolectar_iteraciones(iterar_newton_raphson(
+                func_str, x0, 1e-10, 200, detectar_multiplicidad=detectar))
+        
+        _, fijo, _ = resolver_con(False)
+        _, detectado, iteraciones = resolver_con(True)
+        ultima = iteraciones[-1]
+        print(f"{func_str:<16} {fijo['iteracion']:>4} it, error {abs(fijo['raiz'] - raiz):8.1e} -> "
+              f"{detectado['iteracion']:>3} it, error {abs(detectado['raiz'] - raiz):8.1e}  "
+              f"({ultima['variante']}, m = {ultima['factor']})")
+    print()
+
+def benchmark_deflacion(num_arranques=200):
+    """Varias raíces: deflación implícita desde un x0 vs multiarranque en una malla de x0"""
+    print(f"Varias raíces: deflación desde x0 vs multiarranque ({num_arranques} x0 en [-10, 10])")
+    print("-" * 60)
+    casos = [("x^4 - 10*x^2 + 9", 0.5), ("x^3 - 6*x^2 + 11*x - 6", 0.0), ("(x-1)^3*(x-2)", 3.0),
+             ("exp(x) - 3*x", 0.0), ("x^5 - x - 1", 0.0)]
+    x0s = np.linspace(-10, 10, num_arranques)
+    
+    for func_str, x0 in casos:
+        expresion = obtener_expresion(func_str)
+        _, deflacion, corridas = ejecutar_newton_deflacion(func_str, x0, 1e-10, 100)
+        _, malla, _ = ejecutar_newton_multiarranque(func_str, x0s, 1e-10, 100)
+        t_deflacion = medir(lambda: ejecutar_newton_deflacion(func_str, x0, 1e-10, 100))
+        t_malla = medir(lambda: ejecutar_newton_multiarranque(func_str, x0s, 1e-10, 100))
+        residuo = max(abs(expresion.escalar(raiz)) for raiz in deflacion['raices'])
+        print(f"{func_str:<24} {len(deflacion['raices'])} raíces ({len(corridas)} corridas, "
+              f"{deflacion['evaluaciones']:>3} evaluaciones, |f| <= {residuo:7.1e}) {t_deflacion * 1e3:6.2f} ms | "
+              f"malla: {len(malla['raices'])} raíces {t_malla * 1e3:6.2f} ms")
+    print()
+
+def benchmark_continuacion(num_valores=1000):
+    """Raíz de f(x; a) en una malla de a: una solución en frío por valor vs barrido con continuación"""
+    print(f"Barrido de un parámetro ({num_valores} valores): en frío vs continuación (1 cadena / ~sqrt(n) cadenas)")
+    print("-" * 60)
+    casos = [("x^3 - a*x - 1", 'a', (0.0, 10.0), 1.5), ("cos(x) - a*x", 'a', (0.1, 5.0), 1.0),
+             ("exp(-a*x) - x", 'a', (0.0, 20.0), 0.5)]
+    
+    for func_str, parametro, (inicio, fin), x0 in casos:
+        valores = np.linspace(inicio, fin, num_valores)
+        expresion = ExpresionParametrica(func_str, (parametro,))
+        
+        def en_frio():
+            return [ejecutar_metodo_newton_raphson(expresion.texto_con({parametro: valor}), x0, 1e-12, 100)
+                    for valor in valores.tolist()]
+        
+        t_frio = medir(en_frio, 1)
+        evaluaciones_frio = sum(r['evaluaciones'] for exito, r, _ in en_frio() if exito)
+        columnas = []
+        for segmentos in (1, None):
+            t = medir(lambda: ejecutar_barrido_parametro(func_str, parametro, valores, x0, 1e-12, 100,
+                                                         segmentos=segmentos), 3)
+            _, resultado, _ = ejecutar_barrido_parametro(func_str, parametro, valores, x0, 1e-12, 100,
+                                                         segmentos=segmentos)
+            columnas.append(f"{t * 1e3:7.2f} ms ({resultado['evaluaciones']} ev.)")
+        print(f"{func_str:<16} {t_frio * 1e3:8.2f} ms ({evaluaciones_frio} ev.) -> {columnas[0]} -> {columnas[1]}")
+    print()
+
+def benchmark_diagnostico(max_iter=10000):
+    """Newton sin convergencia: iteraciones y tiempo hasta max_iter vs detención por ciclo, divergencia o estancamiento"""
+    print(f"Detección de ciclos, divergencia y estancamiento (max_iter = {max_iter})")
+    print("-" * 60)
+    casos = [("x^3 - 2*x + 2", 0.0), ("x^2 + 1", 0.5), ("atan(x)", 1.5), ("x*exp(-x)", 2.0), ("cbrt(x)", 1.0)]
+    
+    for func_str, x0 in casos:
+        def resolver_con(diagnosticar):
+            return recolectar_iteraciones(iterar_newton_raphson(
+                func_str, x0, 1e-10, max_iter, diagnosticar=diagnosticar), guardar=False)
+        
+        exito_sin, sin_diagnostico, _ = resolver_con(False)
+        _, con_diagnostico, _ = resolver_con(True)
+        t_sin = medir(lambda: resolver_con(False), 3)
+        t_con = medir(lambda: resolver_con(True), 3)
+        antes = f"{sin_diagnostico['iteracion']:>6} it" if exito_sin else f"{'falla':>9}"
+        reinicio = con_diagnostico.get('reinicio')
+        print(f"{func_str:<16} {antes} {t_sin * 1e3:8.2f} ms -> {con_diagnostico['iteracion']:>4} it "
+              f"{t_con * 1e3:6.2f} ms  {con_diagnostico['estado']:<10} "
+              f"reinicio: {'-' if reinicio is None else f'{reinicio:g}'}")
+    print()
+
+def memoria_retenida(construir):
+    """(objeto, bytes que siguen asignados por el objeto que retorna construir(), pico de bytes al construirlo)"""
+    tracemalloc.start()
+    objeto = construir()
+    retenida, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return objeto, retenida, pico
+
+def benchmark_historial(num_iteraciones=100000):
+    """Historial de iteraciones: lista de dicts vs columnas NumPy (HistorialIteraciones)"""
+    print(f"Historial de {num_iteraciones} iteraciones (Newton sin raíz real): lista de dicts vs columnas")
+    print("-" * 60)
+
+    def registros():
+        # x^2 + 1 no tiene raíz real: sin el diagnóstico de estancamiento, Newton itera hasta max_iter
+        try:
+            yield from iterar_newton_raphson("x^2 + 1", 0.5, 1e-12, num_iteraciones, diagnosticar=False)
+        except ValueError:
+            pass
+
+    lista, memoria_lista, pico_lista = memoria_retenida(lambda: list(registros()))
+    # Como en recolectar_iteraciones: cada registro se agrega a las columnas en cuanto llega
+    historial, memoria_historial, pico_historial = memoria_retenida(lambda: HistorialIteraciones(registros()))
+    t_construccion = medir(lambda: HistorialIteraciones.desde_registros(lista), 3)
+    t_columna_lista = medir(lambda: np.array([registro['xn'] for registro in lista]))
+    t_columna_historial = medir(lambda: historial.columna('xn'))
+
+    print(f"{'Memoria retenida: lista de dicts':<40} {memoria_lista / 2**20:8.1f} MB")
+    print(f"{'Memoria retenida: HistorialIteraciones':<40} {memoria_historial / 2**20:8.1f} MB  "
+          f"(x{memoria_lista / memoria_historial:.1f} menos)")
+    print(f"{'Pico al construir: lista / historial':<40} {pico_lista / 2**20:8.1f} MB / {pico_historial / 2**20:.1f} MB")
+    print(f"{'Pickle (lote): lista / historial':<40} {len(pickle.dumps(lista)) / 2**20:8.1f} MB / "
+          f"{len(pickle.dumps(historial)) / 2**20:.1f} MB")
+    print(f"{'Construcción por columnas':<40} {t_construccion * 1e3:8.1f} ms")
+    print(f"{'Columna xn: desde la lista':<40} {t_columna_lista * 1e3:8.3f} ms")
+    print(f"{'Columna xn: vista del historial':<40} {t_columna_historial * 1e3:8.3f} ms")
+    print()
+
+def benchmark_lote(num_problemas=4000):
+    """Lote de ecuaciones: bucle secuencial vs resolver_lote en todos los núcleos"""
+    workers = os.cpu_count() or 1
+    print(f"Lote de {num_problemas} problemas: secuencial vs resolver_lote ({workers} procesos)")
+    print("-" * 60)
+    problemas = [(FUNCIONES[i % len(FUNCIONES)], 0.5 + (i % 50) / 10, 1e-12, 1000)
+                 for i in range(num_problemas)]
+    
+    t_secuencial = medir(lambda: [ejecutar_metodo_newton_raphson(*p) for p in problemas], 1)
+    t_lote = medir(lambda: list(resolver_lote(problemas, workers=workers)), 1)
+    tiempos = [r['tiempo'] for r in resolver_lote(problemas, workers=workers)]
+    print(f"{'Secuencial':<40} {t_secuencial * 1e3:8.1f} ms")
+    print(f"{'resolver_lote':<40} {t_lote * 1e3:8.1f} ms  (x{t_secuencial / t_lote:.1f}, "
+          f"máx. por problema {max(tiempos) * 1e3:.2f} ms)")
+    print()
+
+def benchmark_cuencas(num_puntos=2000, resolucion=800):
+    """Cuencas de Newton: bucle escalar vs iteración por lotes, y malla compleja en 1 proceso vs todos los núcleos"""
+    workers = os.cpu_count() or 1
+    print(f"Cuencas de atracción: recta real ({num_puntos} x0) y plano ({resolucion}x{resolucion}, {workers} procesos)")
+    print("-" * 60)
+    for func_str in ["x^3 - 2*x + 2", "sin(x) - x/2", "x^5 - x - 1"]:
+        x0s = np.linspace(-5, 5, num_puntos).tolist()
+        t_escalar = medir(lambda: [ejecutar_metodo_newton_raphson(func_str, x0, 1e-10, 50) for x0 in x0s], 1)
+        t_lotes = medir(lambda: ejecutar_cuencas(func_str, (-5, 5), resolucion=(num_puntos, 1), workers=1), 3)
+        print(f"{func_str:<16} escalar {t_escalar * 1e3:8.1f} ms -> lotes {t_lotes * 1e3:7.2f} ms "
+              f"(x{t_escalar / t_lotes:.0f})")
+    for func_str in ["x^3 - 1", "x^5 - 1", "sin(x)"]:
+        argumentos = (func_str, (-2, 2), (-2, 2), (resolucion, resolucion))
+        t_uno = medir(lambda: ejecutar_cuencas(*argumentos, workers=1), 1)
+        t_pool = medir(lambda: ejecutar_cuencas(*argumentos, workers=workers), 1)
+        _, _, raices_info = ejecutar_cuencas(*argumentos, workers=workers)
+        print(f"{func_str:<16} 1 proceso {t_uno * 1e3:8.1f} ms -> {workers} procesos {t_pool * 1e3:8.1f} ms "
+              f"(x{t_uno / t_pool:.1f}, {len(raices_info)} raíces)")
+    print()
+
+def main():
+    print("=" * 60)
+    print("BENCHMARKS DEL MOTOR DE EVALUACIÓN")
+    print("=" * 60)
+    print()
+    benchmark_compilacion()
+    benchmark_vectorizado()
+    benchmark_cache()
+    benchmark_derivada()
+    benchmark_estrategias_derivada()
+    benchmark_optimizacion()
+    benchmark_intervalos()
+    benchmark_multiarranque()
+    benchmark_secante()
+    benchmark_protegido()
+    benchmark_brent()
+    benchmark_orden_superior()
+    benchmark_raices()
+    benchmark_polinomios()
+    benchmark_alta_precision()
+    benchmark_raices_multiples()
+    benchmark_deflacion()
+    benchmark_continuacion()
+    benchmark_diagnostico()
+    benchmark_historial()
+    benchmark_lote()
+    benchmark_cuencas()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+"""
+Back ends de evaluación
+Genera código Python a partir del árbol de sintaxis (optimizado, ver optimizador.py)
+y lo compila una sola vez, ya sea para números (módulo math) o para arreglos completos (NumPy).
+"""
+
+import cmath
+import math
+import numpy as np
+from decimal import Decimal
+from analizador import a_texto, Constante, Llamada
+from optimizador import optimizar, nombres_externos, hijos, reconstruir
+
+def cbrt_real(x):
+    """Raíz cúbica que maneja negativos correctamente"""
+    if x >= 0:
+        return x ** (1/3)
+    else:
+        return -((-x) ** (1/3))
+
+# Funciones trigonométricas recíprocas
+def csc_func(x):
+    """Cosecante: csc(x) = 1/sin(x)"""
+    sin_val = math.sin(x)
+    if abs(sin_val) < 1e-15:
+        raise ValueError("Cosecante indefinida (sin(x) = 0)")
+    return 1 / sin_val
+
+def sec_func(x):
+    """Secante: sec(x) = 1/cos(x)"""
+    cos_val = math.cos(x)
+    if abs(cos_val) < 1e-15:
+        raise ValueError("Secante indefinida (cos(x) = 0)")
+    return 1 / cos_val
+
+def cot_func(x):
+    """Cotangente: cot(x) = cos(x)/sin(x)"""
+    sin_val = math.sin(x)
+    if abs(sin_val) < 1e-15:
+        raise ValueError("Cotangente indefinida (sin(x) = 0)")
+    return math.cos(x) / sin_val
+
+def logb_func(x, base):
+    """Logaritmo en base arbitraria: logb(x, b) = ln(x)/ln(b)"""
+    return math.log(x) / math.log(base)
+
+def root_func(x, n):
+    """Raíz n-ésima: root(x, n) = x^(1/n) - el primer parámetro es x, el segundo es n"""
+    return x ** (1 / n)
+
+# Versiones vectorizadas (NumPy) de las funciones especiales
+def csc_vectorizada(x):
+    """Cosecante vectorizada: NaN donde sin(x) = 0"""
+    sin_val = np.sin(x)
+    return np.where(np.abs(sin_val) < 1e-15, np.nan, 1 / sin_val)
+
+def sec_vectorizada(x):
+    """Secante vectorizada: NaN donde cos(x) = 0"""
+    cos_val = np.cos(x)
+    return np.where(np.abs(cos_val) < 1e-15, np.nan, 1 / cos_val)
+
+def cot_vectorizada(x):
+    """Cotangente vectorizada: NaN donde sin(x) = 0"""
+    sin_val = np.sin(x)
+    return np.where(np.abs(sin_val) < 1e-15, np.nan, np.cos(x) / sin_val)
+
+def logb_vectorizada(x, base):
+    return np.log(x) / np.log(base)
+
+# Nombres permitidos en el código generado (escalar)
+ENTORNO_ESCALAR = {
+    "__builtins__": {},
+    "sin": math.sin, "cos": math.cos, "tan": math.tan,
+    "csc": csc_func, "sec": sec_func, "cot": cot_func,
+    "asin": math.asin, "acos": math.acos, "atan": math.atan,
+    "sinh": math.sinh, "cosh": math.cosh, "tanh": math.tanh,
+    "asinh": math.asinh, "acosh": math.acosh, "atanh": math.atanh,
+    "exp": math.exp, "ln": math.log, "log10": math.log10, "log2": math.log2,
+    "logb": logb_func, "sqrt": math.sqrt, "cbrt": cbrt_real, "root": root_func,
+    "abs": abs, "floor": math.floor, "ceil": math.ceil,
+    "pi": math.pi, "e": math.e, "inf": math.inf,
+}
+
+# Nombres permitidos en el código generado (arreglos NumPy)
+ENTORNO_VECTORIZADO = {
+    "__builtins__": {},
+    "sin": np.sin, "cos": np.cos, "tan": np.tan,
+    "csc": csc_vectorizada, "sec": sec_vectorizada, "cot": cot_vectorizada,
+    "asin": np.arcsin, "acos": np.arccos, "atan": np.arctan,
+    "sinh": np.sinh, "cosh": np.cosh, "tanh": np.tanh,
+    "asinh": np.arcsinh, "acosh": np.arccosh, "atanh": np.arctanh,
+    "exp": np.exp, "ln": np.log, "log10": np.log10, "log2": np.log2,
+    "logb": logb_vectorizada, "sqrt": np.sqrt, "cbrt": np.cbrt, "root": root_func,
+    "abs": np.abs, "floor": np.floor, "ceil": np.ceil,
+    "pi": math.pi, "e": math.e, "inf": math.inf,
+}
+
+# Versiones complejas (derivada por paso complejo, ver derivada_numerica.py)
+def csc_compleja(z):
+    return 1 / cmath.sin(z)
+
+def sec_compleja(z):
+    return 1 / cmath.cos(z)
+
+def cot_compleja(z):
+    return cmath.cos(z) / cmath.sin(z)
+
+def log2_compleja(z):
+    return cmath.log(z) / math.log(2)
+
+def logb_compleja(z, base):
+    return cmath.log(z) / cmath.log(base)
+
+def cbrt_compleja(z):
+    """Extensión analítica de la raíz cúbica real (negativa para Re(z) < 0)"""
+    if z.real >= 0:
+        return z ** (1/3)
+    return -((-z) ** (1/3))
+
+# Nombres permitidos en el código generado (números complejos); sin abs, floor ni ceil,
+# que no son analíticas
+ENTORNO_COMPLEJO = {
+    "__builtins__": {},
+    "sin": cmath.sin, "cos": cmath.cos, "tan": cmath.tan,
+    "csc": csc_compleja, "sec": sec_compleja, "cot": cot_compleja,
+    "asin": cmath.asin, "acos": cmath.acos, "atan": cmath.atan,
+    "sinh": cmath.sinh, "cosh": cmath.cosh, "tanh": cmath.tanh,
+    "asinh": cmath.asinh, "acosh": cmath.acosh, "atanh": cmath.atanh,
+    "exp": cmath.exp, "ln": cmath.log, "log10": cmath.log10, "log2": log2_compleja,
+    "logb": logb_compleja, "sqrt": cmath.sqrt, "cbrt": cbrt_compleja, "root": root_func,
+    "pi": math.pi, "e": math.e, "inf": math.inf,
+}
+
+def cbrt_compleja_vectorizada(z):
+    """cbrt_compleja sobre un arreglo complejo"""
+    return np.where(z.real >= 0, z ** (1/3), -((-z) ** (1/3)))
+
+# Nombres permitidos en el código generado (arreglos NumPy complejos: cuencas de Newton en el
+# plano complejo); las funciones NumPy aceptan complejos salvo cbrt, y sin abs, floor ni ceil
+ENTORNO_COMPLEJO_VECTORIZADO = {
+    nombre: funcion for nombre, funcion in ENTORNO_VECTORIZADO.items() if nombre not in ('abs', 'floor', 'ceil')
+}
+ENTORNO_COMPLEJO_VECTORIZADO["cbrt"] = cbrt_compleja_vectorizada
+
+PREFIJO_LITERAL = '_n'
+# Constantes cuyo valor depende de la precisión: en el back end Decimal se llaman como funciones
+CONSTANTES_CON_PRECISION = {'pi', 'e'}
+
+def generar_codigo(arbol):
+    """Código Python de la expresión (los números se escriben como float)"""
+    return a_texto(arbol, repr)
+
+def evaluar_constante(arbol):
+    """Valor de un subárbol sin variables (para el plegado de constantes)"""
+    return eval(compile(generar_codigo(arbol), "<constante>", "eval"), ENTORNO_ESCALAR)
+
+def generar_fuente(arboles, variables=('x',), tupla=False, evaluar=evaluar_constante, literales=None):
+    """
+    Fuente de la función optimizada: temporales para subexpresiones repetidas y
+    funciones/constantes enlazadas como variables locales de un cierre (sin búsquedas
+    en el diccionario global en cada evaluación).
+    evaluar: valor de un subárbol constante para el plegado (None = no plegar)
+    literales: dict texto del número -> nombre; si se da, los números se escriben como
+    esos nombres (que el entorno debe definir) en lugar de literales float
+    """
+    asignaciones, arboles = optimizar(arboles, evaluar)
+    externos = nombres_externos([nodo for _, nodo in asignaciones] + arboles)
+    
+    if literales is None:
+        codigo = generar_codigo
+    else:
+        def nombre_literal(valor):
+            return literales.setdefault(repr(valor), f"{PREFIJO_LITERAL}{len(literales)}")
+        
+        def codigo(nodo):
+            return a_texto(nodo, nombre_literal)
+    
+    cuerpo = [f"def funcion({', '.join(variables)}):"]
+    cuerpo += [f"    {nombre} = {codigo(nodo)}" for nombre, nodo in asignaciones]
+    if tupla:
+        cuerpo.append(f"    return ({', '.join(codigo(a) for a in arboles)},)")
+    else:
+        cuerpo.append(f"    return {codigo(arboles[0])}")
+    
+    externos += list(literales.values()) if literales else []
+    enlaces = ', '.join(f"{nombre}={nombre}" for nombre in externos)
+    lineas = [f"def crear_funcion({enlaces}):"]
+    lineas += [f"    {linea}" for linea in cuerpo]
+    lineas.append("    return funcion")
+    return '\n'.join(lineas) + '\n'
+
+def compilar_fuente(fuente, entorno):
+    espacio = dict(entorno)
+    exec(compile(fuente, "<funcion>", "exec"), espacio)
+    funcion = espacio['crear_funcion']()
+    funcion.codigo = fuente
+    return funcion
+
+def compilar_arbol(arbol, entorno, variables=('x',)):
+    """
+    Compila el árbol en una función de Python cuyos argumentos son las variables.
+    El texto del usuario nunca se evalúa: el código se genera desde el árbol optimizado.
+    """
+    return compilar_fuente(generar_fuente([arbol], variables), entorno)
+
+def compilar_tupla(arboles, entorno, variables=('x',)):
+    """
+    Compila varios árboles en una sola función que retorna la tupla de sus valores.
+    Se usa para el kernel fusionado (f, f') de Newton-Raphson: las subexpresiones
+    comunes a f y f' se calculan una sola vez.
+    """
+    return compilar_fuente(generar_fuente(list(arboles), variables, tupla=True), entorno)
+
+def constantes_como_llamadas(nodo):
+    """pi -> pi(), e -> e() (su valor Decimal se calcula a la precisión del momento)"""
+    if isinstance(nodo, Constante) and nodo.nombre in CONSTANTES_CON_PRECISION:
+        return Llamada(nodo.nombre, ())
+    return reconstruir(nodo, [constantes_como_llamadas(h) for h in hijos(nodo)])
+
+def compilar_decimal(arboles, entorno, variables=('x',)):
+    """
+    Compila varios árboles para números Decimal (precisión arbitraria); retorna la tupla
+    de sus valores. Sin plegado de constantes (daría floats de 16 dígitos), con los números
+    como Decimal exactos de su texto ('0.1' -> Decimal('0.1')) y pi, e como llamadas.
+    """
+    literales = {}
+    arboles = [constantes_como_llamadas(arbol) for arbol in arboles]
+    fuente = generar_fuente(arboles, variables, tupla=True, evaluar=lambda nodo: None, literales=literales)
+    entorno = dict(entorno, **{nombre: Decimal(texto) for texto, nombre in literales.items()})
+    return compilar_fuente(fuente, entorno)
@@ -0,0 +1,242 @@
+"""
+Barridos de un parámetro con continuación
+Raíz de f(x; a) para muchos valores del parámetro a. En lugar de resolver cada valor desde
+cero, cada raíz arranca desde la del valor vecino (continuación), corregida con la tangente
+dx/da = -(∂f/∂a) / (∂f/∂x) cuando ∂f/∂a es simbólica. Si Newton no converge en
+ITER_CONTINUACION iteraciones desde esa predicción, el paso en a se parte a la mitad (hasta
+MAX_REDUCCIONES_PASO veces) y vuelve a crecer tras cada paso exitoso.
+Cada x0 sigue su propia rama de raíces. La malla de valores se divide en segmentos: una
+pasada gruesa recorre los inicios de segmento y luego todos los segmentos de todas las
+ramas avanzan juntos (cadenas independientes) con el evaluador vectorizado, así que el
+número de pasos secuenciales es ~2·sqrt(n) en lugar de n.
+Cada raíz se escribe en el arreglo de salida en cuanto converge (puede ser un np.memmap
+para barridos grandes).
+"""
+
+import math
+import numpy as np
+from matematicas import ExpresionParametrica
+from metodo_newton_raphson import calcular_derivada_numerica_vectorizada
+
+ITER_CONTINUACION = 8  # Iteraciones desde una predicción antes de achicar el paso
+MAX_REDUCCIONES_PASO = 10
+
+def kernel_barrido(expresion, parametro, fijos):
+    """
+    Callable (x, a) -> (f, ∂f/∂x, ∂f/∂a) sobre arreglos. Sin derivadas simbólicas, ∂f/∂x sale
+    de diferencias centrales y ∂f/∂a es None (continuación sin tangente).
+    """
+    fusionada = expresion.fusionada_barrido(parametro, fijos)
+    if fusionada is not None:
+        return fusionada
+    funcion = expresion.vectorizada_barrido(parametro, fijos)
+
+    def evaluar(x, a):
+        return funcion(x, a), calcular_derivada_numerica_vectorizada(lambda xs: funcion(xs, a), x), None
+
+    return evaluar
+
+def newton_parametrico(evaluar, x, a, tolerance, limites):
+    """
+    Newton-Raphson en carriles independientes: el carril k resuelve f(x; a[k]) = 0 desde x[k]
+    con a lo sumo limites[k] iteraciones. Los carriles terminados se enmascaran.
+    Retorna (x, convergio, fpx, fa, iteraciones): fpx y fa son ∂f/∂x y ∂f/∂a en el último
+    iterado (para la tangente de la continuación; fa es None si no es simbólica).
+    """
+    x = x.copy()
+    n = x.size
+    convergio = np.zeros(n, dtype=bool)
+    iteraciones = np.zeros(n, dtype=int)
+    fpx_final = np.full(n, np.nan)
+    fa_final = np.full(n, np.nan)
+    activos = np.nonzero(np.isfinite(x))[0]
+
+    for i in range(int(limites.max(initial=0))):
+        activos = activos[limites[activos] > i]
+        if activos.size == 0:
+            break
+
+        xa = x[activos]
+        fxa, fpxa, faa = evaluar(xa, a[activos])
+        iteraciones[activos] = i + 1
+        fpx_final[activos] = fpxa
+        if faa is not None:
+            fa_final[activos] = faa
+
+        paso = np.isfinite(fxa) & np.isfinite(fpxa) & (np.abs(fpxa) >= 1e-15)
+        xn = np.where(paso, xa - fxa / np.where(paso, fpxa, 1.0), xa)
+        if i > 0:
+            error_rel = np.abs((xn - xa) / np.where(xn != 0, xn, 1.0))
+        else:
+            error_rel = np.full(xa.size, np.inf)
+        paso &= np.isfinite(xn)
+        x[activos[paso]] = xn[paso]
+
+        termino = paso & ((np.abs(fxa) < 1e-12) | (error_rel < tolerance))
+        convergio[activos[termino]] = True
+        activos = activos[paso & ~termino]
+
+    return x, convergio, fpx_final, fa_final, iteraciones
+
+def continuar_cadenas(evaluar, valores, indices, ramas, a0, x0, tolerance, max_iter,
+                      raices, iteraciones, convergio):
+    """
+    Avanza todas las cadenas a la vez. La cadena c resuelve, en orden, los valores
+    valores[indices[c]] (índice -1 = fin de la cadena) de la rama ramas[c], partiendo de la
+    raíz x0[c] conocida en a0[c] (a0[c] NaN: x0[c] es solo un punto inicial, sin control de paso).
+    Escribe raices, iteraciones y convergio[ramas[c], j] en cuanto termina cada valor j.
+    Retorna el número de evaluaciones de f y f'.
+    """
+    num_cadenas, largo = indices.shape
+    posicion = np.zeros(num_cadenas, dtype=int)
+    a_actual = np.array(a0, dtype=float)
+    x_actual = np.array(x0, dtype=float)
+    tangente = np.zeros(num_cadenas)
+    paso = np.full(num_cadenas, np.inf)  # Paso máximo en a
+    reducciones = np.zeros(num_cadenas, dtype=int)
+    acumuladas = np.zeros(num_cadenas, dtype=int)  # Iteraciones del valor en curso
+    evaluaciones = 0
+
+    while True:
+        activas = np.nonzero(posicion < largo)[0]
+        activas = activas[indices[activas, posicion[activas]] >= 0]
+        if activas.size == 0:
+            return evaluaciones
+
+        j = indices[activas, posicion[activas]]
+        objetivo = valores[j]
+        a = a_actual[activas]
+        frio = np.isnan(a)
+        distancia = np.where(frio, 0.0, objetivo - a)
+        completo = frio | (paso[activas] >= np.abs(distancia))
+        desplazamiento = np.where(completo, distancia, np.copysign(paso[activas], distancia))
+        a_prueba = np.where(completo, objetivo, a + desplazamiento)
+        x_prueba = np.where(frio, x_actual[activas], x_actual[activas] + tangente[activas] * desplazamiento)
+        limites = np.where(frio, max_iter, min(max_iter, ITER_CONTINUACION))
+
+        x_nuevo, exito, fpx, fa, usadas = newton_parametrico(evaluar, x_prueba, a_prueba, tolerance, limites)
+        evaluaciones += 2 * int(usadas.sum())
+        acumuladas[activas] += usadas
+
+        # Pasos exitosos: la raíz en a_prueba es el nuevo punto de partida
+        ok = activas[exito]
+        a_actual[ok] = a_prueba[exito]
+        x_actual[ok] = x_nuevo[exito]
+        with np.errstate(all='ignore'):
+            pendiente = -fa[exito] / fpx[exito]
+        tangente[ok] = np.where(np.isfinite(pendiente), pendiente, 0.0)
+        paso[ok] = np.where(frio[exito] | (desplazamiento[exito] == 0), np.inf, 2 * np.abs(desplazamiento[exito]))
+        reducciones[ok] = 0
+
+        # Pasos fallidos: partir el paso a la mitad o, agotadas las reducciones, abandonar el valor
+        fallo = ~exito
+        reintentar = fallo & ~frio & (reducciones[activas] < MAX_REDUCCIONES_PASO)
+        paso[activas[reintentar]] = np.abs(desplazamiento[reintentar]) / 2
+        reducciones[activas[reintentar]] += 1
+        abandonar = fallo & ~reintentar
+
+        # Valores terminados (alcanzados o abandonados): escribir la salida y pasar al siguiente
+        llego = exito & (a_prueba == objetivo)
+        terminado = llego | abandonar
+        if terminado.any():
+            cadenas = activas[terminado]
+            filas, columnas = ramas[cadenas], j[terminado]
+            raices[filas, columnas] = np.where(llego[terminado], x_nuevo[terminado], np.nan)
+            iteraciones[filas, columnas] = acumuladas[cadenas]
+            convergio[filas, columnas] = llego[terminado]
+            acumuladas[cadenas] = 0
+            posicion[cadenas] += 1
+
+        # Rama perdida: el próximo valor arranca desde la última raíz, como punto inicial
+        perdidas = activas[abandonar]
+        a_actual[perdidas] = np.nan
+        tangente[perdidas] = 0.0
+        paso[perdidas] = np.inf
+        reducciones[perdidas] = 0
+
+def ejecutar_barrido_parametro(func_str, parametro, valores, x0, tolerance, max_iter, fijos=None,
+                               salida=None, segmentos=None):
+    """
+    Resuelve f(x; parametro) = 0 para cada valor de la malla valores (en orden), con
+    continuación desde el valor vecino.
+    func_str: función con parámetros con nombre ('x^3 - a*x + b')
+    x0: punto inicial del primer valor; con un arreglo de x0 se sigue una rama por cada uno
+    fijos: dict con el valor de los demás parámetros
+    salida: arreglo float donde se escriben las raíces (forma (n,) o (len(x0), n)); por ejemplo
+    un np.memmap. None = se crea uno nuevo
+    segmentos: cadenas por rama (None = ~sqrt(n))
+    Retorna: (exito, resultado, ramas)
+    - resultado: 'raices' (la salida; NaN donde no convergió), 'iteraciones', 'convergio'
+      (misma forma), 'valores' y 'evaluaciones'
+    - ramas: un dict por x0 (x0, convergidos, iteraciones)
+    """
+    try:
+        fijos = dict(fijos or {})
+        parametros = (parametro, *fijos)
+        expresion = ExpresionParametrica(func_str, parametros)
+        evaluar = kernel_barrido(expresion, parametro, fijos)
+
+        valores = np.asarray(valores, dtype=float).ravel()
+        escalar = np.ndim(x0) == 0
+        x0s = np.atleast_1d(np.asarray(x0, dtype=float)).ravel()
+        num_ramas, n = x0s.size, valores.size
+        if n == 0:
+            raise ValueError("La malla de valores está vacía")
+        if not np.all(np.isfinite(valores)):
+            raise ValueError("Los valores del parámetro deben ser finitos")
+
+        if salida is None:
+            salida = np.full((num_ramas, n) if not escalar else n, np.nan)
+        raices = salida.reshape(num_ramas, n)
+        if not np.shares_memory(raices, salida):
+            raise ValueError(f"La salida debe tener forma {(num_ramas, n) if not escalar else (n,)}")
+        raices[...] = np.nan
+        iteraciones = np.zeros((num_ramas, n), dtype=int)
+        convergio = np.zeros((num_ramas, n), dtype=bool)
+
+        # Inicios de segmento: un valor cada `largo`
+        if segmentos is None:
+            segmentos = math.isqrt(n - 1) + 1
+        largo = -(-n // max(1, min(segmentos, n)))
+        inicios = np.arange(0, n, largo)
+        ramas = np.arange(num_ramas)
+
+        # Pasada gruesa: cada rama recorre los inicios de segmento desde su x0
+        evaluaciones = continuar_cadenas(
+            evaluar, valores, np.tile(inicios, (num_ramas, 1)), ramas,
+            np.full(num_ramas, np.nan), x0s, tolerance, max_iter, raices, iteraciones, convergio)
+
+        # Pasada fina: cada segmento de cada rama desde la raíz de su inicio
+        if largo > 1:
+            desplazamientos = np.arange(1, largo)
+            indices = inicios[:, None] + desplazamientos[None, :]
+            indices[indices >= n] = -1
+            indices = np.tile(indices, (num_ramas, 1))
+            ramas_cadena = np.repeat(ramas, inicios.size)
+            a0 = np.tile(valores[inicios], num_ramas)
+            x_inicio = raices[:, inicios].ravel()
+            # Inicio sin raíz: el segmento arranca desde el x0 de su rama, sin continuación
+            sin_raiz = np.isnan(x_inicio)
+            a0[sin_raiz] = np.nan
+            x_inicio[sin_raiz] = x0s[ramas_cadena[sin_raiz]]
+            evaluaciones += continuar_cadenas(
+                evaluar, valores, indices, ramas_cadena, a0, x_inicio, tolerance, max_iter,
+                raices, iteraciones, convergio)
+
+        ramas_info = [{
+            'x0': float(x0s[b]),
+            'convergidos': int(convergio[b].sum()),
+            'iteraciones': int(iteraciones[b].sum())
+        } for b in range(num_ramas)]
+
+        forma = salida.shape
+        return True, {
+            'raices': salida,
+            'iteraciones': iteraciones.reshape(forma),
+            'convergio': convergio.reshape(forma),
+            'valores': valores,
+            'evaluaciones': evaluaciones
+        }, ramas_info
+
+    except Exception as e:
+        return False, str(e), []
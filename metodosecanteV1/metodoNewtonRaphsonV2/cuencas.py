@@ -0,0 +1,391 @@
+"""
+Cuencas de atracción de Newton-Raphson
+Para cada punto inicial de una malla (sobre la recta real o en el plano complejo) se
+calcula a qué raíz converge Newton y en cuántas iteraciones.
+La malla se divide en bloques de filas. Cada bloque itera sus puntos por teselas de
+TAMANO_TESELA con el kernel (f, f') vectorizado (complejo en el plano, ver
+ExpresionCompilada.fusionada_compleja_vectorizada) y los bloques se reparten en un
+ProcessPoolExecutor. Los trabajadores escriben el punto final y las iteraciones
+directamente en un buffer de memoria compartida: no viajan arreglos entre procesos. Al final se agrupan los puntos finales en raíces. Cerca de una raíz de multiplicidad m
+Newton solo llega a ~|f|^(1/m) de ella, así que los grupos que caen dentro de la
+incertidumbre estimada de otro (m·|f/f'|) se fusionan y cada raíz se pule con el paso
+modificado z - m·f/f'; las reales además con ejecutar_metodo_newton_raphson.
+Las expresiones no analíticas (abs, floor, ceil) solo admiten la recta real.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+import numpy as np
+from matematicas import obtener_expresion
+from iteraciones import ErrorIteracion
+from metodo_newton_raphson import ejecutar_metodo_newton_raphson, calcular_derivada_numerica_vectorizada
+
+# Por debajo de estos puntos la malla se calcula en el proceso actual (sin costo de arranque del pool)
+MIN_PUNTOS_POOL = 100000
+
+# Bloques por trabajador: varios para repartir la carga (las zonas caóticas iteran más)
+BLOQUES_POR_TRABAJADOR = 4
+
+# Puntos que se iteran juntos dentro de un bloque: teselas que caben en caché rinden más que el bloque entero
+TAMANO_TESELA = 65536
+
+# Distancia (relativa a la mayor raíz) por debajo de la cual dos puntos finales son la misma raíz
+SEPARACION_RAICES = 1e-6
+
+# Multiplicidad máxima que se estima al fusionar y pulir raíces
+MAX_MULTIPLICIDAD = 10
+
+# Pasos del pulido con Newton modificado
+ITER_PULIDO = 8
+
+def kernel_newton(expresion, complejo):
+    """Callable z -> (f, f') sobre arreglos (complejos en el plano, float en la recta real)"""
+    if complejo:
+        fusionada = expresion.fusionada_compleja_vectorizada
+        if fusionada is None:
+            raise ValueError("La función no es analítica (abs, floor, ceil): usa la recta real.")
+        return fusionada
+    if expresion.fusionada_vectorizada is not None:
+        return expresion.fusionada_vectorizada
+    funcion = expresion.vectorizada
+    return lambda x: (funcion(x), calcular_derivada_numerica_vectorizada(funcion, x))
+
+def newton_lotes(fusionada, z, tolerance, max_iter):
+    """
+    Newton-Raphson desde todos los puntos de z a la vez (reales o complejos), con el
+    criterio de convergencia de iterar_newton_raphson. Los puntos activos se mantienen
+    compactados: cada iteración evalúa solo los que siguen iterando.
+    Retorna (z, iteraciones, convergio).
+    """
+    z = z.copy()
+    iteraciones = np.zeros(z.size, dtype=np.int32)
+    convergio = np.zeros(z.size, dtype=bool)
+    activos = np.nonzero(np.isfinite(z))[0]
+    za = z[activos]
+
+    for i in range(max_iter):
+        if activos.size == 0:
+            break
+        with np.errstate(all='ignore'):
+            fza, fpza = fusionada(za)
+            paso = ~(np.isnan(fza) | np.isnan(fpza)) & (np.abs(fpza) >= 1e-15)
+            zn = za - fza / np.where(paso, fpza, 1.0)
+            if i > 0:
+                error_rel = np.abs((zn - za) / np.where(zn != 0, zn, 1.0))
+            else:
+                error_rel = np.full(za.size, np.inf)
+        paso &= np.isfinite(zn)
+        termino = paso & ((np.abs(fza) < 1e-12) | (error_rel < tolerance))
+        sigue = paso & ~termino
+
+        # Terminados (convergieron o no pueden dar el paso): escribir su estado final
+        fin = ~sigue
+        iteraciones[activos[fin]] = i + 1
+        z[activos[termino]] = zn[termino]
+        convergio[activos[termino]] = True
+        activos, za = activos[sigue], zn[sigue]
+
+    iteraciones[activos] = max_iter
+    z[activos] = za
+    return z, iteraciones, convergio
+
+def puntos_iniciales(extension, forma, fila_inicio, fila_fin):
+    """Puntos de las filas [fila_inicio, fila_fin) de la malla (fila 0 = parte imaginaria mínima)"""
+    x_min, x_max, y_min, y_max = extension
+    alto, ancho = forma
+    x = np.linspace(x_min, x_max, ancho)
+    if alto == 1:
+        return x[None, :]
+    y = np.linspace(y_min, y_max, alto)[fila_inicio:fila_fin]
+    return x[None, :] + 1j * y[:, None]
+
+def vistas_salida(buffer, forma):
+    """Arreglos (puntos finales complejos, iteraciones int32) sobre un buffer de la malla completa"""
+    finales = np.ndarray(forma, dtype=complex, buffer=buffer)
+    iteraciones = np.ndarray(forma, dtype=np.int32, buffer=buffer, offset=finales.nbytes)
+    return finales, iteraciones
+
+def tamano_salida(forma):
+    return forma[0] * forma[1] * (np.dtype(complex).itemsize + np.dtype(np.int32).itemsize)
+
+def calcular_bloque(func_str, extension, forma, filas, tolerance, max_iter, finales, iteraciones):
+    """Newton en un bloque de filas; escribe el punto final (NaN si no convergió) y las iteraciones"""
+    fila_inicio, fila_fin = filas
+    complejo = forma[0] > 1
+    fusionada = kernel_newton(obtener_expresion(func_str), complejo)
+    z0 = puntos_iniciales(extension, forma, fila_inicio, fila_fin).ravel()
+    finales_bloque = finales[fila_inicio:fila_fin].reshape(-1)
+    iteraciones_bloque = iteraciones[fila_inicio:fila_fin].reshape(-1)
+    for inicio in range(0, z0.size, TAMANO_TESELA):
+        tesela = slice(inicio, inicio + TAMANO_TESELA)
+        z, usadas, convergio = newton_lotes(fusionada, z0[tesela], tolerance, max_iter)
+        z[~convergio] = np.nan
+        finales_bloque[tesela] = z
+        iteraciones_bloque[tesela] = usadas
+
+def calcular_bloque_compartido(nombre_memoria, func_str, extension, forma, filas, tolerance, max_iter):
+    """Tarea del trabajador: calcula un bloque y lo escribe en la memoria compartida"""
+    memoria = shared_memory.SharedMemory(name=nombre_memoria)
+    try:
+        finales, iteraciones = vistas_salida(memoria.buf, forma)
+        calcular_bloque(func_str, extension, forma, filas, tolerance, max_iter, finales, iteraciones)
+        del finales, iteraciones  # Liberar las vistas antes de cerrar el buffer
+    finally:
+        memoria.close()
+
+def agrupar_finales(finales, tolerance):
+    """
+    Agrupa los puntos finales en raíces. Cada punto se redondea a una celda de lado
+    ~SEPARACION_RAICES; las celdas vecinas (raíz en un borde) se fusionan.
+    Retorna (raices complejas ordenadas por parte real e imaginaria, índice de raíz de cada
+    punto con -1 donde no convergió).
+    """
+    indices = np.full(finales.shape, -1, dtype=np.int32)
+    convergidos = ~np.isnan(finales)
+    z = finales[convergidos]
+    if z.size == 0:
+        return np.array([], dtype=complex), indices
+
+    # Celda de cada punto como un solo entero (ordenar int64 es mucho más rápido que complejos)
+    escala = max(SEPARACION_RAICES, 10 * tolerance) * max(1.0, float(np.abs(z).max()))
+    celda_real = np.round(z.real / escala).astype(np.int64)
+    celda_imag = np.round(z.imag / escala).astype(np.int64)
+    desplazamiento = int(np.abs(celda_imag).max()) + 1
+    base = 2 * desplazamiento + 1
+    claves, inversa = np.unique(celda_real * base + celda_imag, return_inverse=True)
+    inversa = inversa.ravel()
+
+    # Componentes conexas de celdas vecinas: cada celda busca (en las claves ordenadas) sus
+    # vecinas de arriba y de la derecha
+    origenes, destinos = [], []
+    for vecina in (1, base - 1, base, base + 1):
+        posicion = np.minimum(np.searchsorted(claves, claves + vecina), claves.size - 1)
+        existe = claves[posicion] == claves + vecina
+        origenes.append(np.nonzero(existe)[0])
+        destinos.append(posicion[existe])
+    grupo, num_grupos = componentes_conexas(claves.size, np.concatenate(origenes), np.concatenate(destinos))
+
+    # Raíz de cada grupo: promedio de sus puntos finales
+    por_punto = grupo[inversa]
+    cantidad = np.bincount(por_punto, minlength=num_grupos)
+    raices = (np.bincount(por_punto, z.real, num_grupos) + 1j * np.bincount(por_punto, z.imag, num_grupos)) / cantidad
+    indices[convergidos] = por_punto
+    return ordenar_raices(raices, indices)
+
+def componentes_conexas(num_nodos, origenes, destinos):
+    """
+    Componentes conexas de un grafo dado por sus aristas (propagación de la etiqueta mínima
+    con saltos de puntero); retorna (grupo de cada nodo numerado desde 0, número de grupos)
+    """
+    etiqueta = np.arange(num_nodos)
+    while True:
+        minimo = np.minimum(etiqueta[origenes], etiqueta[destinos])
+        nueva = etiqueta.copy()
+        np.minimum.at(nueva, origenes, minimo)
+        np.minimum.at(nueva, destinos, minimo)
+        nueva = nueva[nueva]
+        if np.array_equal(nueva, etiqueta):
+            break
+        etiqueta = nueva
+    etiquetas, grupo = np.unique(etiqueta, return_inverse=True)
+    return grupo.ravel(), etiquetas.size
+
+def ordenar_raices(raices, indices, *asociados):
+    """
+    Ordena las raíces por parte real e imaginaria y renumera los índices de los puntos
+    (-1 se conserva); los arreglos asociados (uno por raíz) se reordenan igual
+    """
+    orden = np.lexsort((raices.imag, raices.real))
+    posicion = np.full(raices.size + 1, -1, dtype=np.int32)  # Posición extra: índice -1
+    posicion[orden] = np.arange(raices.size)
+    return (raices[orden], posicion[indices], *(arreglo[orden] for arreglo in asociados))
+
+def estimar_multiplicidad(fusionada, raices):
+    """
+    (multiplicidad, radio) de cada raíz aproximada: cerca de una raíz de multiplicidad m dos
+    pasos de Newton seguidos se reducen en (m - 1)/m, y la raíz está a ~m·|f/f'|.
+    """
+    with np.errstate(all='ignore'):
+        fz, fpz = fusionada(raices)
+        paso = fz / fpz
+        f_siguiente, fp_siguiente = fusionada(raices - paso)
+        razon = np.abs(f_siguiente / fp_siguiente) / np.abs(paso)
+        multiplicidad = np.clip(np.round(np.where(razon < 1, 1 / (1 - razon), 1.0)), 1, MAX_MULTIPLICIDAD)
+        radio = multiplicidad * np.abs(paso)
+    return multiplicidad, np.where(np.isfinite(radio), radio, 0.0)
+
+def fusionar_raices(raices, indices, radio, multiplicidad):
+    """
+    Une las raíces que caen dentro del radio de incertidumbre de otra (puntos finales dispersos
+    alrededor de una raíz múltiple). De mayor a menor número de puntos, cada raíz sin grupo
+    abre uno y absorbe las que quedan a menos de 2·(radio de ambas), con el radio del grupo
+    creciendo hasta el de su miembro más lejano. La raíz del grupo es el promedio pesado por
+    puntos; su multiplicidad y el inicio del pulido salen del miembro más alejado de ese
+    promedio (cerca de la raíz los cocientes de pasos quedan dominados por el redondeo de f).
+    Retorna (raices, indices, multiplicidad, inicios) ordenados como ordenar_raices.
+    """
+    puntos = np.bincount(indices[indices >= 0], minlength=raices.size).astype(float)
+    grupo = np.full(raices.size, -1)
+    num_grupos = 0
+    for k in np.argsort(-puntos, kind='stable'):
+        if grupo[k] >= 0:
+            continue
+        grupo[k] = num_grupos
+        radio_grupo = radio[k]
+        while True:
+            libres = np.nonzero(grupo < 0)[0]
+            cercanas = libres[np.abs(raices[libres] - raices[k]) <= 2 * (radio[libres] + radio_grupo)]
+            if cercanas.size == 0:
+                break
+            grupo[cercanas] = num_grupos
+            radio_grupo = max(radio_grupo, radio[cercanas].max())
+        num_grupos += 1
+
+    peso = np.bincount(grupo, puntos, num_grupos)
+    fusionadas = (np.bincount(grupo, puntos * raices.real, num_grupos) +
+                  1j * np.bincount(grupo, puntos * raices.imag, num_grupos)) / np.maximum(peso, 1)
+    # Miembro más alejado de cada grupo: el último de cada grupo ordenando por (grupo, distancia)
+    orden = np.lexsort((np.abs(raices - fusionadas[grupo]), grupo))
+    lejano = orden[np.append(grupo[orden][1:] != grupo[orden][:-1], True)]
+    grupo = np.append(grupo, -1)  # Índice -1 (sin convergencia) se conserva
+    return ordenar_raices(fusionadas, grupo[indices], multiplicidad[lejano], raices[lejano])
+
+def pulir_multiples(fusionada, raices, inicios, multiplicidad):
+    """
+    Newton modificado z - m·f/f' desde cada inicio mientras los pasos se achican (dentro de la
+    zona donde f es puro redondeo dejan de hacerlo). Donde no se pudo dar ningún paso se
+    conserva la raíz recibida.
+    """
+    z = inicios.copy()
+    paso_anterior = np.full(z.shape, np.inf)
+    with np.errstate(all='ignore'):
+        for _ in range(ITER_PULIDO):
+            fz, fpz = fusionada(z)
+            paso = multiplicidad * fz / fpz
+            sigue = np.isfinite(paso) & (np.abs(paso) < paso_anterior)
+            z = np.where(sigue, z - paso, z)
+            paso_anterior = np.where(sigue, np.abs(paso), 0.0)
+    return np.where(np.isfinite(z) & (z != inicios), z, raices)
+
+def pulir_raices_reales(func_str, raices, multiplicidad, tolerance, max_iter, escala):
+    """
+    Raíces simples sobre el eje real (|Im| <= escala) pulidas con ejecutar_metodo_newton_raphson
+    (las múltiples ya quedan pulidas por pulir_multiples)
+    """
+    pulidas = raices.copy()
+    for k, raiz in enumerate(raices):
+        if abs(raiz.imag) > escala or multiplicidad[k] > 1:
+            continue
+        exito, resultado, _ = ejecutar_metodo_newton_raphson(func_str, float(raiz.real), tolerance, max_iter)
+        if exito and resultado['convergio'] and abs(resultado['raiz'] - raiz.real) <= 10 * escala:
+            pulidas[k] = resultado['raiz']
+    return pulidas
+
+def ejecutar_cuencas(func_str, x_rango, y_rango=None, resolucion=(400, 400), tolerance=1e-10, max_iter=50,
+                     workers=None, cancelacion=None, progreso=None):
+    """
+    Cuencas de atracción de Newton en una malla de puntos iniciales.
+    x_rango: (mínimo, máximo) de la parte real
+    y_rango: (mínimo, máximo) de la parte imaginaria; None = solo la recta real
+    resolucion: (ancho, alto) de la malla en puntos (en la recta real solo cuenta el ancho)
+    workers: procesos (None = todos los núcleos; 1 = en el proceso actual)
+    cancelacion: token Cancelacion; se revisa al terminar cada bloque de filas
+    progreso: callable (filas hechas, filas totales) llamado al terminar cada bloque
+    Retorna: (exito, resultado, raices_info)
+    - resultado: 'raices' (complejas en el plano, float en la recta), 'indices' (raíz a la
+      que converge cada punto, -1 si no converge; forma (alto, ancho)), 'iteraciones',
+      'extension' (x_min, x_max, y_min, y_max) y 'complejo'
+    - raices_info: un dict por raíz (raiz, puntos, iteraciones_media)
+    """
+    try:
+        complejo = y_rango is not None
+        expresion = obtener_expresion(func_str)
+        fusionada = kernel_newton(expresion, complejo)  # También verifica antes de repartir el trabajo
+
+        ancho, alto = (int(resolucion[0]), int(resolucion[1]) if complejo else 1)
+        if ancho < 2 or alto < (2 if complejo else 1):
+            raise ValueError("La resolución debe ser de al menos 2 puntos por eje")
+        forma = (alto, ancho)
+        extension = (*map(float, x_rango), *(map(float, y_rango) if complejo else (0.0, 0.0)))
+
+        workers = workers or os.cpu_count() or 1
+        if alto * ancho < MIN_PUNTOS_POOL:
+            workers = 1
+        # Bloques de a lo sumo una tesela: el progreso y la cancelación se atienden seguido
+        filas_por_bloque = max(1, min(-(-alto // (workers * BLOQUES_POR_TRABAJADOR)), TAMANO_TESELA // ancho))
+        bloques = [(fila, min(fila + filas_por_bloque, alto)) for fila in range(0, alto, filas_por_bloque)]
+        pendientes = list(bloques)
+
+        def terminar_bloque(filas):
+            """Quita el bloque de los pendientes, informa el progreso y atiende la cancelación"""
+            pendientes.remove(filas)
+            hechas = alto - sum(fin - inicio for inicio, fin in pendientes)
+            if progreso is not None:
+                progreso(hechas, alto)
+            if cancelacion is not None and cancelacion.cancelada:
+                raise ErrorIteracion(f"Error: Cálculo cancelado ({hechas} de {alto} filas).")
+
+        memoria = shared_memory.SharedMemory(create=True, size=tamano_salida(forma))
+        finales_compartidos = iteraciones_compartidas = None
+        try:
+            finales_compartidos, iteraciones_compartidas = vistas_salida(memoria.buf, forma)
+            if workers > 1 and len(bloques) > 1:
+                try:
+                    with ProcessPoolExecutor(max_workers=min(workers, len(bloques))) as executor:
+                        futuros = {executor.submit(calcular_bloque_compartido, memoria.name, func_str, extension,
+                                                   forma, filas, tolerance, max_iter): filas for filas in bloques}
+                        try:
+                            for futuro in as_completed(futuros):
+                                futuro.result()
+                                terminar_bloque(futuros[futuro])
+                        finally:
+                            # Cancelado o con error: no esperar a los bloques que no empezaron
+                            executor.shutdown(wait=True, cancel_futures=True)
+                except BrokenProcessPool:
+                    pass  # Un proceso murió: lo que falte se calcula aquí
+            for filas in list(pendientes):
+                calcular_bloque(func_str, extension, forma, filas, tolerance, max_iter,
+                                finales_compartidos, iteraciones_compartidas)
+                terminar_bloque(filas)
+            finales = finales_compartidos.copy()
+            iteraciones = iteraciones_compartidas.copy()
+        finally:
+            # Liberar las vistas antes de cerrar el buffer (también si hubo una excepción)
+            finales_compartidos = iteraciones_compartidas = None
+            memoria.close()
+            memoria.unlink()
+
+        raices, indices = agrupar_finales(finales, tolerance)
+        if raices.size:
+            # En la recta real el kernel es real
+            muestras = raices if complejo else raices.real
+            multiplicidad, radio = estimar_multiplicidad(fusionada, muestras)
+            raices, indices, multiplicidad, inicios = fusionar_raices(raices, indices, radio, multiplicidad)
+            if not complejo:
+                raices, inicios = raices.real, inicios.real
+            raices = pulir_multiples(fusionada, raices, inicios, multiplicidad).astype(complex)
+            escala = max(SEPARACION_RAICES, 10 * tolerance) * max(1.0, float(np.abs(raices).max()))
+            raices = pulir_raices_reales(func_str, raices, multiplicidad, tolerance, max_iter, escala)
+        if not complejo:
+            raices = raices.real
+
+        cantidad = np.bincount(indices[indices >= 0], minlength=raices.size)
+        suma_iteraciones = np.bincount(indices[indices >= 0], iteraciones[indices >= 0], raices.size)
+        raices_info = [{
+            'raiz': raices[k].item(),
+            'puntos': int(cantidad[k]),
+            'iteraciones_media': float(suma_iteraciones[k] / cantidad[k])
+        } for k in range(raices.size)]
+
+        return True, {
+            'raices': raices,
+            'indices': indices,
+            'iteraciones': iteraciones,
+            'extension': extension,
+            'complejo': complejo
+        }, raices_info
+
+    except Exception as e:
+        return False, str(e), []
@@ -0,0 +1,125 @@
+"""
+Estrategias de derivada numérica
+Newton-Raphson usa la derivada simbólica cuando existe; estas estrategias cubren las
+expresiones sin ella (floor, ceil) y los puntos donde f' falla (ej: sqrt(x) en 0).
+- Paso complejo: f'(x) = Im(f(x + ih)) / h con h = 1e-20. Una sola evaluación compleja y
+  ninguna resta de valores cercanos (sin cancelación): precisión de máquina. Solo sirve
+  para expresiones analíticas (sin abs, floor ni ceil).
+- Richardson: diferencias centrales con h cada vez menor, extrapoladas para anular los
+  términos h², h⁴, ... (tabla de Ridders); se detiene cuando el error estimado deja de bajar.
+"""
+
+import math
+import sys
+from optimizador import nombres_externos
+
+# Estrategias: 'auto' usa la derivada simbólica y, donde no la hay, la numérica que
+# corresponda a la expresión (paso complejo si es analítica, Richardson si no)
+DERIVADA_AUTOMATICA = 'auto'
+DERIVADA_PASO_COMPLEJO = 'paso_complejo'
+DERIVADA_RICHARDSON = 'richardson'
+ESTRATEGIAS_DERIVADA = (DERIVADA_AUTOMATICA, DERIVADA_PASO_COMPLEJO, DERIVADA_RICHARDSON)
+
+FUNCIONES_NO_ANALITICAS = {'abs', 'floor', 'ceil'}
+H_PASO_COMPLEJO = 1e-20
+H_INICIAL_RICHARDSON = 1e-3  # Relativo a max(1, |x|)
+H_LATERAL = 1e-8
+MAX_NIVELES_RICHARDSON = 8
+MAX_REDUCCIONES_DOMINIO = 10  # h se divide entre 10 hasta que x ± h quede dentro del dominio
+# Error estimado (relativo) con el que Richardson se detiene; la estimación es conservadora
+TOLERANCIA_RICHARDSON = 1e4 * sys.float_info.epsilon
+ERRORES_EVALUACION = (ValueError, ZeroDivisionError, OverflowError)
+
+def es_analitica(arbol):
+    """True si la expresión no usa funciones sin extensión analítica (abs, floor, ceil)"""
+    return not FUNCIONES_NO_ANALITICAS.intersection(nombres_externos([arbol]))
+
+def validar_estrategia(estrategia):
+    if estrategia not in ESTRATEGIAS_DERIVADA:
+        raise ValueError(f"Estrategia de derivada desconocida: {estrategia}. "
+                         f"Disponibles: {', '.join(ESTRATEGIAS_DERIVADA)}")
+
+def derivada_paso_complejo(funcion_compleja, x, h=H_PASO_COMPLEJO):
+    """f'(x) = Im(f(x + ih)) / h; None si f no se puede evaluar en x + ih"""
+    try:
+        valor = funcion_compleja(complex(x, h))
+    except ERRORES_EVALUACION:
+        return None
+    derivada = valor.imag / h if isinstance(valor, complex) else 0.0  # Expresión constante
+    return derivada if math.isfinite(derivada) else None
+
+def diferencia_central(funcion, x, h):
+    return (funcion(x + h) - funcion(x - h)) / (2 * h)
+
+def derivada_lateral(funcion, x, h=H_LATERAL):
+    """Diferencia hacia adelante (o hacia atrás) para x en el borde del dominio; None si ambas fallan"""
+    for paso in (h, -h):
+        try:
+            return (funcion(x + paso) - funcion(x)) / paso
+        except ERRORES_EVALUACION:
+            continue
+    return None
+
+def derivada_richardson(funcion, x, h=None, max_niveles=MAX_NIVELES_RICHARDSON):
+    """
+    Extrapolación de Richardson de diferencias centrales (tabla de Ridders): h se divide
+    entre 2 en cada nivel y la columna k de la tabla anula el término h^(2k).
+    Retorna (f'(x), evaluaciones); f'(x) es None si f no se puede evaluar alrededor de x.
+    """
+    h = H_INICIAL_RICHARDSON * max(1.0, abs(x)) if h is None else h
+    evaluaciones = 0
+    for _ in range(MAX_REDUCCIONES_DOMINIO):
+        evaluaciones += 2
+        try:
+            anterior = [diferencia_central(funcion, x, h)]
+            break
+        except ERRORES_EVALUACION:
+            h /= 10  # x ± h fuera del dominio (ej: ln(x) con x pequeño)
+    else:
+        return derivada_lateral(funcion, x), evaluaciones + 2
+
+    mejor, error_mejor = anterior[0], math.inf
+    for nivel in range(1, max_niveles):
+        h /= 2
+        evaluaciones += 2
+        try:
+            fila = [diferencia_central(funcion, x, h)]
+        except ERRORES_EVALUACION:
+            break
+        factor = 1.0
+        for k in range(1, nivel + 1):
+            factor *= 4
+            fila.append(fila[k - 1] + (fila[k - 1] - anterior[k - 1]) / (factor - 1))
+            error = max(abs(fila[k] - fila[k - 1]), abs(fila[k] - anterior[k - 1]))
+            if error <= error_mejor:
+                mejor, error_mejor = fila[k], error
+        if abs(fila[nivel] - anterior[nivel - 1]) >= 2 * error_mejor:
+            break  # El redondeo ya domina: niveles más finos solo empeoran
+        if error_mejor <= TOLERANCIA_RICHARDSON * max(1.0, abs(mejor)):
+            break
+        anterior = fila
+    return (mejor if math.isfinite(mejor) else None), evaluaciones
+
+def derivada_numerica(expresion, estrategia=DERIVADA_AUTOMATICA):
+    """
+    Callable x -> (f'(x), evaluaciones) para la ExpresionCompilada con la estrategia dada
+    ('auto': paso complejo si la expresión es analítica, Richardson si no).
+    Donde el paso complejo falla (ej: singularidad de f') se recurre a Richardson.
+    """
+    validar_estrategia(estrategia)
+    funcion = expresion.escalar
+    if estrategia == DERIVADA_RICHARDSON or (estrategia == DERIVADA_AUTOMATICA and not expresion.analitica):
+        return lambda x: derivada_richardson(funcion, x)
+    if not expresion.analitica:
+        raise ValueError("Error: El paso complejo requiere una expresión analítica (sin abs, floor ni ceil).")
+
+    funcion_compleja = expresion.compleja
+
+    def calcular(x):
+        derivada = derivada_paso_complejo(funcion_compleja, x)
+        if derivada is not None:
+            return derivada, 1
+        derivada, evaluaciones = derivada_richardson(funcion, x)
+        return derivada, evaluaciones + 1
+
+    return calcular
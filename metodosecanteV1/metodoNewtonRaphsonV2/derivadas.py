@@ -0,0 +1,233 @@
+"""
+Derivación simbólica sobre el árbol de sintaxis
+Produce el árbol de f'(x) para que Newton-Raphson evalúe f y f' en una sola llamada
+con precisión de máquina, sin diferencias finitas.
+"""
+
+from analizador import Numero, Constante, Variable, Unario, Binario, Llamada
+
+class NoDiferenciable(ValueError):
+    """La expresión contiene funciones sin derivada simbólica (floor, ceil)"""
+
+CERO = Numero(0.0)
+UNO = Numero(1.0)
+DOS = Numero(2.0)
+
+# ---------------------------------------------------------------------------
+# Constructores con simplificación básica (mantienen legible la derivada)
+# ---------------------------------------------------------------------------
+
+def es_numero(nodo, valor=None):
+    return isinstance(nodo, Numero) and (valor is None or nodo.valor == valor)
+
+def negativo(a):
+    if es_numero(a):
+        return Numero(-a.valor)
+    if isinstance(a, Unario) and a.op == '-':
+        return a.operando
+    # -(2*x) -> -2*x
+    if isinstance(a, Binario) and a.op == '*' and es_numero(a.izquierdo):
+        return producto(Numero(-a.izquierdo.valor), a.derecho)
+    return Unario('-', a)
+
+def suma(a, b):
+    if es_numero(a, 0):
+        return b
+    if es_numero(b, 0):
+        return a
+    if es_numero(a) and es_numero(b):
+        return Numero(a.valor + b.valor)
+    if isinstance(b, Unario) and b.op == '-':
+        return resta(a, b.operando)
+    return Binario('+', a, b)
+
+def resta(a, b):
+    if es_numero(b, 0):
+        return a
+    if es_numero(a, 0):
+        return negativo(b)
+    if es_numero(a) and es_numero(b):
+        return Numero(a.valor - b.valor)
+    if isinstance(b, Unario) and b.op == '-':
+        return suma(a, b.operando)
+    return Binario('-', a, b)
+
+def producto(a, b):
+    if es_numero(a, 0) or es_numero(b, 0):
+        return CERO
+    if es_numero(a, 1):
+        return b
+    if es_numero(b, 1):
+        return a
+    if es_numero(a, -1):
+        return negativo(b)
+    if es_numero(b, -1):
+        return negativo(a)
+    if es_numero(a) and es_numero(b):
+        return Numero(a.valor * b.valor)
+    # Sacar el signo hacia afuera: (-a)*b -> -(a*b)
+    if isinstance(a, Unario) and a.op == '-':
+        return negativo(producto(a.operando, b))
+    if isinstance(b, Unario) and b.op == '-':
+        return negativo(producto(a, b.operando))
+    # (a/b)*b -> a
+    if isinstance(a, Binario) and a.op == '/' and a.derecho == b:
+        return a.izquierdo
+    if isinstance(b, Binario) and b.op == '/' and b.derecho == a:
+        return b.izquierdo
+    # Números y constantes a la izquierda: x*3 -> 3*x, x*pi -> pi*x
+    if es_numero(b) and not es_numero(a):
+        return producto(b, a)
+    if isinstance(b, Constante) and tiene_variables(a):
+        return producto(b, a)
+    # Asociar a la izquierda: a*(b*c) -> a*b*c
+    if isinstance(b, Binario) and b.op == '*':
+        return producto(producto(a, b.izquierdo), b.derecho)
+    return Binario('*', a, b)
+
+def cociente(a, b):
+    if es_numero(a, 0):
+        return CERO
+    if es_numero(b, 1):
+        return a
+    if a == b:
+        return UNO
+    if isinstance(a, Unario) and a.op == '-':
+        return negativo(cociente(a.operando, b))
+    return Binario('/', a, b)
+
+def potencia(a, b):
+    if es_numero(b, 0):
+        return UNO
+    if es_numero(b, 1):
+        return a
+    return Binario('^', a, b)
+
+def llamada(nombre, *argumentos):
+    # ln(e) = 1 aparece al derivar e^x
+    if nombre == 'ln' and argumentos == (Constante('e'),):
+        return UNO
+    return Llamada(nombre, tuple(argumentos))
+
+def tiene_variables(nodo):
+    if isinstance(nodo, Variable):
+        return True
+    if isinstance(nodo, Unario):
+        return tiene_variables(nodo.operando)
+    if isinstance(nodo, Binario):
+        return tiene_variables(nodo.izquierdo) or tiene_variables(nodo.derecho)
+    if isinstance(nodo, Llamada):
+        return any(tiene_variables(a) for a in nodo.argumentos)
+    return False
+
+def depende_de(nodo, variable):
+    """True si el árbol contiene la variable"""
+    if isinstance(nodo, Variable):
+        return nodo.nombre == variable
+    if isinstance(nodo, Unario):
+        return depende_de(nodo.operando, variable)
+    if isinstance(nodo, Binario):
+        return depende_de(nodo.izquierdo, variable) or depende_de(nodo.derecho, variable)
+    if isinstance(nodo, Llamada):
+        return any(depende_de(a, variable) for a in nodo.argumentos)
+    return False
+
+# ---------------------------------------------------------------------------
+# Reglas de derivación
+# ---------------------------------------------------------------------------
+
+def derivada_externa(nombre, u, argumentos):
+    """f'(u) para cada función de una variable (regla de la cadena aparte)"""
+    if nombre == 'sin':
+        return llamada('cos', u)
+    if nombre == 'cos':
+        return negativo(llamada('sin', u))
+    if nombre == 'tan':
+        return potencia(llamada('sec', u), DOS)
+    if nombre == 'csc':
+        return negativo(producto(llamada('csc', u), llamada('cot', u)))
+    if nombre == 'sec':
+        return producto(llamada('sec', u), llamada('tan', u))
+    if nombre == 'cot':
+        return negativo(potencia(llamada('csc', u), DOS))
+    if nombre == 'asin':
+        return cociente(UNO, llamada('sqrt', resta(UNO, potencia(u, DOS))))
+    if nombre == 'acos':
+        return negativo(cociente(UNO, llamada('sqrt', resta(UNO, potencia(u, DOS)))))
+    if nombre == 'atan':
+        return cociente(UNO, suma(UNO, potencia(u, DOS)))
+    if nombre == 'sinh':
+        return llamada('cosh', u)
+    if nombre == 'cosh':
+        return llamada('sinh', u)
+    if nombre == 'tanh':
+        return resta(UNO, potencia(llamada('tanh', u), DOS))
+    if nombre == 'asinh':
+        return cociente(UNO, llamada('sqrt', suma(potencia(u, DOS), UNO)))
+    if nombre == 'acosh':
+        return cociente(UNO, llamada('sqrt', resta(potencia(u, DOS), UNO)))
+    if nombre == 'atanh':
+        return cociente(UNO, resta(UNO, potencia(u, DOS)))
+    if nombre == 'exp':
+        return llamada('exp', u)
+    if nombre == 'ln':
+        return cociente(UNO, u)
+    if nombre == 'log10':
+        return cociente(UNO, producto(u, llamada('ln', Numero(10.0))))
+    if nombre == 'log2':
+        return cociente(UNO, producto(u, llamada('ln', DOS)))
+    if nombre == 'sqrt':
+        return cociente(UNO, producto(DOS, llamada('sqrt', u)))
+    if nombre == 'cbrt':
+        return cociente(UNO, producto(Numero(3.0), potencia(llamada('cbrt', u), DOS)))
+    if nombre == 'abs':
+        return cociente(u, llamada('abs', u))
+    if nombre == 'logb':
+        # Base constante: 1/(u*ln(b))
+        return cociente(UNO, producto(u, llamada('ln', argumentos[1])))
+    if nombre == 'root':
+        # Índice constante: root(u,n)/(n*u)
+        return cociente(llamada('root', u, argumentos[1]), producto(argumentos[1], u))
+    raise NoDiferenciable(f"{nombre} no tiene derivada simbólica")
+
+def derivar(nodo, variable='x'):
+    """Árbol de la derivada de nodo respecto a variable"""
+    if isinstance(nodo, (Numero, Constante)):
+        return CERO
+    if isinstance(nodo, Variable):
+        return UNO if nodo.nombre == variable else CERO
+    if isinstance(nodo, Unario):
+        return negativo(derivar(nodo.operando, variable))
+    if isinstance(nodo, Binario):
+        u, v = nodo.izquierdo, nodo.derecho
+        if nodo.op == '+':
+            return suma(derivar(u, variable), derivar(v, variable))
+        if nodo.op == '-':
+            return resta(derivar(u, variable), derivar(v, variable))
+        if nodo.op == '*':
+            return suma(producto(derivar(u, variable), v), producto(u, derivar(v, variable)))
+        if nodo.op == '/':
+            dv = derivar(v, variable)
+            if es_numero(dv, 0):
+                return cociente(derivar(u, variable), v)
+            return cociente(resta(producto(derivar(u, variable), v), producto(u, dv)),
+                            potencia(v, DOS))
+        # Potencia u^v
+        if not depende_de(v, variable):
+            exponente = resta(v, UNO) if not es_numero(v) else Numero(v.valor - 1)
+            return producto(producto(v, potencia(u, exponente)), derivar(u, variable))
+        if not depende_de(u, variable):
+            return producto(producto(nodo, llamada('ln', u)), derivar(v, variable))
+        return producto(nodo, suma(producto(derivar(v, variable), llamada('ln', u)),
+                                   cociente(producto(v, derivar(u, variable)), u)))
+    if isinstance(nodo, Llamada):
+        u = nodo.argumentos[0]
+        if nodo.nombre == 'logb' and depende_de(nodo.argumentos[1], variable):
+            # Base variable: derivar ln(u)/ln(b)
+            return derivar(Binario('/', llamada('ln', u), llamada('ln', nodo.argumentos[1])),
+                           variable)
+        if nodo.nombre == 'root' and depende_de(nodo.argumentos[1], variable):
+            return derivar(Binario('^', u, Binario('/', UNO, nodo.argumentos[1])), variable)
+        # Regla de la cadena: u' * f'(u)
+        return producto(derivar(u, variable), derivada_externa(nodo.nombre, u, nodo.argumentos))
+    raise NoDiferenciable(f"Nodo desconocido: {nodo!r}")
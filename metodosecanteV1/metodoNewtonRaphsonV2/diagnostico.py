@@ -0,0 +1,158 @@
+"""
+Diagnóstico de iteraciones que no convergen
+MonitorConvergencia observa cada iterado y detecta, con costo O(1) por paso y sin guardar
+el historial:
+- ciclos: cada iterado se redondea a una clave hashable (clave_iterado) y se compara con un
+  punto de control que se renueva cuando la distancia recorrida llega a una potencia de dos
+  (algoritmo de Brent); un ciclo de longitud L se detecta a lo sumo ~2·(inicio + L) pasos
+  después de empezar
+- divergencia: iterado no finito o enorme, pasos que crecen VENTANA_DIVERGENCIA veces seguidas
+  mientras |f| también crece, o deriva: |x| que crece VENTANA_DERIVA veces seguidas con pasos
+  que no se achican y sin que |f| disminuya. Si |f| baja en cada paso no hay deriva: Newton
+  puede estar acercándose a una raíz lejana (ej: ln(x) - 20 desde x0 = 1, con pasos cada vez
+  más largos hasta x = 4.85e8). Ambas exigen además que |f| / |x| baje (RAZON_SUBLINEAL): con
+  |f| ~ |x| (cos(x) - x desde -5 llega a 6.8e7 en 11 pasos crecientes) Newton vuelve y converge
+- estancamiento: en ventanas de VENTANA_ESTANCAMIENTO iteraciones, el mínimo de |f| no baja
+  a MEJORA_ESTANCAMIENTO veces el de la ventana anterior, el paso más corto no se achica
+  (RAZON_ESTANCAMIENTO) y los iterados no salen de una banda de ancho relativo
+  BANDA_ESTANCAMIENTO. Comparar con el mínimo histórico detenía corridas que convergen
+  tras salir lejos (x^10 - 1 desde 0.2: |f| ~ 1e87 y 120 pasos de bajada hasta volver a
+  |f(x0)|) o tras vagar con pasos largos (cos(x) - x desde -3 converge en la iteración 126)
+El motivo se reporta con uno de los códigos ESTADO_* (los mismos de los carriles de
+ejecutar_newton_multiarranque).
+"""
+
+import math
+
+# Estado final de una ejecución o de un carril
+ESTADO_CONVERGIO = 'convergio'
+ESTADO_MAX_ITER = 'max_iter'
+ESTADO_DERIVADA_CERO = 'derivada_cero'
+ESTADO_FUERA_DE_DOMINIO = 'fuera_de_dominio'
+ESTADO_DIVERGIO = 'divergio'
+ESTADO_CICLO = 'ciclo'
+ESTADO_ESTANCADO = 'estancado'
+ESTADO_CANCELADO = 'cancelado'
+
+# Descripciones para el usuario (interfaz y línea de comandos)
+DESCRIPCIONES_ESTADO = {
+    ESTADO_CONVERGIO: "convergió",
+    ESTADO_MAX_ITER: "máximo de iteraciones alcanzado",
+    ESTADO_DIVERGIO: "los iterados divergen",
+    ESTADO_CICLO: "los iterados entraron en un ciclo",
+    ESTADO_ESTANCADO: "|f(x)| dejó de disminuir (estancamiento)",
+    ESTADO_CANCELADO: "cálculo cancelado",
+}
+
+BITS_CICLO = 32  # Bits de mantisa que se conservan al redondear un iterado (~9.6 dígitos)
+LIMITE_DIVERGENCIA = 1e150
+VENTANA_DIVERGENCIA = 4
+# |f| / |x| debe bajar al menos a esta fracción en cada paso que cuenta como divergencia o deriva
+RAZON_SUBLINEAL = 0.9
+VENTANA_DERIVA = 8
+RAZON_DERIVA = 0.9  # Cociente mínimo entre pasos consecutivos para contar como deriva
+VENTANA_ESTANCAMIENTO = 30
+MEJORA_ESTANCAMIENTO = 0.5  # El mínimo de |f| de una ventana debe bajar al menos a la mitad
+RAZON_ESTANCAMIENTO = 0.5   # Los pasos no se achican: el más corto de la ventana no baja de esta fracción del anterior
+BANDA_ESTANCAMIENTO = 0.1   # Ancho de los iterados de la ventana, en unidades de max(1, |x|)
+
+def clave_iterado(x):
+    """Clave hashable de x redondeado a BITS_CICLO bits de mantisa (iterados casi iguales -> misma clave)"""
+    mantisa, exponente = math.frexp(x)
+    return round(mantisa * (1 << BITS_CICLO)), exponente
+
+class MonitorConvergencia:
+    """
+    Detector de ciclos, divergencia y estancamiento; observar(xn, fxn) se llama con cada
+    iterado nuevo y retorna el código ESTADO_* si hay que detener la iteración (None si no).
+    Tras la detención, mejor_x / mejor_f guardan el iterado con menor |f| y longitud_ciclo
+    la longitud del ciclo encontrado.
+    """
+    __slots__ = ('_control', '_potencia', '_longitud', '_paso_anterior', '_x_anterior',
+                 '_f_anterior', '_crecientes', '_deriva', '_ventana', '_anterior', 'mejor_x', 'mejor_f',
+                 'longitud_ciclo')
+
+    def __init__(self):
+        self._control = None   # Clave del punto de control (Brent)
+        self._potencia = 1
+        self._longitud = 0     # Pasos desde el punto de control
+        self._paso_anterior = math.inf
+        self._x_anterior = None
+        self._f_anterior = math.inf
+        self._crecientes = 0   # Pasos seguidos más largos que el anterior, con |f| creciente
+        self._deriva = 0       # Pasos seguidos que alejan |x| sin achicarse ni bajar |f|
+        self._ventana = None   # [iterados, mínimo |f|, paso mínimo, x mínimo, x máximo] de la ventana actual
+        self._anterior = None  # (mínimo |f|, paso mínimo) de la ventana anterior
+        self.mejor_x = None
+        self.mejor_f = math.inf
+        self.longitud_ciclo = 0
+
+    def observar(self, xn, fxn):
+        """Registra el iterado xn (con f(xn)); retorna el motivo de detención o None"""
+        f_abs = abs(fxn)
+        if f_abs < self.mejor_f:
+            self.mejor_x, self.mejor_f = xn, f_abs
+
+        if not abs(xn) < LIMITE_DIVERGENCIA:
+            return ESTADO_DIVERGIO  # También NaN e infinito
+        if self._x_anterior is not None:
+            paso = abs(xn - self._x_anterior)
+            if self._estancado(xn, f_abs, paso):
+                return ESTADO_ESTANCADO
+            # Newton solo diverge donde |f| crece más lento que |x| (atan, cbrt); si crece como |x|
+            # (cos(x) - x, sin(x) - x/2) los saltos largos son parte de un recorrido que vuelve
+            sublineal = f_abs * abs(self._x_anterior) <= RAZON_SUBLINEAL * self._f_anterior * abs(xn)
+            if paso > self._paso_anterior and f_abs > self._f_anterior and sublineal:
+                self._crecientes += 1
+                if self._crecientes >= VENTANA_DIVERGENCIA:
+                    return ESTADO_DIVERGIO
+            else:
+                self._crecientes = 0
+            if (paso >= RAZON_DERIVA * self._paso_anterior and abs(xn) > abs(self._x_anterior)
+                    and f_abs >= self._f_anterior and sublineal):
+                self._deriva += 1
+                if self._deriva >= VENTANA_DERIVA:
+                    return ESTADO_DIVERGIO
+            else:
+                self._deriva = 0
+            self._paso_anterior = paso
+        self._x_anterior, self._f_anterior = xn, f_abs
+
+        # Brent: comparar con el punto de control; moverlo a xn cada potencia de dos pasos
+        clave = clave_iterado(xn)
+        self._longitud += 1
+        if clave == self._control:
+            self.longitud_ciclo = self._longitud
+            return ESTADO_CICLO
+        if self._longitud == self._potencia:
+            self._control = clave
+            self._potencia *= 2
+            self._longitud = 0
+        return None
+
+    def _estancado(self, xn, f_abs, paso):
+        """Acumula la ventana actual; al completarla, True si no hubo progreso respecto de la anterior"""
+        ventana = self._ventana
+        if ventana is None:
+            self._ventana = [1, f_abs, paso, xn, xn]
+            return False
+        ventana[0] += 1
+        ventana[1] = min(ventana[1], f_abs)
+        ventana[2] = min(ventana[2], paso)
+        ventana[3] = min(ventana[3], xn)
+        ventana[4] = max(ventana[4], xn)
+        if ventana[0] < VENTANA_ESTANCAMIENTO:
+            return False
+        iterados, f_minimo, paso_minimo, x_minimo, x_maximo = ventana
+        anterior, self._anterior, self._ventana = self._anterior, (f_minimo, paso_minimo), None
+        return (anterior is not None
+                and f_minimo >= MEJORA_ESTANCAMIENTO * anterior[0]
+                and paso_minimo >= RAZON_ESTANCAMIENTO * anterior[1]
+                and x_maximo - x_minimo <= BANDA_ESTANCAMIENTO * max(1.0, abs(xn)))
+
+def describir_estado(estado, monitor=None):
+    """Texto del motivo de detención (con la longitud del ciclo si el monitor la tiene)"""
+    texto = DESCRIPCIONES_ESTADO.get(estado, estado)
+    if estado == ESTADO_CICLO and monitor is not None:
+        texto += f" de longitud {monitor.longitud_ciclo}"
+    return texto
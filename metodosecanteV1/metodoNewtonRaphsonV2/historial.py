@@ -0,0 +1,213 @@
+"""
+Historial de iteraciones en columnas
+En lugar de un dict por iteración, cada campo ('xn', 'fxn', ...) es una columna NumPy
+que crece al doble cuando se llena (crecimiento amortizado): 8 bytes por valor numérico
+en vez de un dict y un float de Python por campo. Cada fila se lee como un mapeo
+(FilaIteracion), así que la tabla y el panel de pasos siguen usando data['xn'].
+"""
+
+from collections.abc import Mapping, Sequence
+from operator import itemgetter
+import numpy as np
+
+CAPACIDAD_INICIAL = 16
+
+# Campos enteros conocidos; el resto de los números se guarda como float64 (ej: xn = 1 en la primera fila)
+CAMPOS_ENTEROS = {'iteracion', 'precision', 'factor'}
+
+def tipo_columna(clave, valor):
+    """dtype de la columna según el campo y su primer valor: entero, float o cualquier objeto (None, texto)"""
+    if clave in CAMPOS_ENTEROS and type(valor) is int:
+        return np.int64
+    if isinstance(valor, (int, float)) and not isinstance(valor, bool):
+        return np.float64
+    return object
+
+def valor_vacio(dtype):
+    """Valor de relleno de las filas que no traen el campo"""
+    if dtype == np.float64:
+        return np.nan
+    return 0 if dtype == np.int64 else None
+
+class FilaIteracion(Mapping):
+    """Vista de una fila del historial; se lee como el dict de la iteración"""
+    __slots__ = ('_historial', '_indice')
+
+    def __init__(self, historial, indice):
+        self._historial = historial
+        self._indice = indice
+
+    def __getitem__(self, clave):
+        # item() retorna el valor como tipo de Python (int, float u objeto)
+        return self._historial._columnas[clave].item(self._indice)
+
+    def __iter__(self):
+        return iter(self._historial._columnas)
+
+    def __len__(self):
+        return len(self._historial._columnas)
+
+    def __repr__(self):
+        return f"FilaIteracion({dict(self)!r})"
+
+class HistorialIteraciones(Sequence):
+    """
+    Secuencia de iteraciones almacenada por columnas.
+    agregar(registro) añade un dict de iteración; historial[i] es una FilaIteracion y
+    columna(nombre) / columnas() exportan las columnas como vistas NumPy (sin copia).
+    """
+
+    def __init__(self, registros=(), capacidad=CAPACIDAD_INICIAL):
+        self._columnas = {}  # nombre -> arreglo de longitud self._capacidad
+        self._capacidad = max(capacidad, 1)
+        self._tamano = 0
+        # Vía rápida: campos de la última fila (en orden) y sus columnas, si cubren todas
+        self._claves = None
+        self._orden = ()
+        for registro in registros:
+            self.agregar(registro)
+
+    @classmethod
+    def desde_registros(cls, registros):
+        """
+        Construye el historial de una lista ya completa de dicts: cada columna se arma de una
+        vez con numpy.array (más rápido que agregar fila por fila)
+        """
+        historial = cls(capacidad=len(registros))
+        # Campos en orden de aparición (casi siempre todos están en la primera fila)
+        campos = dict.fromkeys(registros[0]) if registros else {}
+        todas = None
+        if not set().union(*registros) - campos.keys():
+            try:
+                # Mismos campos en todas las filas: cada columna se extrae en C con map(itemgetter)
+                todas = [list(map(itemgetter(clave), registros)) for clave in campos]
+            except KeyError:
+                pass  # Alguna fila sin todos los campos
+        if todas is None:
+            for registro in registros:
+                campos.update(dict.fromkeys(registro))
+            todas = ([registro.get(clave) for registro in registros] for clave in campos)
+        for clave, valores in zip(campos, todas):
+            primero = next((v for v in valores if v is not None), None)
+            dtype = tipo_columna(clave, primero)
+            try:
+                columna = np.array(valores, dtype=dtype)
+            except (TypeError, ValueError):
+                columna = None
+            if dtype is np.float64 and columna is not None and np.isnan(columna).any() and None in valores:
+                columna = None  # numpy convierte None en NaN: conservar el None
+            if columna is None or (dtype is np.int64 and not all(type(v) is int for v in valores)):
+                # None (campo ausente en algunas filas) o texto mezclado con números: columna de objetos
+                columna = np.empty(len(valores), dtype=object)
+                columna[:] = valores
+            historial._columnas[clave] = columna
+        historial._tamano = len(registros)
+        historial._capacidad = max(len(registros), 1)
+        return historial
+
+    def _nueva_columna(self, clave, valor):
+        dtype = tipo_columna(clave, valor)
+        columna = np.empty(self._capacidad, dtype=dtype)
+        columna[:self._tamano] = valor_vacio(dtype)
+        self._columnas[clave] = columna
+        return columna
+
+    def _ensanchar(self, clave, valor):
+        """Convierte la columna a un dtype que admita el valor (entero -> float -> objeto)"""
+        columna = self._columnas[clave]
+        dtype = np.float64 if columna.dtype == np.int64 and isinstance(valor, float) else object
+        self._columnas[clave] = columna = columna.astype(dtype)
+        return columna
+
+    def _crecer(self):
+        """Duplica la capacidad; las vistas exportadas antes siguen siendo válidas (copias del estado previo)"""
+        self._capacidad *= 2
+        for clave, columna in self._columnas.items():
+            nueva = np.empty(self._capacidad, dtype=columna.dtype)
+            nueva[:self._tamano] = columna[:self._tamano]
+            self._columnas[clave] = nueva
+        self._claves = None
+
+    def agregar(self, registro):
+        """Añade una iteración (dict campo -> valor)"""
+        indice = self._tamano
+        if indice == self._capacidad:
+            self._crecer()
+        claves = tuple(registro)
+        if claves == self._claves:
+            # Mismos campos que la fila anterior: asignación directa en las columnas
+            try:
+                for columna, valor in zip(self._orden, registro.values()):
+                    columna[indice] = valor
+                self._tamano = indice + 1
+                return
+            except (TypeError, ValueError):
+                pass  # Valor no numérico en una columna numérica: la vía general ensancha la columna
+        self._agregar_general(registro, indice)
+        self._tamano = indice + 1
+        if len(claves) == len(self._columnas):
+            self._claves = claves
+            self._orden = tuple(self._columnas[clave] for clave in claves)
+        else:
+            self._claves = None
+
+    def _agregar_general(self, registro, indice):
+        """Campo por campo: crea columnas nuevas, ensancha dtypes y rellena los campos ausentes"""
+        columnas = self._columnas
+        for clave, valor in registro.items():
+            columna = columnas.get(clave)
+            if columna is None:
+                columna = self._nueva_columna(clave, valor)
+            elif columna.dtype == np.int64 and type(valor) is not int:
+                columna = self._ensanchar(clave, valor)
+            try:
+                columna[indice] = valor
+            except (TypeError, ValueError):
+                # Ej: 'a' = None en una columna float, o un texto
+                self._ensanchar(clave, valor)[indice] = valor
+        if len(registro) != len(columnas):
+            for clave, columna in columnas.items():
+                if clave not in registro:
+                    columna[indice] = valor_vacio(columna.dtype)
+
+    def __len__(self):
+        return self._tamano
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [FilaIteracion(self, i) for i in range(*indice.indices(self._tamano))]
+        if indice < 0:
+            indice += self._tamano
+        if not 0 <= indice < self._tamano:
+            raise IndexError("índice de iteración fuera de rango")
+        return FilaIteracion(self, indice)
+
+    def __repr__(self):
+        return f"HistorialIteraciones({self._tamano} iteraciones, campos={list(self._columnas)})"
+
+    def campos(self):
+        return list(self._columnas)
+
+    def columna(self, nombre):
+        """Vista NumPy (sin copia) de la columna con las iteraciones registradas"""
+        return self._columnas[nombre][:self._tamano]
+
+    def columnas(self):
+        """Todas las columnas como vistas NumPy (sin copia): nombre -> arreglo"""
+        return {nombre: columna[:self._tamano] for nombre, columna in self._columnas.items()}
+
+    def a_dicts(self):
+        """Lista de dicts (el formato anterior de iteraciones_data)"""
+        return [dict(fila) for fila in self]
+
+    def __getstate__(self):
+        # Al serializar (lote en varios procesos) solo viajan las filas usadas, no la capacidad libre
+        return {'columnas': self.columnas(), 'tamano': self._tamano}
+
+    def __setstate__(self, estado):
+        self._tamano = estado['tamano']
+        self._capacidad = max(self._tamano, 1)
+        self._columnas = {clave: columna if len(columna) else np.empty(1, dtype=columna.dtype)
+                          for clave, columna in estado['columnas'].items()}
+        self._claves = None
+        self._orden = ()
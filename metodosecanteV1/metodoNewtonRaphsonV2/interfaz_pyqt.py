@@ -5,6 +5,7 @@ Diseño inspirado en Microsoft Mathematics
 """
 
 import sys
+import time
 from PyQt5.QtWidgets import *
 from PyQt5.QtCore import *
 from PyQt5.QtGui import *
@@ -13,15 +14,57 @@ matplotlib.use('Qt5Agg')
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 import numpy as np
-from matematicas import validar_ecuacion, preprocesar_funcion, evaluar_funcion
-from metodo_newton_raphson import ejecutar_metodo_newton_raphson
+from matematicas import validar_ecuacion, obtener_expresion
+from intervalos import regiones_con_raiz, acotar_rango
+from raices import raices_en_malla
+from solucionadores import METODOS, METODO_AUTOMATICO, METODO_POR_DEFECTO, obtener_metodo, iterar_solucion
+from iteraciones import Cancelacion, recolectar_iteraciones
+from cuencas import ejecutar_cuencas
+
+# Nombres legibles de los pasos de respaldo (métodos protegido y Brent)
+NOMBRES_PASO = {
+    'illinois': 'Illinois',
+    'biseccion': 'bisección',
+    'secante': 'secante',
+    'interpolacion': 'interpolación cuadrática inversa',
+}
+
+# Con más raíces que esto en el gráfico solo se dibujan los marcadores (sin etiquetas)
+MAX_ETIQUETAS_RAICES = 10
+
+# Segundos entre actualizaciones del diálogo de progreso mientras se itera
+INTERVALO_PROGRESO = 0.05
+
+# Cuencas de atracción: puntos por eje como máximo y tope de iteraciones por punto
+MAX_RESOLUCION_CUENCAS = 600
+MAX_ITER_CUENCAS = 100
+
+def diagnostico_resultado(result):
+    """
+    (título, sugerencia) de un resultado sin convergencia: el motivo de la detención
+    (ciclo, divergencia, estancamiento o máximo de iteraciones) y el x0 sugerido para
+    reintentar ("" si el método no lo da)
+    """
+    motivo = result.get('diagnostico') or "máximo de iteraciones alcanzado"
+    sugerencia = ""
+    if result.get('reinicio') is not None:
+        sugerencia = f"Sugerencia: reintentar desde x0 = {result['reinicio']:.6g}"
+    return motivo[0].upper() + motivo[1:], sugerencia
+
+def nombres_metodo(clave):
+    """(nombre, título) del método, incluida la selección automática"""
+    if clave == METODO_AUTOMATICO:
+        return "Automático", "Selección automática de método"
+    info_metodo = obtener_metodo(clave)
+    return info_metodo['nombre'], info_metodo['titulo']
 
 class IterationsTableDialog(QDialog):
     """Ventana emergente para mostrar la tabla de iteraciones"""
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, metodo='newton'):
         super().__init__(parent)
-        self.setWindowTitle("Tabla de Iteraciones - Método de Newton-Raphson")
+        info_metodo = obtener_metodo(metodo)
+        self.setWindowTitle(f"Tabla de Iteraciones - {info_metodo['titulo']}")
         self.setModal(True)
         self.resize(800, 400)
         
@@ -30,7 +73,9 @@ class IterationsTableDialog(QDialog):
         # Tabla de iteraciones
         self.table = QTableWidget()
         self.table.setColumnCount(6)
-        self.table.setHorizontalHeaderLabels(["Iter", "xn", "f(xn)", "f'(xn)", "xn+1", "Error"])
+        # La secante aproxima f'(xn) con la pendiente entre xn-1 y xn
+        columna_pendiente = "f'(xn)" if info_metodo['usa_derivada'] else "Pendiente"
+        self.table.setHorizontalHeaderLabels(["Iter", "xn", "f(xn)", columna_pendiente, "xn+1", "Error"])
         self.table.setFont(QFont("Consolas", 10))
         self.table.setStyleSheet("""
             QTableWidget {
@@ -89,7 +134,10 @@ class MathCanvas(FigureCanvas):
         # Variables para pan (arrastrar) y zoom por selección
         self.press = None
         self.current_func = None
+        self.current_func_vectorized = None  # Función vectorizada para redibujado
+        self.current_expression = None  # ExpresionCompilada (búsqueda de raíces)
         self.root_positions = []  # Almacenar posiciones de raíces
+        self.basins_complex = None  # Con cuencas en pantalla: True en el plano, False en la recta real
         self.tooltip_annotation = None
         self.alt_pressed = False  # Estado de la tecla ALT
         self.ctrl_pressed = False  # Estado de la tecla CTRL para zoom por selección
@@ -274,6 +322,8 @@ class MathCanvas(FigureCanvas):
         """Extiende la función si el pan se sale del rango calculado"""
         if not hasattr(self, 'current_func') or not self.current_func:
             return
+        if self.current_func_vectorized is None:
+            return
         
         # Obtener rango actual de la función
         function_line = None
@@ -315,23 +365,15 @@ class MathCanvas(FigureCanvas):
             try:
                 num_points = len(current_x)
                 x_new = np.linspace(new_calc_min, new_calc_max, num_points)
-                y_new = []
-                
-                for xi in x_new:
-                    try:
-                        yi = evaluar_funcion(self.current_func, xi)
-                        if abs(yi) < 1e8:
-                            y_new.append(yi)
-                        else:
-                            y_new.append(np.nan)
-                    except:
-                        y_new.append(np.nan)
+                # Una sola pasada vectorizada sobre toda la malla
+                y_new = self.current_func_vectorized(x_new)
+                y_new[np.abs(y_new) >= 1e8] = np.nan
                 
                 # Actualizar la línea de la función
                 function_line.set_data(x_new, y_new)
                 
                 # Actualizar raíces para tooltips
-                self.detect_roots_for_tooltips(x_new, np.array(y_new))
+                self.detect_roots_for_tooltips(x_new, y_new)
                 
             except Exception:
                 pass  # Ignorar errores de extensión
@@ -432,18 +474,15 @@ class MathCanvas(FigureCanvas):
                 self.draw_idle()
     
     def detect_roots_for_tooltips(self, x, y):
-        """Detecta raíces para tooltips sin marcarlas visualmente"""
-        crossings = []
-        
-        for i in range(1, len(y)):
-            if not (np.isnan(y[i-1]) or np.isnan(y[i])):
-                if y[i-1] * y[i] < 0:  # Cambio de signo
-                    # Interpolación lineal para encontrar el cruce
-                    x_cross = x[i-1] - y[i-1] * (x[i] - x[i-1]) / (y[i] - y[i-1])
-                    crossings.append(x_cross)
-        
-        # Guardar todas las raíces para tooltips
-        self.root_positions = crossings[:10]  # Hasta 10 raíces
+        """
+        Detecta raíces para tooltips sin marcarlas visualmente.
+        Parte de la malla ya evaluada y pule cada candidata a precisión completa
+        (incluye raíces dobles sin cambio de signo; descarta polos y saltos).
+        """
+        if self.current_expression is None:
+            self.root_positions = []
+            return
+        self.root_positions = raices_en_malla(self.current_expression, x, y)
         
     def plot_function(self, func_str, x_range=(-10, 10), interval=None, show_roots=False):
         """Grafica una función matemática con rango inteligente"""
@@ -454,7 +493,9 @@ class MathCanvas(FigureCanvas):
         try:
             # Guardar función original para detección
             self.original_func_str = func_str
-            func_str_proc = preprocesar_funcion(func_str)
+            # Expresión analizada/compilada desde el caché (ya la analizó validar_ecuacion)
+            expresion = obtener_expresion(func_str)
+            func_str_proc = expresion.texto
             
             if interval:
                 a, b = interval
@@ -468,31 +509,20 @@ class MathCanvas(FigureCanvas):
             num_points = 1500
             x = np.linspace(x_min, x_max, num_points)
             
-            # Guardar función actual para redibujado
+            # Guardar función actual (y vectorizada) para redibujado
+            self.basins_complex = None
             self.current_func = func_str_proc
-            y = []
+            self.current_func_vectorized = expresion.vectorizada
+            self.current_expression = expresion
             
             # Detectar si es función con crecimiento extremo (como x^x^e)
             has_extreme_growth = any(pattern in func_str_proc for pattern in ['^x', '**x', 'x^x', 'x**x'])
             
-            for xi in x:
-                try:
-                    yi = evaluar_funcion(func_str_proc, xi)
-                    # Limitar valores extremos más agresivamente para funciones con crecimiento extremo
-                    if has_extreme_growth:
-                        if abs(yi) < 1e6:  # Límite más bajo para funciones extremas
-                            y.append(yi)
-                        else:
-                            y.append(np.nan)
-                    else:
-                        if abs(yi) < 1e8:  # Filtrar valores extremos
-                            y.append(yi)
-                        else:
-                            y.append(np.nan)
-                except:
-                    y.append(np.nan)
-            
-            y = np.array(y)
+            # Evaluar toda la malla en una sola pasada (NaN donde el dominio es inválido)
+            y = self.current_func_vectorized(x)
+            # Limitar valores extremos más agresivamente para funciones con crecimiento extremo
+            y_limit = 1e6 if has_extreme_growth else 1e8
+            y[np.abs(y) >= y_limit] = np.nan
             
             # Configurar límites Y inteligentes
             valid_y = y[~np.isnan(y)]
@@ -613,7 +643,7 @@ class MathCanvas(FigureCanvas):
             
             # Solo marcar raíces si se solicita explícitamente
             if show_roots:
-                self.mark_zero_crossings(x, y, interval)
+                self.mark_zero_crossings(interval)
             
             
             # Asegurar que siempre se vean los ejes del sistema cartesiano en X
@@ -656,6 +686,64 @@ class MathCanvas(FigureCanvas):
                         ha='center', va='center', fontsize=12, color='red')
             self.draw_idle()
     
+    def plot_basins(self, func_str, result):
+        """
+        Dibuja las cuencas de atracción de Newton (resultado de ejecutar_cuencas) como imagen:
+        un color por raíz, más oscuro cuantas más iteraciones, negro donde no converge
+        """
+        self.ax.clear()
+        self.ax.set_facecolor('#fafafa')
+        
+        # Sin curva: el pan y el zoom no redibujan ninguna función
+        self.current_func = None
+        self.current_func_vectorized = None
+        self.current_expression = None
+        self.root_positions = []
+        self.basins_complex = result['complejo']
+        
+        raices = result['raices']
+        indices = result['indices']
+        iteraciones = result['iteraciones']
+        x_min, x_max, y_min, y_max = result['extension']
+        
+        paleta_base = matplotlib.colormaps['tab10' if len(raices) <= 10 else 'tab20']
+        paleta = np.array([paleta_base(k % paleta_base.N)[:3] for k in range(max(1, len(raices)))])
+        brillo = 1 - 0.7 * np.log1p(iteraciones) / np.log1p(max(1, int(iteraciones.max())))
+        imagen = paleta[np.maximum(indices, 0)] * brillo[..., None]
+        imagen[indices < 0] = 0.0
+        
+        if self.basins_complex:
+            self.ax.imshow(imagen, extent=(x_min, x_max, y_min, y_max), origin='lower',
+                           interpolation='nearest', aspect='equal')
+            puntos = [(raiz.real, raiz.imag) for raiz in raices]
+            self.ax.set_xlabel('Re(x0)', fontsize=11)
+            self.ax.set_ylabel('Im(x0)', fontsize=11)
+        else:
+            # Recta real: una franja de un punto de alto
+            self.ax.imshow(imagen, extent=(x_min, x_max, -0.5, 0.5), origin='lower',
+                           interpolation='nearest', aspect='auto')
+            puntos = [(raiz, 0.0) for raiz in raices]
+            self.ax.set_yticks([])
+            self.ax.set_xlabel('x0', fontsize=11)
+        
+        # Marcar las raíces (solo las que caen dentro de la imagen)
+        y_bajo, y_alto = (y_min, y_max) if self.basins_complex else (-0.5, 0.5)
+        visibles = [(x, y) for x, y in puntos if x_min <= x <= x_max and y_bajo <= y <= y_alto]
+        if visibles:
+            xs, ys = zip(*visibles)
+            self.ax.plot(xs, ys, 'o', color='white', markeredgecolor='black', markersize=7, zorder=5)
+            if len(visibles) <= MAX_ETIQUETAS_RAICES:
+                for x, y in visibles:
+                    texto = f'{x:.4g}' if y == 0 else f'{x:.4g}{y:+.4g}i'
+                    self.ax.annotate(texto, (x, y), xytext=(6, 6), textcoords='offset points', fontsize=9,
+                                     bbox=dict(boxstyle='round,pad=0.2', facecolor='white', alpha=0.8))
+        
+        self.ax.set_xlim(x_min, x_max)
+        if self.basins_complex:
+            self.ax.set_ylim(y_min, y_max)
+        self.ax.set_title(f'Cuencas de Newton: f(x) = {func_str}', fontsize=12, pad=15)
+        self.draw_idle()
+    
     def find_optimal_range(self, func_str_proc):
         """Encuentra el rango óptimo para mostrar la función"""
         from matematicas import preprocesar_funcion
@@ -677,67 +765,51 @@ class MathCanvas(FigureCanvas):
         
         best_range = (-5, 5)
         max_score = 0
-        y_limit = 1e6 if has_extreme_growth else 1e8
+        try:
+            arbol = obtener_expresion(func_str_proc).arbol
+        except ValueError:
+            return best_range
         
         for x_min, x_max in test_ranges:
-            x_test = np.linspace(x_min, x_max, 200)
-            y_test = []
-            crossings = 0
-            variation = 0
+            # Cota garantizada del rango Y (None: f no está definida en el rango)
+            y_bounds = acotar_rango(arbol, x_min, x_max)
+            if y_bounds is None:
+                continue
             
-            for xi in x_test:
-                try:
-                    yi = evaluar_funcion(func_str_proc, xi)
-                    if abs(yi) < y_limit:
-                        y_test.append(yi)
-                    else:
-                        y_test.append(np.nan)
-                except:
-                    y_test.append(np.nan)
+            # Regiones que pueden contener raíces; el resto está descartado con garantía
+            crossings = len(regiones_con_raiz(arbol, x_min, x_max))
+            variation = y_bounds[1] - y_bounds[0]
             
-            valid_y = [y for y in y_test if not np.isnan(y)]
-            if len(valid_y) > 10:
-                for i in range(1, len(y_test)):
-                    if not (np.isnan(y_test[i-1]) or np.isnan(y_test[i])):
-                        if y_test[i-1] * y_test[i] < 0:
-                            crossings += 1
-                
-                if len(valid_y) > 1:
-                    variation = np.std(valid_y)
-                
-                score = crossings * 100 + min(variation, 50)
-                
-                if score > max_score:
-                    max_score = score
-                    best_range = (x_min, x_max)
+            score = crossings * 100 + min(variation, 50)
+            
+            if score > max_score:
+                max_score = score
+                best_range = (x_min, x_max)
         
         return best_range
     
-    def mark_zero_crossings(self, x, y, interval=None):
-        """Marca las intersecciones aproximadas con el eje X"""
-        crossings = []
-        
-        for i in range(1, len(y)):
-            if not (np.isnan(y[i-1]) or np.isnan(y[i])):
-                if y[i-1] * y[i] < 0:  # Cambio de signo
-                    # Interpolación lineal para encontrar el cruce
-                    x_cross = x[i-1] - y[i-1] * (x[i] - x[i-1]) / (y[i] - y[i-1])
-                    
-                    # Si hay intervalo especificado, solo mostrar raíces dentro del intervalo
-                    if interval is None or (interval[0] <= x_cross <= interval[1]):
-                        crossings.append(x_cross)
+    def mark_zero_crossings(self, interval=None):
+        """Marca las raíces detectadas (detect_roots_for_tooltips) sobre el eje X"""
+        crossings = self.root_positions
+        
+        # Si hay intervalo especificado, solo mostrar raíces dentro del intervalo
+        if interval is not None:
+            crossings = [x_cross for x_cross in crossings if interval[0] <= x_cross <= interval[1]]
         
         # Guardar posiciones para tooltips
-        self.root_positions = crossings[:5]
-        
-        # Marcar hasta 5 cruces para no saturar el gráfico
-        for i, x_cross in enumerate(crossings[:5]):
-            self.ax.plot(x_cross, 0, 'go', markersize=6, 
-                        label=f'Raíz ≈ {x_cross:.3f}' if i == 0 else '')
-            self.ax.annotate(f'{x_cross:.3f}', (x_cross, 0), 
-                           xytext=(5, 10), textcoords='offset points',
-                           fontsize=9, color='green',
-                           bbox=dict(boxstyle='round,pad=0.2', facecolor='white', alpha=0.7))
+        self.root_positions = crossings
+        if not crossings:
+            return
+        
+        # Todos los marcadores en una sola línea; etiquetas solo si no saturan el gráfico
+        self.ax.plot(crossings, np.zeros(len(crossings)), 'go', markersize=6,
+                    label=f'Raíz ≈ {crossings[0]:.3f}')
+        if len(crossings) <= MAX_ETIQUETAS_RAICES:
+            for x_cross in crossings:
+                self.ax.annotate(f'{x_cross:.3f}', (x_cross, 0), 
+                               xytext=(5, 10), textcoords='offset points',
+                               fontsize=9, color='green',
+                               bbox=dict(boxstyle='round,pad=0.2', facecolor='white', alpha=0.7))
     
     def mark_root(self, root_x):
         """Marca la raíz en el gráfico"""
@@ -872,6 +944,7 @@ class InterfazReglaFalsaPyQt(QMainWindow):
     def __init__(self):
         super().__init__()
         self.iterations_data = []  # Almacenar datos de iteraciones
+        self.current_method = None  # Método usado en el último cálculo
         self.init_ui()
         self.setup_connections()
         
@@ -1035,6 +1108,20 @@ class InterfazReglaFalsaPyQt(QMainWindow):
         params_group = QGroupBox("Parámetros del Método")
         params_layout = QFormLayout(params_group)
         
+        # Método de solución
+        self.method_combo = QComboBox()
+        self.method_combo.addItem(nombres_metodo(METODO_AUTOMATICO)[0], METODO_AUTOMATICO)
+        for clave, info_metodo in METODOS.items():
+            self.method_combo.addItem(info_metodo['nombre'], clave)
+        self.method_combo.setCurrentIndex(self.method_combo.findData(METODO_POR_DEFECTO))
+        self.method_combo.setToolTip("Automático: Brent para abs, floor, ceil, cbrt y root; Newton-Raphson para el resto\n"
+                                     "Newton-Raphson: 2 evaluaciones por iteración (f y f')\n"
+                                     "Secante: 1 evaluación por iteración, sin derivada\n"
+                                     "Newton protegido: Newton con intervalo de cambio de signo\n"
+                                     "Brent: 1 evaluación por iteración dentro de un intervalo [a, b]\n"
+                                     "Halley / Householder: f'' (y f''') en la misma llamada, menos iteraciones")
+        params_layout.addRow("Método:", self.method_combo)
+        
         # Punto inicial x0
         self.x0_input = QLineEdit("1.5")
         self.x0_input.setFixedWidth(80)
@@ -1078,7 +1165,7 @@ class InterfazReglaFalsaPyQt(QMainWindow):
         buttons_layout = QHBoxLayout()
         
         self.plot_btn = QPushButton("📊 Graficar")
-        self.solve_btn = QPushButton("🎯 Encontrar Raíz (Newton)")
+        self.solve_btn = QPushButton(f"🎯 Encontrar Raíz ({nombres_metodo(METODO_POR_DEFECTO)[0]})")
         
         self.plot_btn.setFixedHeight(38)
         self.plot_btn.setStyleSheet("""
@@ -1154,10 +1241,10 @@ class InterfazReglaFalsaPyQt(QMainWindow):
         layout.setSpacing(5)
         
         # Título del panel
-        title_label = QLabel("Método de Newton-Raphson - Paso a Paso")
-        title_label.setFont(QFont("Arial", 12, QFont.Bold))
-        title_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(title_label)
+        self.steps_title_label = QLabel(f"{nombres_metodo(METODO_POR_DEFECTO)[1]} - Paso a Paso")
+        self.steps_title_label.setFont(QFont("Arial", 12, QFont.Bold))
+        self.steps_title_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.steps_title_label)
         
         # Área de texto para mostrar pasos detallados
         self.steps_text = QTextEdit()
@@ -1223,9 +1310,10 @@ class InterfazReglaFalsaPyQt(QMainWindow):
         zoom_in_btn = QPushButton("🔍+")
         zoom_out_btn = QPushButton("🔍-")
         reset_zoom_btn = QPushButton("🏠")
+        basins_btn = QPushButton("◐")
         
         # Configurar botones con mejor visibilidad
-        for btn in [zoom_in_btn, zoom_out_btn, reset_zoom_btn]:
+        for btn in [zoom_in_btn, zoom_out_btn, reset_zoom_btn, basins_btn]:
             btn.setFixedSize(28, 25)
             btn.setStyleSheet("""
                 QPushButton {
@@ -1248,16 +1336,20 @@ class InterfazReglaFalsaPyQt(QMainWindow):
         zoom_in_btn.setToolTip("Acercar zoom")
         zoom_out_btn.setToolTip("Alejar zoom")
         reset_zoom_btn.setToolTip("Restablecer vista original")
+        basins_btn.setToolTip("Cuencas de atracción de Newton en la región visible\n"
+                              "(plano complejo; recta real si f no es analítica)")
         
         title_layout.addWidget(zoom_in_btn)
         title_layout.addWidget(zoom_out_btn)
         title_layout.addWidget(reset_zoom_btn)
+        title_layout.addWidget(basins_btn)
         title_layout.addSpacing(10)  # Espacio adicional para mostrar todos los botones
         
         # Conectar botones de zoom
         zoom_in_btn.clicked.connect(self.zoom_in)
         zoom_out_btn.clicked.connect(self.zoom_out)
         reset_zoom_btn.clicked.connect(self.reset_zoom)
+        basins_btn.clicked.connect(self.show_basins)
         
         layout.addLayout(title_layout)
         
@@ -1282,6 +1374,7 @@ class InterfazReglaFalsaPyQt(QMainWindow):
         self.function_buttons.function_inserted.connect(self.insert_function)
         self.plot_btn.clicked.connect(self.plot_function)
         self.solve_btn.clicked.connect(self.solve_equation)
+        self.method_combo.currentIndexChanged.connect(self.on_method_changed)
         
         # Validación en tiempo real
         for input_field in [self.x0_input, self.tolerance_input]:
@@ -1351,6 +1444,12 @@ class InterfazReglaFalsaPyQt(QMainWindow):
             self.show_error_message("valores numéricos inválidos")
             return False
 
+    def on_method_changed(self):
+        """Actualiza los textos que dependen del método seleccionado"""
+        nombre, titulo = nombres_metodo(self.method_combo.currentData())
+        self.solve_btn.setText(f"🎯 Encontrar Raíz ({nombre})")
+        self.steps_title_label.setText(f"{titulo} - Paso a Paso")
+    
     def apply_max_iter(self):
         """Handler para el botón Aplicar del máximo de iteraciones"""
         try:
@@ -1441,7 +1540,7 @@ class InterfazReglaFalsaPyQt(QMainWindow):
             progress.close()
     
     def solve_equation(self):
-        """Resuelve la ecuación usando el método de Newton-Raphson"""
+        """Resuelve la ecuación con el método seleccionado, mostrando el progreso de las iteraciones"""
         if not self.validate_inputs():
             return
         
@@ -1455,8 +1554,11 @@ class InterfazReglaFalsaPyQt(QMainWindow):
             QMessageBox.warning(self, "Error", f"Error de validacion: {str(e)}")
             return
         
+        metodo = self.method_combo.currentData()
+        
         # Mostrar diálogo de espera
-        progress = QProgressDialog("Calculando raíz por método de Newton-Raphson...", "Cancelar", 0, 0, self)
+        progress = QProgressDialog(f"Calculando raíz por {nombres_metodo(metodo)[1].lower()}...",
+                                   "Cancelar", 0, 0, self)
         progress.setWindowTitle("Espere...")
         progress.setWindowModality(Qt.WindowModal)
         progress.setMinimumDuration(200)
@@ -1471,21 +1573,31 @@ class InterfazReglaFalsaPyQt(QMainWindow):
             except Exception:
                 max_iter = 10000
             
-            # Ejecutar método
-            success, result, iterations = ejecutar_metodo_newton_raphson(func_str, x0, tolerance, max_iter)
+            # Ejecutar método consumiendo las iteraciones a medida que se calculan:
+            # el diálogo muestra el progreso y su botón Cancelar detiene el cálculo
+            cancelacion = Cancelacion()
+            progress.canceled.connect(cancelacion.cancelar)
+            generador = iterar_solucion(metodo, func_str, x0, tolerance, max_iter, cancelacion=cancelacion)
+            success, result, iterations = recolectar_iteraciones(self.iterate_with_progress(generador, progress))
             
             if not success:
-                QMessageBox.critical(self, "Error", result)
+                if cancelacion.cancelada:
+                    self.show_normal_message(result)
+                else:
+                    QMessageBox.critical(self, "Error", result)
                 return
             
+            # Con selección automática, el resultado indica el método que se usó
+            self.current_method = result.get('metodo', metodo)
+            
             # Mostrar resultados
             self.display_results(iterations, result)
             
-            # Graficar con zoom alrededor de la raíz
-            raiz = result['raiz']
+            # Graficar con zoom alrededor de la raíz (en alta precisión la raíz es un Decimal)
+            raiz = float(result['raiz'])
             intervalo = (raiz - 2, raiz + 2)
             self.canvas.plot_function(func_str, interval=intervalo, show_roots=True)
-            self.canvas.mark_root(result['raiz'])
+            self.canvas.mark_root(raiz)
             
             # Mensaje de éxito
             if result['convergio']:
@@ -1494,9 +1606,11 @@ class InterfazReglaFalsaPyQt(QMainWindow):
                     f"Iteraciones: {result['iteracion']}\n"
                     f"Error: {result['error']:.8f}")
             else:
+                titulo, sugerencia = diagnostico_resultado(result)
                 QMessageBox.warning(self, "Advertencia", 
-                    f"Máximo de iteraciones alcanzado\n"
-                    f"Raíz aproximada: {result['raiz']:.10f}")
+                    f"{titulo}\n"
+                    f"Raíz aproximada: {result['raiz']:.10f}\n"
+                    f"{sugerencia}".rstrip())
             
             self.show_success_message(f"Raíz encontrada: {result['raiz']:.6f}")
             
@@ -1505,6 +1619,23 @@ class InterfazReglaFalsaPyQt(QMainWindow):
         finally:
             progress.close()
     
+    def iterate_with_progress(self, generator, progress):
+        """
+        Reentrega los registros del generador del método (y su resultado final) y cada
+        INTERVALO_PROGRESO segundos actualiza el diálogo y atiende eventos (botón Cancelar).
+        """
+        next_update = time.perf_counter() + INTERVALO_PROGRESO
+        while True:
+            try:
+                record = next(generator)
+            except StopIteration as end:
+                return end.value
+            yield record
+            if time.perf_counter() >= next_update:
+                progress.setLabelText(f"Iteración {record['iteracion']}: xn = {record['xn_nuevo']:.10g}")
+                QApplication.processEvents()
+                next_update = time.perf_counter() + INTERVALO_PROGRESO
+    
     def display_results(self, iterations, result):
         """Muestra los resultados y pasos detallados"""
         # Guardar datos para la ventana emergente
@@ -1525,24 +1656,113 @@ class InterfazReglaFalsaPyQt(QMainWindow):
         x0_initial = float(self.x0_input.text())
         tolerance = float(self.tolerance_input.text())
         
-        steps_text = f"""MÉTODO DE NEWTON-RAPHSON
+        info_metodo = obtener_metodo(self.current_method)
+        
+        if info_metodo['usa_derivada']:
+            # Derivada simbólica (None si se usó derivada numérica, ej: floor/ceil)
+            derivada = result.get('derivada')
+            derivada_str = derivada.replace('**', '^') if derivada else "numérica (diferencias finitas)"
+            linea_derivada = f"Derivada: f'(x) = {derivada_str}\n"
+        else:
+            linea_derivada = ""
+        
+        # Polinomio en modo automático: Newton parte de la raíz de la matriz compañera más cercana a x0
+        if 'semilla' in result:
+            linea_inicial = (f"Punto inicial: x0 = {x0_initial} -> semilla (matriz compañera) "
+                             f"x0 = {result['semilla']:.10f}")
+        else:
+            linea_inicial = f"Punto inicial: x0 = {x0_initial}"
+        
+        steps_text = f"""{info_metodo['titulo'].upper()}
 {'='*50}
 
 Función: f(x) = {func_str}
-Punto inicial: x0 = {x0_initial}
+{linea_derivada}{linea_inicial}
 Tolerancia: {tolerance}
 
-FÓRMULA: xn+1 = xn - f(xn) / f'(xn)
+FÓRMULA: {info_metodo['formula']}
 
 """
         
         for i, data in enumerate(iterations):
-            steps_text += f"""ITERACIÓN {data['iteracion']}:
+            if data.get('paso', 'newton') != 'newton':
+                # Paso dentro del intervalo con cambio de signo (respaldo del método protegido o Brent)
+                steps_text += f"""ITERACIÓN {data['iteracion']} (paso de {NOMBRES_PASO[data['paso']]}):
+{'-'*20}
+xn = {data['xn']:.6f}
+f(xn) = {data['fxn']:.6e}
+Intervalo con cambio de signo: [{data['a']:.6f}, {data['b']:.6f}]
+
+xn+1 = {data['xn_nuevo']:.6f}
+"""
+            elif 'fppxn' in data:
+                # Halley / Householder: el paso combina f, f' y las derivadas de orden superior
+                steps_text += f"""ITERACIÓN {data['iteracion']}:
+{'-'*20}
+xn = {data['xn']:.6f}
+f(xn) = {data['fxn']:.6e}
+f'(xn) = {data['fpxn']:.6e}
+f''(xn) = {data['fppxn']:.6e}
+"""
+                if 'fpppxn' in data:
+                    steps_text += f"f'''(xn) = {data['fpppxn']:.6e}\n"
+                steps_text += f"""
+xn+1 = {data['xn_nuevo']:.6f}
+"""
+            elif data.get('variante') == 'steffensen':
+                # Pendiente entre xn y el punto auxiliar xn + f(xn) (sin derivada)
+                steps_text += f"""ITERACIÓN {data['iteracion']}:
+{'-'*20}
+xn = {data['xn']:.6f}
+f(xn) = {data['fxn']:.6e}
+xn + f(xn) = {data['xn'] + data['fxn']:.6f}
+Pendiente = (f(xn + f(xn)) - f(xn)) / f(xn) = {data['fpxn']:.6e}
+
+Cálculo de xn+1:
+xn+1 = {data['xn']:.6f} - ({data['fxn']:.6e}) / ({data['fpxn']:.6e})
+xn+1 = {data['xn_nuevo']:.6f}
+"""
+            elif data.get('variante') == 'aitken':
+                # Punto fijo de g(x) = x - f(x): x1 = g(xn), x2 = g(x1) y extrapolación Δ²
+                x1 = data['xn'] - data['fxn']
+                x2 = x1 - data['fxn'] * (1 - data['fpxn'])  # f(x1) = f(xn) - pendiente·f(xn)
+                steps_text += f"""ITERACIÓN {data['iteracion']}:
+{'-'*20}
+xn = {data['xn']:.6f}
+x1 = g(xn) = {x1:.6f}
+x2 = g(x1) = {x2:.6f}
+
+Aceleración de Aitken:
+xn+1 = xn - (x1 - xn)^2 / (x2 - 2 x1 + xn)
+xn+1 = {data['xn_nuevo']:.6f}
+"""
+            elif info_metodo['usa_derivada']:
+                variante = data.get('variante', 'newton')
+                if variante == 'cociente':
+                    # Newton sobre u = f / f' (raíz múltiple de multiplicidad no entera)
+                    linea_paso = f"xn+1 = xn - f·f' / (f'^2 - f·f'')    (Newton sobre f / f')"
+                elif variante == 'modificado':
+                    linea_paso = (f"xn+1 = {data['xn']:.6f} - {data['factor']}·({data['fxn']:.6e}) / "
+                                  f"({data['fpxn']:.6e})    (Newton modificado, m = {data['factor']})")
+                else:
+                    linea_paso = f"xn+1 = {data['xn']:.6f} - ({data['fxn']:.6e}) / ({data['fpxn']:.6e})"
+                steps_text += f"""ITERACIÓN {data['iteracion']}:
 {'-'*20}
 xn = {data['xn']:.6f}
 f(xn) = {data['fxn']:.6e}
 f'(xn) = {data['fpxn']:.6e}
 
+Cálculo de xn+1:
+{linea_paso}
+xn+1 = {data['xn_nuevo']:.6f}
+"""
+            else:
+                steps_text += f"""ITERACIÓN {data['iteracion']}:
+{'-'*20}
+xn-1 = {data['xn_anterior']:.6f}    f(xn-1) = {data['fxn_anterior']:.6e}
+xn   = {data['xn']:.6f}    f(xn)   = {data['fxn']:.6e}
+Pendiente = (f(xn) - f(xn-1)) / (xn - xn-1) = {data['fpxn']:.6e}
+
 Cálculo de xn+1:
 xn+1 = {data['xn']:.6f} - ({data['fxn']:.6e}) / ({data['fpxn']:.6e})
 xn+1 = {data['xn_nuevo']:.6f}
@@ -1550,6 +1770,14 @@ xn+1 = {data['xn_nuevo']:.6f}
             
             if i > 0:
                 steps_text += f"Error relativo = {data['error_rel']:.6f}\n"
+            if 'precision' in data:
+                steps_text += f"Precisión de trabajo: {data['precision']} dígitos\n"
+            if data.get('multiplicidad', float('nan')) == data.get('multiplicidad'):
+                # Estimaciones de los últimos pasos (NaN hasta tener pasos suficientes)
+                steps_text += f"Multiplicidad estimada: {data['multiplicidad']:.3f}"
+                if data['orden'] == data['orden']:
+                    steps_text += f"    Orden estimado: {data['orden']:.3f}"
+                steps_text += "\n"
             
             steps_text += "\n"
         
@@ -1559,15 +1787,22 @@ xn+1 = {data['xn_nuevo']:.6f}
 {'='*30}
 Raíz encontrada: {result['raiz']:.10f}
 Iteraciones: {result['iteracion']}
+Evaluaciones de f: {result['evaluaciones']}
 Error final: {result['error']:.8f}
 """
         else:
-            steps_text += f"""MÁXIMO DE ITERACIONES ALCANZADO
+            titulo, sugerencia = diagnostico_resultado(result)
+            steps_text += f"""{titulo.upper()}
 {'='*35}
 Raíz aproximada: {result['raiz']:.10f}
 Iteraciones: {result['iteracion']}
+Evaluaciones de f: {result['evaluaciones']}
 Error final: {result['error']:.8f}
 """
+            if sugerencia:
+                steps_text += f"{sugerencia}\n"
+        if 'precision' in result:
+            steps_text += f"\nRaíz con {result['precision']} dígitos:\n{result['raiz']}\n"
         
         self.steps_text.setPlainText(steps_text)
     def update_summary(self, result):
@@ -1589,12 +1824,15 @@ Tolerancia: {self.tolerance_input.text()}"""
                 }
             """)
         else:
-            summary = f"""⚠ MÁXIMO DE ITERACIONES
+            titulo, sugerencia = diagnostico_resultado(result)
+            summary = f"""⚠ {titulo.upper()}
 
 Raíz aprox: {result['raiz']:.8f}
 Iteraciones: {result['iteracion']}
 Error: {result['error']:.6f}
 Tolerancia: {self.tolerance_input.text()}"""
+            if sugerencia:
+                summary += f"\n{sugerencia}"
             self.summary_label.setStyleSheet("""
                 QLabel {
                     background-color: #fff3e0;
@@ -1612,7 +1850,7 @@ Tolerancia: {self.tolerance_input.text()}"""
         if not self.iterations_data:
             return
         
-        dialog = IterationsTableDialog(self)
+        dialog = IterationsTableDialog(self, self.current_method)
         dialog.populate_table(self.iterations_data)
         dialog.exec_()
     
@@ -1936,6 +2174,79 @@ Tolerancia: {self.tolerance_input.text()}"""
         if func_str:
             self.plot_function()
     
+    def show_basins(self):
+        """Calcula y dibuja las cuencas de atracción de Newton en la región visible del gráfico"""
+        if not self.validate_inputs():
+            return
+        
+        func_str = self.function_input.text().strip()
+        try:
+            valid, message = validar_ecuacion(func_str)
+            if not valid:
+                QMessageBox.warning(self, "Error", f"Funcion invalida: {message}")
+                return
+        except Exception as e:
+            QMessageBox.warning(self, "Error", f"Error de validacion: {str(e)}")
+            return
+        
+        tolerance = float(self.tolerance_input.text())
+        max_iter = min(int(self.max_iter_input.text()), MAX_ITER_CUENCAS)
+        
+        # Región: el eje x visible; en y, la vista actual si ya son cuencas en el plano,
+        # o un rango centrado en 0 con la proporción del canvas
+        x_rango = self.canvas.ax.get_xlim()
+        ancho_px, alto_px = max(1, self.canvas.width()), max(1, self.canvas.height())
+        complejo = obtener_expresion(func_str).analitica
+        if not complejo:
+            y_rango = None
+        elif self.canvas.basins_complex:
+            y_rango = self.canvas.ax.get_ylim()
+        else:
+            mitad = (x_rango[1] - x_rango[0]) * alto_px / ancho_px / 2
+            y_rango = (-mitad, mitad)
+        
+        ancho = min(MAX_RESOLUCION_CUENCAS, ancho_px)
+        alto = ancho
+        if y_rango is not None:
+            proporcion = (y_rango[1] - y_rango[0]) / (x_rango[1] - x_rango[0])
+            alto = max(2, min(MAX_RESOLUCION_CUENCAS, round(ancho * proporcion)))
+        
+        # Diálogo de progreso por filas de la malla; su botón Cancelar detiene el cálculo
+        progress = QProgressDialog("Calculando cuencas de atracción...", "Cancelar", 0, 0, self)
+        progress.setWindowTitle("Espere...")
+        progress.setWindowModality(Qt.WindowModal)
+        progress.setMinimumDuration(200)
+        progress.show()
+        QApplication.processEvents()
+        
+        def update_progress(rows_done, rows_total):
+            progress.setMaximum(rows_total)
+            progress.setValue(rows_done)
+            QApplication.processEvents()
+        
+        try:
+            cancelacion = Cancelacion()
+            progress.canceled.connect(cancelacion.cancelar)
+            exito, result, raices_info = ejecutar_cuencas(func_str, x_rango, y_rango, (ancho, alto),
+                                                          tolerance, max_iter, cancelacion=cancelacion,
+                                                          progreso=update_progress)
+            if not exito:
+                if cancelacion.cancelada:
+                    self.show_normal_message(result)
+                else:
+                    QMessageBox.warning(self, "Error", f"No se pudieron calcular las cuencas: {result}")
+                return
+            
+            self.canvas.plot_basins(func_str, result)
+            sin_convergencia = int((result['indices'] < 0).sum())
+            region = "el plano complejo" if result['complejo'] else "la recta real"
+            self.show_success_message(f"Cuencas en {region}: {len(raices_info)} raíces, "
+                                      f"{sin_convergencia} de {result['indices'].size} puntos sin convergencia")
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Error al calcular las cuencas: {str(e)}")
+        finally:
+            progress.close()
+    
     def show_about(self):
         """Muestra información sobre la aplicación"""
         QMessageBox.about(self, "Acerca de", 
@@ -0,0 +1,342 @@
+"""
+Aritmética de intervalos sobre el árbol de sintaxis
+Dado [a, b] retorna cotas garantizadas de f en todo el intervalo. Permite descartar
+regiones sin raíces y acotar el rango Y con pocas evaluaciones, sin muestrear.
+"""
+
+import math
+from collections import deque
+from typing import NamedTuple
+from analizador import Numero, Constante, Variable, Unario, Binario, Llamada, CONSTANTES
+
+INF = math.inf
+
+class Intervalo(NamedTuple):
+    inf: float
+    sup: float
+
+# Cota sin información (polos, divisiones por intervalos que contienen 0)
+TODA_LA_RECTA = Intervalo(-INF, INF)
+UNO = Intervalo(1.0, 1.0)
+
+def afuera(inf, sup):
+    """Intervalo con redondeo hacia afuera (absorbe el error de redondeo de cada operación)"""
+    if inf != inf or sup != sup:  # NaN (ej: inf - inf)
+        return TODA_LA_RECTA
+    return Intervalo(math.nextafter(inf, -INF), math.nextafter(sup, INF))
+
+def seguro(funcion, valor, si_desborda):
+    """Evalúa una función en un extremo; desbordamiento -> si_desborda"""
+    try:
+        return funcion(valor)
+    except (OverflowError, ValueError):
+        return si_desborda
+
+def contiene_cero(intervalo):
+    return intervalo.inf <= 0 <= intervalo.sup
+
+def es_acotado(intervalo):
+    return math.isfinite(intervalo.inf) and math.isfinite(intervalo.sup)
+
+# ---------------------------------------------------------------------------
+# Operaciones (None = la función no está definida en ningún punto del intervalo)
+# ---------------------------------------------------------------------------
+
+def multiplicar_extremos(a, b):
+    # 0 * inf se toma como 0 (el extremo infinito nunca se alcanza)
+    return 0.0 if a == 0 or b == 0 else a * b
+
+def sumar(u, v):
+    return afuera(u.inf + v.inf, u.sup + v.sup)
+
+def restar(u, v):
+    return afuera(u.inf - v.sup, u.sup - v.inf)
+
+def multiplicar(u, v):
+    productos = [multiplicar_extremos(a, b) for a in u for b in v]
+    return afuera(min(productos), max(productos))
+
+def dividir(u, v):
+    if v.inf == 0 and v.sup == 0:
+        return None
+    if v.inf > 0 or v.sup < 0:
+        reciproco = Intervalo(1 / v.sup, 1 / v.inf)
+    elif v.inf == 0:
+        reciproco = Intervalo(1 / v.sup, INF)
+    elif v.sup == 0:
+        reciproco = Intervalo(-INF, 1 / v.inf)
+    else:
+        return TODA_LA_RECTA
+    return multiplicar(u, reciproco)
+
+def potencia_entera(u, n):
+    if n == 0:
+        return UNO
+    if n < 0:
+        return dividir(UNO, potencia_entera(u, -n))
+
+    def elevar(v):
+        return seguro(lambda t: t ** n, v, math.copysign(INF, v) if n % 2 else INF)
+
+    a, b = elevar(u.inf), elevar(u.sup)
+    if n % 2 == 1:
+        return afuera(a, b)
+    if u.inf >= 0:
+        return afuera(a, b)
+    if u.sup <= 0:
+        return afuera(b, a)
+    return afuera(0.0, max(a, b))
+
+def potencia(u, v):
+    # Exponente constante entero: definido para cualquier base
+    if v.inf == v.sup and math.isfinite(v.inf) and v.inf == int(v.inf):
+        return potencia_entera(u, int(v.inf))
+
+    # Exponente fraccionario: base negativa no es real
+    if u.sup < 0:
+        return None
+    base = Intervalo(max(u.inf, 0.0), u.sup)
+
+    if v.inf == v.sup:
+        p = v.inf
+        if p > 0:
+            return afuera(seguro(lambda t: t ** p, base.inf, INF), seguro(lambda t: t ** p, base.sup, INF))
+        if base.sup == 0:
+            return None
+        superior = INF if base.inf == 0 else seguro(lambda t: t ** p, base.inf, INF)
+        return afuera(base.sup ** p, superior)
+
+    # Exponente variable: u^v = exp(v*ln(u)) solo con base no negativa
+    if u.inf < 0:
+        return TODA_LA_RECTA
+    logaritmo = monotona(math.log, base, 0.0, INF, en_inf=-INF)
+    return exponencial(multiplicar(v, logaritmo)) if logaritmo is not None else None
+
+def monotona(funcion, u, dominio_inf=-INF, dominio_sup=INF, creciente=True,
+             en_inf=None, en_sup=None, abierto=False):
+    """
+    Imagen de una función monótona restringida a su dominio.
+    en_inf/en_sup: valor en el borde del dominio (ej: ln(0) = -inf).
+    abierto: los bordes del dominio no pertenecen a él (atanh en ±1).
+    """
+    inf = max(u.inf, dominio_inf)
+    sup = min(u.sup, dominio_sup)
+    if inf > sup or (abierto and (inf >= dominio_sup or sup <= dominio_inf)):
+        return None
+
+    def valor(t):
+        if t == dominio_inf and en_inf is not None:
+            return en_inf
+        if t == dominio_sup and en_sup is not None:
+            return en_sup
+        return seguro(funcion, t, math.copysign(INF, t))
+
+    a, b = valor(inf), valor(sup)
+    return afuera(a, b) if creciente else afuera(b, a)
+
+def exponencial(u):
+    return monotona(math.exp, u)
+
+def contiene_punto(inf, sup, desplazamiento, periodo):
+    """True si algún desplazamiento + k*periodo cae en [inf, sup]"""
+    k = math.ceil((inf - desplazamiento) / periodo)
+    return desplazamiento + k * periodo <= sup
+
+def periodica(funcion, u, maximo, minimo):
+    """Imagen de sin/cos: los extremos globales se alcanzan si el intervalo los contiene"""
+    if not es_acotado(u) or u.sup - u.inf >= 2 * math.pi:
+        return Intervalo(-1.0, 1.0)
+    a, b = funcion(u.inf), funcion(u.sup)
+    inf, sup = min(a, b), max(a, b)
+    if contiene_punto(u.inf, u.sup, maximo, 2 * math.pi):
+        sup = 1.0
+    if contiene_punto(u.inf, u.sup, minimo, 2 * math.pi):
+        inf = -1.0
+    resultado = afuera(inf, sup)
+    return Intervalo(max(resultado.inf, -1.0), min(resultado.sup, 1.0))
+
+def seno(u):
+    return periodica(math.sin, u, math.pi / 2, -math.pi / 2)
+
+def coseno(u):
+    return periodica(math.cos, u, 0.0, math.pi)
+
+def tangente(u):
+    if not es_acotado(u) or u.sup - u.inf >= math.pi:
+        return TODA_LA_RECTA
+    if contiene_punto(u.inf, u.sup, math.pi / 2, math.pi):
+        return TODA_LA_RECTA  # Contiene un polo
+    return afuera(math.tan(u.inf), math.tan(u.sup))
+
+def par(funcion, u, minimo_en=0.0):
+    """Imagen de una función par creciente en [0, inf) (abs, cosh)"""
+    a = seguro(funcion, u.inf, INF)
+    b = seguro(funcion, u.sup, INF)
+    if u.inf <= minimo_en <= u.sup:
+        return afuera(funcion(minimo_en), max(a, b))
+    return afuera(min(a, b), max(a, b))
+
+def evaluar_llamada(nombre, argumentos):
+    u = argumentos[0]
+    if nombre == 'sin':
+        return seno(u)
+    if nombre == 'cos':
+        return coseno(u)
+    if nombre == 'tan':
+        return tangente(u)
+    if nombre == 'csc':
+        return dividir(UNO, seno(u))
+    if nombre == 'sec':
+        return dividir(UNO, coseno(u))
+    if nombre == 'cot':
+        return dividir(coseno(u), seno(u))
+    if nombre == 'asin':
+        return monotona(math.asin, u, -1.0, 1.0)
+    if nombre == 'acos':
+        return monotona(math.acos, u, -1.0, 1.0, creciente=False)
+    if nombre == 'atan':
+        return monotona(math.atan, u)
+    if nombre == 'sinh':
+        return monotona(math.sinh, u)
+    if nombre == 'cosh':
+        return par(math.cosh, u)
+    if nombre == 'tanh':
+        return monotona(math.tanh, u)
+    if nombre == 'asinh':
+        return monotona(math.asinh, u)
+    if nombre == 'acosh':
+        return monotona(math.acosh, u, 1.0, INF)
+    if nombre == 'atanh':
+        return monotona(math.atanh, u, -1.0, 1.0, en_inf=-INF, en_sup=INF, abierto=True)
+    if nombre == 'exp':
+        return exponencial(u)
+    if nombre == 'ln':
+        return monotona(math.log, u, 0.0, INF, en_inf=-INF, abierto=True)
+    if nombre == 'log10':
+        return monotona(math.log10, u, 0.0, INF, en_inf=-INF, abierto=True)
+    if nombre == 'log2':
+        return monotona(math.log2, u, 0.0, INF, en_inf=-INF, abierto=True)
+    if nombre == 'logb':
+        numerador = evaluar_llamada('ln', (u,))
+        denominador = evaluar_llamada('ln', (argumentos[1],))
+        if numerador is None or denominador is None:
+            return None
+        return dividir(numerador, denominador)
+    if nombre == 'sqrt':
+        return monotona(math.sqrt, u, 0.0, INF)
+    if nombre == 'cbrt':
+        return monotona(lambda t: math.copysign(abs(t) ** (1 / 3), t), u)
+    if nombre == 'root':
+        exponente = dividir(UNO, argumentos[1])
+        return potencia(u, exponente) if exponente is not None else None
+    if nombre == 'abs':
+        return par(abs, u)
+    if nombre == 'floor':
+        return monotona(math.floor, u)
+    if nombre == 'ceil':
+        return monotona(math.ceil, u)
+    return TODA_LA_RECTA
+
+def evaluar(nodo, x):
+    """Cota de f sobre el intervalo x (None si f no está definida en ningún punto)"""
+    if isinstance(nodo, Numero):
+        return Intervalo(nodo.valor, nodo.valor)
+    if isinstance(nodo, Constante):
+        valor = CONSTANTES[nodo.nombre]
+        return Intervalo(valor, valor)
+    if isinstance(nodo, Variable):
+        return x
+    if isinstance(nodo, Unario):
+        u = evaluar(nodo.operando, x)
+        return Intervalo(-u.sup, -u.inf) if u is not None else None
+    if isinstance(nodo, Binario):
+        u = evaluar(nodo.izquierdo, x)
+        v = evaluar(nodo.derecho, x)
+        if u is None or v is None:
+            return None
+        if nodo.op == '+':
+            return sumar(u, v)
+        if nodo.op == '-':
+            return restar(u, v)
+        if nodo.op == '*':
+            return multiplicar(u, v)
+        if nodo.op == '/':
+            return dividir(u, v)
+        return potencia(u, v)
+    if isinstance(nodo, Llamada):
+        argumentos = [evaluar(a, x) for a in nodo.argumentos]
+        if any(a is None for a in argumentos):
+            return None
+        return evaluar_llamada(nodo.nombre, argumentos)
+    return TODA_LA_RECTA
+
+def evaluar_intervalo(arbol, a, b):
+    """Cotas garantizadas de f(x) para todo x en [a, b]"""
+    return evaluar(arbol, Intervalo(float(a), float(b)))
+
+# ---------------------------------------------------------------------------
+# Subdivisión
+# ---------------------------------------------------------------------------
+
+def puede_tener_raiz(arbol, a, b):
+    """
+    False si [a, b] no contiene raíces con seguridad.
+    Un cambio de signo con cota no acotada es un polo (tan, 1/x), no una raíz.
+    """
+    cota = evaluar_intervalo(arbol, a, b)
+    return cota is not None and contiene_cero(cota) and es_acotado(cota)
+
+def regiones_con_raiz(arbol, a, b, ancho_minimo=None, max_evaluaciones=64):
+    """
+    Subdivide [a, b] descartando los subintervalos donde f no puede anularse.
+    Retorna una lista ordenada de (inicio, fin) que aún pueden contener raíces;
+    todo lo que no aparece está libre de raíces con garantía. Las regiones de polos
+    (cota no acotada al ancho mínimo) también se descartan.
+    """
+    if ancho_minimo is None:
+        ancho_minimo = (b - a) / 256
+    pendientes = deque([(float(a), float(b))])
+    hojas = []
+    evaluaciones = 0
+
+    # En anchura: el presupuesto se reparte por igual entre las regiones
+    while pendientes:
+        inicio, fin = pendientes.popleft()
+        cota = evaluar_intervalo(arbol, inicio, fin)
+        evaluaciones += 1
+        if cota is None or not contiene_cero(cota):
+            continue
+        if fin - inicio <= ancho_minimo:
+            if es_acotado(cota):
+                hojas.append((inicio, fin))
+            continue
+        if evaluaciones + len(pendientes) >= max_evaluaciones:
+            hojas.append((inicio, fin))
+            continue
+        medio = (inicio + fin) / 2
+        pendientes.append((inicio, medio))
+        pendientes.append((medio, fin))
+
+    # Fusionar regiones contiguas
+    hojas.sort()
+    regiones = []
+    for inicio, fin in hojas:
+        if regiones and inicio <= regiones[-1][1]:
+            regiones[-1] = (regiones[-1][0], max(regiones[-1][1], fin))
+        else:
+            regiones.append((inicio, fin))
+    return regiones
+
+def acotar_rango(arbol, a, b, piezas=16):
+    """
+    Cota del rango Y de f en [a, b] uniendo las cotas de 'piezas' subintervalos.
+    Retorna (y_min, y_max) o None si f no está definida en [a, b].
+    """
+    y_min, y_max = INF, -INF
+    paso = (b - a) / piezas
+    for i in range(piezas):
+        cota = evaluar_intervalo(arbol, a + i * paso, a + (i + 1) * paso if i < piezas - 1 else b)
+        if cota is not None:
+            y_min = min(y_min, cota.inf)
+            y_max = max(y_max, cota.sup)
+    return (y_min, y_max) if y_min <= y_max else None
@@ -0,0 +1,56 @@
+"""
+Solucionadores en forma de generador
+Un generador iterar_* entrega cada registro de iteración en cuanto se calcula y, al
+terminar, retorna el dict de resultado (StopIteration.value). Quien lo consume puede
+dejar de iterar cuando quiera o pasarle un token Cancelacion.
+recolectar_iteraciones lo convierte en la tupla (exito, resultado, iteraciones_data)
+de las funciones ejecutar_*, con los registros guardados por columnas (HistorialIteraciones).
+"""
+
+import threading
+from collections import deque
+from historial import HistorialIteraciones
+
+class ErrorIteracion(ValueError):
+    """Fallo del método (derivada cero, tiempo límite, ...); el texto es el mensaje para el usuario"""
+
+class Cancelacion:
+    """Token de cancelación; se puede activar desde otro hilo o desde una señal de la interfaz"""
+
+    def __init__(self):
+        self._evento = threading.Event()
+
+    def cancelar(self):
+        self._evento.set()
+
+    @property
+    def cancelada(self):
+        return self._evento.is_set()
+
+def recolectar_iteraciones(generador, guardar=True):
+    """
+    Consume el generador y retorna (exito, resultado, iteraciones_data)
+    iteraciones_data es un HistorialIteraciones (secuencia de filas que se leen como dicts).
+    guardar=False descarta los registros (iteraciones_data queda vacía) para no acumular memoria.
+    Un cálculo cancelado cuenta como fallo.
+    """
+    final = []
+
+    def delegar():
+        # 'yield from' captura el valor de retorno del generador
+        final.append((yield from generador))
+
+    try:
+        if guardar:
+            # Cada registro pasa a las columnas en cuanto llega: nunca se arma la lista de dicts
+            iteraciones_data = HistorialIteraciones(delegar())
+        else:
+            iteraciones_data = []
+            deque(delegar(), maxlen=0)
+    except Exception as e:
+        return False, str(e), []
+    resultado = final[0]
+
+    if resultado.get('cancelado'):
+        return False, f"Error: Cálculo cancelado en la iteración {resultado['iteracion'] + 1}.", []
+    return True, resultado, iteraciones_data
@@ -0,0 +1,159 @@
+"""
+Resolución por lotes en varios procesos
+Reparte muchas ecuaciones entre los núcleos con ProcessPoolExecutor y entrega
+cada resultado en cuanto termina.
+"""
+
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from iteraciones import recolectar_iteraciones
+from solucionadores import iterar_solucion, validar_metodo, METODO_POR_DEFECTO
+
+TOLERANCIA_POR_DEFECTO = 1e-6
+MAX_ITER_POR_DEFECTO = 100
+TIEMPO_LIMITE_POR_DEFECTO = 5.0  # Segundos por problema
+
+# Fragmentos por trabajador: varios para repartir la carga, pocos para amortizar el IPC
+FRAGMENTOS_POR_TRABAJADOR = 4
+
+def normalizar_problema(indice, problema):
+    """
+    Acepta un dict {'funcion', 'x0', 'tolerancia', 'max_iter', 'metodo'} o una tupla
+    (funcion, x0[, tolerancia[, max_iter[, metodo]]]) y retorna la tupla completa con su índice.
+    """
+    if isinstance(problema, dict):
+        funcion = problema['funcion']
+        x0 = problema['x0']
+        tolerancia = problema.get('tolerancia', TOLERANCIA_POR_DEFECTO)
+        max_iter = problema.get('max_iter', MAX_ITER_POR_DEFECTO)
+        metodo = problema.get('metodo', METODO_POR_DEFECTO)
+    else:
+        funcion, x0, *resto = problema
+        tolerancia = resto[0] if len(resto) > 0 else TOLERANCIA_POR_DEFECTO
+        max_iter = resto[1] if len(resto) > 1 else MAX_ITER_POR_DEFECTO
+        metodo = resto[2] if len(resto) > 2 else METODO_POR_DEFECTO
+    # Validar la clave aquí, antes de repartir el trabajo
+    validar_metodo(metodo)
+    return (indice, funcion, float(x0), float(tolerancia), int(max_iter), metodo)
+
+def resultado_error(problema, mensaje, tiempo=0.0):
+    indice, funcion, x0, _, _, metodo = problema
+    return {
+        'indice': indice,
+        'funcion': funcion,
+        'x0': x0,
+        'metodo': metodo,
+        'exito': False,
+        'resultado': mensaje,
+        'num_iteraciones': 0,
+        'tiempo': tiempo,
+        'pid': os.getpid()
+    }
+
+def resolver_problema(problema, tiempo_limite, incluir_iteraciones):
+    """
+    Resuelve un problema en el proceso actual (la expresión sale del caché del proceso)
+    Sin incluir_iteraciones los registros se consumen sin acumularse en una lista.
+    """
+    indice, funcion, x0, tolerancia, max_iter, metodo = problema
+    inicio = time.perf_counter()
+    try:
+        exito, resultado, iteraciones_data = recolectar_iteraciones(
+            iterar_solucion(metodo, funcion, x0, tolerancia, max_iter, tiempo_limite=tiempo_limite),
+            guardar=incluir_iteraciones)
+    except Exception as e:
+        return resultado_error(problema, str(e), time.perf_counter() - inicio)
+
+    respuesta = {
+        'indice': indice,
+        'funcion': funcion,
+        'x0': x0,
+        'metodo': metodo,
+        'exito': exito,
+        'resultado': resultado,
+        'num_iteraciones': len(iteraciones_data) if incluir_iteraciones else (resultado['iteracion'] if exito else 0),
+        'tiempo': time.perf_counter() - inicio,
+        'pid': os.getpid()
+    }
+    if incluir_iteraciones:
+        respuesta['iteraciones_data'] = iteraciones_data
+    return respuesta
+
+def resolver_fragmento(fragmento, tiempo_limite, incluir_iteraciones):
+    """Tarea del trabajador: un fragmento de problemas, un solo viaje de ida y vuelta"""
+    return [resolver_problema(problema, tiempo_limite, incluir_iteraciones) for problema in fragmento]
+
+def dividir_en_fragmentos(problemas, tamano):
+    return [problemas[i:i + tamano] for i in range(0, len(problemas), tamano)]
+
+def resolver_en_pool(fragmentos, workers, tiempo_limite, incluir_iteraciones):
+    """
+    Generador: resultados de los fragmentos en orden de finalización.
+    Retorna (al terminar) los fragmentos que no se completaron porque un proceso murió.
+    """
+    rotos = []
+    with ProcessPoolExecutor(max_workers=min(workers, len(fragmentos))) as executor:
+        futuros = {
+            executor.submit(resolver_fragmento, fragmento, tiempo_limite, incluir_iteraciones): fragmento
+            for fragmento in fragmentos
+        }
+        try:
+            for futuro in as_completed(futuros):
+                fragmento = futuros[futuro]
+                try:
+                    resultados = futuro.result()
+                except BrokenProcessPool:
+                    rotos.append(fragmento)
+                    continue
+                except Exception as e:
+                    for problema in fragmento:
+                        yield resultado_error(problema, f"Error: {e}")
+                    continue
+                yield from resultados
+        finally:
+            # Si quien consume deja de iterar, no esperar a los fragmentos pendientes
+            executor.shutdown(wait=True, cancel_futures=True)
+    return rotos
+
+def resolver_lote(problemas, workers=None, tamano_fragmento=None,
+                  tiempo_limite=TIEMPO_LIMITE_POR_DEFECTO, incluir_iteraciones=False):
+    """
+    Resuelve muchas ecuaciones en paralelo (selección automática salvo que el problema indique 'metodo').
+
+    problemas: iterable de dicts {'funcion', 'x0', 'tolerancia', 'max_iter', 'metodo'} o tuplas
+               (funcion, x0[, tolerancia[, max_iter[, metodo]]])
+    workers: número de procesos (None = todos los núcleos)
+    tamano_fragmento: problemas por tarea (None = automático)
+    tiempo_limite: segundos máximos por problema (None = sin límite)
+
+    Generador: produce un dict por problema en orden de finalización, con 'indice'
+    (posición en la entrada), 'exito', 'resultado', 'num_iteraciones' y 'tiempo'.
+    Un problema que falla o excede su tiempo solo afecta a su propio resultado; si un
+    proceso muere, los problemas afectados se reintentan hasta aislar al culpable.
+    """
+    problemas = [normalizar_problema(i, p) for i, p in enumerate(problemas)]
+    if not problemas:
+        return
+
+    workers = workers or os.cpu_count() or 1
+    if tamano_fragmento is None:
+        tamano_fragmento = max(1, math.ceil(len(problemas) / (workers * FRAGMENTOS_POR_TRABAJADOR)))
+
+    # Agrupar por expresión: cada trabajador la compila una vez y la reutiliza del caché
+    problemas.sort(key=lambda p: p[1])
+    fragmentos = dividir_en_fragmentos(problemas, tamano_fragmento)
+    rotos = yield from resolver_en_pool(fragmentos, workers, tiempo_limite, incluir_iteraciones)
+
+    # Un proceso murió: todo lo pendiente en ese pool falló con él. Reintentar problema por problema
+    if rotos:
+        sueltos = [[problema] for fragmento in rotos for problema in fragmento]
+        rotos = yield from resolver_en_pool(sueltos, workers, tiempo_limite, incluir_iteraciones)
+
+    # Los que vuelven a fallar se ejecutan solos: si el proceso muere, el culpable es ese problema
+    for fragmento in rotos:
+        culpables = yield from resolver_en_pool([fragmento], 1, tiempo_limite, incluir_iteraciones)
+        for problema in (p for roto in culpables for p in roto):
+            yield resultado_error(problema, "Error: El proceso de trabajo terminó inesperadamente.")
@@ -6,6 +6,8 @@ Versión: 2.0
 
 Módulos:
 - matematicas.py: Funciones matemáticas y validación
+- metodo_newton_raphson.py / metodo_secante.py: Métodos numéricos
+- solucionadores.py: Registro de métodos (interfaz, consola y lotes)
 - grafico.py: Funciones de graficación
 - interfaz.py: Interfaz Tkinter (original)
 - interfaz_pyqt.py: Interfaz PyQt5 (moderna)
@@ -14,14 +16,161 @@ Módulos:
 import sys
 import argparse
 
+def resolver_en_consola(args):
+    """Resuelve la ecuación sin interfaz gráfica e imprime la tabla de iteraciones"""
+    from matematicas import validar_ecuacion
+    from solucionadores import resolver, obtener_metodo
+    
+    valida, mensaje = validar_ecuacion(args.funcion)
+    if not valida:
+        print(f"Función inválida: {mensaje}")
+        return 1
+    
+    exito, resultado, iteraciones = resolver(args.metodo, args.funcion, args.x0,
+                                             args.tolerancia, args.max_iter)
+    if not exito:
+        print(resultado)
+        return 1
+    
+    # Con --metodo auto, el resultado indica el método que se usó
+    metodo = obtener_metodo(resultado['metodo'])
+    print(f"Método: {metodo['nombre']}    ({metodo['formula']})")
+    if 'semilla' in resultado:
+        print(f"Polinomio: x0 = {args.x0} -> semilla de la matriz compañera {resultado['semilla']:.12f}")
+    print(f"{'Iter':>5} {'xn':>20} {'f(xn)':>16} {'xn+1':>20} {'Error':>12}")
+    for it in iteraciones:
+        print(f"{it['iteracion']:>5} {it['xn']:>20.12f} {it['fxn']:>16.6e} "
+              f"{it['xn_nuevo']:>20.12f} {it['error_rel']:>12.4e}")
+    
+    # Sin convergencia: motivo (ciclo, divergencia, estancamiento o máximo de iteraciones)
+    estado = "convergió" if resultado['convergio'] else \
+        f"no convergió ({resultado.get('diagnostico') or 'máximo de iteraciones'})"
+    raiz = resultado['raiz']
+    if 'precision' in resultado:
+        # Alta precisión: la raíz es un Decimal con todos sus dígitos
+        print(f"\nRaíz ({resultado['precision']} dígitos): {raiz}  -  {estado}")
+    else:
+        print(f"\nRaíz: {raiz:.12f}  -  {estado}")
+    print(f"Iteraciones: {resultado['iteracion']}    Evaluaciones: {resultado['evaluaciones']}")
+    if resultado.get('reinicio') is not None:
+        print(f"Sugerencia: reintentar con --x0 {resultado['reinicio']:.6g}")
+    return 0 if resultado['convergio'] else 2
+
+def resolver_raices_en_consola(args):
+    """Busca varias raíces distintas (Newton con deflación implícita) e imprime una por línea"""
+    from matematicas import validar_ecuacion
+    from metodo_newton_raphson import ejecutar_newton_deflacion
+    
+    valida, mensaje = validar_ecuacion(args.funcion)
+    if not valida:
+        print(f"Función inválida: {mensaje}")
+        return 1
+    
+    num_raices = args.raices if args.raices > 0 else None
+    exito, resultado, corridas = ejecutar_newton_deflacion(args.funcion, args.x0, args.tolerancia,
+                                                           args.max_iter, num_raices)
+    if not exito:
+        print(resultado)
+        return 1
+    
+    print(f"{'Raíz':>22} {'Multiplicidad':>14}")
+    for raiz, multiplicidad in zip(resultado['raices'], resultado['multiplicidades']):
+        print(f"{raiz:>22.12f} {multiplicidad:>14}")
+    print(f"\nCorridas: {len(corridas)}    Iteraciones: {resultado['iteracion']}    "
+          f"Evaluaciones: {resultado['evaluaciones']}")
+    if not resultado['convergio']:
+        print(f"Se encontraron {len(resultado['raices'])} de {args.raices} raíces "
+              f"({resultado['diagnostico'] or 'sin más raíces'})")
+    return 0 if resultado['convergio'] else 2
+
+def resolver_barrido_en_consola(args):
+    """Barre un parámetro con continuación e imprime la raíz de cada valor (o la guarda en --salida)"""
+    import numpy as np
+    from continuacion import ejecutar_barrido_parametro
+    
+    parametro, inicio, fin, num_valores = args.barrer
+    valores = np.linspace(inicio, fin, num_valores)
+    salida = None
+    if args.salida is not None:
+        # .npy en disco: cada raíz se escribe en cuanto converge
+        salida = np.lib.format.open_memmap(args.salida, mode='w+', dtype=float, shape=(num_valores,))
+    
+    exito, resultado, _ = ejecutar_barrido_parametro(args.funcion, parametro, valores, args.x0, args.tolerancia,
+                                                     args.max_iter, fijos=dict(args.parametro or []), salida=salida)
+    if not exito:
+        print(resultado)
+        return 1
+    
+    if salida is not None:
+        salida.flush()
+    else:
+        print(f"{parametro:>14} {'Raíz':>22} {'Iter':>5}")
+        for valor, raiz, iteraciones in zip(valores, resultado['raices'], resultado['iteraciones']):
+            print(f"{valor:>14.6g} {raiz:>22.12f} {iteraciones:>5}")
+    convergidos = int(resultado['convergio'].sum())
+    print(f"\nConvergieron {convergidos} de {num_valores}    Iteraciones: {int(resultado['iteraciones'].sum())}    "
+          f"Evaluaciones: {resultado['evaluaciones']}")
+    return 0 if convergidos == num_valores else 2
+
+def valor_parametro(texto):
+    """'a=2.5' -> ('a', 2.5) (argumento --parametro)"""
+    nombre, _, valor = texto.partition('=')
+    try:
+        return nombre.strip(), float(valor)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"se esperaba NOMBRE=VALOR, se recibió '{texto}'")
+
+def malla_parametro(texto):
+    """'a=0:10:101' -> ('a', 0.0, 10.0, 101) (argumento --barrer)"""
+    nombre, _, rango = texto.partition('=')
+    try:
+        inicio, fin, num_valores = rango.split(':')
+        num_valores = int(num_valores)
+        if num_valores < 1:
+            raise ValueError
+        return nombre.strip(), float(inicio), float(fin), num_valores
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"se esperaba NOMBRE=INICIO:FIN:N, se recibió '{texto}'")
+
 def main():
     """Función principal de la aplicación"""
     parser = argparse.ArgumentParser(description='Método de la Regla Falsa')
     parser.add_argument('--interface', '-i', choices=['tkinter', 'pyqt'], default='pyqt',
                        help='Seleccionar interfaz: tkinter (original) o pyqt (moderna)')
     
+    # Modo consola: con --funcion se resuelve sin abrir la interfaz
+    from solucionadores import METODOS, METODO_AUTOMATICO, METODO_POR_DEFECTO
+    parser.add_argument('--funcion', '-f', help='Resolver f(x) = 0 en consola, sin interfaz')
+    parser.add_argument('--x0', type=float, default=1.0, help='Valor inicial (por defecto 1.0)')
+    parser.add_argument('--tolerancia', '-t', type=float, default=1e-6,
+                       help='Tolerancia del error relativo (por defecto 1e-6)')
+    parser.add_argument('--max-iter', type=int, default=100, help='Máximo de iteraciones (por defecto 100)')
+    parser.add_argument('--metodo', '-m', choices=[METODO_AUTOMATICO, *METODOS], default=METODO_POR_DEFECTO,
+                       help='Método de solución (auto: Brent para abs/floor/ceil/cbrt/root, Newton para el resto)')
+    parser.add_argument('--raices', '-r', type=int, metavar='N',
+                       help='Buscar N raíces distintas con Newton y deflación (0 = todas las que encuentre)')
+    parser.add_argument('--parametro', '-p', type=valor_parametro, action='append', metavar='NOMBRE=VALOR',
+                       help='Valor de un parámetro de la función (ej: -f "x^2 - a" -p a=2); se puede repetir')
+    parser.add_argument('--barrer', '-b', type=malla_parametro, metavar='NOMBRE=INICIO:FIN:N',
+                       help='Resolver para N valores del parámetro con continuación (Newton desde la raíz vecina)')
+    parser.add_argument('--salida', '-o', metavar='ARCHIVO.npy', help='Con --barrer: guardar las raíces en un .npy')
+    
     args = parser.parse_args()
     
+    if args.funcion is not None:
+        if args.barrer is not None:
+            sys.exit(resolver_barrido_en_consola(args))
+        if args.parametro:
+            # Parámetros fijos: se reemplazan en el texto y se resuelve como cualquier función
+            from matematicas import ExpresionParametrica
+            valores = dict(args.parametro)
+            try:
+                args.funcion = ExpresionParametrica(args.funcion, tuple(valores)).texto_con(valores)
+            except ValueError as e:
+                print(f"Función inválida: {e}")
+                sys.exit(1)
+        sys.exit(resolver_raices_en_consola(args) if args.raices is not None else resolver_en_consola(args))
+    
     try:
         if args.interface == 'tkinter':
             from interfaz_pyqt import InterfazReglaFalsaPyQt as InterfazReglaFalsa
@@ -1,166 +1,507 @@
-import re
-import math
+import threading
+from collections import OrderedDict
+import numpy as np
+from analizador import parsear, a_texto, TABLA_UNICODE
+from compilador import (compilar_arbol, compilar_tupla, compilar_decimal, ENTORNO_ESCALAR,
+                        ENTORNO_VECTORIZADO, ENTORNO_COMPLEJO, ENTORNO_COMPLEJO_VECTORIZADO)
+from optimizador import sustituir
+from alta_precision import ENTORNO_DECIMAL
+from derivadas import derivar, NoDiferenciable
+from derivada_numerica import es_analitica
+from polinomios import (coeficientes_polinomio, arbol_horner, derivada_polinomio, raices_reales,
+                        en_forma_expandida)
 
 def limpiar_caracteres_unicode(func_str: str) -> str:
     """Limpia caracteres Unicode problemáticos"""
-    # Reemplazar caracteres Unicode comunes
-    replacements = {
-        '−': '-',  # U+2212 (minus sign) -> ASCII hyphen
-        '–': '-',  # U+2013 (en dash)
-        '—': '-',  # U+2014 (em dash)
-        '×': '*',  # U+00D7 (multiplication sign)
-        '÷': '/',  # U+00F7 (division sign)
-        '²': '^2', # U+00B2 (superscript 2)
-        '³': '^3', # U+00B3 (superscript 3)
-        '√': 'sqrt', # U+221A (square root)
-        'π': 'pi', # U+03C0 (pi)
-        '∞': 'inf', # U+221E (infinity)
-    }
-    
-    for unicode_char, ascii_char in replacements.items():
-        func_str = func_str.replace(unicode_char, ascii_char)
-    
-    return func_str
+    # Reemplazar caracteres Unicode comunes (ver analizador.REEMPLAZOS_UNICODE) en una pasada
+    return func_str.translate(TABLA_UNICODE)
 
-def preprocesar_funcion(func_str: str) -> str:
-    """Preprocesa la función para convertir notación matemática"""
-    # Limpiar caracteres Unicode primero
-    func_str = limpiar_caracteres_unicode(func_str)
-    
-    func_str = func_str.replace('^', '**')
-    
-    # Multiplicación implícita: número con constantes y variable (orden importante)
-    # Primero: número con pi seguido de x (2pix -> 2*pi*x)
-    func_str = re.sub(r'(\d)(\s*)(pi)(\s*)(x)', r'\1*\3*\5', func_str)
-    # Primero: número con e seguido de x (3ex -> 3*e*x) - pero NO exp
-    func_str = re.sub(r'(\d)(\s*)(e)(\s*)(x)(?![a-z])', r'\1*\3*\5', func_str)
-    
-    # Luego: número con constante (2pi -> 2*pi, 2e -> 2*e)
-    func_str = re.sub(r'(\d)(\s*)(pi)\b', r'\1*\3', func_str)
-    func_str = re.sub(r'(\d)(\s*)(e)\b(?!xp)', r'\1*\3', func_str)
-    # Número con variable (2x -> 2*x)
-    func_str = re.sub(r'(\d)(\s*)(x)', r'\1*\3', func_str)
-    
-    # Multiplicación implícita: variable/constante con número
-    func_str = re.sub(r'(x)(\s*)(\d)', r'\1*\3', func_str)  # x2 -> x*2
-    
-    # Multiplicación implícita: constantes con variable
-    func_str = re.sub(r'(pi)(\s*)(x)', r'\1*\3', func_str)  # pix -> pi*x
-    # ex -> e*x SOLO si NO está precedido por 'e' (para evitar exp)
-    func_str = re.sub(r'(?<!e)\b(e)(\s*)(x)(?![a-z])', r'\1*\3', func_str)  # ex -> e*x pero no exp
-    
-    # Multiplicación implícita: número/variable/constante con paréntesis
-    # IMPORTANTE: solo si el dígito NO está precedido por letras O dígitos (para evitar log10, log2, etc.)
-    func_str = re.sub(r'(?<![a-z0-9])(\d+)(\s*)\(', r'\1*(', func_str)  # 2( -> 2*( (pero no log10()
-    func_str = re.sub(r'\b(x)(\s*)\(', r'\1*(', func_str)  # x( -> x*(
-    func_str = re.sub(r'(pi)(\s*)\(', r'\1*(', func_str)  # pi( -> pi*(
-    func_str = re.sub(r'\b(e)(\s*)\(', r'\1*(', func_str)  # e( -> e*(
-    
-    # Multiplicación implícita: paréntesis con paréntesis/variable
-    func_str = re.sub(r'\)(\s*)\(', r')*(', func_str)  # )( -> )*(
-    func_str = re.sub(r'\)(\s*)(x)', r')*\2', func_str)  # )x -> )*x
-    func_str = re.sub(r'\)(\s*)([a-z]+)\(', r')*\2(', func_str)  # )sin( -> )*sin(
-    
-    # Multiplicación implícita: número/variable/constante con función
-    # IMPORTANTE: usar \b antes para asegurar que no estamos en medio de una palabra
-    func_str = re.sub(r'(\d)(\s*)([a-z]+)\(', r'\1*\3(', func_str)  # 2sin( -> 2*sin(
-    func_str = re.sub(r'\b(x)(\s*)([a-z]+)\(', r'\1*\3(', func_str)  # xsin( -> x*sin( (pero no exp)
-    func_str = re.sub(r'(pi)(\s*)([a-z]+)\(', r'\1*\3(', func_str)  # pisin( -> pi*sin(
-    # esin( -> e*sin( pero NO exp(
-    func_str = re.sub(r'\b(e)(\s*)(?!xp)([a-z]+)\(', r'\1*\3(', func_str)
-    return func_str
+class ExpresionCompilada:
+    """
+    Expresión analizada una sola vez.
+    Los back ends (escalar, vectorizado) se compilan bajo demanda y se reutilizan.
+    Los polinomios escritos en forma expandida se compilan en forma de Horner (ver polinomios.py).
+    """
+    
+    def __init__(self, arbol):
+        self.arbol = arbol
+        self.texto = a_texto(arbol)  # Texto canónico (clave del caché)
+        self._escalar = None
+        self._vectorizada = None
+        self._derivada = None
+        self._texto_derivada = None
+        self._fusionada = None
+        self._compleja = None
+        self._fusionada_compleja = None
+        self._analitica = None
+        self._decimales = {}  # orden -> callable Decimal x -> (f, ..., f^(orden))
+        self._derivadas_superiores = {}  # orden -> árbol de f^(orden) (None si no es simbólica)
+        self._fusionadas_superiores = {}  # orden -> callable x -> (f, f', ..., f^(orden))
+        self._fusionadas_vectorizadas = {}  # orden -> callable x_array -> (f, f', ..., f^(orden))
+        self.diferenciable = None  # Se decide al derivar por primera vez
+        self._coeficientes = None
+        self._raices_polinomio = None
+        self.es_polinomio = None  # Se decide al extraer los coeficientes por primera vez
+        self._horner = None
+    
+    @property
+    def polinomio(self):
+        """Coeficientes (de mayor a menor grado) si la expresión es un polinomio en x; None si no"""
+        if self.es_polinomio is None:
+            self._coeficientes = coeficientes_polinomio(self.arbol)
+            self.es_polinomio = self._coeficientes is not None
+        return self._coeficientes
+    
+    @property
+    def raices_polinomio(self):
+        """Raíces reales del polinomio (matriz compañera, se calculan una sola vez); None si no es polinomio"""
+        if self._raices_polinomio is None and self.polinomio is not None:
+            self._raices_polinomio = raices_reales(self.polinomio)
+        return self._raices_polinomio
+    
+    @property
+    def horner(self):
+        """
+        True si se compila la forma de Horner: polinomio ya escrito en forma expandida.
+        Uno factorizado ((x - 1)^20) conserva su árbol, exacto cerca de sus raíces múltiples
+        (Horner sobre los coeficientes expandidos da 2e-11 en x = 1.1 en vez de 1e-20).
+        """
+        if self._horner is None:
+            self._horner = self.polinomio is not None and en_forma_expandida(self.arbol)
+        return self._horner
+    
+    def arbol_compilable(self, orden=0):
+        """
+        Árbol que se compila para f^(orden): forma de Horner de los coeficientes si la
+        expresión es un polinomio en forma expandida, el árbol original (o su derivada
+        simbólica) si no.
+        """
+        if self.horner:
+            return arbol_horner(derivada_polinomio(self.polinomio, orden))
+        return self.arbol if orden == 0 else self.derivada_de_orden(orden)
+    
+    @property
+    def escalar(self):
+        """Callable f(x) para valores escalares"""
+        if self._escalar is None:
+            try:
+                funcion_compilada = compilar_arbol(self.arbol_compilable(), ENTORNO_ESCALAR)
+            except Exception as e:
+                raise ValueError(f"Error al evaluar la función: {e}")
+            
+            def funcion(x_val):
+                try:
+                    return funcion_compilada(x_val)
+                except Exception as e:
+                    raise ValueError(f"Error al evaluar la función: {e}")
+            
+            funcion.codigo = funcion_compilada.codigo
+            self._escalar = funcion
+        return self._escalar
+    
+    @property
+    def vectorizada(self):
+        """Callable f(x_array) -> arreglo float con NaN donde el dominio es inválido"""
+        if self._vectorizada is None:
+            try:
+                funcion_compilada = compilar_arbol(self.arbol_compilable(), ENTORNO_VECTORIZADO)
+            except Exception as e:
+                raise ValueError(f"Error al evaluar la función: {e}")
+            
+            def funcion(x_array):
+                x_array = np.asarray(x_array, dtype=float)
+                try:
+                    with np.errstate(all='ignore'):
+                        y = funcion_compilada(x_array)
+                except Exception as e:
+                    raise ValueError(f"Error al evaluar la función: {e}")
+                # Copia en float (también expande expresiones constantes a la forma de x)
+                y = np.array(np.broadcast_to(y, x_array.shape), dtype=float)
+                y[~np.isfinite(y)] = np.nan
+                return y
+            
+            funcion.codigo = funcion_compilada.codigo
+            self._vectorizada = funcion
+        return self._vectorizada
+    
+    @property
+    def analitica(self):
+        """True si la expresión admite argumento complejo (sin abs, floor, ceil): derivada por paso complejo"""
+        if self._analitica is None:
+            self._analitica = es_analitica(self.arbol)
+        return self._analitica
+    
+    @property
+    def compleja(self):
+        """Callable f(z) para números complejos; None si la expresión no es analítica"""
+        if self._compleja is None and self.analitica:
+            try:
+                self._compleja = compilar_arbol(self.arbol_compilable(), ENTORNO_COMPLEJO)
+            except Exception as e:
+                raise ValueError(f"Error al evaluar la función: {e}")
+        return self._compleja
+    
+    @property
+    def fusionada_compleja_vectorizada(self):
+        """
+        Callable z_array -> (f, f') como arreglos complejos, NaN donde el valor no es finito
+        (Newton en el plano complejo, ver cuencas.py). None si la expresión no es analítica o
+        no tiene derivada simbólica.
+        """
+        if self._fusionada_compleja is None and self.analitica and self.derivada is not None:
+            try:
+                funcion_compilada = compilar_tupla(
+                    (self.arbol_compilable(), self.arbol_compilable(1)), ENTORNO_COMPLEJO_VECTORIZADO)
+            except Exception as e:
+                raise ValueError(f"Error al evaluar la función: {e}")
+            
+            def funcion(z_array):
+                z_array = np.asarray(z_array, dtype=complex)
+                try:
+                    with np.errstate(all='ignore'):
+                        resultados = funcion_compilada(z_array)
+                except Exception as e:
+                    raise ValueError(f"Error al evaluar la función: {e}")
+                return valores_finitos(resultados, z_array.shape, complex)
+            
+            funcion.codigo = funcion_compilada.codigo
+            self._fusionada_compleja = funcion
+        return self._fusionada_compleja
+    
+    @property
+    def derivada(self):
+        """Árbol de f'(x); None si la expresión no tiene derivada simbólica (floor, ceil)"""
+        if self.diferenciable is None:
+            try:
+                self._derivada = derivar(self.arbol)
+                self.diferenciable = True
+            except NoDiferenciable:
+                self.diferenciable = False
+        return self._derivada
+    
+    @property
+    def texto_derivada(self):
+        """Texto canónico de f'(x), o None si no hay derivada simbólica (se genera una sola vez)"""
+        if self._texto_derivada is None and self.derivada is not None:
+            self._texto_derivada = a_texto(self.derivada)
+        return self._texto_derivada
+    
+    @property
+    def fusionada(self):
+        """
+        Callable x -> (f(x), f'(x)) en una sola llamada compilada.
+        None si la expresión no tiene derivada simbólica (usar derivada numérica).
+        """
+        if self._fusionada is None and self.derivada is not None:
+            try:
+                funcion_compilada = compilar_tupla(
+                    (self.arbol_compilable(), self.arbol_compilable(1)), ENTORNO_ESCALAR)
+            except Exception as e:
+                raise ValueError(f"Error al evaluar la función: {e}")
+            
+            def funcion(x_val):
+                try:
+                    return funcion_compilada(x_val)
+                except Exception as e:
+                    raise ValueError(f"Error al evaluar la función: {e}")
+            
+            funcion.codigo = funcion_compilada.codigo
+            self._fusionada = funcion
+        return self._fusionada
+    
+    def decimal_de_orden(self, orden=1):
+        """
+        Callable x -> (f(x), ..., f^(orden)(x)) en números Decimal, a la precisión del contexto
+        actual (ver alta_precision.py). Usa el árbol original, no la forma de Horner (cuyos
+        coeficientes son float). None si alguna derivada hasta ese orden no es simbólica.
+        """
+        if orden not in self._decimales:
+            arboles = [self.arbol] + [self.derivada_de_orden(k) for k in range(1, orden + 1)]
+            funcion = None
+            if all(arbol is not None for arbol in arboles):
+                try:
+                    funcion_compilada = compilar_decimal(arboles, ENTORNO_DECIMAL)
+                except Exception as e:
+                    raise ValueError(f"Error al evaluar la función: {e}")
+                
+                def funcion(x_val):
+                    try:
+                        return funcion_compilada(x_val)
+                    except (ArithmeticError, ValueError, TypeError) as e:
+                        # decimal.InvalidOperation (ej: (-8)^(1/3)) es un ArithmeticError
+                        raise ValueError(f"Error al evaluar la función: {e}")
+                
+                funcion.codigo = funcion_compilada.codigo
+            self._decimales[orden] = funcion
+        return self._decimales[orden]
+    
+    def derivada_de_orden(self, orden):
+        """Árbol de f^(orden)(x); None si alguna derivada hasta ese orden no es simbólica"""
+        if orden == 1:
+            return self.derivada
+        if orden not in self._derivadas_superiores:
+            anterior = self.derivada_de_orden(orden - 1)
+            arbol = None
+            if anterior is not None:
+                try:
+                    arbol = derivar(anterior)
+                except NoDiferenciable:
+                    pass
+            self._derivadas_superiores[orden] = arbol
+        return self._derivadas_superiores[orden]
+    
+    def fusionada_de_orden(self, orden):
+        """
+        Callable x -> (f(x), f'(x), ..., f^(orden)(x)) en una sola llamada compilada
+        (las subexpresiones comunes entre f y sus derivadas se calculan una vez).
+        None si alguna derivada hasta ese orden no es simbólica.
+        """
+        if orden == 1:
+            return self.fusionada
+        if orden not in self._fusionadas_superiores:
+            arboles = [self.arbol_compilable(k) for k in range(orden + 1)]
+            funcion = None
+            if all(arbol is not None for arbol in arboles):
+                try:
+                    funcion_compilada = compilar_tupla(arboles, ENTORNO_ESCALAR)
+                except Exception as e:
+                    raise ValueError(f"Error al evaluar la función: {e}")
+                
+                def funcion(x_val):
+                    try:
+                        return funcion_compilada(x_val)
+                    except Exception as e:
+                        raise ValueError(f"Error al evaluar la función: {e}")
+                
+                funcion.codigo = funcion_compilada.codigo
+            self._fusionadas_superiores[orden] = funcion
+        return self._fusionadas_superiores[orden]
+    
+    @property
+    def fusionada_vectorizada(self):
+        """
+        Callable x_array -> (f, f') como arreglos float con NaN donde el dominio es inválido.
+        None si la expresión no tiene derivada simbólica.
+        """
+        return self.fusionada_vectorizada_de_orden(1)
+    
+    def fusionada_vectorizada_de_orden(self, orden):
+        """
+        Callable x_array -> (f, f', ..., f^(orden)) como arreglos float con NaN donde el
+        dominio es inválido. None si alguna derivada hasta ese orden no es simbólica.
+        """
+        if orden not in self._fusionadas_vectorizadas:
+            arboles = [self.arbol_compilable(k) for k in range(orden + 1)]
+            funcion = None
+            if all(arbol is not None for arbol in arboles):
+                try:
+                    funcion_compilada = compilar_tupla(arboles, ENTORNO_VECTORIZADO)
+                except Exception as e:
+                    raise ValueError(f"Error al evaluar la función: {e}")
+                
+                def funcion(x_array):
+                    x_array = np.asarray(x_array, dtype=float)
+                    try:
+                        with np.errstate(all='ignore'):
+                            resultados = funcion_compilada(x_array)
+                    except Exception as e:
+                        raise ValueError(f"Error al evaluar la función: {e}")
+                    return valores_finitos(resultados, x_array.shape)
+                
+                funcion.codigo = funcion_compilada.codigo
+            self._fusionadas_vectorizadas[orden] = funcion
+        return self._fusionadas_vectorizadas[orden]
 
-def evaluar_funcion(func_str, x_val):
-    """Evalúa la función de forma segura"""
-    try:
-        import re
-        
-        # Procesar raíces y logaritmos especiales PRIMERO (antes de reemplazar funciones)
-        # Usar función especial para raíz cúbica que maneja negativos correctamente
-        def cbrt_real(x):
-            """Raíz cúbica que maneja negativos correctamente"""
-            if x >= 0:
-                return x ** (1/3)
-            else:
-                return -((-x) ** (1/3))
-        
-        # Reemplazar cbrt con llamada a función personalizada
-        func_str = re.sub(r'cbrt\(', r'cbrt_real(', func_str)
-        # root(x,n) = x^(1/n) - el primer parámetro es x, el segundo es n
-        func_str = re.sub(r'root\(([^,]+),([^)]+)\)', r'((\1)**(1/(\2)))', func_str)
-        func_str = re.sub(r'logb\((.*?),(.*?)\)', r'(math.log(\1)/math.log(\2))', func_str)
-        
-        # Reemplazar constantes antes de funciones
-        func_str = func_str.replace('pi', 'math.pi')
-        # Reemplazar 'e' solo si no es parte de 'exp'
-        func_str = re.sub(r'\be\b', 'math.e', func_str)
-        
-        # Reemplazar funciones trigonométricas usando regex para evitar conflictos
-        func_str = re.sub(r'\basin\(', 'math.asin(', func_str)
-        func_str = re.sub(r'\bacos\(', 'math.acos(', func_str)
-        func_str = re.sub(r'\batan\(', 'math.atan(', func_str)
-        func_str = re.sub(r'\bsin\(', 'math.sin(', func_str)
-        func_str = re.sub(r'\bcos\(', 'math.cos(', func_str)
-        func_str = re.sub(r'\btan\(', 'math.tan(', func_str)
-        # Reemplazar funciones hiperbólicas e inversas
-        func_str = re.sub(r'\basinh\(', 'math.asinh(', func_str)
-        func_str = re.sub(r'\bacosh\(', 'math.acosh(', func_str)
-        func_str = re.sub(r'\batanh\(', 'math.atanh(', func_str)
-        func_str = re.sub(r'\bsinh\(', 'math.sinh(', func_str)
-        func_str = re.sub(r'\bcosh\(', 'math.cosh(', func_str)
-        func_str = re.sub(r'\btanh\(', 'math.tanh(', func_str)
-        # Funciones trigonométricas recíprocas
-        func_str = re.sub(r'\bcsc\(', 'csc_func(', func_str)
-        func_str = re.sub(r'\bsec\(', 'sec_func(', func_str)
-        func_str = re.sub(r'\bcot\(', 'cot_func(', func_str)
-        func_str = re.sub(r'\bexp\(', 'math.exp(', func_str)
-        func_str = re.sub(r'\bln\(', 'math.log(', func_str)
-        func_str = re.sub(r'\blog10\(', 'math.log10(', func_str)
-        func_str = re.sub(r'\blog2\(', 'math.log2(', func_str)
-        func_str = re.sub(r'\bsqrt\(', 'math.sqrt(', func_str)
-        func_str = re.sub(r'\bfloor\(', 'math.floor(', func_str)
-        func_str = re.sub(r'\bceil\(', 'math.ceil(', func_str)
+def valores_finitos(resultados, forma, dtype=float):
+    """Copia (float o complex) de cada resultado vectorizado, expandido a la forma dada y con NaN donde no es finito"""
+    salida = []
+    for valores in resultados:
+        valores = np.array(np.broadcast_to(valores, forma), dtype=dtype)
+        valores[~np.isfinite(valores)] = np.nan
+        salida.append(valores)
+    return tuple(salida)
+
+class ExpresionParametrica:
+    """
+    Expresión en x con parámetros con nombre: f(x; a, b, ...).
+    fijar() da la ExpresionCompilada (del caché) para valores concretos de los parámetros;
+    fusionada_barrido() compila f, ∂f/∂x y ∂f/∂a con el parámetro a como segunda variable,
+    para evaluar muchos valores de a en una pasada (ver continuacion.py).
+    """
+    
+    def __init__(self, func_str, parametros):
+        self.parametros = tuple(parametros)
+        self.arbol = parsear(func_str, self.parametros)
+        self.texto = a_texto(self.arbol)
+    
+    def _arbol_con(self, valores, libres=()):
+        """Árbol con los parámetros fijados; todos deben tener valor salvo los libres"""
+        faltantes = [p for p in self.parametros if p not in valores and p not in libres]
+        if faltantes:
+            raise ValueError(f"Falta el valor de: {', '.join(faltantes)}")
+        desconocidos = [p for p in valores if p not in self.parametros]
+        if desconocidos:
+            raise ValueError(f"Parámetro desconocido: {', '.join(desconocidos)}")
+        return sustituir(self.arbol, {p: v for p, v in valores.items() if p not in libres})
+    
+    def texto_con(self, valores):
+        """Texto de f(x) con los parámetros reemplazados (valores: dict nombre -> número)"""
+        return a_texto(self._arbol_con(valores))
+    
+    def fijar(self, valores):
+        """ExpresionCompilada de f(x) con los parámetros fijados (la comparten los métodos de solución)"""
+        return obtener_expresion(self.texto_con(valores))
+    
+    def vectorizada_barrido(self, parametro, fijos=None):
+        """
+        Callable (x_array, a_array) -> f como arreglo float (NaN donde el dominio es inválido),
+        con el parámetro libre a = parametro y los demás fijados en fijos
+        """
+        arbol = self._arbol_con(fijos or {}, libres=(parametro,))
+        funcion_compilada = compilar_arbol(arbol, ENTORNO_VECTORIZADO, variables=('x', parametro))
         
-        func_str = func_str.replace('abs(', 'abs(')
+        def funcion(x_array, a_array):
+            x_array = np.asarray(x_array, dtype=float)
+            try:
+                with np.errstate(all='ignore'):
+                    y = funcion_compilada(x_array, a_array)
+            except Exception as e:
+                raise ValueError(f"Error al evaluar la función: {e}")
+            return valores_finitos((y,), x_array.shape)[0]
         
-        # Reemplazar x por el valor (solo x como variable, no dentro de exp, etc.)
-        func_str = re.sub(r'\bx\b', str(x_val), func_str)
+        funcion.codigo = funcion_compilada.codigo
+        return funcion
+    
+    def fusionada_barrido(self, parametro, fijos=None):
+        """
+        Callable (x_array, a_array) -> (f, ∂f/∂x, ∂f/∂a) en una pasada compilada, como la
+        fusionada vectorizada de ExpresionCompilada. None si alguna de las dos derivadas no
+        es simbólica.
+        """
+        arbol = self._arbol_con(fijos or {}, libres=(parametro,))
+        try:
+            arboles = (arbol, derivar(arbol, 'x'), derivar(arbol, parametro))
+        except NoDiferenciable:
+            return None
+        funcion_compilada = compilar_tupla(arboles, ENTORNO_VECTORIZADO, variables=('x', parametro))
         
-        # Funciones trigonométricas recíprocas
-        def csc_func(x):
-            """Cosecante: csc(x) = 1/sin(x)"""
-            sin_val = math.sin(x)
-            if abs(sin_val) < 1e-15:
-                raise ValueError("Cosecante indefinida (sin(x) = 0)")
-            return 1 / sin_val
+        def funcion(x_array, a_array):
+            x_array = np.asarray(x_array, dtype=float)
+            try:
+                with np.errstate(all='ignore'):
+                    resultados = funcion_compilada(x_array, a_array)
+            except Exception as e:
+                raise ValueError(f"Error al evaluar la función: {e}")
+            return valores_finitos(resultados, x_array.shape)
         
-        def sec_func(x):
-            """Secante: sec(x) = 1/cos(x)"""
-            cos_val = math.cos(x)
-            if abs(cos_val) < 1e-15:
-                raise ValueError("Secante indefinida (cos(x) = 0)")
-            return 1 / cos_val
+        funcion.codigo = funcion_compilada.codigo
+        return funcion
+
+class CacheExpresiones:
+    """
+    Caché LRU acotado de expresiones compiladas, compartido por todo el proceso.
+    La clave es el texto canónico: '2x', '2*x' y '2 x' comparten una sola entrada.
+    """
+    
+    def __init__(self, max_entradas=128):
+        self.max_entradas = max_entradas
+        self._expresiones = OrderedDict()  # texto canónico -> ExpresionCompilada
+        self._alias = OrderedDict()  # texto tal como llegó -> texto canónico
+        self._lock = threading.Lock()
+        self.aciertos = 0
+        self.fallos = 0
+    
+    def obtener(self, func_str):
+        """Retorna la ExpresionCompilada de func_str (la analiza solo si no está en caché)"""
+        with self._lock:
+            clave = self._alias.get(func_str)
+            expresion = self._expresiones.get(clave) if clave is not None else None
+            if expresion is not None:
+                self._alias.move_to_end(func_str)
+                self._expresiones.move_to_end(clave)
+                self.aciertos += 1
+                return expresion
         
-        def cot_func(x):
-            """Cotangente: cot(x) = cos(x)/sin(x)"""
-            sin_val = math.sin(x)
-            if abs(sin_val) < 1e-15:
-                raise ValueError("Cotangente indefinida (sin(x) = 0)")
-            return math.cos(x) / sin_val
+        # Analizar fuera del lock; los errores de sintaxis no se guardan
+        arbol = parsear(func_str)
+        clave = a_texto(arbol)
         
-        # Evaluar de forma segura
-        allowed_names = {
-            "__builtins__": {},
-            "math": math,
-            "abs": abs,
-            "cbrt_real": cbrt_real,
-            "csc_func": csc_func,
-            "sec_func": sec_func,
-            "cot_func": cot_func
+        with self._lock:
+            expresion = self._expresiones.get(clave)
+            if expresion is None:
+                self.fallos += 1
+                expresion = ExpresionCompilada(arbol)
+                self._expresiones[clave] = expresion
+                if len(self._expresiones) > self.max_entradas:
+                    self._expresiones.popitem(last=False)
+            else:
+                self.aciertos += 1
+                self._expresiones.move_to_end(clave)
+            
+            self._alias[func_str] = clave
+            if len(self._alias) > 4 * self.max_entradas:
+                self._alias.popitem(last=False)
+        return expresion
+    
+    def estadisticas(self):
+        """Contadores de aciertos/fallos y ocupación del caché"""
+        total = self.aciertos + self.fallos
+        return {
+            'aciertos': self.aciertos,
+            'fallos': self.fallos,
+            'entradas': len(self._expresiones),
+            'max_entradas': self.max_entradas,
+            'tasa_aciertos': self.aciertos / total if total else 0.0
         }
-        return eval(func_str, allowed_names)
-    except Exception as e:
-        raise ValueError(f"Error al evaluar la función: {e}")
+    
+    def limpiar(self):
+        """Vacía el caché y reinicia los contadores"""
+        with self._lock:
+            self._expresiones.clear()
+            self._alias.clear()
+            self.aciertos = 0
+            self.fallos = 0
+
+# Caché único del proceso
+CACHE_EXPRESIONES = CacheExpresiones()
+
+def obtener_expresion(func_str):
+    """Punto de entrada común: expresión analizada/compilada desde el caché"""
+    return CACHE_EXPRESIONES.obtener(func_str)
+
+def preprocesar_funcion(func_str: str) -> str:
+    """
+    Preprocesa la función para convertir notación matemática.
+    Un único análisis sintáctico (tokenizador + parser) reemplaza la cadena de regex:
+    el resultado es el texto canónico con multiplicación explícita y '**' ('2pix' -> '2*pi*x').
+    """
+    return obtener_expresion(func_str).texto
+
+def compilar_funcion(func_str):
+    """
+    Compila la función una sola vez (o la toma del caché).
+    Retorna un callable f(x) que reutiliza el código compilado en cada evaluación.
+    """
+    return obtener_expresion(func_str).escalar
+
+def evaluar_funcion(func_str, x_val):
+    """Evalúa la función de forma segura"""
+    return compilar_funcion(func_str)(x_val)
+
+def compilar_funcion_vectorizada(func_str):
+    """
+    Compila la función para evaluar arreglos completos con NumPy (o la toma del caché).
+    Retorna un callable f(x_array) -> arreglo float con NaN donde el dominio es inválido.
+    """
+    return obtener_expresion(func_str).vectorizada
+
+def evaluar_funcion_vectorizada(func_str, x_array):
+    """Evalúa la función sobre un arreglo completo de puntos en una sola pasada"""
+    return compilar_funcion_vectorizada(func_str)(x_array)
+
+def estadisticas_cache():
+    """Estadísticas del caché de expresiones compiladas"""
+    return CACHE_EXPRESIONES.estadisticas()
 
 def validar_ecuacion(func_str):
     """Valida si la ecuación es correcta"""
@@ -183,9 +524,8 @@ def validar_ecuacion(func_str):
         if depth != 0:
             return False, "Paréntesis desbalanceados"
         
-        func_str_proc = preprocesar_funcion(func_str)
-        # Probar evaluación con x=1
-        evaluar_funcion(func_str_proc, 1)
+        # Analizar/compilar a través del caché y probar evaluación con x=1
+        obtener_expresion(func_str).escalar(1)
         return True, "Ecuación válida"
     except Exception as e:
         return False, str(e)
\ No newline at end of file
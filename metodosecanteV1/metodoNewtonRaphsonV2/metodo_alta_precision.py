@@ -0,0 +1,142 @@
+"""
+Newton-Raphson en precisión arbitraria (módulo decimal)
+Newton duplica los dígitos correctos en cada paso, así que no tiene sentido calcular desde
+el principio con todos los dígitos pedidos: la precisión de trabajo sigue a los dígitos ya
+correctos (el doble más una guarda), empieza en PRECISION_INICIAL y solo los últimos pasos
+se pagan a la precisión completa.
+La tolerancia fija los dígitos: 1e-50 -> raíz con 50 dígitos correctos. Por debajo del
+mínimo de float (1e-308) se puede pasar como Decimal o texto: Decimal('1e-1000').
+"""
+
+import time
+from decimal import Decimal, localcontext, getcontext, ROUND_FLOOR
+from matematicas import obtener_expresion
+from iteraciones import ErrorIteracion, recolectar_iteraciones
+
+PRECISION_INICIAL = 20
+DIGITOS_GUARDA = 10
+MAX_DIGITOS = 5000
+
+def a_decimal(x):
+    """Decimal del texto del número (1.1 -> Decimal('1.1'), no el binario 1.100000000000000088...)"""
+    return Decimal(repr(x)) if isinstance(x, float) else Decimal(x)
+
+def digitos_objetivo(tolerancia):
+    """Precisión final (dígitos significativos) para alcanzar la tolerancia relativa (Decimal)"""
+    if not tolerancia > 0:
+        raise ErrorIteracion("Error: La tolerancia debe ser positiva.")
+    digitos = -tolerancia.log10().to_integral_value(rounding=ROUND_FLOOR) + DIGITOS_GUARDA
+    return int(min(max(PRECISION_INICIAL, digitos), MAX_DIGITOS))
+
+def derivada_decimal(funcion, x):
+    """Diferencia central con h = 10^-(precisión/3) (expresiones sin derivada simbólica: floor, ceil)"""
+    h = Decimal(10) ** -(getcontext().prec // 3) * max(1, abs(x))
+    return (funcion(x + h)[0] - funcion(x - h)[0]) / (2 * h)
+
+def iterar_newton_alta_precision(func_str, x0, tolerance, max_iter, tiempo_limite=None, cancelacion=None,
+                                 duplicar_precision=True):
+    """
+    Generador de Newton-Raphson en números Decimal: entrega cada registro de iteración
+    (con 'precision', los dígitos usados en ese paso) y retorna el dict de resultado,
+    con la raíz como Decimal (ver iteraciones.py).
+    Converge cuando, a la precisión completa, el error relativo baja de la tolerancia.
+    tiempo_limite: segundos máximos de ejecución (None = sin límite)
+    cancelacion: token Cancelacion; si se activa, retorna el resultado parcial con 'cancelado'
+    duplicar_precision=False calcula todos los pasos con la precisión completa (para comparar)
+    """
+    limite = time.perf_counter() + tiempo_limite if tiempo_limite is not None else None
+    tolerancia = a_decimal(tolerance)
+    objetivo = digitos_objetivo(tolerancia)
+
+    expresion = obtener_expresion(func_str)
+    fusionada = expresion.decimal_de_orden(1)
+    funcion = expresion.decimal_de_orden(0)
+
+    xn_old = a_decimal(x0)
+    precision = min(PRECISION_INICIAL, objetivo) if duplicar_precision else objetivo
+    error_rel = Decimal('Infinity')
+    evaluaciones = 0
+
+    for i in range(max_iter):
+        if limite is not None and time.perf_counter() > limite:
+            raise ErrorIteracion(f"Error: Tiempo límite excedido ({tiempo_limite} s) en la iteración {i + 1}.")
+        if cancelacion is not None and cancelacion.cancelada:
+            return {
+                'raiz': xn_old,
+                'iteracion': i,
+                'error': error_rel,
+                'convergio': False,
+                'cancelado': True,
+                'derivada': expresion.texto_derivada,
+                'evaluaciones': evaluaciones,
+                'precision': objetivo
+            }
+
+        with localcontext() as ctx:
+            ctx.prec = precision
+            xn_old = +xn_old  # Redondear a la precisión de este paso
+            try:
+                if fusionada is not None:
+                    fxn, fpxn = fusionada(xn_old)
+                    evaluaciones += 2
+                else:
+                    fxn, = funcion(xn_old)
+                    fpxn = derivada_decimal(funcion, xn_old)
+                    evaluaciones += 3
+            except ValueError as e:
+                raise ErrorIteracion(str(e))
+
+            if fpxn == 0:
+                if fxn != 0:
+                    raise ErrorIteracion("Error: La derivada es cero o no se puede calcular.")
+                xn = xn_old
+            else:
+                xn = xn_old - fxn / fpxn
+            error_rel = abs((xn - xn_old) / (xn if xn != 0 else 1))
+
+        yield {
+            'iteracion': i + 1,
+            'xn': xn_old,
+            'fxn': fxn,
+            'fpxn': fpxn,
+            'xn_nuevo': xn,
+            'error_rel': error_rel,
+            'precision': precision
+        }
+
+        # Solo se declara la convergencia con la precisión completa
+        if precision == objetivo and (fxn == 0 or error_rel < tolerancia):
+            return {
+                'raiz': xn,
+                'iteracion': i + 1,
+                'error': error_rel,
+                'convergio': True,
+                'derivada': expresion.texto_derivada,
+                'evaluaciones': evaluaciones,
+                'precision': objetivo
+            }
+
+        # xn tiene ~2·(dígitos correctos de xn_old): la precisión del próximo paso se duplica
+        correctos = -error_rel.adjusted() if error_rel != 0 else objetivo
+        if duplicar_precision:
+            precision = min(objetivo, max(PRECISION_INICIAL, 2 * correctos + DIGITOS_GUARDA))
+        xn_old = xn
+
+    return {
+        'raiz': xn,
+        'iteracion': max_iter,
+        'error': error_rel,
+        'convergio': False,
+        'derivada': expresion.texto_derivada,
+        'evaluaciones': evaluaciones,
+        'precision': objetivo
+    }
+
+def ejecutar_newton_alta_precision(func_str, x0, tolerance, max_iter, tiempo_limite=None):
+    """
+    Ejecuta Newton-Raphson en precisión arbitraria (recolecta iterar_newton_alta_precision)
+    tiempo_limite: segundos máximos de ejecución (None = sin límite)
+    Retorna: (exito, resultado, iteraciones_data)
+    """
+    return recolectar_iteraciones(
+        iterar_newton_alta_precision(func_str, x0, tolerance, max_iter, tiempo_limite=tiempo_limite))
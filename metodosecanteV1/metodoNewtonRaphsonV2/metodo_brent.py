@@ -0,0 +1,150 @@
+"""
+Método de Brent
+Combina interpolación cuadrática inversa, secante y bisección dentro de un
+intervalo con cambio de signo: converge superlinealmente en problemas suaves,
+nunca peor que la bisección en los demás, y usa una sola evaluación de f por
+iteración, sin derivada.
+"""
+
+import math
+import time
+from matematicas import obtener_expresion
+from metodo_hibrido import buscar_intervalo
+
+EPSILON = 2.220446049250313e-16
+
+PASO_INTERPOLACION = 'interpolacion'
+PASO_SECANTE = 'secante'
+PASO_BISECCION = 'biseccion'
+
+MENSAJE_SIN_INTERVALO = ("Error: No se encontró un cambio de signo cerca de x0; "
+                         "el método de Brent necesita un intervalo [a, b].")
+
+def ejecutar_metodo_brent(func_str, x0, tolerance, max_iter, a=None, b=None, tiempo_limite=None):
+    """
+    Ejecuta el método de Brent
+    a, b: intervalo con cambio de signo (None = se busca alrededor de x0)
+    tiempo_limite: segundos máximos de ejecución (None = sin límite)
+    Cada registro de iteración incluye 'paso' (interpolacion, secante o biseccion) y el intervalo 'a', 'b';
+    'fpxn' es la pendiente de la secante entre los dos últimos puntos.
+    Retorna: (exito, resultado, iteraciones_data)
+    """
+    try:
+        limite = time.perf_counter() + tiempo_limite if tiempo_limite is not None else None
+
+        # Compilar una sola vez (caché de expresiones) y reutilizar en todas las iteraciones
+        funcion = obtener_expresion(func_str).escalar
+
+        if a is not None and b is not None:
+            fa, fb = funcion(a), funcion(b)
+            evaluaciones = 2
+            if fa * fb > 0:
+                return False, "Error: f(a) y f(b) deben tener signos opuestos.", []
+        else:
+            encontrado = buscar_intervalo(funcion, x0)
+            evaluaciones = encontrado[-1]
+            if len(encontrado) != 5:
+                return False, MENSAJE_SIN_INTERVALO, []
+            a, fa, b, fb, _ = encontrado
+
+        # Escala de |f| en el intervalo inicial (para distinguir raíces de polos)
+        escala_intervalo = min(abs(fa), abs(fb))
+
+        # b: mejor aproximación, c: extremo opuesto del intervalo, a: punto anterior
+        c, fc = a, fa
+        d = e = b - a
+        error_rel_decimal = float('inf')
+        iteraciones_data = []
+
+        for i in range(max_iter + 1):
+            if (fb > 0) == (fc > 0):
+                c, fc = a, fa
+                d = e = b - a
+            if abs(fc) < abs(fb):
+                a, b, c = b, c, b
+                fa, fb, fc = fb, fc, fb
+
+            tol1 = 2 * EPSILON * abs(b) + 0.5 * tolerance * max(abs(b), 1.0)
+            xm = 0.5 * (c - b)
+            error_rel_decimal = abs(xm) / max(abs(b), 1.0)
+
+            # Verificar convergencia (residuo o semiancho del intervalo)
+            if abs(fb) < 1e-12 or abs(xm) <= tol1:
+                if abs(fb) >= 1e-12 and abs(fb) >= escala_intervalo:
+                    # |f| creció al cerrar el intervalo: colapsó sobre un polo (ej: 1/x), no sobre una raíz
+                    return False, "Error: El cambio de signo corresponde a una discontinuidad, no a una raíz.", []
+                return True, {
+                    'raiz': b,
+                    'iteracion': i,
+                    'error': error_rel_decimal,
+                    'convergio': True,
+                    'derivada': None,
+                    'evaluaciones': evaluaciones
+                }, iteraciones_data
+
+            if i == max_iter:
+                break
+            if limite is not None and time.perf_counter() > limite:
+                return False, f"Error: Tiempo límite excedido ({tiempo_limite} s) en la iteración {i + 1}.", []
+
+            paso = PASO_BISECCION
+            if abs(e) >= tol1 and abs(fa) > abs(fb):
+                s = fb / fa
+                if a == c:
+                    # Secante con los dos últimos puntos
+                    p = 2 * xm * s
+                    q = 1 - s
+                    candidato = PASO_SECANTE
+                else:
+                    # Interpolación cuadrática inversa con a, b y c
+                    q = fa / fc
+                    r = fb / fc
+                    p = s * (2 * xm * q * (q - r) - (b - a) * (r - 1))
+                    q = (q - 1) * (r - 1) * (s - 1)
+                    candidato = PASO_INTERPOLACION
+                if p > 0:
+                    q = -q
+                p = abs(p)
+                # Aceptar la interpolación solo si cae dentro del intervalo y reduce el paso
+                if 2 * p < min(3 * xm * q - abs(tol1 * q), abs(e * q)):
+                    e, d = d, p / q
+                    paso = candidato
+                else:
+                    d = e = xm
+            else:
+                d = e = xm
+
+            pendiente = (fb - fa) / (b - a) if b != a else float('nan')
+            xn_old, fxn_old = b, fb
+
+            # Única evaluación nueva de la iteración
+            a, fa = b, fb
+            b += d if abs(d) > tol1 else math.copysign(tol1, xm)
+            fb = funcion(b)
+            evaluaciones += 1
+
+            error_rel_decimal = abs((b - xn_old) / (b if b != 0 else 1))
+            iteraciones_data.append({
+                'iteracion': i + 1,
+                'xn': xn_old,
+                'fxn': fxn_old,
+                'fpxn': pendiente,
+                'xn_nuevo': b,
+                'error_rel': error_rel_decimal,
+                'paso': paso,
+                'a': min(xn_old, c),
+                'b': max(xn_old, c)
+            })
+
+        # Máximo de iteraciones alcanzado
+        return True, {
+            'raiz': b,
+            'iteracion': max_iter,
+            'error': error_rel_decimal,
+            'convergio': False,
+            'derivada': None,
+            'evaluaciones': evaluaciones
+        }, iteraciones_data
+
+    except Exception as e:
+        return False, str(e), []
@@ -0,0 +1,247 @@
+"""
+Newton-Raphson protegido
+Mientras no conoce un cambio de signo avanza con Newton; en cuanto lo encuentra
+guarda el intervalo [a, b] y ya no lo abandona. Un paso de Newton que sale del
+intervalo o que no reduce el residuo a la mitad se reemplaza por un paso de
+Illinois (regla falsa modificada), y si el intervalo no se reduce a la mitad en
+dos iteraciones se fuerza una bisección. Con intervalo, la convergencia está
+garantizada en O(log2((b - a) / tolerancia)) iteraciones.
+"""
+
+import math
+import time
+from matematicas import obtener_expresion
+from metodo_newton_raphson import calcular_derivada_numerica
+
+# Iteraciones de Newton sin intervalo antes de buscar un cambio de signo alrededor de x0
+ITERACIONES_SIN_INTERVALO = 50
+# Evaluaciones máximas de la búsqueda de cambio de signo
+MAX_EVALUACIONES_BUSQUEDA = 60
+# Veces que se acorta a la mitad un paso de Newton que sale del dominio (sin intervalo)
+MAX_REDUCCIONES_PASO = 20
+
+PASO_NEWTON = 'newton'
+PASO_ILLINOIS = 'illinois'
+PASO_BISECCION = 'biseccion'
+
+def buscar_intervalo(funcion, x0, max_evaluaciones=MAX_EVALUACIONES_BUSQUEDA):
+    """
+    Busca un cambio de signo alejándose de x0 en ambas direcciones con pasos que se duplican.
+    Retorna (a, fa, b, fb, evaluaciones) o (None, evaluaciones) si no lo encuentra.
+    """
+    paso = 1e-2 * max(abs(x0), 1.0)
+    ultimos = {}  # Último punto válido de cada lado: signo -> (x, fx)
+    evaluaciones = 0
+    try:
+        fx0 = funcion(x0)
+        evaluaciones += 1
+        if math.isfinite(fx0):
+            ultimos[-1] = ultimos[1] = (x0, fx0)
+    except (ValueError, TypeError):
+        pass  # Fuera del dominio o valor complejo (ej: root(x, 3) con x < 0)
+
+    while evaluaciones < max_evaluaciones:
+        for signo in (-1, 1):
+            x = x0 + signo * paso
+            evaluaciones += 1
+            try:
+                fx = funcion(x)
+                if not math.isfinite(fx):
+                    continue
+            except (ValueError, TypeError):
+                continue  # Fuera del dominio: seguir alejándose
+            previo = ultimos.get(signo)
+            if previo is not None and previo[1] * fx <= 0:
+                (xa, fa), (xb, fb) = sorted([previo, (x, fx)])
+                return (xa, fa, xb, fb, evaluaciones)
+            ultimos[signo] = (x, fx)
+        paso *= 2
+    return (None, evaluaciones)
+
+def ejecutar_newton_protegido(func_str, x0, tolerance, max_iter, a=None, b=None, tiempo_limite=None):
+    """
+    Ejecuta Newton-Raphson protegido con intervalo de cambio de signo
+    a, b: intervalo inicial opcional (f(a) y f(b) con signos opuestos)
+    tiempo_limite: segundos máximos de ejecución (None = sin límite)
+    Cada registro de iteración incluye 'paso' (newton, illinois o biseccion) y el intervalo 'a', 'b'.
+    Retorna: (exito, resultado, iteraciones_data)
+    """
+    try:
+        limite = time.perf_counter() + tiempo_limite if tiempo_limite is not None else None
+
+        expresion = obtener_expresion(func_str)
+        funcion = expresion.escalar
+        fusionada = expresion.fusionada
+        evaluaciones = 0
+
+        def evaluar(x):
+            """(f(x), f'(x)); f'(x) es None si no se puede calcular. ValueError fuera del dominio"""
+            nonlocal evaluaciones
+            valores = None
+            if fusionada is not None:
+                try:
+                    evaluaciones += 2
+                    valores = fusionada(x)
+                except ValueError:
+                    pass  # f' fuera de su dominio (ej: sqrt(x) en 0)
+            if valores is None:
+                evaluaciones += 3
+                fx = funcion(x)
+                valores = fx, None if isinstance(fx, complex) else calcular_derivada_numerica(funcion, x)
+            if isinstance(valores[0], complex) or isinstance(valores[1], complex):
+                # Valor complejo (ej: root(x, 3) con x < 0): fuera del dominio, como en buscar_intervalo
+                raise ValueError(f"Error: La función no es real en x = {x:.6g} (fuera del dominio).")
+            return valores
+
+        # Intervalo [a, b] con f(a), f(b) y los pesos de Illinois
+        con_intervalo = a is not None and b is not None
+        if con_intervalo:
+            a, b = min(a, b), max(a, b)
+            fa, fb = funcion(a), funcion(b)
+            evaluaciones += 2
+            if isinstance(fa, complex) or isinstance(fb, complex):
+                return False, "Error: La función no es real en a o en b (fuera del dominio).", []
+            if fa * fb > 0:
+                return False, "Error: f(a) y f(b) deben tener signos opuestos.", []
+            if not a <= x0 <= b:
+                x0 = (a + b) / 2
+            fa_i, fb_i, lado = fa, fb, 0
+            anchos = [b - a]
+            escala_intervalo = min(abs(fa), abs(fb))
+
+        x = x0
+        fx, fpx = evaluar(x)
+        paso_lento = False  # El último paso de Newton no redujo el residuo a la mitad
+        busqueda_hecha = False
+        iteraciones_data = []
+
+        for i in range(max_iter):
+            if limite is not None and time.perf_counter() > limite:
+                return False, f"Error: Tiempo límite excedido ({tiempo_limite} s) en la iteración {i + 1}.", []
+
+            # Candidato de Newton: xn = x - f(x) / f'(x)
+            xn = None
+            if fpx is not None and abs(fpx) >= 1e-15:
+                candidato = x - fx / fpx
+                if math.isfinite(candidato) and (not con_intervalo or a <= candidato <= b):
+                    xn = candidato
+            elif abs(fx) < 1e-12:
+                xn = x  # Ya es raíz aunque f'(x) sea cero (ej: x^2 en 0)
+
+            # Sin intervalo y Newton sin paso útil, estancado o demasiado largo: buscar un cambio de signo
+            if not con_intervalo and not busqueda_hecha and (
+                    xn is None or paso_lento or i == ITERACIONES_SIN_INTERVALO):
+                busqueda_hecha = True
+                encontrado = buscar_intervalo(funcion, x)
+                evaluaciones += encontrado[-1]
+                if len(encontrado) == 5:
+                    a, fa, b, fb, _ = encontrado
+                    fa_i, fb_i, lado = fa, fb, 0
+                    anchos = [b - a]
+                    escala_intervalo = min(abs(fa), abs(fb))
+                    con_intervalo = True
+                    if xn is not None and not a <= xn <= b:
+                        xn = None
+            if xn is None and not con_intervalo:
+                return False, "Error: La derivada es cero y no se encontró un cambio de signo cerca de x0.", []
+
+            paso = PASO_NEWTON
+            if con_intervalo and (xn is None or paso_lento):
+                if len(anchos) >= 3 and anchos[-1] > 0.5 * anchos[-3]:
+                    # El intervalo no se redujo a la mitad en dos iteraciones: bisección
+                    xn, paso = (a + b) / 2, PASO_BISECCION
+                else:
+                    xn, paso = b - fb_i * (b - a) / (fb_i - fa_i), PASO_ILLINOIS
+                    if not a < xn < b:
+                        xn, paso = (a + b) / 2, PASO_BISECCION
+
+            # Calcular error relativo
+            error_rel_decimal = abs((xn - x) / (xn if xn != 0 else 1)) if i > 0 else float('inf')
+
+            iteracion_info = {
+                'iteracion': i + 1,
+                'xn': x,
+                'fxn': fx,
+                'fpxn': fpx if fpx is not None else float('nan'),
+                'xn_nuevo': xn,
+                'error_rel': error_rel_decimal,
+                'paso': paso,
+                'a': a if con_intervalo else None,
+                'b': b if con_intervalo else None
+            }
+            iteraciones_data.append(iteracion_info)
+
+            # Verificar convergencia (residuo, cambio relativo o ancho del intervalo)
+            ancho_rel = (b - a) / max(abs(xn), 1.0) if con_intervalo else float('inf')
+            if abs(fx) < 1e-12 or (i > 0 and error_rel_decimal < tolerance) or ancho_rel < tolerance:
+                if con_intervalo and abs(fx) >= 1e-12 and abs(fx) >= escala_intervalo:
+                    # |f| creció al cerrar el intervalo: colapsó sobre un polo (ej: 1/x), no sobre una raíz
+                    return False, "Error: El cambio de signo corresponde a una discontinuidad, no a una raíz.", []
+                return True, {
+                    'raiz': xn,
+                    'iteracion': i + 1,
+                    'error': min(error_rel_decimal, ancho_rel),
+                    'convergio': True,
+                    'derivada': expresion.texto_derivada,
+                    'evaluaciones': evaluaciones
+                }, iteraciones_data
+
+            try:
+                fxn, fpxn = evaluar(xn)
+            except ValueError:
+                if not con_intervalo:
+                    # Newton saltó fuera del dominio (ej: root(x, 3) - 0.5 desde 0.5 cae en x < 0):
+                    # acortar el paso a la mitad hacia x hasta volver a entrar
+                    fxn, xn = None, (x + xn) / 2
+                    for _ in range(MAX_REDUCCIONES_PASO):
+                        try:
+                            fxn, fpxn = evaluar(xn)
+                            break
+                        except ValueError:
+                            xn = (x + xn) / 2
+                    if fxn is None:
+                        raise
+                    iteracion_info['xn_nuevo'] = xn
+                else:
+                    # Hueco en el dominio dentro del intervalo: bisección
+                    xn = (a + b) / 2
+                    iteracion_info['xn_nuevo'], iteracion_info['paso'] = xn, PASO_BISECCION
+                    fxn, fpxn = evaluar(xn)
+
+            paso_lento = paso == PASO_NEWTON and abs(fxn) > 0.5 * abs(fx)
+
+            # Actualizar el intervalo (Illinois: si un extremo se conserva dos veces, su peso se divide)
+            if con_intervalo:
+                if (fxn < 0) == (fa < 0):
+                    a, fa, fa_i = xn, fxn, fxn
+                    if lado == -1:
+                        fb_i /= 2
+                    lado = -1
+                else:
+                    b, fb, fb_i = xn, fxn, fxn
+                    if lado == 1:
+                        fa_i /= 2
+                    lado = 1
+                anchos.append(b - a)
+            elif fx * fxn < 0:
+                # Primer cambio de signo entre dos iteraciones de Newton
+                (a, fa), (b, fb) = sorted([(x, fx), (xn, fxn)])
+                fa_i, fb_i, lado = fa, fb, 0
+                anchos = [b - a]
+                escala_intervalo = min(abs(fa), abs(fb))
+                con_intervalo = True
+
+            x, fx, fpx = xn, fxn, fpxn
+
+        # Máximo de iteraciones alcanzado
+        return True, {
+            'raiz': xn,
+            'iteracion': max_iter,
+            'error': error_rel_decimal,
+            'convergio': False,
+            'derivada': expresion.texto_derivada,
+            'evaluaciones': evaluaciones
+        }, iteraciones_data
+
+    except Exception as e:
+        return False, str(e), []
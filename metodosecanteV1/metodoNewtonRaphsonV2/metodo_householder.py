@@ -0,0 +1,134 @@
+"""
+Métodos de Householder
+Iteraciones de orden superior con derivadas simbólicas evaluadas en una sola
+llamada compilada (f, f', ..., f^(d)):
+- orden 2 (Halley): convergencia cúbica con f''
+- orden 3 (Householder): convergencia de orden cuatro con f'' y f'''
+Cuestan más por iteración que Newton, pero necesitan menos iteraciones: convienen
+cuando cada evaluación es cara y las derivadas comparten subexpresiones con f.
+"""
+
+import time
+from matematicas import obtener_expresion
+from metodo_newton_raphson import calcular_derivada_numerica
+
+def paso_householder(orden, f, d1, d2=0.0, d3=0.0):
+    """
+    (numerador, denominador) del paso xn+1 = xn - numerador / denominador
+    orden 1: Newton, orden 2: Halley, orden 3: Householder
+    """
+    if orden == 1:
+        return f, d1
+    if orden == 2:
+        return 2 * f * d1, 2 * d1 * d1 - f * d2
+    return f * (6 * d1 * d1 - 3 * f * d2), 6 * d1 * d1 * d1 - 6 * f * d1 * d2 + f * f * d3
+
+def ejecutar_metodo_householder(func_str, x0, tolerance, max_iter, orden=3, tiempo_limite=None):
+    """
+    Ejecuta el método de Householder del orden dado (2 = Halley, 3 = Householder)
+    Si la expresión no tiene derivadas simbólicas hasta ese orden, o fallan en un punto
+    (fuera de dominio), la iteración usa el paso de Newton.
+    tiempo_limite: segundos máximos de ejecución (None = sin límite)
+    Retorna: (exito, resultado, iteraciones_data)
+    """
+    try:
+        limite = time.perf_counter() + tiempo_limite if tiempo_limite is not None else None
+
+        expresion = obtener_expresion(func_str)
+        funcion = expresion.escalar
+        # Kernel fusionado (f, f', ..., f^(orden)); None si falta alguna derivada simbólica
+        fusionada = expresion.fusionada_de_orden(orden)
+        fusionada_newton = expresion.fusionada
+
+        tolerance_decimal = tolerance
+        xn_old = x0
+        evaluaciones = 0
+        iteraciones_data = []
+
+        for i in range(max_iter):
+            if limite is not None and time.perf_counter() > limite:
+                return False, f"Error: Tiempo límite excedido ({tiempo_limite} s) en la iteración {i + 1}.", []
+
+            # Evaluar f(xn) y sus derivadas en una sola llamada
+            derivadas = None
+            if fusionada is not None:
+                try:
+                    derivadas = fusionada(xn_old)
+                    evaluaciones += orden + 1
+                except ValueError:
+                    pass  # Alguna derivada fuera de su dominio (ej: sqrt(x) en 0)
+
+            if derivadas is None:
+                # Sin derivadas de orden superior: paso de Newton
+                if fusionada_newton is not None:
+                    try:
+                        derivadas = fusionada_newton(xn_old)
+                        evaluaciones += 2
+                    except ValueError:
+                        pass
+                if derivadas is None:
+                    fxn = funcion(xn_old)
+                    derivadas = (fxn, None if isinstance(fxn, complex) else calcular_derivada_numerica(funcion, xn_old))
+                    evaluaciones += 3
+
+            if any(isinstance(valor, complex) for valor in derivadas):
+                # Potencia de base negativa (ej: root(x, 3) o x^x con x < 0): fuera del dominio real
+                return False, f"Error: La función no es real en x = {xn_old:.6g} (fuera del dominio).", []
+
+            fxn, fpxn = derivadas[0], derivadas[1]
+            if fpxn is None or abs(fpxn) < 1e-15:
+                return False, "Error: La derivada es cero o no se puede calcular.", []
+
+            numerador, denominador = paso_householder(len(derivadas) - 1, *derivadas)
+            if abs(denominador) < 1e-15:
+                # Denominador degenerado: paso de Newton
+                numerador, denominador = fxn, fpxn
+
+            xn = xn_old - numerador / denominador
+
+            # Calcular error relativo
+            error_rel_decimal = abs((xn - xn_old) / (xn if xn != 0 else 1)) if i > 0 else float('inf')
+
+            # Guardar datos de la iteración
+            iteracion_info = {
+                'iteracion': i + 1,
+                'xn': xn_old,
+                'fxn': fxn,
+                'fpxn': fpxn,
+                'fppxn': derivadas[2] if len(derivadas) > 2 else float('nan'),
+                'xn_nuevo': xn,
+                'error_rel': error_rel_decimal
+            }
+            if orden >= 3:
+                iteracion_info['fpppxn'] = derivadas[3] if len(derivadas) > 3 else float('nan')
+            iteraciones_data.append(iteracion_info)
+
+            # Verificar convergencia
+            if abs(fxn) < 1e-12 or (i > 0 and error_rel_decimal < tolerance_decimal):
+                return True, {
+                    'raiz': xn,
+                    'iteracion': i + 1,
+                    'error': error_rel_decimal,
+                    'convergio': True,
+                    'derivada': expresion.texto_derivada,
+                    'evaluaciones': evaluaciones
+                }, iteraciones_data
+
+            xn_old = xn
+
+        # Máximo de iteraciones alcanzado
+        return True, {
+            'raiz': xn,
+            'iteracion': max_iter,
+            'error': error_rel_decimal,
+            'convergio': False,
+            'derivada': expresion.texto_derivada,
+            'evaluaciones': evaluaciones
+        }, iteraciones_data
+
+    except Exception as e:
+        return False, str(e), []
+
+def ejecutar_metodo_halley(func_str, x0, tolerance, max_iter, tiempo_limite=None):
+    """Método de Halley: Householder de orden 2 (convergencia cúbica)"""
+    return ejecutar_metodo_householder(func_str, x0, tolerance, max_iter, 2, tiempo_limite)
@@ -1,78 +1,526 @@
-from matematicas import preprocesar_funcion, evaluar_funcion
+import math
+import time
+import numpy as np
+from matematicas import obtener_expresion, compilar_funcion
+from iteraciones import ErrorIteracion, recolectar_iteraciones
+from derivada_numerica import derivada_numerica, derivada_richardson, validar_estrategia, DERIVADA_AUTOMATICA
+from diagnostico import (MonitorConvergencia, describir_estado, ESTADO_CONVERGIO, ESTADO_MAX_ITER,
+                         ESTADO_DERIVADA_CERO, ESTADO_FUERA_DE_DOMINIO, ESTADO_DIVERGIO, ESTADO_CANCELADO)
 
-def calcular_derivada_numerica(func_str, x_val, h=1e-8):
-    """Calcula la derivada numérica usando diferencias finitas"""
+def calcular_derivada_numerica(funcion, x_val, h=None):
+    """
+    Calcula la derivada numérica con extrapolación de Richardson (ver derivada_numerica.py)
+    funcion: función compilada (o texto preprocesado, que se compila aquí)
+    h: paso inicial (None = relativo a x_val); se reduce si x ± h sale del dominio
+    Solo se usa cuando la expresión no tiene derivada simbólica (floor, ceil)
+    """
     try:
-        # Intentar con diferencias centrales primero
-        try:
-            f_plus = evaluar_funcion(func_str, x_val + h)
-            f_minus = evaluar_funcion(func_str, x_val - h)
-            return (f_plus - f_minus) / (2 * h)
-        except:
-            # Si falla (ej: ln(x-h) con x pequeño), usar diferencias hacia adelante
-            f_plus = evaluar_funcion(func_str, x_val + h)
-            f_current = evaluar_funcion(func_str, x_val)
-            return (f_plus - f_current) / h
-    except:
+        if isinstance(funcion, str):
+            funcion = compilar_funcion(funcion)
+        return derivada_richardson(funcion, x_val, h)[0]
+    except (ValueError, ZeroDivisionError):
         return None
 
-def ejecutar_metodo_newton_raphson(func_str, x0, tolerance, max_iter):
+# Variantes del paso de Newton según la multiplicidad estimada de la raíz
+VARIANTE_NEWTON = 'newton'          # xn+1 = xn - f / f'
+VARIANTE_MODIFICADO = 'modificado'  # xn+1 = xn - m·f / f' (raíz de multiplicidad m conocida)
+VARIANTE_COCIENTE = 'cociente'      # Newton sobre u = f / f' (raíz simple de u, sea cual sea m)
+
+# Se cambia de variante cuando la convergencia es lineal (orden estimado < ORDEN_LINEAL), la
+# estimación de m se repite entre dos iteraciones (variación relativa < VARIACION_MULTIPLICIDAD)
+# y el paso relativo ya es menor que PASO_RELATIVO_CAMBIO (lejos de la raíz, Newton sobre x^2 - 4
+# también reduce el paso a la mitad y parecería una raíz doble)
+ORDEN_LINEAL = 1.5
+VARIACION_MULTIPLICIDAD = 0.1
+PASO_RELATIVO_CAMBIO = 0.1
+# Distancia máxima de m a un entero para usar Newton modificado (si no, el cociente f / f')
+DISTANCIA_ENTERO = 0.2
+
+NAN = float('nan')
+
+def estimar_convergencia(razon, razon_anterior, factor=1):
+    """
+    Orden empírico y multiplicidad de la raíz a partir de los cocientes de pasos consecutivos
+    razon = d_k / d_k-1 y razon_anterior = d_k-1 / d_k-2, con d_k = xn+1 - xn (con signo)
+    orden: q = ln|razon| / ln|razon_anterior| (1 = lineal, 2 = cuadrático)
+    multiplicidad: con xn+1 = xn - factor·f / f' el error se reduce en r = 1 - factor / m por
+    paso, así que m = factor / (1 - razon) (Newton: factor = 1, razon -> (m-1)/m)
+    Retorna (orden, multiplicidad), con NaN donde los pasos no alcanzan o no convergen.
+    """
+    multiplicidad = factor / (1 - razon) if -1 < razon < 1 else NAN
+    if razon != 0 and 0 < abs(razon_anterior) != 1:
+        return math.log(abs(razon)) / math.log(abs(razon_anterior)), multiplicidad
+    return NAN, multiplicidad
+
+# Distancia relativa a una raíz deflacionada por debajo de la cual la iteración se da por
+# perdida (ahí g = f / ∏(x - ri) es 0 / 0 en punto flotante)
+SEPARACION_DEFLACION = 1e-6
+
+def iterar_newton_raphson(func_str, x0, tolerance, max_iter, tiempo_limite=None, cancelacion=None,
+                          derivada=DERIVADA_AUTOMATICA, detectar_multiplicidad=True, diagnosticar=True,
+                          deflacion=()):
+    """
+    Generador del método de Newton-Raphson: entrega cada registro de iteración en cuanto
+    se calcula y retorna el dict de resultado (ver iteraciones.py).
+    Cada iteración cuesta dos evaluaciones (f y f'); con f' numérica, f más las de la
+    estrategia (una por paso complejo, varias por Richardson). El total se reporta en
+    resultado['evaluaciones'].
+    En una raíz múltiple Newton converge solo linealmente: con el orden y la multiplicidad
+    estimados de los últimos pasos (estimar_convergencia) cambia a Newton modificado
+    (m·f / f') o, si m no es entera, a Newton sobre f / f' (usa f''). Si un paso de esas
+    variantes aumenta |f|, se deshace y se sigue con Newton. Cada registro trae 'orden',
+    'multiplicidad' (estimados; NaN al principio), 'variante' y 'factor' (la m usada).
+    tiempo_limite: segundos máximos de ejecución (None = sin límite)
+    derivada: 'auto' (simbólica; numérica donde no la hay), 'paso_complejo' o 'richardson'
+    (ver derivada_numerica.py)
+    cancelacion: token Cancelacion; si se activa, retorna el resultado parcial con 'cancelado'
+    detectar_multiplicidad=False usa siempre el paso de Newton (para comparar)
+    Un ciclo, la divergencia o el estancamiento (ver diagnostico.py) terminan la iteración
+    antes de max_iter. resultado['estado'] trae el motivo (ESTADO_*); si no convergió,
+    'raiz' es el iterado con menor |f|, 'diagnostico' describe el motivo y 'reinicio'
+    sugiere un x0 perturbado desde el que Newton sí converge (None si no se encontró).
+    diagnosticar=False desactiva esa detección (itera hasta max_iter)
+    deflacion: raíces ya encontradas (repetidas según su multiplicidad); se resuelve
+    g(x) = f(x) / ∏(x - ri) sin formar el producto: g / g' = f / (f' - f·Σ 1 / (x - ri)),
+    así que el paso solo cambia f' por esa derivada efectiva (la que trae 'fpxn')
+    Los fallos (derivada cero, tiempo límite, dominio, f compleja) se lanzan como excepción.
     """
-    Ejecuta el método de Newton-Raphson
+    limite = time.perf_counter() + tiempo_limite if tiempo_limite is not None else None
+    try:
+        validar_estrategia(derivada)
+    except ValueError as e:
+        raise ErrorIteracion(f"Error: {e}")
+    
+    # Compilar una sola vez (caché de expresiones) y reutilizar en todas las iteraciones
+    expresion = obtener_expresion(func_str)
+    funcion = expresion.escalar
+    # Kernel fusionado (f, f') con derivada simbólica; None para floor/ceil o si se pidió f' numérica
+    fusionada = expresion.fusionada if derivada == DERIVADA_AUTOMATICA else None
+    try:
+        derivada_aproximada = derivada_numerica(expresion, derivada)
+    except ValueError as e:
+        raise ErrorIteracion(str(e))
+    
+    tolerance_decimal = tolerance
+    xn_old = x0
+    error_rel_decimal = float('inf')
+    evaluaciones = 0
+    
+    # Estado de la detección de raíces múltiples
+    variante = VARIANTE_NEWTON
+    factor = 1
+    paso_anterior = 0.0  # xn - xn-1 (0 = sin paso previo)
+    razon = NAN  # Cociente entre los dos últimos pasos
+    multiplicidad_anterior = NAN
+    fusionada_segunda = None  # (f, f', f''), solo para la variante del cociente
+    cambio_bloqueado = not detectar_multiplicidad
+    anterior = None  # (xn, f(xn), f'(xn)) antes de un paso modificado o del cociente
+    monitor = MonitorConvergencia()
+    observar = monitor.observar if diagnosticar else None
+    
+    for i in range(max_iter):
+        if limite is not None and time.perf_counter() > limite:
+            raise ErrorIteracion(f"Error: Tiempo límite excedido ({tiempo_limite} s) en la iteración {i + 1}.")
+        if cancelacion is not None and cancelacion.cancelada:
+            return {
+                'raiz': xn_old,
+                'iteracion': i,
+                'error': error_rel_decimal,
+                'convergio': False,
+                'cancelado': True,
+                'estado': ESTADO_CANCELADO,
+                'derivada': expresion.texto_derivada,
+                'evaluaciones': evaluaciones
+            }
+        
+        # Evaluar f(xn) y f'(xn) (y f'' en la variante del cociente) en una sola llamada
+        fpxn = fppxn = None
+        try:
+            if variante == VARIANTE_COCIENTE:
+                fxn, fpxn, fppxn = fusionada_segunda(xn_old)
+                evaluaciones += 3
+            elif fusionada is not None:
+                fxn, fpxn = fusionada(xn_old)
+                evaluaciones += 2
+        except ValueError:
+            fpxn = None  # f' fuera de su dominio (ej: sqrt(x) en 0)
+        
+        if fpxn is None:
+            # Sin derivada simbólica: derivada numérica (paso complejo o Richardson)
+            fxn = funcion(xn_old)
+            fpxn, evaluaciones_derivada = derivada_aproximada(xn_old)
+            evaluaciones += 1 + evaluaciones_derivada
+        
+        if isinstance(fxn, complex) or isinstance(fpxn, complex):
+            # Potencia de base negativa (ej: root(x, 3) o x^x con x < 0): los iterados saldrían
+            # del eje real, donde ni la derivada numérica ni la estimación de m tienen sentido
+            raise ErrorIteracion(f"Error: La función no es real en x = {xn_old:.6g} (fuera del dominio).")
+        
+        if deflacion and fpxn is not None:
+            if any(abs(xn_old - r) <= SEPARACION_DEFLACION * max(1.0, abs(r)) for r in deflacion):
+                # g = f / ∏(x - ri) todavía se anula en una raíz ya deflacionada: su multiplicidad era
+                # mayor. Ahí el paso es 0 / 0 en punto flotante: se reporta esa raíz
+                return {
+                    'raiz': xn_old,
+                    'iteracion': i,
+                    'error': error_rel_decimal,
+                    'convergio': True,
+                    'estado': ESTADO_CONVERGIO,
+                    'derivada': expresion.texto_derivada,
+                    'evaluaciones': evaluaciones
+                }
+            # Deflación implícita: derivada efectiva de g = f / ∏(x - ri) (relativa a g)
+            fpxn -= fxn * sum(1.0 / (xn_old - r) for r in deflacion)
+        
+        deshecho = anterior is not None and (abs(fxn) > abs(anterior[1]) or (
+            (fpxn is None or abs(fpxn) < 1e-15) and abs(fxn) >= 1e-12))
+        if deshecho:
+            # El paso modificado alejó de la raíz o cayó en f' = 0 (m mal estimada, ej: x^20 - 1 lejos
+            # de sus raíces se parece a una raíz de multiplicidad 20): volver al punto previo con Newton
+            xn_old, fxn, fpxn = anterior
+            fppxn = None
+            variante, factor, cambio_bloqueado = VARIANTE_NEWTON, 1, True
+            paso_anterior, razon = 0.0, NAN
+        anterior = None
+        
+        if fpxn is not None and abs(fpxn) < 1e-15 and abs(fxn) < 1e-12:
+            xn = xn_old  # Ya es raíz aunque f'(xn) sea cero (ej: semilla en una raíz doble)
+        elif fpxn is None or abs(fpxn) < 1e-15:
+            raise ErrorIteracion("Error: La derivada es cero o no se puede calcular.")
+        elif fppxn is not None and fpxn * fpxn != fxn * fppxn:
+            # Newton sobre u = f / f': u / u' = f·f' / (f'^2 - f·f'')
+            xn = xn_old - fxn * fpxn / (fpxn * fpxn - fxn * fppxn)
+        else:
+            # Fórmula de Newton-Raphson: xn = xn-1 - m·f(xn-1) / f'(xn-1) (m = 1 salvo en el modificado)
+            xn = xn_old - factor * fxn / fpxn
+        
+        # Calcular error relativo
+        error_rel_decimal = abs((xn - xn_old) / (xn if xn != 0 else 1)) if i > 0 else float('inf')
+        
+        # Orden y multiplicidad estimados de los últimos pasos
+        paso = xn - xn_old
+        razon_anterior, razon = razon, (paso / paso_anterior if paso_anterior != 0 else NAN)
+        if razon == razon:
+            orden, multiplicidad = estimar_convergencia(razon, razon_anterior, factor)
+        else:
+            orden = multiplicidad = NAN
+        
+        # Entregar los datos de la iteración
+        yield {
+            'iteracion': i + 1,
+            'xn': xn_old,
+            'fxn': fxn,
+            'fpxn': fpxn,
+            'xn_nuevo': xn,
+            'error_rel': error_rel_decimal,
+            'orden': orden,
+            'multiplicidad': multiplicidad,
+            'variante': variante,
+            'factor': factor
+        }
+        
+        # Verificar convergencia
+        if abs(fxn) < 1e-12 or (i > 0 and error_rel_decimal < tolerance_decimal):
+            if i == 0:
+                # Convergió en el primer paso (ej: desde una semilla exacta): reportar ese paso
+                error_rel_decimal = abs((xn - xn_old) / (xn if xn != 0 else 1))
+            raiz = xn
+            if variante != VARIANTE_NEWTON and abs(razon) > 1:
+                # Paso más largo que el anterior junto a una raíz múltiple: f y f' ya son ruido de redondeo
+                raiz = xn_old
+            return {
+                'raiz': raiz,
+                'iteracion': i + 1,
+                'error': error_rel_decimal,
+                'convergio': True,
+                'estado': ESTADO_CONVERGIO,
+                'derivada': expresion.texto_derivada,
+                'evaluaciones': evaluaciones
+            }
+        
+        # Ciclo, divergencia o estancamiento: terminar antes de max_iter (el punto deshecho ya se observó)
+        motivo = observar(xn_old, fxn) if observar is not None and not deshecho else None
+        if motivo is not None:
+            resultado = resultado_sin_convergencia(expresion, monitor, motivo, x0, tolerance, i + 1,
+                                                   error_rel_decimal, evaluaciones)
+            resultado['derivada'] = expresion.texto_derivada
+            return resultado
+        
+        # Convergencia lineal con m estable: cambiar a Newton modificado o al cociente f / f'
+        if (not cambio_bloqueado and variante != VARIANTE_COCIENTE and orden < ORDEN_LINEAL
+                and abs(multiplicidad - multiplicidad_anterior) < VARIACION_MULTIPLICIDAD * multiplicidad
+                and abs(paso) < PASO_RELATIVO_CAMBIO * max(1.0, abs(xn))):
+            m = round(multiplicidad)
+            if abs(multiplicidad - m) <= DISTANCIA_ENTERO and m != factor:
+                variante = VARIANTE_MODIFICADO if m > 1 else VARIANTE_NEWTON
+                factor = m
+            elif fusionada is not None and not deflacion:
+                # (el cociente usa f'' de f, que la deflación no corrige)
+                if fusionada_segunda is None:
+                    fusionada_segunda = expresion.fusionada_de_orden(2)
+                if fusionada_segunda is not None:
+                    variante, factor = VARIANTE_COCIENTE, 1
+            paso, razon, multiplicidad = 0.0, NAN, NAN
+        multiplicidad_anterior = multiplicidad
+        paso_anterior = paso
+        if variante != VARIANTE_NEWTON:
+            anterior = (xn_old, fxn, fpxn)
+        
+        xn_old = xn
+    
+    # Máximo de iteraciones alcanzado
+    resultado = resultado_sin_convergencia(expresion, monitor, ESTADO_MAX_ITER, x0, tolerance, max_iter,
+                                           error_rel_decimal, evaluaciones)
+    resultado['raiz'] = xn
+    resultado['derivada'] = expresion.texto_derivada
+    return resultado
+
+def resultado_sin_convergencia(expresion, monitor, estado, x0, tolerance, iteraciones, error, evaluaciones,
+                               sugerir=True):
+    """
+    Dict de resultado de una ejecución que terminó sin converger: raíz aproximada (el iterado
+    con menor |f|), motivo y x0 sugerido para reiniciar (sugerir_reinicio).
+    sugerir=False deja 'reinicio' en None: la sugerencia sale de sondear Newton, que no
+    sirve para otros métodos.
+    """
+    return {
+        'raiz': monitor.mejor_x,
+        'iteracion': iteraciones,
+        'error': error,
+        'convergio': False,
+        'estado': estado,
+        'diagnostico': describir_estado(estado, monitor),
+        'reinicio': sugerir_reinicio(expresion.texto, x0, tolerance) if sugerir else None,
+        'evaluaciones': evaluaciones
+    }
+
+def ejecutar_metodo_newton_raphson(func_str, x0, tolerance, max_iter, tiempo_limite=None,
+                                   derivada=DERIVADA_AUTOMATICA, deflacion=()):
+    """
+    Ejecuta el método de Newton-Raphson (recolecta iterar_newton_raphson en una lista)
+    tiempo_limite: segundos máximos de ejecución (None = sin límite)
+    derivada: estrategia de f' ('auto', 'paso_complejo' o 'richardson')
+    deflacion: raíces ya encontradas que la iteración debe evitar (ver ejecutar_newton_deflacion)
     Retorna: (exito, resultado, iteraciones_data)
     """
+    return recolectar_iteraciones(
+        iterar_newton_raphson(func_str, x0, tolerance, max_iter, tiempo_limite=tiempo_limite,
+                              derivada=derivada, deflacion=deflacion))
+
+MAX_RAICES_DEFLACION = 50
+INTENTOS_DEFLACION = 4  # Puntos de partida seguidos sin raíz nueva antes de terminar
+
+def ejecutar_newton_deflacion(func_str, x0, tolerance, max_iter, num_raices=None, tiempo_limite=None):
+    """
+    Encuentra varias raíces distintas en una llamada, todas desde x0.
+    Cada corrida de ejecutar_metodo_newton_raphson resuelve f(x) / ∏(x - ri) con las raíces
+    ya encontradas (deflación implícita: el producto nunca se forma y f se sigue evaluando
+    con el kernel compilado original, sin el error acumulado de dividir coeficientes), así
+    que no vuelve a caer en ellas. Una raíz múltiple se deflaciona según su multiplicidad
+    ('factor' del último registro); si igual reaparece, su multiplicidad aumenta en uno.
+    Cuando una corrida no converge se reintenta desde el x0 que sugiere su diagnóstico
+    ('reinicio') o desde x0 perturbado (PERTURBACIONES_REINICIO), hasta INTENTOS_DEFLACION
+    fallos seguidos.
+    num_raices: cuántas raíces buscar (None = hasta que no aparezcan más, máx. MAX_RAICES_DEFLACION)
+    tiempo_limite: segundos máximos de cada corrida (None = sin límite)
+    Retorna: (exito, resultado, corridas)
+    - resultado: 'raices' (ordenadas) y sus 'multiplicidades', 'iteracion' y 'evaluaciones'
+      totales, 'convergio' (se encontraron num_raices) y 'diagnostico' (por qué terminó la búsqueda)
+    - corridas: un dict por corrida que convergió (x0, raiz, multiplicidad, iteraciones, evaluaciones)
+    """
+    escala = max(1.0, abs(x0))
+    perturbados = [x0 + desplazamiento * escala for desplazamiento in PERTURBACIONES_REINICIO]
+    objetivo = min(num_raices, MAX_RAICES_DEFLACION) if num_raices is not None else MAX_RAICES_DEFLACION
+    raices, multiplicidades, deflacion, corridas = [], [], [], []
+    iteraciones_total = evaluaciones_total = 0
+    fallos = 0
+    diagnostico = None
+    inicios = [x0] + perturbados
+
+    def indice_cercana(x, multiplicidad=1):
+        """
+        Índice de la raíz encontrada que coincide con x (de esa multiplicidad); None si no
+        hay. Una raíz de multiplicidad m solo se determina hasta ~|f|^(1/m): la separación
+        crece con la mayor de las dos multiplicidades.
+        """
+        for j, (r, m) in enumerate(zip(raices, multiplicidades)):
+            separacion = max(SEPARACION_DEFLACION, 10 * tolerance, 1e-12 ** (1 / (max(m, multiplicidad) + 1)))
+            if abs(x - r) <= separacion * max(1.0, abs(r)):
+                return j
+        return None
+
+    while len(raices) < objetivo and fallos < INTENTOS_DEFLACION and len(corridas) < 2 * MAX_RAICES_DEFLACION:
+        # Primer punto de partida que no está sobre una raíz deflacionada (ahí g es 0 / 0)
+        while inicios and indice_cercana(inicios[0]) is not None:
+            inicios.pop(0)
+        if not inicios:
+            break
+        inicio = inicios.pop(0)
+        exito, resultado, iteraciones_data = ejecutar_metodo_newton_raphson(
+            func_str, inicio, tolerance, max_iter, tiempo_limite=tiempo_limite, deflacion=tuple(deflacion))
+        if not exito or not resultado['convergio']:
+            diagnostico = resultado if not exito else resultado.get('diagnostico')
+            if exito and resultado.get('reinicio') is not None:
+                inicios.insert(0, resultado['reinicio'])
+            fallos += 1
+            continue
+        fallos = 0
+        inicios = [x0] + perturbados
+        iteraciones_total += resultado['iteracion']
+        evaluaciones_total += resultado['evaluaciones']
+
+        raiz = resultado['raiz']
+        multiplicidad = iteraciones_data[-1]['factor'] if len(iteraciones_data) else 1
+        repetida = indice_cercana(raiz, multiplicidad)
+        if repetida is None:
+            raices.append(raiz)
+            multiplicidades.append(multiplicidad)
+        else:
+            # Reapareció (multiplicidad subestimada): deflacionarla otra vez en el mismo punto
+            raiz = raices[repetida]
+            multiplicidades[repetida] += multiplicidad
+        deflacion.extend([raiz] * multiplicidad)
+        corridas.append({
+            'x0': inicio,
+            'raiz': raiz,
+            'multiplicidad': multiplicidad,
+            'iteraciones': resultado['iteracion'],
+            'evaluaciones': resultado['evaluaciones']
+        })
+
+    if not raices:
+        return False, diagnostico or "Error: No se encontró ninguna raíz.", []
+    orden = sorted(range(len(raices)), key=raices.__getitem__)
+    return True, {
+        'raices': [raices[j] for j in orden],
+        'multiplicidades': [multiplicidades[j] for j in orden],
+        'iteracion': iteraciones_total,
+        'evaluaciones': evaluaciones_total,
+        'convergio': num_raices is None or len(raices) >= num_raices,
+        'diagnostico': diagnostico
+    }, corridas
+
+def calcular_derivada_numerica_vectorizada(funcion_vectorizada, x, h=1e-8):
+    """Diferencias centrales sobre un arreglo (para expresiones sin derivada simbólica)"""
+    return (funcion_vectorizada(x + h) - funcion_vectorizada(x - h)) / (2 * h)
+
+def agrupar_raices(raices, valores_f, tolerance):
+    """
+    Elimina duplicados: raíces ordenadas a distancia relativa menor que la tolerancia
+    forman un grupo y se conserva la de menor |f(x)|.
+    """
+    if raices.size == 0:
+        return raices
+    orden = np.argsort(raices)
+    raices = raices[orden]
+    valores_f = np.abs(valores_f[orden])
+    
+    separacion = max(tolerance, 1e-10) * 10
+    nuevo_grupo = np.diff(raices) > separacion * np.maximum(1.0, np.abs(raices[1:]))
+    grupos = np.split(np.arange(raices.size), np.nonzero(nuevo_grupo)[0] + 1)
+    return np.array([raices[g[np.argmin(valores_f[g])]] for g in grupos])
+
+def ejecutar_newton_multiarranque(func_str, x0s, tolerance, max_iter):
+    """
+    Ejecuta Newton-Raphson desde muchos puntos iniciales a la vez.
+    Todos los carriles avanzan juntos con el evaluador vectorizado (f y f' en una pasada);
+    los que convergen o fallan se enmascaran y dejan de evaluarse.
+    Retorna: (exito, resultado, carriles)
+    """
     try:
-        func_str_proc = preprocesar_funcion(func_str)
+        expresion = obtener_expresion(func_str)
+        fusionada = expresion.fusionada_vectorizada
+        funcion_vectorizada = expresion.vectorizada
+        
+        x0s = np.atleast_1d(np.asarray(x0s, dtype=float)).ravel()
+        x = x0s.copy()
+        n = x.size
+        iteraciones = np.zeros(n, dtype=int)
+        errores = np.full(n, np.inf)
+        estados = np.full(n, ESTADO_MAX_ITER, dtype=object)
         
-        tolerance_decimal = tolerance
-        xn_old = x0
-        iteraciones_data = []
+        estados[~np.isfinite(x)] = ESTADO_FUERA_DE_DOMINIO
+        activos = np.nonzero(np.isfinite(x))[0]  # Índices de carriles aún iterando
         
         for i in range(max_iter):
-            # Evaluar función en xn
-            fxn = evaluar_funcion(func_str_proc, xn_old)
+            if activos.size == 0:
+                break
             
-            # Calcular derivada numérica
-            fpxn = calcular_derivada_numerica(func_str_proc, xn_old)
+            xa = x[activos]
+            if fusionada is not None:
+                fxa, fpxa = fusionada(xa)
+            else:
+                fxa = funcion_vectorizada(xa)
+                fpxa = calcular_derivada_numerica_vectorizada(funcion_vectorizada, xa)
+            iteraciones[activos] = i + 1
             
-            if fpxn is None or abs(fpxn) < 1e-15:
-                return False, "Error: La derivada es cero o no se puede calcular.", []
+            # Carriles que no pueden dar el paso
+            fuera = np.isnan(fxa) | np.isnan(fpxa)
+            cero = ~fuera & (np.abs(fpxa) < 1e-15)
+            paso = ~(fuera | cero)
             
-            # Fórmula de Newton-Raphson: xn = xn-1 - f(xn-1) / f'(xn-1)
-            xn = xn_old - fxn / fpxn
+            # Fórmula de Newton-Raphson en todos los carriles válidos
+            xn = np.where(paso, xa - fxa / np.where(paso, fpxa, 1.0), xa)
+            if i > 0:
+                error_rel = np.abs((xn - xa) / np.where(xn != 0, xn, 1.0))
+            else:
+                error_rel = np.full(xa.size, np.inf)
             
-            # Calcular error relativo
-            error_rel_decimal = abs((xn - xn_old) / (xn if xn != 0 else 1)) if i > 0 else float('inf')
+            diverge = paso & ~np.isfinite(xn)
+            paso &= ~diverge
+            x[activos[paso]] = xn[paso]
+            errores[activos[paso]] = error_rel[paso]
             
-            # Guardar datos de la iteración
-            iteracion_info = {
-                'iteracion': i + 1,
-                'xn': xn_old,
-                'fxn': fxn,
-                'fpxn': fpxn,
-                'xn_nuevo': xn,
-                'error_rel': error_rel_decimal
-            }
-            iteraciones_data.append(iteracion_info)
+            convergio = paso & ((np.abs(fxa) < 1e-12) | (error_rel < tolerance))
             
-            # Verificar convergencia
-            if abs(fxn) < 1e-12 or (i > 0 and error_rel_decimal < tolerance_decimal):
-                return True, {
-                    'raiz': xn,
-                    'iteracion': i + 1,
-                    'error': error_rel_decimal,
-                    'convergio': True
-                }, iteraciones_data
+            estados[activos[fuera]] = ESTADO_FUERA_DE_DOMINIO
+            estados[activos[cero]] = ESTADO_DERIVADA_CERO
+            estados[activos[diverge]] = ESTADO_DIVERGIO
+            estados[activos[convergio]] = ESTADO_CONVERGIO
             
-            xn_old = xn
+            # Enmascarar carriles terminados
+            activos = activos[paso & ~convergio]
+        
+        convergidos = estados == ESTADO_CONVERGIO
+        raices_convergidas = x[convergidos]
+        raices = agrupar_raices(raices_convergidas, funcion_vectorizada(raices_convergidas), tolerance)
+        
+        carriles = [{
+            'x0': float(x0s[j]),
+            'raiz': float(x[j]),
+            'iteraciones': int(iteraciones[j]),
+            'error': float(errores[j]),
+            'estado': estados[j]
+        } for j in range(n)]
         
-        # Máximo de iteraciones alcanzado
         return True, {
-            'raiz': xn,
-            'iteracion': max_iter,
-            'error': error_rel_decimal,
-            'convergio': False
-        }, iteraciones_data
+            'raices': raices,
+            'x': x,
+            'iteraciones': iteraciones,
+            'errores': errores,
+            'estados': estados,
+            'convergio': convergidos
+        }, carriles
     
     except Exception as e:
         return False, str(e), []
+
+# Desplazamientos de x0 (en unidades de max(1, |x0|)) que prueba sugerir_reinicio, del más cercano al más lejano
+PERTURBACIONES_REINICIO = (0.1, -0.1, 0.25, -0.25, 0.5, -0.5, 1.0, -1.0, 2.0, -2.0, 4.0, -4.0)
+MAX_ITER_REINICIO = 50
+
+def sugerir_reinicio(func_str, x0, tolerance):
+    """
+    x0 perturbado desde el que Newton converge: prueba los desplazamientos de
+    PERTURBACIONES_REINICIO a la vez (ejecutar_newton_multiarranque, MAX_ITER_REINICIO
+    iteraciones) y retorna el más cercano a x0 que convergió; None si ninguno lo hizo
+    """
+    escala = max(1.0, abs(x0))
+    candidatos = [x0 + desplazamiento * escala for desplazamiento in PERTURBACIONES_REINICIO]
+    exito, resultado, _ = ejecutar_newton_multiarranque(func_str, candidatos, tolerance, MAX_ITER_REINICIO)
+    if not exito:
+        return None
+    for candidato, convergio in zip(candidatos, resultado['convergio']):
+        if convergio:
+            return candidato
+    return None
@@ -0,0 +1,91 @@
+import time
+from matematicas import obtener_expresion
+
+def segundo_punto_inicial(x0):
+    """x1 por defecto: x0 desplazado un paso pequeño relativo a su magnitud"""
+    return x0 + 1e-4 * max(abs(x0), 1.0)
+
+def ejecutar_metodo_secante(func_str, x0, tolerance, max_iter, x1=None, tiempo_limite=None):
+    """
+    Ejecuta el método de la secante
+    No necesita derivada: f'(xn) se aproxima con la pendiente entre xn-1 y xn.
+    Cada iteración evalúa f una sola vez (f(xn-1) se reutiliza de la iteración anterior).
+    x1: segundo punto inicial (None = x0 desplazado ligeramente)
+    tiempo_limite: segundos máximos de ejecución (None = sin límite)
+    Retorna: (exito, resultado, iteraciones_data)
+    """
+    try:
+        limite = time.perf_counter() + tiempo_limite if tiempo_limite is not None else None
+
+        # Compilar una sola vez (caché de expresiones) y reutilizar en todas las iteraciones
+        funcion = obtener_expresion(func_str).escalar
+
+        tolerance_decimal = tolerance
+        xn_anterior = x0
+        xn_old = x1 if x1 is not None else segundo_punto_inicial(x0)
+        fxn_anterior = funcion(xn_anterior)
+        evaluaciones = 1
+        iteraciones_data = []
+
+        for i in range(max_iter):
+            if limite is not None and time.perf_counter() > limite:
+                return False, f"Error: Tiempo límite excedido ({tiempo_limite} s) en la iteración {i + 1}.", []
+
+            # Única evaluación nueva de la iteración
+            fxn = funcion(xn_old)
+            evaluaciones += 1
+            if isinstance(fxn, complex) or isinstance(fxn_anterior, complex):
+                # Potencia de base negativa (ej: root(x, 3) con x < 0): fuera del dominio real
+                x_complejo = xn_anterior if isinstance(fxn_anterior, complex) else xn_old
+                return False, f"Error: La función no es real en x = {x_complejo:.6g} (fuera del dominio).", []
+
+            # Pendiente de la secante (aproxima f'(xn))
+            dx = xn_old - xn_anterior
+            pendiente = (fxn - fxn_anterior) / dx if dx != 0 else 0.0
+
+            if abs(pendiente) < 1e-15:
+                return False, "Error: La pendiente de la secante es cero (f(xn) = f(xn-1)).", []
+
+            # Fórmula de la secante: xn+1 = xn - f(xn) * (xn - xn-1) / (f(xn) - f(xn-1))
+            xn = xn_old - fxn / pendiente
+
+            # Calcular error relativo
+            error_rel_decimal = abs((xn - xn_old) / (xn if xn != 0 else 1)) if i > 0 else float('inf')
+
+            # Guardar datos de la iteración
+            iteracion_info = {
+                'iteracion': i + 1,
+                'xn_anterior': xn_anterior,
+                'fxn_anterior': fxn_anterior,
+                'xn': xn_old,
+                'fxn': fxn,
+                'fpxn': pendiente,
+                'xn_nuevo': xn,
+                'error_rel': error_rel_decimal
+            }
+            iteraciones_data.append(iteracion_info)
+
+            # Verificar convergencia
+            if abs(fxn) < 1e-12 or (i > 0 and error_rel_decimal < tolerance_decimal):
+                return True, {
+                    'raiz': xn,
+                    'iteracion': i + 1,
+                    'error': error_rel_decimal,
+                    'convergio': True,
+                    'evaluaciones': evaluaciones
+                }, iteraciones_data
+
+            xn_anterior, fxn_anterior = xn_old, fxn
+            xn_old = xn
+
+        # Máximo de iteraciones alcanzado
+        return True, {
+            'raiz': xn,
+            'iteracion': max_iter,
+            'error': error_rel_decimal,
+            'convergio': False,
+            'evaluaciones': evaluaciones
+        }, iteraciones_data
+
+    except Exception as e:
+        return False, str(e), []
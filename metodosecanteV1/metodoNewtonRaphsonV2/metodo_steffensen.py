@@ -0,0 +1,196 @@
+"""
+Métodos de Steffensen y de punto fijo con aceleración de Aitken
+Convergencia cuadrática sin derivadas: f'(xn) se reemplaza por la pendiente entre xn y un
+punto auxiliar a distancia f(xn), que se acerca a xn tan rápido como f(xn) -> 0.
+- Steffensen: punto auxiliar xn + f(xn)
+- Aitken: iteración de punto fijo g(x) = x - f(x) acelerada con Δ²:
+      x1 = g(xn), x2 = g(x1), xn+1 = xn - (x1 - xn)^2 / (x2 - 2·x1 + xn)
+  La iteración simple solo converge si |1 - f'| < 1; la acelerada converge donde f' != 0.
+  Algebraicamente es el paso de Steffensen con el punto auxiliar xn - f(xn).
+Cada iteración cuesta dos evaluaciones de f (sin f'), como una de Newton; convienen
+cuando f' es cara o no es confiable. Lejos de la raíz, con |f(xn)| grande, el punto
+auxiliar quedaría lejos y la pendiente no diría nada de f'(xn) (e^x - 3 desde x0 = 5:
+pendiente ~1e63, paso redondeado a 0): el desplazamiento se acota a
+MAX_DESPLAZAMIENTO·max(1, |xn|) y el paso se vuelve una diferencia finita hacia adelante.
+Un paso corto solo cuenta como convergencia si el residuo en el nuevo iterado también
+lo es (ver iterar_diferencia_adaptativa).
+Los registros tienen el formato de Newton-Raphson (iterar_newton_raphson), con la
+pendiente en 'fpxn'; los ciclos, la divergencia y el estancamiento también terminan la
+iteración antes de max_iter (ver diagnostico.py). Sin converger, 'reinicio' queda en None:
+el x0 que sugiere Newton (sugerir_reinicio) no dice nada de estos métodos.
+"""
+
+import math
+import time
+from matematicas import obtener_expresion
+from iteraciones import ErrorIteracion, recolectar_iteraciones
+from metodo_newton_raphson import estimar_convergencia, resultado_sin_convergencia, NAN
+from diagnostico import MonitorConvergencia, ESTADO_CONVERGIO, ESTADO_MAX_ITER, ESTADO_CANCELADO
+
+VARIANTE_STEFFENSEN = 'steffensen'
+VARIANTE_AITKEN = 'aitken'
+
+# Signo del desplazamiento del punto auxiliar xn + signo·f(xn)
+SIGNO_AUXILIAR = {VARIANTE_STEFFENSEN: 1, VARIANTE_AITKEN: -1}
+
+# Desplazamiento máximo del punto auxiliar, en unidades de max(1, |xn|)
+MAX_DESPLAZAMIENTO = 0.1
+
+def iterar_diferencia_adaptativa(func_str, x0, tolerance, max_iter, variante, tiempo_limite=None,
+                                 cancelacion=None):
+    """
+    Generador común de Steffensen y Aitken (variante 'steffensen' o 'aitken'): entrega cada
+    registro de iteración y retorna el dict de resultado (ver iteraciones.py).
+    Converge con |f(xn)| < 1e-12 o con un paso relativo menor que la tolerancia, siempre que
+    la corrección |f(xn+1) / pendiente| también lo sea (f(xn+1) se reutiliza en el paso siguiente).
+    tiempo_limite: segundos máximos de ejecución (None = sin límite)
+    cancelacion: token Cancelacion; si se activa, retorna el resultado parcial con 'cancelado'
+    """
+    limite = time.perf_counter() + tiempo_limite if tiempo_limite is not None else None
+    signo = SIGNO_AUXILIAR[variante]
+
+    # Compilar una sola vez (caché de expresiones) y reutilizar en todas las iteraciones
+    expresion = obtener_expresion(func_str)
+    funcion = expresion.escalar
+
+    tolerance_decimal = tolerance
+    xn_old = x0
+    error_rel_decimal = float('inf')
+    evaluaciones = 0
+    paso_anterior = 0.0
+    razon = NAN
+    f_siguiente = None  # f(xn+1) ya evaluada al comprobar la convergencia
+    monitor = MonitorConvergencia()
+
+    for i in range(max_iter):
+        if limite is not None and time.perf_counter() > limite:
+            raise ErrorIteracion(f"Error: Tiempo límite excedido ({tiempo_limite} s) en la iteración {i + 1}.")
+        if cancelacion is not None and cancelacion.cancelada:
+            return {
+                'raiz': xn_old,
+                'iteracion': i,
+                'error': error_rel_decimal,
+                'convergio': False,
+                'cancelado': True,
+                'estado': ESTADO_CANCELADO,
+                'evaluaciones': evaluaciones
+            }
+
+        if f_siguiente is None:
+            fxn = funcion(xn_old)
+            evaluaciones += 1
+        else:
+            fxn, f_siguiente = f_siguiente, None
+        if isinstance(fxn, complex):
+            # Potencia de base negativa (ej: root(x, 3) con x < 0): fuera del dominio real
+            raise ErrorIteracion(f"Error: La función no es real en x = {xn_old:.6g} (fuera del dominio).")
+        if fxn == 0:
+            xn, pendiente = xn_old, NAN  # Raíz exacta: sin punto auxiliar
+        else:
+            # Pendiente entre xn y el punto auxiliar xn ± h (aproxima f'(xn)), con h = f(xn)
+            # acotado a MAX_DESPLAZAMIENTO·max(1, |xn|) mientras |f(xn)| es grande
+            h = math.copysign(min(abs(fxn), MAX_DESPLAZAMIENTO * max(1.0, abs(xn_old))), fxn)
+            x_auxiliar = xn_old + signo * h
+            f_auxiliar = funcion(x_auxiliar)
+            evaluaciones += 1
+            if isinstance(f_auxiliar, complex):
+                raise ErrorIteracion(f"Error: La función no es real en x = {x_auxiliar:.6g} (fuera del dominio).")
+            pendiente = (f_auxiliar - fxn) / (signo * h)
+            if abs(pendiente) >= 1e-15:
+                # Steffensen: xn+1 = xn - f(xn)^2 / (f(xn + f(xn)) - f(xn)); Aitken: el mismo con xn - f(xn)
+                xn = xn_old - fxn / pendiente
+            elif abs(fxn) < 1e-12:
+                # Ya es raíz: h = f(xn) es menor que el espaciado de x y el punto auxiliar redondea
+                # a xn (ej: (x - 1)^3 en 1.000001) o f no cambia entre ellos (sqrt(x) - 2 en 4)
+                xn = xn_old
+            else:
+                raise ErrorIteracion(f"Error: La pendiente es cero (f({x_auxiliar:.6g}) = f(xn)).")
+
+        # Calcular error relativo
+        error_rel_decimal = abs((xn - xn_old) / (xn if xn != 0 else 1)) if i > 0 else float('inf')
+
+        # Orden estimado de los últimos pasos (2 cerca de una raíz simple)
+        paso = xn - xn_old
+        razon_anterior, razon = razon, (paso / paso_anterior if paso_anterior != 0 else NAN)
+        if razon == razon:
+            orden, multiplicidad = estimar_convergencia(razon, razon_anterior)
+        else:
+            orden = multiplicidad = NAN
+        paso_anterior = paso
+
+        # Entregar los datos de la iteración
+        yield {
+            'iteracion': i + 1,
+            'xn': xn_old,
+            'fxn': fxn,
+            'fpxn': pendiente,
+            'xn_nuevo': xn,
+            'error_rel': error_rel_decimal,
+            'orden': orden,
+            'multiplicidad': multiplicidad,
+            'variante': variante,
+            'factor': 1
+        }
+
+        # Verificar convergencia
+        convergio = abs(fxn) < 1e-12
+        if not convergio and i > 0 and error_rel_decimal < tolerance_decimal:
+            # Un paso corto no basta: con una pendiente enorme se redondea a 0 lejos de la raíz.
+            # La corrección que pide el residuo en xn+1 también debe quedar bajo la tolerancia
+            f_siguiente = funcion(xn)
+            evaluaciones += 1
+            convergio = abs(f_siguiente) <= tolerance_decimal * abs(pendiente) * (abs(xn) if xn != 0 else 1)
+        if convergio:
+            if i == 0:
+                # Convergió en el primer paso: reportar ese paso
+                error_rel_decimal = abs((xn - xn_old) / (xn if xn != 0 else 1))
+            return {
+                'raiz': xn,
+                'iteracion': i + 1,
+                'error': error_rel_decimal,
+                'convergio': True,
+                'estado': ESTADO_CONVERGIO,
+                'evaluaciones': evaluaciones
+            }
+
+        # Ciclo, divergencia o estancamiento: terminar antes de max_iter
+        motivo = monitor.observar(xn_old, fxn)
+        if motivo is not None:
+            return resultado_sin_convergencia(expresion, monitor, motivo, x0, tolerance, i + 1,
+                                              error_rel_decimal, evaluaciones, sugerir=False)
+
+        xn_old = xn
+
+    # Máximo de iteraciones alcanzado
+    resultado = resultado_sin_convergencia(expresion, monitor, ESTADO_MAX_ITER, x0, tolerance, max_iter,
+                                           error_rel_decimal, evaluaciones, sugerir=False)
+    resultado['raiz'] = xn
+    return resultado
+
+def iterar_metodo_steffensen(func_str, x0, tolerance, max_iter, tiempo_limite=None, cancelacion=None):
+    """Generador del método de Steffensen (ver iterar_diferencia_adaptativa)"""
+    return iterar_diferencia_adaptativa(func_str, x0, tolerance, max_iter, VARIANTE_STEFFENSEN,
+                                        tiempo_limite, cancelacion)
+
+def iterar_punto_fijo_aitken(func_str, x0, tolerance, max_iter, tiempo_limite=None, cancelacion=None):
+    """Generador del punto fijo de g(x) = x - f(x) acelerado con Aitken Δ² (ver iterar_diferencia_adaptativa)"""
+    return iterar_diferencia_adaptativa(func_str, x0, tolerance, max_iter, VARIANTE_AITKEN,
+                                        tiempo_limite, cancelacion)
+
+def ejecutar_metodo_steffensen(func_str, x0, tolerance, max_iter, tiempo_limite=None):
+    """
+    Ejecuta el método de Steffensen (recolecta iterar_metodo_steffensen)
+    tiempo_limite: segundos máximos de ejecución (None = sin límite)
+    Retorna: (exito, resultado, iteraciones_data)
+    """
+    return recolectar_iteraciones(
+        iterar_metodo_steffensen(func_str, x0, tolerance, max_iter, tiempo_limite=tiempo_limite))
+
+def ejecutar_punto_fijo_aitken(func_str, x0, tolerance, max_iter, tiempo_limite=None):
+    """
+    Ejecuta el punto fijo con aceleración de Aitken (recolecta iterar_punto_fijo_aitken)
+    tiempo_limite: segundos máximos de ejecución (None = sin límite)
+    Retorna: (exito, resultado, iteraciones_data)
+    """
+    return recolectar_iteraciones(
+        iterar_punto_fijo_aitken(func_str, x0, tolerance, max_iter, tiempo_limite=tiempo_limite))
@@ -0,0 +1,151 @@
+"""
+Optimización del árbol de sintaxis antes de generar código
+Plegado de constantes, potencias enteras pequeñas como multiplicaciones y
+eliminación de subexpresiones comunes (temporales). No cambia el texto canónico:
+solo afecta al código que compila compilador.py.
+"""
+
+import math
+from collections import Counter
+from analizador import Numero, Constante, Variable, Unario, Binario, Llamada
+
+# Exponentes enteros que se expanden en multiplicaciones (x^4 -> t*t con t = x*x)
+MAX_EXPONENTE_EXPANDIDO = 4
+
+PREFIJO_TEMPORAL = '_t'
+
+def es_atomo(nodo):
+    return isinstance(nodo, (Numero, Constante, Variable))
+
+def es_constante(nodo):
+    """True si el árbol no contiene variables"""
+    if isinstance(nodo, Variable):
+        return False
+    if isinstance(nodo, Unario):
+        return es_constante(nodo.operando)
+    if isinstance(nodo, Binario):
+        return es_constante(nodo.izquierdo) and es_constante(nodo.derecho)
+    if isinstance(nodo, Llamada):
+        return all(es_constante(a) for a in nodo.argumentos)
+    return True
+
+def hijos(nodo):
+    if isinstance(nodo, Unario):
+        return (nodo.operando,)
+    if isinstance(nodo, Binario):
+        return (nodo.izquierdo, nodo.derecho)
+    if isinstance(nodo, Llamada):
+        return nodo.argumentos
+    return ()
+
+def reconstruir(nodo, nuevos_hijos):
+    """Copia de nodo con otros hijos"""
+    if isinstance(nodo, Unario):
+        return Unario(nodo.op, nuevos_hijos[0])
+    if isinstance(nodo, Binario):
+        return Binario(nodo.op, nuevos_hijos[0], nuevos_hijos[1])
+    if isinstance(nodo, Llamada):
+        return Llamada(nodo.nombre, tuple(nuevos_hijos))
+    return nodo
+
+def sustituir(nodo, valores):
+    """Reemplaza las variables de valores (dict nombre -> número) por su valor: fija parámetros"""
+    if isinstance(nodo, Variable) and nodo.nombre in valores:
+        return Numero(float(valores[nodo.nombre]))
+    return reconstruir(nodo, [sustituir(h, valores) for h in hijos(nodo)])
+
+def plegar_constantes(nodo, evaluar):
+    """
+    Reemplaza cada subárbol sin variables por su valor (2*pi -> 6.283185307179586).
+    evaluar: callable nodo -> valor. Si la evaluación falla o no da un real finito
+    (ej: ln(-1), 1/0) el subárbol se deja tal cual y el error aparece al evaluar.
+    """
+    if isinstance(nodo, (Numero, Variable)):
+        return nodo
+    if es_constante(nodo):
+        try:
+            valor = evaluar(nodo)
+        except Exception:
+            valor = None
+        if isinstance(valor, (int, float)) and math.isfinite(valor):
+            return Numero(float(valor))
+    return reconstruir(nodo, [plegar_constantes(h, evaluar) for h in hijos(nodo)])
+
+def expandir_potencias(nodo):
+    """u^2 -> u*u, u^3 -> u*u*u, u^4 -> (u*u)*(u*u), u^-n -> 1/u^n"""
+    nodo = reconstruir(nodo, [expandir_potencias(h) for h in hijos(nodo)])
+    if not (isinstance(nodo, Binario) and nodo.op == '^' and isinstance(nodo.derecho, Numero)):
+        return nodo
+
+    exponente = nodo.derecho.valor
+    if exponente != int(exponente) or not 2 <= abs(exponente) <= MAX_EXPONENTE_EXPANDIDO:
+        return nodo
+
+    base = nodo.izquierdo
+    n = abs(int(exponente))
+    if n == 4:
+        cuadrado = Binario('*', base, base)
+        resultado = Binario('*', cuadrado, cuadrado)
+    else:
+        resultado = base
+        for _ in range(n - 1):
+            resultado = Binario('*', resultado, base)
+    return resultado if exponente > 0 else Binario('/', Numero(1.0), resultado)
+
+def eliminar_subexpresiones(arboles):
+    """
+    Extrae los subárboles repetidos (en uno o varios árboles) a temporales.
+    Retorna (asignaciones, arboles): asignaciones es una lista [(nombre, nodo)] en orden
+    de evaluación y los árboles resultantes referencian los temporales como Variable.
+    """
+    conteo = Counter()
+
+    def contar(nodo):
+        if es_atomo(nodo):
+            return
+        conteo[nodo] += 1
+        # Los hijos de un subárbol repetido se cuentan una sola vez
+        if conteo[nodo] == 1:
+            for h in hijos(nodo):
+                contar(h)
+
+    for arbol in arboles:
+        contar(arbol)
+
+    temporales = {}
+    asignaciones = []
+
+    def reescribir(nodo):
+        if es_atomo(nodo):
+            return nodo
+        if nodo in temporales:
+            return temporales[nodo]
+        nuevo = reconstruir(nodo, [reescribir(h) for h in hijos(nodo)])
+        if conteo[nodo] > 1:
+            temporal = Variable(f"{PREFIJO_TEMPORAL}{len(asignaciones)}")
+            asignaciones.append((temporal.nombre, nuevo))
+            temporales[nodo] = temporal
+            return temporal
+        return nuevo
+
+    arboles = [reescribir(arbol) for arbol in arboles]
+    return asignaciones, arboles
+
+def nombres_externos(nodos):
+    """Funciones y constantes que usa el código (se enlazan como variables locales)"""
+    nombres = set()
+    pendientes = list(nodos)
+    while pendientes:
+        nodo = pendientes.pop()
+        if isinstance(nodo, (Llamada, Constante)):
+            nombres.add(nodo.nombre)
+        pendientes.extend(hijos(nodo))
+    return sorted(nombres)
+
+def optimizar(arboles, evaluar):
+    """
+    Pasada completa sobre uno o varios árboles que se evalúan juntos.
+    Retorna (asignaciones, arboles) listos para generar código.
+    """
+    arboles = [expandir_potencias(plegar_constantes(arbol, evaluar)) for arbol in arboles]
+    return eliminar_subexpresiones(arboles)
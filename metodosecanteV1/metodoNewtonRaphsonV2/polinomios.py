@@ -0,0 +1,245 @@
+"""
+Vía rápida para polinomios (la entrada más común, ej: x^3 - 2x - 5)
+- Detección sobre el árbol de sintaxis y extracción del vector de coeficientes.
+- Evaluación por Horner: el polinomio se reescribe como árbol ((c0*x + c1)*x + c2)...
+  y se compila como cualquier otra expresión (escalar, vectorizada y fusionada con sus derivadas).
+  Solo si ya estaba escrito en forma expandida (en_forma_expandida): expandir (x - 1)^20 da
+  coeficientes de ~1e5 que se cancelan cerca de la raíz, así que la forma factorizada
+  conserva su árbol y los coeficientes solo sirven para hallar las raíces.
+- Todas las raíces, reales y complejas, de una vez: valores propios de la matriz compañera
+  (numpy.roots) pulidos con Newton sobre el polinomio original. Una raíz de multiplicidad m
+  sale como m valores propios a distancia ~eps^(1/m); raices_reales los agrupa por su
+  promedio (agrupar_valores_propios) y pule cada grupo sobre p^(m-1).
+"""
+
+import numpy as np
+from analizador import Numero, Variable, Unario, Binario
+from compilador import evaluar_constante
+from optimizador import es_constante
+
+# Grado máximo tratado como polinomio (más allá, matriz compañera y Horner dejan de convenir)
+MAX_GRADO = 32
+MAX_ITER_PULIDO = 10
+# |Im(r)| relativa hasta la que el centro de un grupo de valores propios puede ser real
+TOLERANCIA_IMAGINARIA = 1e-4
+# Margen sobre la cota de redondeo de Horner para considerar que p se anula
+MARGEN_REDONDEO = 10
+EPSILON = np.finfo(float).eps
+
+def _coeficientes_ascendentes(nodo):
+    """Coeficientes de menor a mayor grado, o None si el subárbol no es un polinomio en x"""
+    if es_constante(nodo):
+        return np.array([float(evaluar_constante(nodo))])
+    if isinstance(nodo, Variable):
+        return np.array([0.0, 1.0])
+    if isinstance(nodo, Unario):
+        operando = _coeficientes_ascendentes(nodo.operando)
+        return -operando if operando is not None and nodo.op == '-' else operando
+    if not isinstance(nodo, Binario):
+        return None  # Llamada con x (sin, exp, ...)
+
+    izquierdo = _coeficientes_ascendentes(nodo.izquierdo)
+    if izquierdo is None:
+        return None
+    if nodo.op == '^':
+        if not es_constante(nodo.derecho):
+            return None
+        exponente = float(evaluar_constante(nodo.derecho))
+        if not exponente.is_integer() or not 0 <= exponente * (len(izquierdo) - 1) <= MAX_GRADO:
+            return None
+        resultado = np.array([1.0])
+        for _ in range(int(exponente)):
+            resultado = np.convolve(resultado, izquierdo)
+        return resultado
+
+    derecho = _coeficientes_ascendentes(nodo.derecho)
+    if derecho is None:
+        return None
+    if nodo.op in ('+', '-'):
+        resultado = np.zeros(max(len(izquierdo), len(derecho)))
+        resultado[:len(izquierdo)] += izquierdo
+        resultado[:len(derecho)] += derecho if nodo.op == '+' else -derecho
+        return resultado
+    if nodo.op == '*':
+        if len(izquierdo) + len(derecho) - 2 > MAX_GRADO:
+            return None
+        return np.convolve(izquierdo, derecho)
+    if nodo.op == '/':
+        divisor = np.trim_zeros(derecho, 'b')
+        if len(divisor) != 1:
+            return None  # Cociente con x en el denominador: función racional
+        return izquierdo / divisor[0]
+    return None
+
+def coeficientes_polinomio(arbol):
+    """
+    Coeficientes de mayor a menor grado (convención de numpy.roots/polyval), o None si la
+    expresión no es un polinomio en x de grado 1 a MAX_GRADO con coeficientes reales finitos.
+    """
+    try:
+        ascendentes = _coeficientes_ascendentes(arbol)
+    except (ValueError, TypeError, ArithmeticError):
+        return None  # Constante inválida (ej: ln(-1)) o compleja: la vía general reporta el error
+    if ascendentes is None:
+        return None
+    ascendentes = np.trim_zeros(ascendentes, 'b')
+    if len(ascendentes) < 2 or not np.all(np.isfinite(ascendentes)):
+        return None
+    return ascendentes[::-1].copy()
+
+def _es_monomio(nodo):
+    """c·x^k (un solo término): multiplicarlo o elevarlo no mezcla coeficientes"""
+    coeficientes = _coeficientes_ascendentes(nodo)
+    return coeficientes is not None and np.count_nonzero(coeficientes) <= 1
+
+def en_forma_expandida(arbol):
+    """
+    True si el polinomio está escrito como suma de términos c·x^k: sus coeficientes salen sin
+    multiplicar polinomios entre sí y Horner es tan exacto como el árbol. Un producto o una
+    potencia de sumas ((x - 1)^20, (x + 1)(x - 2)) no lo está.
+    """
+    if isinstance(arbol, Unario):
+        return en_forma_expandida(arbol.operando)
+    if not isinstance(arbol, Binario):
+        return True
+    if arbol.op == '*' and not (_es_monomio(arbol.izquierdo) or _es_monomio(arbol.derecho)):
+        return False
+    if arbol.op == '^' and not _es_monomio(arbol.izquierdo):
+        return False
+    return en_forma_expandida(arbol.izquierdo) and en_forma_expandida(arbol.derecho)
+
+def arbol_horner(coeficientes):
+    """
+    Árbol de p(x) en forma de Horner: una multiplicación y una suma por coeficiente.
+    Los tramos de coeficientes nulos se saltan con una potencia (x^20 - 1 -> x^20 - 1, no 20 productos).
+    """
+    coeficientes = [float(c) for c in coeficientes]
+    if coeficientes[0] < 0:
+        return Unario('-', arbol_horner([-c for c in coeficientes]))
+    x = Variable('x')
+    nodo = Numero(coeficientes[0])
+    grado_pendiente = 0  # Potencia de x que falta aplicar al acumulado
+
+    for c in coeficientes[1:] + [None]:
+        if c is not None:
+            grado_pendiente += 1
+            if c == 0:
+                continue
+        if grado_pendiente:
+            potencia = x if grado_pendiente == 1 else Binario('^', x, Numero(float(grado_pendiente)))
+            nodo = potencia if nodo == Numero(1.0) else Binario('*', nodo, potencia)
+            grado_pendiente = 0
+        if c is not None:
+            nodo = Binario('+', nodo, Numero(c)) if c > 0 else Binario('-', nodo, Numero(-c))
+    return nodo
+
+def derivada_polinomio(coeficientes, orden=1):
+    """Coeficientes de p^(orden)(x) (al menos un coeficiente: [0.0] si se anula)"""
+    derivada = np.asarray(coeficientes, dtype=float)
+    for _ in range(orden):
+        if len(derivada) == 1:
+            return np.array([0.0])
+        derivada = derivada[:-1] * np.arange(len(derivada) - 1, 0, -1)
+    return derivada
+
+def cota_error_horner(coeficientes, x):
+    """Cota del error de redondeo de Horner en x: 2n·eps·Σ|ci|·|x|^i"""
+    return 2 * len(coeficientes) * EPSILON * np.polyval(np.abs(coeficientes), np.abs(x))
+
+def raices_polinomio(coeficientes, max_iter=MAX_ITER_PULIDO):
+    """
+    Todas las raíces complejas de p: valores propios de la matriz compañera (numpy.roots)
+    y pasos de Newton vectorizados que solo se aceptan si reducen |p|.
+    """
+    raices = np.roots(coeficientes).astype(complex)
+    derivada = derivada_polinomio(coeficientes)
+    valores = np.abs(np.polyval(coeficientes, raices))
+    for _ in range(max_iter):
+        with np.errstate(all='ignore'):
+            nuevas = raices - np.polyval(coeficientes, raices) / np.polyval(derivada, raices)
+        nuevos_valores = np.abs(np.polyval(coeficientes, nuevas))
+        mejora = np.isfinite(nuevas) & (nuevos_valores < valores)
+        if not mejora.any():
+            break
+        raices = np.where(mejora, nuevas, raices)
+        valores = np.where(mejora, nuevos_valores, valores)
+    return raices
+
+def se_anula(coeficientes, x):
+    """True (por elemento) si |p(x)| no supera, con MARGEN_REDONDEO, el error de redondeo de evaluarlo"""
+    return np.abs(np.polyval(coeficientes, x)) <= MARGEN_REDONDEO * cota_error_horner(coeficientes, x)
+
+def agrupar_valores_propios(raices, coeficientes):
+    """
+    Agrupa los valores propios que representan una misma raíz múltiple.
+    Los m valores propios de una raíz de multiplicidad m quedan repartidos a distancia
+    ~eps^(1/m) (0.17 para m = 20: ninguna tolerancia fija sirve), pero su promedio es exacto
+    hasta el redondeo. Para cada valor propio se prueban sus k vecinos más cercanos: forman
+    una raíz de multiplicidad k si p, p', ..., p^(k-1) se anulan en su promedio; se queda
+    el mayor k que cumple.
+    Retorna una lista de (centro complejo, multiplicidad, radio del grupo).
+    """
+    derivadas = [np.asarray(coeficientes, dtype=float)]
+    for _ in range(len(coeficientes) - 2):
+        derivadas.append(derivada_polinomio(derivadas[-1]))
+    pendientes = sorted(np.asarray(raices, dtype=complex), key=lambda r: (r.real, r.imag))
+    grupos = []
+    while pendientes:
+        semilla = pendientes[0]
+        cercanas = sorted(pendientes, key=lambda r: abs(r - semilla))
+        # Promedio de los k más cercanos para todo k, y p^(j) evaluada en todos a la vez
+        centros = np.cumsum(cercanas) / np.arange(1, len(cercanas) + 1)
+        anulada = np.array([se_anula(derivada, centros) for derivada in derivadas[:len(centros)]])
+        multiplicidad = max(k for k in range(1, len(centros) + 1) if k == 1 or anulada[:k, k - 1].all())
+        grupo = cercanas[:multiplicidad]
+        centro = np.mean(grupo) if multiplicidad > 1 else semilla
+        grupos.append((centro, multiplicidad, max(abs(r - centro) for r in grupo)))
+        for r in grupo:
+            pendientes.remove(r)
+    return grupos
+
+def raices_reales(coeficientes, a=-np.inf, b=np.inf):
+    """
+    Raíces reales de p en [a, b], ordenadas, cada raíz múltiple una sola vez.
+    Un grupo de valores propios (agrupar_valores_propios) es una raíz real si la parte
+    imaginaria de su centro es pequeña y p, ..., p^(m-1) se anulan en su parte real hasta el
+    error de redondeo. Cada raíz se pule sobre p^(m-1), donde es simple.
+    """
+    resultado = []
+    for centro, multiplicidad, radio in agrupar_valores_propios(np.roots(coeficientes), coeficientes):
+        real = float(centro.real)
+        if abs(centro.imag) > TOLERANCIA_IMAGINARIA * max(1.0, abs(real)):
+            continue
+        derivada = np.asarray(coeficientes, dtype=float)
+        es_raiz = True
+        for _ in range(multiplicidad):
+            es_raiz = es_raiz and se_anula(derivada, real)
+            derivada = derivada_polinomio(derivada)
+        if not es_raiz and centro.imag != 0:
+            continue
+        raiz = pulir_raiz_multiple(coeficientes, real, multiplicidad, radio)
+        if a <= raiz <= b:
+            resultado.append(raiz)
+    return sorted(resultado)
+
+def pulir_raiz_multiple(coeficientes, raiz, multiplicidad, radio=0.0):
+    """
+    Una raíz de multiplicidad m es raíz simple de p^(m-1): Newton sobre esa derivada
+    la recupera a precisión completa (sobre p solo se alcanza eps^(1/m)).
+    Los pasos se aceptan mientras reducen |p^(m-1)| y no salen del grupo de valores propios
+    (radio, con un mínimo relativo de TOLERANCIA_IMAGINARIA).
+    """
+    derivada = derivada_polinomio(coeficientes, multiplicidad - 1)
+    siguiente = derivada_polinomio(derivada)
+    alcance = max(radio, TOLERANCIA_IMAGINARIA * max(1.0, abs(raiz)))
+    inicio, valor = raiz, abs(np.polyval(derivada, raiz))
+    for _ in range(MAX_ITER_PULIDO):
+        pendiente = np.polyval(siguiente, raiz)
+        if pendiente == 0:
+            break
+        nueva = float(raiz - np.polyval(derivada, raiz) / pendiente)
+        nuevo_valor = abs(np.polyval(derivada, nueva))
+        if abs(nueva - inicio) > alcance or not nuevo_valor < valor:
+            break  # Se aleja del grupo o ya no mejora: quedarse con el último
+        raiz, valor = nueva, nuevo_valor
+    return raiz
@@ -0,0 +1,178 @@
+"""
+Búsqueda de todas las raíces de f en un intervalo
+1. Exploración: cambios de signo y mínimos locales de |f| en una malla vectorizada.
+2. Pulido: todos los candidatos a la vez, un carril NumPy por candidato, hasta precisión completa.
+3. Depuración: se descartan polos, saltos y mínimos que no tocan el eje, y se fusionan duplicados.
+"""
+
+import numpy as np
+from matematicas import obtener_expresion
+from intervalos import puede_tener_raiz
+
+NUM_PUNTOS_POR_DEFECTO = 2000
+MAX_ITER_PULIDO = 100
+ITERACIONES_AUREA = 80
+TOLERANCIA_X = 4 * np.finfo(float).eps  # Cambio relativo de x para dar un carril por terminado
+TOLERANCIA_RESIDUO = 1e-10  # |f| máximo (relativo a la escala de f) para aceptar un mínimo como raíz
+TOLERANCIA_DUPLICADOS = 1e-9
+RAZON_AUREA = (np.sqrt(5.0) - 1) / 2
+
+def candidatos_en_malla(x, y, arbol=None):
+    """
+    Candidatos a raíz de una malla evaluada (NaN = fuera de dominio).
+    Retorna (exactos, indices_cambio, indices_minimo):
+    - exactos: puntos de la malla con f = 0 (solo el primero de cada tramo con f = 0, ej: floor(x) en [0, 1))
+    - indices_cambio: celdas [x[i], x[i+1]] con cambio de signo (los polos se descartan
+      con aritmética de intervalos si se da el árbol)
+    - indices_minimo: mínimos locales de |f| sin cambio de signo (raíces de multiplicidad par)
+    """
+    cero = y == 0
+    exactos = x[cero & ~np.concatenate(([False], cero[:-1]))]
+
+    cambio = np.nonzero(y[:-1] * y[1:] < 0)[0]
+    if arbol is not None:
+        cambio = np.array([i for i in cambio if puede_tener_raiz(arbol, x[i], x[i + 1])], dtype=int)
+
+    abs_y = np.abs(y)
+    centro = abs_y[1:-1]
+    # NaN nunca cumple las comparaciones: los bordes del dominio no generan candidatos.
+    # Con empate (ej: abs(x) con la raíz a mitad de celda) cuenta solo el punto de la izquierda
+    minimo = np.nonzero((centro < abs_y[:-2]) & (centro <= abs_y[2:]) &
+                        (y[:-2] * y[1:-1] > 0) & (y[1:-1] * y[2:] > 0))[0] + 1
+    return exactos, cambio, minimo
+
+def pulir_cambios_de_signo(expresion, a, b):
+    """
+    Newton protegido vectorizado: un carril por intervalo [a, b] con cambio de signo.
+    Usa el paso de Newton si cae dentro del intervalo y la bisección en otro caso
+    (solo bisección si no hay derivada simbólica). Retorna las raíces de cada carril.
+    """
+    funcion = expresion.vectorizada
+    fusionada = expresion.fusionada_vectorizada
+    a, b = a.astype(float), b.astype(float)
+    signo_a = np.sign(funcion(a))
+    x = (a + b) / 2
+    activos = np.arange(len(x))
+
+    for _ in range(MAX_ITER_PULIDO):
+        if len(activos) == 0:
+            break
+        xi, ai, bi = x[activos], a[activos], b[activos]
+        if fusionada is not None:
+            fx, fpx = fusionada(xi)
+        else:
+            fx, fpx = funcion(xi), np.full(len(xi), np.nan)
+
+        # Mantener el cambio de signo: el extremo con el mismo signo que f(x) pasa a ser x
+        mismo_signo = np.sign(fx) == signo_a[activos]
+        ai = np.where(mismo_signo, xi, ai)
+        bi = np.where(mismo_signo, bi, xi)
+
+        with np.errstate(all='ignore'):
+            newton = xi - fx / fpx
+        usar_newton = np.isfinite(newton) & (newton > ai) & (newton < bi)
+        nuevo = np.where(usar_newton, newton, (ai + bi) / 2)
+
+        a[activos], b[activos], x[activos] = ai, bi, nuevo
+        escala = TOLERANCIA_X * np.abs(nuevo)
+        terminado = (fx == 0) | (np.abs(nuevo - xi) <= escala) | (bi - ai <= escala)
+        x[activos[fx == 0]] = xi[fx == 0]
+        activos = activos[~terminado]
+
+    return x
+
+def minimizar_abs_aurea(funcion, a, b, iteraciones=ITERACIONES_AUREA):
+    """Sección áurea vectorizada: mínimo de |f| en cada [a, b]"""
+    a, b = a.astype(float), b.astype(float)
+    c = b - RAZON_AUREA * (b - a)
+    d = a + RAZON_AUREA * (b - a)
+    fc, fd = np.abs(funcion(c)), np.abs(funcion(d))
+    for _ in range(iteraciones):
+        izquierda = ~(fc >= fd)  # NaN en d: quedarse con el lado de c
+        a = np.where(izquierda, a, c)
+        b = np.where(izquierda, d, b)
+        nuevo = np.where(izquierda, b - RAZON_AUREA * (b - a), a + RAZON_AUREA * (b - a))
+        f_nuevo = np.abs(funcion(nuevo))
+        c, fc, d, fd = (np.where(izquierda, nuevo, d), np.where(izquierda, f_nuevo, fd),
+                        np.where(izquierda, c, nuevo), np.where(izquierda, fc, f_nuevo))
+    return (a + b) / 2
+
+def pulir_minimos(expresion, x0, izquierda, derecha):
+    """
+    Punto crítico de f cerca de cada mínimo de |f| de la malla: Newton sobre f' (con f'')
+    dentro de [izquierda, derecha]; los carriles sin f'' o que salen de la celda usan sección áurea.
+    """
+    x = x0.astype(float)
+    pendientes = np.ones(len(x), dtype=bool)  # Carriles que aún necesitan sección áurea
+    fusionada = expresion.fusionada_vectorizada_de_orden(2)
+
+    if fusionada is not None:
+        activos = np.arange(len(x))
+        for _ in range(MAX_ITER_PULIDO):
+            if len(activos) == 0:
+                break
+            xi = x[activos]
+            _, fpx, fppx = fusionada(xi)
+            with np.errstate(all='ignore'):
+                nuevo = xi - fpx / fppx
+            valido = np.isfinite(nuevo) & (nuevo >= izquierda[activos]) & (nuevo <= derecha[activos])
+            convergido = valido & ((fpx == 0) | (np.abs(nuevo - xi) <= TOLERANCIA_X * np.abs(nuevo)))
+            x[activos[valido]] = nuevo[valido]
+            pendientes[activos[convergido]] = False
+            activos = activos[valido & ~convergido]
+
+    if pendientes.any():
+        x[pendientes] = minimizar_abs_aurea(expresion.vectorizada, izquierda[pendientes], derecha[pendientes])
+    return x
+
+def depurar(raices, tolerancia=TOLERANCIA_DUPLICADOS):
+    """Ordena y fusiona raíces a menos de 'tolerancia' (relativa, absoluta cerca de 0)"""
+    unicas = []
+    for raiz in np.sort(raices):
+        if unicas and raiz - unicas[-1] <= tolerancia * max(1.0, abs(raiz)):
+            continue
+        unicas.append(float(raiz))
+    return unicas
+
+def raices_en_malla(expresion, x, y):
+    """
+    Todas las raíces de f a partir de una malla ya evaluada (la misma que usa la gráfica).
+    expresion: ExpresionCompilada; x, y: malla y valores (NaN = fuera de dominio)
+    Retorna la lista ordenada de raíces.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if len(x) < 3:
+        return []
+    if expresion.polinomio is not None:
+        # Polinomio: raíces de la matriz compañera, sin depender de la resolución de la malla
+        return [raiz for raiz in expresion.raices_polinomio if x.min() <= raiz <= x.max()]
+    exactos, cambio, minimo = candidatos_en_malla(x, y, expresion.arbol)
+    raices = [exactos]
+
+    if len(cambio):
+        r = pulir_cambios_de_signo(expresion, x[cambio], x[cambio + 1])
+        # Un salto (floor) o un polo no filtrado deja |f| tan grande como en los extremos de la celda
+        fr = np.abs(expresion.vectorizada(r))
+        extremos = np.minimum(np.abs(y[cambio]), np.abs(y[cambio + 1]))
+        raices.append(r[fr < extremos])
+
+    if len(minimo):
+        r = pulir_minimos(expresion, x[minimo], x[minimo - 1], x[minimo + 1])
+        # Solo los mínimos que tocan el eje son raíces (multiplicidad par)
+        finitos = np.abs(y[np.isfinite(y)])
+        escala = max(1.0, float(np.median(finitos))) if len(finitos) else 1.0
+        fr = np.abs(expresion.vectorizada(r))
+        raices.append(r[fr <= TOLERANCIA_RESIDUO * escala])
+
+    return depurar(np.concatenate(raices))
+
+def encontrar_todas_las_raices(func_str, a, b, num_puntos=NUM_PUNTOS_POR_DEFECTO):
+    """
+    Todas las raíces de f(x) = 0 en [a, b], ordenadas y sin duplicados.
+    Incluye raíces de multiplicidad par (sin cambio de signo) y excluye polos y saltos.
+    Raíces más cercanas entre sí que (b - a) / num_puntos pueden confundirse (salvo en polinomios).
+    """
+    expresion = obtener_expresion(func_str)
+    x = np.linspace(a, b, num_puntos)
+    return raices_en_malla(expresion, x, expresion.vectorizada(x))
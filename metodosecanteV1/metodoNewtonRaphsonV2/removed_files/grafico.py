@@ -1,5 +1,7 @@
 import tkinter as tk
-from matematicas import preprocesar_funcion, evaluar_funcion
+import numpy as np
+from matematicas import preprocesar_funcion, compilar_funcion_vectorizada, obtener_expresion
+from intervalos import regiones_con_raiz, acotar_rango
 
 def calcular_rango_optimo(func_str_proc):
     """Calcula el rango óptimo para mostrar la función enfocado en raíces y detalles"""
@@ -7,46 +9,24 @@ def calcular_rango_optimo(func_str_proc):
     
     mejor_rango = None
     mejor_score = -1
+    arbol = obtener_expresion(func_str_proc).arbol
     
     for x_min_test, x_max_test in rangos_x:
-        y_vals = []
-        y_cerca_cero = []  # Valores Y cerca del eje X
-        cambios_signo = 0
-        y_anterior = None
-        
-        for i in range(200):
-            x = x_min_test + (x_max_test - x_min_test) * i / 199
-            try:
-                y = evaluar_funcion(func_str_proc, x)
-                if abs(y) < 1e10:
-                    y_vals.append(y)
-                    # Guardar valores cerca del eje X (zona de interés)
-                    if abs(y) < 100:  # Zona cercana a raíces
-                        y_cerca_cero.append(y)
-                    if y_anterior is not None and y_anterior * y < 0:
-                        cambios_signo += 1
-                    y_anterior = y
-            except:
-                continue
-        
-        if len(y_vals) > 20 and cambios_signo > 0:
-            # Si hay valores cerca de cero, usar esos para definir el rango Y
-            if len(y_cerca_cero) > 10:
-                y_min = min(y_cerca_cero)
-                y_max = max(y_cerca_cero)
-                # Expandir un poco para ver contexto
-                y_range = y_max - y_min
-                if y_range < 10:  # Si el rango es muy pequeño, expandir más
-                    y_margin = 10
-                else:
-                    y_margin = y_range * 0.5
+        # Cota garantizada de f en el rango (aritmética de intervalos, sin muestrear)
+        cotas_y = acotar_rango(arbol, x_min_test, x_max_test)
+        # Regiones que pueden contener raíces (el resto está descartado con garantía)
+        cambios_signo = len(regiones_con_raiz(arbol, x_min_test, x_max_test))
+        
+        if cotas_y is not None and cambios_signo > 0:
+            # Zona cercana a raíces: la cota limitada a [-100, 100]
+            y_min = max(cotas_y[0], -100.0)
+            y_max = min(cotas_y[1], 100.0)
+            # Expandir un poco para ver contexto
+            y_range = y_max - y_min
+            if y_range < 10:  # Si el rango es muy pequeño, expandir más
+                y_margin = 10
             else:
-                # Usar percentiles para evitar valores extremos
-                y_sorted = sorted(y_vals)
-                y_min = y_sorted[len(y_sorted)//10]  # Percentil 10
-                y_max = y_sorted[9*len(y_sorted)//10]  # Percentil 90
-                y_range = y_max - y_min
-                y_margin = y_range * 0.2
+                y_margin = y_range * 0.5
             
             score = cambios_signo * 100 - (x_max_test - x_min_test)
             
@@ -74,6 +54,7 @@ def dibujar_grafico(canvas_grafico, entry_function, intervalo=None):
             return None
             
         func_str_proc = preprocesar_funcion(func_str)
+        funcion = compilar_funcion_vectorizada(func_str_proc)
         
         # Configuración del canvas
         width = canvas_grafico.winfo_width() or 500
@@ -92,31 +73,21 @@ def dibujar_grafico(canvas_grafico, entry_function, intervalo=None):
         
         # Calcular rango Y si aún no está definido (caso de intervalo proporcionado)
         if intervalo:
-            y_vals = []
-            y_cerca_cero = []
-            
-            for i in range(200):
-                x = x_min + (x_max - x_min) * i / 199
-                try:
-                    y = evaluar_funcion(func_str_proc, x)
-                    if abs(y) < 1e10:
-                        y_vals.append(y)
-                        if abs(y) < 100:
-                            y_cerca_cero.append(y)
-                except:
-                    continue
+            y = funcion(np.linspace(x_min, x_max, 200))
+            y_vals = y[np.abs(y) < 1e10]
+            y_cerca_cero = y_vals[np.abs(y_vals) < 100]
             
-            if y_vals:
+            if len(y_vals):
                 # Usar valores cerca de cero si existen
                 if len(y_cerca_cero) > 10:
-                    y_min = min(y_cerca_cero)
-                    y_max = max(y_cerca_cero)
+                    y_min = float(np.min(y_cerca_cero))
+                    y_max = float(np.max(y_cerca_cero))
                     y_range = y_max - y_min
                     y_margin = max(y_range * 0.5, 10) if y_range < 10 else y_range * 0.5
                 else:
-                    y_sorted = sorted(y_vals)
-                    y_min = y_sorted[len(y_sorted)//10]
-                    y_max = y_sorted[9*len(y_sorted)//10]
+                    y_sorted = np.sort(y_vals)
+                    y_min = float(y_sorted[len(y_sorted)//10])
+                    y_max = float(y_sorted[9*len(y_sorted)//10])
                     y_range = y_max - y_min
                     y_margin = y_range * 0.2
                 
@@ -125,17 +96,12 @@ def dibujar_grafico(canvas_grafico, entry_function, intervalo=None):
             else:
                 y_min, y_max = -10, 10
         
-        # Calcular puntos con buena resolución
-        puntos = []
+        # Calcular puntos con buena resolución (una sola pasada vectorizada)
         num_puntos = 2000
-        for i in range(num_puntos):
-            x = x_min + (x_max - x_min) * i / (num_puntos - 1)
-            try:
-                y = evaluar_funcion(func_str_proc, x)
-                if abs(y) < 1e10:  # Solo evitar valores infinitos
-                    puntos.append((x, y))
-            except:
-                continue
+        x = np.linspace(x_min, x_max, num_puntos)
+        y = funcion(x)
+        validos = np.abs(y) < 1e10  # Solo evitar valores infinitos
+        puntos = list(zip(x[validos].tolist(), y[validos].tolist()))
         
         if not puntos:
             return None
@@ -0,0 +1,176 @@
+"""
+Registro de métodos de solución
+Todos comparten el contrato
+    ejecutar(func_str, x0, tolerance, max_iter, tiempo_limite=None) -> (exito, resultado, iteraciones_data)
+y la interfaz, main.py y lote.py los eligen por su clave. Los que tienen forma de generador
+la registran en 'iterar' (ver iteraciones.py); iterar_solucion la usa para entregar
+las iteraciones a medida que se calculan.
+"""
+
+from matematicas import obtener_expresion
+from optimizador import nombres_externos
+from iteraciones import ErrorIteracion, recolectar_iteraciones
+from metodo_newton_raphson import ejecutar_metodo_newton_raphson, iterar_newton_raphson
+from metodo_secante import ejecutar_metodo_secante
+from metodo_hibrido import ejecutar_newton_protegido
+from metodo_brent import ejecutar_metodo_brent, MENSAJE_SIN_INTERVALO
+from metodo_householder import ejecutar_metodo_halley, ejecutar_metodo_householder
+from metodo_alta_precision import ejecutar_newton_alta_precision, iterar_newton_alta_precision
+from metodo_steffensen import (ejecutar_metodo_steffensen, ejecutar_punto_fijo_aitken,
+                               iterar_metodo_steffensen, iterar_punto_fijo_aitken)
+
+METODOS = {
+    'newton': {
+        'nombre': 'Newton-Raphson',
+        'titulo': 'Método de Newton-Raphson',
+        'ejecutar': ejecutar_metodo_newton_raphson,
+        'iterar': iterar_newton_raphson,
+        'formula': "xn+1 = xn - f(xn) / f'(xn); en raíces múltiples, m·f / f' o Newton sobre f / f'",
+        'usa_derivada': True,
+    },
+    'secante': {
+        'nombre': 'Secante',
+        'titulo': 'Método de la Secante',
+        'ejecutar': ejecutar_metodo_secante,
+        'formula': "xn+1 = xn - f(xn) * (xn - xn-1) / (f(xn) - f(xn-1))",
+        'usa_derivada': False,
+    },
+    'steffensen': {
+        'nombre': 'Steffensen',
+        'titulo': 'Método de Steffensen',
+        'ejecutar': ejecutar_metodo_steffensen,
+        'iterar': iterar_metodo_steffensen,
+        'formula': "xn+1 = xn - f(xn)^2 / (f(xn + f(xn)) - f(xn))",
+        'usa_derivada': False,
+    },
+    'aitken': {
+        'nombre': 'Punto fijo (Aitken)',
+        'titulo': 'Punto fijo de g(x) = x - f(x) con aceleración de Aitken',
+        'ejecutar': ejecutar_punto_fijo_aitken,
+        'iterar': iterar_punto_fijo_aitken,
+        'formula': "x1 = g(xn), x2 = g(x1), xn+1 = xn - (x1 - xn)^2 / (x2 - 2 x1 + xn)",
+        'usa_derivada': False,
+    },
+    'protegido': {
+        'nombre': 'Newton protegido',
+        'titulo': 'Método de Newton-Raphson protegido',
+        'ejecutar': ejecutar_newton_protegido,
+        'formula': "xn+1 = xn - f(xn) / f'(xn) dentro de [a, b]; si no, Illinois o bisección",
+        'usa_derivada': True,
+    },
+    'brent': {
+        'nombre': 'Brent',
+        'titulo': 'Método de Brent',
+        'ejecutar': ejecutar_metodo_brent,
+        'formula': "interpolación cuadrática inversa, secante o bisección dentro de [a, b]",
+        'usa_derivada': False,
+    },
+    'halley': {
+        'nombre': 'Halley',
+        'titulo': 'Método de Halley',
+        'ejecutar': ejecutar_metodo_halley,
+        'formula': "xn+1 = xn - 2 f f' / (2 f'^2 - f f'')",
+        'usa_derivada': True,
+    },
+    'householder': {
+        'nombre': 'Householder (orden 3)',
+        'titulo': 'Método de Householder de orden 3',
+        'ejecutar': ejecutar_metodo_householder,
+        'formula': "xn+1 = xn - f (6 f'^2 - 3 f f'') / (6 f'^3 - 6 f f' f'' + f^2 f''')",
+        'usa_derivada': True,
+    },
+    'precision': {
+        'nombre': 'Newton (alta precisión)',
+        'titulo': 'Método de Newton-Raphson en precisión arbitraria',
+        'ejecutar': ejecutar_newton_alta_precision,
+        'iterar': iterar_newton_alta_precision,
+        'formula': "xn+1 = xn - f(xn) / f'(xn) en decimal; la precisión se duplica en cada paso",
+        'usa_derivada': True,
+    },
+}
+
+# 'auto': Brent si la expresión no es suave, Newton-Raphson en otro caso
+# (desde la raíz de la matriz compañera más cercana a x0 si es un polinomio)
+METODO_AUTOMATICO = 'auto'
+METODO_POR_DEFECTO = METODO_AUTOMATICO
+
+# Funciones con derivada discontinua o infinita cerca de sus ceros (f' numérica ruidosa)
+FUNCIONES_NO_SUAVES = {'abs', 'floor', 'ceil', 'cbrt', 'root'}
+
+def obtener_metodo(clave):
+    """Entrada del registro para la clave dada"""
+    if clave not in METODOS:
+        raise ValueError(f"Método desconocido: {clave}. Disponibles: {', '.join(METODOS)}")
+    return METODOS[clave]
+
+def validar_metodo(clave):
+    """Acepta las claves del registro y 'auto'"""
+    if clave != METODO_AUTOMATICO:
+        obtener_metodo(clave)
+
+def metodo_recomendado(func_str):
+    """Brent para expresiones no suaves (abs, floor, ceil, cbrt, root) o sin derivada; Newton-Raphson para el resto"""
+    try:
+        expresion = obtener_expresion(func_str)
+    except ValueError:
+        return 'newton'
+    if FUNCIONES_NO_SUAVES.intersection(nombres_externos([expresion.arbol])) or expresion.derivada is None:
+        return 'brent'
+    return 'newton'
+
+def semilla_polinomio(func_str, x0):
+    """Raíz real más cercana a x0 si func_str es un polinomio (matriz compañera); None si no"""
+    try:
+        raices = obtener_expresion(func_str).raices_polinomio
+    except ValueError:
+        return None
+    if not raices:
+        return None  # No es polinomio o no tiene raíces reales (ej: x^2 + 1)
+    return min(raices, key=lambda raiz: abs(raiz - x0))
+
+def iterar_metodo(metodo, func_str, x0, tolerance, max_iter, cancelacion=None, **opciones):
+    """
+    Generador de los registros de iteración del método; retorna el dict de resultado.
+    Los métodos sin forma de generador se ejecutan completos y sus registros se entregan después.
+    """
+    info_metodo = obtener_metodo(metodo)
+    if 'iterar' in info_metodo:
+        resultado = yield from info_metodo['iterar'](
+            func_str, x0, tolerance, max_iter, cancelacion=cancelacion, **opciones)
+    else:
+        exito, resultado, iteraciones_data = info_metodo['ejecutar'](
+            func_str, x0, tolerance, max_iter, **opciones)
+        if not exito:
+            raise ErrorIteracion(resultado)
+        yield from iteraciones_data
+    resultado['metodo'] = metodo
+    return resultado
+
+def iterar_solucion(metodo, func_str, x0, tolerance, max_iter, cancelacion=None, **opciones):
+    """
+    Generador de los registros de iteración del método elegido; retorna el dict de resultado.
+    Con 'auto' el método sale de metodo_recomendado; resultado['metodo'] indica el que se usó.
+    En un polinomio, 'auto' arranca Newton desde semilla_polinomio y la reporta en resultado['semilla'].
+    """
+    if metodo != METODO_AUTOMATICO:
+        return (yield from iterar_metodo(metodo, func_str, x0, tolerance, max_iter, cancelacion, **opciones))
+
+    metodo = metodo_recomendado(func_str)
+    semilla = semilla_polinomio(func_str, x0) if metodo == 'newton' else None
+    if semilla is not None:
+        resultado = yield from iterar_metodo(metodo, func_str, semilla, tolerance, max_iter, cancelacion, **opciones)
+        resultado['semilla'] = semilla
+        return resultado
+    try:
+        return (yield from iterar_metodo(metodo, func_str, x0, tolerance, max_iter, cancelacion, **opciones))
+    except ErrorIteracion as e:
+        if str(e) != MENSAJE_SIN_INTERVALO:
+            raise
+    # Sin cambio de signo (ej: abs(x) en 0): Newton protegido no lo necesita
+    return (yield from iterar_metodo('protegido', func_str, x0, tolerance, max_iter, cancelacion, **opciones))
+
+def resolver(metodo, func_str, x0, tolerance, max_iter, **opciones):
+    """
+    Ejecuta el método elegido (ver iterar_solucion); retorna (exito, resultado, iteraciones_data)
+    """
+    return recolectar_iteraciones(iterar_solucion(metodo, func_str, x0, tolerance, max_iter, **opciones))
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Los módulos del proyecto son planos (sin paquete): se importan desde la carpeta superior
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
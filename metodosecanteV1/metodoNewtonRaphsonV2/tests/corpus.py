@@ -0,0 +1,27 @@
+"""Corpus de ecuaciones con raíz conocida que comparten las pruebas de los métodos"""
+
+import math
+
+import pytest
+
+from solucionadores import resolver
+
+# (función, x0, raíz)
+CORPUS = [
+    ("x^3 - x - 2", 1.5, 1.5213797068045676),
+    ("cos(x) - x", 1.0, 0.7390851332151607),
+    ("exp(x) - 2*x - 1", 1.0, 1.2564312086261696),
+    ("x*sin(x) - 1", 1.0, 1.1141571408719302),
+    ("e^x - 3", 1.0, math.log(3)),
+    ("x^2 - 2", 1.0, math.sqrt(2)),
+    ("ln(x) - 1", 2.0, math.e),
+]
+
+def comprobar_raiz(metodo, func_str, x0, raiz, tolerancia=1e-10, max_iter=100):
+    """Resuelve con el método y verifica la raíz; retorna (resultado, iteraciones_data)"""
+    exito, resultado, iteraciones = resolver(metodo, func_str, x0, tolerancia, max_iter)
+    assert exito, resultado
+    assert resultado['convergio'], resultado
+    assert float(resultado['raiz']) == pytest.approx(raiz, rel=1e-8, abs=1e-12)
+    assert 0 < len(iteraciones) <= max_iter
+    return resultado, iteraciones
@@ -0,0 +1,73 @@
+"""Funciones Decimal (alta_precision.py) contra valores conocidos y contra el módulo math"""
+
+import math
+from decimal import Decimal, localcontext
+
+import pytest
+
+import alta_precision as ap
+from corpus import CORPUS, comprobar_raiz
+from metodo_alta_precision import iterar_newton_alta_precision
+from iteraciones import recolectar_iteraciones
+
+# 60 dígitos de referencia
+PI_60 = Decimal("3.14159265358979323846264338327950288419716939937510582097494")
+E_60 = Decimal("2.71828182845904523536028747135266249775724709369995957496697")
+RAIZ_2_60 = Decimal("1.41421356237309504880168872420969807856967187537694807317668")
+LN_2_60 = Decimal("0.693147180559945309417232121458176568075500134360255254120680")
+
+def cerca(a, b, digitos):
+    return abs(a - b) <= Decimal(10) ** -digitos * max(1, abs(b))
+
+def test_constantes_a_60_digitos():
+    with localcontext() as ctx:
+        ctx.prec = 60
+        assert cerca(ap.pi_decimal(), PI_60, 58)
+        assert cerca(ap.e_decimal(), E_60, 58)
+        assert cerca(ap.sqrt(Decimal(2)), RAIZ_2_60, 58)
+        assert cerca(ap.ln(Decimal(2)), LN_2_60, 58)
+
+def test_identidades_a_50_digitos():
+    with localcontext() as ctx:
+        ctx.prec = 50
+        x = Decimal("0.7")
+        assert cerca(ap.sin(x) ** 2 + ap.cos(x) ** 2, Decimal(1), 48)
+        assert cerca(ap.exp(ap.ln(x)), x, 48)
+        assert cerca(ap.tan(ap.atan(x)), x, 48)
+        assert cerca(ap.sin(ap.asin(x)), x, 48)
+        assert cerca(ap.cbrt(Decimal(-27)), Decimal(-3), 48)
+        assert cerca(ap.cosh(x) ** 2 - ap.sinh(x) ** 2, Decimal(1), 46)
+
+@pytest.mark.parametrize("nombre, x", [
+    ("sin", 1e3), ("cos", -2.5), ("tan", 0.3), ("atan", 5.0), ("asin", -0.4), ("acos", 0.9),
+    ("exp", 3.2), ("ln", 7.5), ("log10", 250.0), ("log2", 0.1), ("sqrt", 2.0),
+    ("sinh", 1.5), ("cosh", -1.5), ("tanh", 0.5), ("asinh", 2.0), ("acosh", 3.0), ("atanh", 0.25),
+])
+def test_igual_al_modulo_math(nombre, x):
+    with localcontext() as ctx:
+        ctx.prec = 30
+        valor = getattr(ap, nombre)(Decimal(repr(x)))
+    assert float(valor) == pytest.approx(getattr(math, "log" if nombre == "ln" else nombre)(x), rel=1e-14)
+
+def test_precision_del_contexto():
+    # Con guarda: el resultado se redondea a la precisión actual
+    with localcontext() as ctx:
+        ctx.prec = 25
+        assert len(ap.sqrt(Decimal(2)).as_tuple().digits) == 25
+
+@pytest.mark.parametrize("nombre, x", [("ln", 0), ("sqrt", -1), ("asin", 2), ("atanh", 1)])
+def test_errores_de_dominio(nombre, x):
+    with pytest.raises(ValueError):
+        getattr(ap, nombre)(Decimal(x))
+
+def test_newton_alta_precision():
+    exito, resultado, iteraciones = recolectar_iteraciones(
+        iterar_newton_alta_precision("x^2 - 2", 1.0, Decimal("1e-50"), 50))
+    assert exito and resultado['convergio']
+    assert cerca(Decimal(resultado['raiz']), RAIZ_2_60, 50)
+    assert iteraciones[-1]['iteracion'] == resultado['iteracion']
+    assert [fila['precision'] for fila in iteraciones] == sorted(fila['precision'] for fila in iteraciones)
+
+@pytest.mark.parametrize("func_str, x0, raiz", CORPUS)
+def test_corpus_precision(func_str, x0, raiz):
+    comprobar_raiz('precision', func_str, x0, raiz)
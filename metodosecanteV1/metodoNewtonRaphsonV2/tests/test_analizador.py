@@ -0,0 +1,48 @@
+"""
+Equivalencia del analizador sintáctico y el compilador con el evaluador original
+(cadena de regex + eval): sus valores quedan fijos en valores_originales.ESPERADOS
+"""
+
+import pytest
+
+from analizador import tokenizar
+from matematicas import evaluar_funcion, preprocesar_funcion, validar_ecuacion
+from valores_originales import EXPRESIONES, ESPERADOS, PUNTOS, evaluar_nuevo
+
+@pytest.mark.parametrize("func_str", EXPRESIONES)
+def test_escalar_igual_al_original(func_str):
+    for x, esperado in zip(PUNTOS, ESPERADOS[func_str]):
+        obtenido = evaluar_nuevo(func_str, x)
+        if esperado is None:
+            assert obtenido is None, (func_str, x)
+        else:
+            assert obtenido == pytest.approx(esperado, rel=1e-12, abs=1e-12), (func_str, x)
+
+def test_multiplicacion_implicita():
+    assert preprocesar_funcion("2pix") == preprocesar_funcion("2*pi*x")
+    assert preprocesar_funcion("3ex") == preprocesar_funcion("3*e*x")
+    assert preprocesar_funcion("x(x-1)") == preprocesar_funcion("x*(x-1)")
+    # log10 y log2 son nombres de función, no log*10
+    assert evaluar_funcion("log10(x)", 100) == pytest.approx(2)
+
+def test_potencia_con_x_negativo():
+    # El evaluador original daba -4 (sustituía el texto '-2.0**2')
+    assert evaluar_funcion("x^2", -2) == pytest.approx(4)
+
+def test_tokens_desconocidos():
+    with pytest.raises(ValueError):
+        tokenizar("x + foo(x)")
+
+@pytest.mark.parametrize("func_str, motivo", [
+    ("sin(x", "desbalanceados"),
+    ("((((((((((((x))))))))))))", "Anidamiento"),
+    ("x +* 2", ""),
+])
+def test_validar_ecuacion_rechaza(func_str, motivo):
+    valida, mensaje = validar_ecuacion(func_str)
+    assert not valida
+    assert motivo in mensaje
+
+def test_dominio_como_error():
+    with pytest.raises(ValueError):
+        evaluar_funcion("ln(x)", -1)
@@ -0,0 +1,71 @@
+"""Método de Brent y selección automática del método"""
+
+import pytest
+
+from corpus import CORPUS, comprobar_raiz
+from metodo_brent import ejecutar_metodo_brent, MENSAJE_SIN_INTERVALO
+from solucionadores import METODO_AUTOMATICO, metodo_recomendado, resolver
+
+@pytest.mark.parametrize("func_str, x0, raiz", CORPUS)
+def test_corpus(func_str, x0, raiz):
+    resultado, iteraciones = comprobar_raiz('brent', func_str, x0, raiz)
+    # Una evaluación de f por iteración (más la búsqueda del intervalo)
+    assert resultado['evaluaciones'] <= len(iteraciones) + 61
+
+@pytest.mark.parametrize("func_str, x0, raiz", CORPUS)
+def test_corpus_automatico(func_str, x0, raiz):
+    comprobar_raiz(METODO_AUTOMATICO, func_str, x0, raiz)
+
+@pytest.mark.parametrize("func_str, metodo", [
+    ("x^3 - x - 2", 'newton'),
+    ("abs(x - 2) - 1", 'brent'),
+    ("floor(x) - 2", 'brent'),
+    ("cbrt(x - 4)", 'brent'),
+    ("root(x, 3) - 0.5", 'brent'),
+])
+def test_metodo_recomendado(func_str, metodo):
+    assert metodo_recomendado(func_str) == metodo
+
+@pytest.mark.parametrize("func_str, x0, raiz", [("abs(x - 2) - 1", 2.5, 3.0), ("cbrt(x - 4)", 1.0, 4.0)])
+def test_no_suaves(func_str, x0, raiz):
+    exito, resultado, _ = resolver(METODO_AUTOMATICO, func_str, x0, 1e-10, 100)
+    assert exito and resultado['convergio']
+    assert resultado['metodo'] == 'brent'
+    assert resultado['raiz'] == pytest.approx(raiz, abs=1e-8)
+
+def test_intervalo_dado():
+    exito, resultado, iteraciones = ejecutar_metodo_brent("cos(x) - x", 100.0, 1e-12, 100, a=0, b=1)
+    assert exito and resultado['convergio']
+    assert resultado['raiz'] == pytest.approx(0.7390851332151607)
+    assert all(0 <= fila['xn_nuevo'] <= 1 for fila in iteraciones)
+
+def test_sin_intervalo():
+    exito, mensaje, _ = ejecutar_metodo_brent("x^2 + 1", 0.0, 1e-10, 100)
+    assert not exito and mensaje == MENSAJE_SIN_INTERVALO
+
+def test_sin_intervalo_automatico_usa_protegido():
+    # abs(x) toca el cero sin cambiar de signo: Brent no sirve, Newton protegido sí
+    exito, resultado, _ = resolver(METODO_AUTOMATICO, "abs(x)", 1.0, 1e-10, 100)
+    assert exito and resultado['convergio']
+    assert resultado['metodo'] == 'protegido'
+    assert resultado['raiz'] == pytest.approx(0, abs=1e-10)
+
+@pytest.mark.parametrize("metodo, func_str, x0, raiz", [
+    # Sin cambio de signo al alcance de Brent; Newton desde 0.5 cae en x < 0, donde root es compleja
+    (METODO_AUTOMATICO, "root(x, 3) - 0.5", 0.5, 0.125),
+    ('protegido', "ln(x)", 5.0, 1.0),
+])
+def test_paso_fuera_del_dominio(metodo, func_str, x0, raiz):
+    # Newton protegido acorta a la mitad el paso que sale del dominio
+    exito, resultado, _ = resolver(metodo, func_str, x0, 1e-10, 100)
+    assert exito, resultado
+    assert resultado['convergio'] and resultado['metodo'] == 'protegido'
+    assert resultado['raiz'] == pytest.approx(raiz, rel=1e-10)
+
+def test_funcion_compleja_en_x0():
+    exito, mensaje, _ = resolver(METODO_AUTOMATICO, "x^x - 2", -0.3, 1e-10, 100)
+    assert not exito and "no es real" in mensaje
+
+def test_discontinuidad():
+    exito, mensaje, _ = ejecutar_metodo_brent("floor(x) - 2.5", 0.0, 1e-10, 100)
+    assert not exito and "discontinuidad" in mensaje
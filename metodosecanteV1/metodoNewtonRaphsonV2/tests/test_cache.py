@@ -0,0 +1,52 @@
+"""Caché LRU de expresiones compiladas indexado por el texto canónico"""
+
+import pytest
+
+from analizador import parsear, a_texto
+from matematicas import CacheExpresiones, evaluar_funcion, preprocesar_funcion
+from valores_originales import EXPRESIONES, PUNTOS, evaluar_nuevo
+
+@pytest.mark.parametrize("func_str", EXPRESIONES)
+def test_texto_canonico_es_estable(func_str):
+    # El texto canónico se vuelve a analizar al mismo árbol (y al mismo texto)
+    texto = preprocesar_funcion(func_str)
+    assert a_texto(parsear(texto)) == texto
+    for x in PUNTOS:
+        esperado = evaluar_nuevo(func_str, x)
+        if esperado is not None:
+            assert evaluar_funcion(texto, x) == pytest.approx(esperado, rel=1e-12, abs=1e-12)
+
+def test_escrituras_equivalentes_comparten_entrada():
+    cache = CacheExpresiones()
+    expresion = cache.obtener("2x")
+    assert cache.obtener("2*x") is expresion
+    assert cache.obtener("2 x") is expresion
+    assert cache.obtener("2x") is expresion
+    estadisticas = cache.estadisticas()
+    assert (estadisticas['fallos'], estadisticas['aciertos'], estadisticas['entradas']) == (1, 3, 1)
+
+def test_expulsa_la_menos_usada():
+    cache = CacheExpresiones(max_entradas=2)
+    primera = cache.obtener("x + 1")
+    cache.obtener("x + 2")
+    cache.obtener("x + 1")  # Ahora 'x + 2' es la menos usada
+    cache.obtener("x + 3")
+    assert cache.estadisticas()['entradas'] == 2
+    assert cache.obtener("x + 1") is primera
+    fallos = cache.fallos
+    cache.obtener("x + 2")
+    assert cache.fallos == fallos + 1
+
+def test_errores_de_sintaxis_no_se_guardan():
+    cache = CacheExpresiones()
+    with pytest.raises(ValueError):
+        cache.obtener("x +* 2")
+    assert cache.estadisticas()['entradas'] == 0
+
+def test_limpiar():
+    cache = CacheExpresiones()
+    cache.obtener("x")
+    cache.obtener("x")
+    cache.limpiar()
+    assert cache.estadisticas() == {
+        'aciertos': 0, 'fallos': 0, 'entradas': 0, 'max_entradas': 128, 'tasa_aciertos': 0.0}
@@ -0,0 +1,76 @@
+"""Expresiones con parámetros y barridos con continuación"""
+
+import numpy as np
+import pytest
+
+from continuacion import ejecutar_barrido_parametro
+from matematicas import ExpresionParametrica, obtener_expresion, valores_finitos
+
+def test_fijar_parametros():
+    expresion = ExpresionParametrica("x^2 - a*x + b", ('a', 'b'))
+    assert expresion.fijar({'a': 3, 'b': 2}).escalar(1.0) == 0.0
+    assert "3" in expresion.texto_con({'a': 3, 'b': 2})
+    with pytest.raises(ValueError):
+        expresion.fijar({'a': 3})
+    with pytest.raises(ValueError):
+        expresion.fijar({'a': 3, 'b': 2, 'c': 1})
+
+def test_barrido_vectorizado_con_nan():
+    # ln(x - a) fuera de su dominio da NaN, no una excepción
+    expresion = ExpresionParametrica("ln(x - a)", ('a',))
+    f, dfdx, dfda = expresion.fusionada_barrido('a')(np.array([2.0, 0.5]), np.array([1.0, 1.0]))
+    assert f[0] == 0.0 and np.isnan(f[1])
+    assert dfdx[0] == 1.0 and dfda[0] == -1.0
+
+@pytest.mark.parametrize("dtype", [float, complex])
+def test_valores_finitos(dtype):
+    f, constante = valores_finitos((np.array([1.0, np.inf, -np.inf]), 2.0), (3,), dtype)
+    assert f.dtype == constante.dtype == dtype
+    assert f[0] == 1.0 and np.isnan(f[1:]).all()
+    assert list(constante) == [2.0, 2.0, 2.0]
+
+def test_kernels_vectorizados_limpian_no_finitos():
+    expresion = obtener_expresion("1/x")
+    f, fp = expresion.fusionada_vectorizada(np.array([0.0, 2.0]))
+    assert np.isnan(f[0]) and np.isnan(fp[0]) and f[1] == 0.5
+    f, fp = expresion.fusionada_compleja_vectorizada(np.array([0.0, 2.0j]))
+    assert np.isnan(f[0]) and f[1] == -0.5j
+
+@pytest.mark.parametrize("segmentos", [None, 1, 7])
+def test_raiz_cuadrada(segmentos):
+    valores = np.linspace(1.0, 100.0, 200)
+    exito, resultado, ramas = ejecutar_barrido_parametro(
+        "x^2 - a", 'a', valores, 1.0, 1e-12, 50, segmentos=segmentos)
+    assert exito
+    assert resultado['convergio'].all()
+    np.testing.assert_allclose(resultado['raices'], np.sqrt(valores), rtol=1e-12)
+    assert ramas[0]['convergidos'] == valores.size
+
+def test_continuacion_ahorra_iteraciones():
+    valores = np.linspace(0.0, 10.0, 400)
+    _, resultado, _ = ejecutar_barrido_parametro("x^3 + x - a", 'a', valores, 0.0, 1e-12, 50)
+    assert resultado['convergio'].all()
+    # Desde la raíz vecina, corregida con la tangente, bastan 1 o 2 iteraciones por valor
+    assert resultado['iteraciones'].mean() < 3
+
+def test_varias_ramas_y_fijos():
+    valores = np.linspace(1.0, 4.0, 31)
+    exito, resultado, ramas = ejecutar_barrido_parametro(
+        "x^2 - a*b", 'a', valores, np.array([-1.0, 1.0]), 1e-12, 50, fijos={'b': 2.0})
+    assert exito
+    assert resultado['raices'].shape == (2, valores.size)
+    np.testing.assert_allclose(resultado['raices'][0], -np.sqrt(2 * valores), rtol=1e-12)
+    np.testing.assert_allclose(resultado['raices'][1], np.sqrt(2 * valores), rtol=1e-12)
+    assert [rama['x0'] for rama in ramas] == [-1.0, 1.0]
+
+def test_salida_en_arreglo_dado():
+    valores = np.linspace(1.0, 2.0, 10)
+    salida = np.empty(10)
+    exito, resultado, _ = ejecutar_barrido_parametro("x - a", 'a', valores, 0.0, 1e-12, 50, salida=salida)
+    assert exito and resultado['raices'] is salida
+    np.testing.assert_allclose(salida, valores)
+
+def test_errores():
+    assert not ejecutar_barrido_parametro("x - a", 'a', [], 0.0, 1e-12, 50)[0]
+    assert not ejecutar_barrido_parametro("x - a", 'a', [1.0, np.inf], 0.0, 1e-12, 50)[0]
+    assert not ejecutar_barrido_parametro("x - a*b", 'a', [1.0], 0.0, 1e-12, 50)[0]  # Falta b
@@ -0,0 +1,54 @@
+"""Cuencas de atracción de Newton: raíces, multiplicidad, avisos y cancelación"""
+
+import warnings
+
+import numpy as np
+import pytest
+
+from cuencas import ejecutar_cuencas
+from iteraciones import Cancelacion
+
+@pytest.mark.parametrize("func_str, raices", [
+    ("x^3 - 1", [1, np.exp(2j * np.pi / 3), np.exp(-2j * np.pi / 3)]),
+    ("(x-1)^3", [1]),
+    ("(x-1)^2*(x+2)", [1, -2]),
+    ("(x^2+1)^2", [1j, -1j]),
+])
+def test_raices_en_el_plano(func_str, raices):
+    exito, resultado, info = ejecutar_cuencas(func_str, (-3, 3), (-3, 3), (100, 100), 1e-10, 50, workers=1)
+    assert exito, resultado
+    encontradas = [complex(raiz['raiz']) for raiz in info]
+    assert len(encontradas) == len(raices)
+    for raiz in raices:
+        # Las raíces múltiples solo se pulen hasta ~eps^(1/m)
+        assert min(abs(z - raiz) for z in encontradas) < 1e-4
+    assert resultado['indices'].shape == (100, 100)
+    assert sum(raiz['puntos'] for raiz in info) == np.count_nonzero(resultado['indices'] >= 0)
+
+def test_raiz_multiple_en_la_recta():
+    exito, resultado, info = ejecutar_cuencas("(x-1)^3", (-3, 3), None, (400, 1), 1e-10, 50, workers=1)
+    assert exito, resultado
+    assert len(info) == 1
+    # Antes quedaba sin pulir (0.99998); el límite de una raíz triple es ~eps^(1/3) = 6e-6
+    assert info[0]['raiz'] == pytest.approx(1.0, abs=1e-6)
+
+def test_sin_avisos_de_numpy():
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        exito, resultado, _ = ejecutar_cuencas("1/x - ln(x)", (-3, 3), (-3, 3), (60, 60), 1e-10, 50, workers=1)
+    assert exito, resultado
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_cancelacion(workers):
+    cancelacion = Cancelacion()
+    pasos = []
+
+    def progreso(hechas, total):
+        pasos.append((hechas, total))
+        cancelacion.cancelar()
+
+    exito, mensaje, info = ejecutar_cuencas("x^3 - 1", (-2, 2), (-2, 2), (600, 600), 1e-10, 50,
+                                            workers=workers, cancelacion=cancelacion, progreso=progreso)
+    assert not exito
+    assert "cancelado" in mensaje
+    assert pasos and pasos[0][1] == 600
@@ -0,0 +1,35 @@
+"""Varias raíces desde un mismo x0 con deflación implícita"""
+
+import math
+
+import pytest
+
+from metodo_newton_raphson import ejecutar_newton_deflacion
+
+@pytest.mark.parametrize("func_str, x0, raices, multiplicidades", [
+    ("x^3 - 6x^2 + 11x - 6", 0.0, [1.0, 2.0, 3.0], [1, 1, 1]),
+    ("x^4 - 5x^2 + 4", 3.0, [-2.0, -1.0, 1.0, 2.0], [1, 1, 1, 1]),
+    ("(x - 1)^2*(x + 2)", 0.0, [-2.0, 1.0], [1, 2]),  # La raíz doble se deflaciona dos veces
+    ("exp(x) - 2", 0.0, [math.log(2)], [1]),
+])
+def test_todas_las_raices(func_str, x0, raices, multiplicidades):
+    exito, resultado, corridas = ejecutar_newton_deflacion(func_str, x0, 1e-10, 100)
+    assert exito
+    assert resultado['convergio']
+    assert resultado['raices'] == pytest.approx(raices, abs=1e-9)
+    assert resultado['multiplicidades'] == multiplicidades
+    assert resultado['iteracion'] == sum(corrida['iteraciones'] for corrida in corridas)
+
+def test_num_raices():
+    exito, resultado, corridas = ejecutar_newton_deflacion("sin(x)", 1.0, 1e-10, 100, num_raices=3)
+    assert exito and resultado['convergio']
+    assert len(resultado['raices']) == 3 == len(corridas)
+    # Raíces distintas, todas múltiplos de pi
+    assert len(set(round(r / math.pi) for r in resultado['raices'])) == 3
+    for raiz in resultado['raices']:
+        assert raiz == pytest.approx(math.pi * round(raiz / math.pi), abs=1e-8)
+
+def test_sin_raices():
+    exito, mensaje, corridas = ejecutar_newton_deflacion("x^2 + 1", 0.5, 1e-10, 50)
+    assert not exito
+    assert isinstance(mensaje, str) and corridas == []
@@ -0,0 +1,62 @@
+"""Estrategias de derivada numérica: paso complejo y extrapolación de Richardson"""
+
+import math
+
+import pytest
+
+from derivada_numerica import (derivada_numerica, derivada_paso_complejo, derivada_richardson,
+                               diferencia_central, DERIVADA_PASO_COMPLEJO, DERIVADA_RICHARDSON)
+from matematicas import obtener_expresion
+from metodo_newton_raphson import ejecutar_metodo_newton_raphson
+
+@pytest.mark.parametrize("func_str, x, derivada", [
+    ("sin(x)", 0.7, math.cos(0.7)),
+    ("exp(x)*x^3", 1.3, math.exp(1.3) * (1.3 ** 3 + 3 * 1.3 ** 2)),
+    ("ln(x)", 1e-3, 1e3),
+    ("atan(x)", 20.0, 1 / 401),
+])
+def test_paso_complejo_a_precision_de_maquina(func_str, x, derivada):
+    valor = derivada_paso_complejo(obtener_expresion(func_str).compleja, x)
+    assert valor == pytest.approx(derivada, rel=1e-14)
+
+def test_paso_complejo_de_una_constante():
+    assert derivada_paso_complejo(lambda z: 3.0, 1.0) == 0.0
+
+@pytest.mark.parametrize("func_str, x, derivada", [
+    ("sin(x)", 0.7, math.cos(0.7)),
+    ("exp(x)*x^3", 1.3, math.exp(1.3) * (1.3 ** 3 + 3 * 1.3 ** 2)),
+    ("ln(x)", 1e-3, 1e3),  # x ± h sale del dominio: h se reduce
+    ("abs(x - 1)", 3.0, 1.0),
+])
+def test_richardson_mejora_la_diferencia_central(func_str, x, derivada):
+    funcion = obtener_expresion(func_str).escalar
+    valor, evaluaciones = derivada_richardson(funcion, x)
+    assert valor == pytest.approx(derivada, rel=1e-10)
+    assert evaluaciones >= 2
+    h = 1e-3 * max(1.0, abs(x))
+    if func_str != "ln(x)":
+        assert abs(valor - derivada) <= abs(diferencia_central(funcion, x, h) - derivada)
+
+def test_richardson_en_el_borde_del_dominio():
+    # sqrt(x) no se evalúa a la izquierda de 0: diferencia lateral
+    valor, _ = derivada_richardson(obtener_expresion("sqrt(x)").escalar, 0.0)
+    assert valor == pytest.approx(1e4, rel=1e-6)
+
+@pytest.mark.parametrize("estrategia", [DERIVADA_PASO_COMPLEJO, DERIVADA_RICHARDSON])
+def test_derivada_numerica(estrategia):
+    valor, evaluaciones = derivada_numerica(obtener_expresion("x^3 - 2x"), estrategia)(2.0)
+    assert valor == pytest.approx(10.0, rel=1e-10)
+    # Una evaluación compleja contra varias diferencias centrales
+    assert (evaluaciones == 1) == (estrategia == DERIVADA_PASO_COMPLEJO)
+
+def test_estrategias_invalidas():
+    with pytest.raises(ValueError):
+        derivada_numerica(obtener_expresion("x"), 'adelante')
+    with pytest.raises(ValueError):
+        derivada_numerica(obtener_expresion("abs(x)"), DERIVADA_PASO_COMPLEJO)
+
+@pytest.mark.parametrize("estrategia", ['auto', DERIVADA_PASO_COMPLEJO, DERIVADA_RICHARDSON])
+def test_newton_con_cada_estrategia(estrategia):
+    exito, resultado, _ = ejecutar_metodo_newton_raphson("cos(x) - x", 1.0, 1e-12, 50, derivada=estrategia)
+    assert exito and resultado['convergio']
+    assert resultado['raiz'] == pytest.approx(0.7390851332151607, rel=1e-12)
@@ -0,0 +1,27 @@
+"""Derivadas simbólicas exactas y el kernel fusionado f/f'"""
+
+import pytest
+
+from derivada_numerica import derivada_richardson
+from matematicas import evaluar_funcion, obtener_expresion
+from valores_originales import EXPRESIONES, PUNTOS, evaluar_nuevo
+
+@pytest.mark.parametrize("func_str", [f for f in EXPRESIONES if "floor" not in f])
+def test_derivada_simbolica(func_str):
+    expresion = obtener_expresion(func_str)
+    assert expresion.fusionada is not None
+    for x in PUNTOS:
+        if evaluar_nuevo(func_str, x) is None:
+            continue
+        try:
+            valor, derivada = expresion.fusionada(x)
+            numerica, _ = derivada_richardson(expresion.escalar, x)
+        except ValueError:
+            continue  # Cerca de un polo o del borde del dominio
+        if numerica is None:
+            continue
+        assert valor == pytest.approx(evaluar_funcion(func_str, x))
+        assert derivada == pytest.approx(numerica, rel=1e-6, abs=1e-6), (func_str, x)
+
+def test_sin_derivada_simbolica():
+    assert obtener_expresion("floor(x) - 1").fusionada is None
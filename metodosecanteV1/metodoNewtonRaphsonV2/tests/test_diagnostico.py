@@ -0,0 +1,82 @@
+"""Diagnóstico de convergencia: raíces lejanas, divergencia, ciclos y estancamiento"""
+
+import pytest
+
+from diagnostico import ESTADO_CICLO, ESTADO_CONVERGIO, ESTADO_DIVERGIO, ESTADO_ESTANCADO
+from iteraciones import recolectar_iteraciones
+from metodo_newton_raphson import iterar_newton_raphson
+from solucionadores import resolver
+
+# Newton se acerca con pasos cada vez más largos mientras |f| baja: no es deriva
+RAICES_LEJANAS = [
+    ("ln(x) - 20", 1.0, 485165195.4097903),
+    ("sqrt(x) - 1000", 1.0, 1e6),
+    ("x^(1/3) - 100", 1.0, 1e6),
+]
+
+@pytest.mark.parametrize("metodo", ['newton', 'auto'])
+@pytest.mark.parametrize("func_str, x0, raiz", RAICES_LEJANAS)
+def test_raiz_lejana_monotona(metodo, func_str, x0, raiz):
+    exito, resultado, iteraciones = resolver(metodo, func_str, x0, 1e-10, 100)
+    assert exito, resultado
+    assert resultado['convergio']
+    assert resultado['estado'] == ESTADO_CONVERGIO
+    assert resultado['raiz'] == pytest.approx(raiz, rel=1e-9)
+    assert len(iteraciones) < 20
+
+@pytest.mark.parametrize("func_str, x0", [("cbrt(x)", 1.0), ("atan(x)", 1.5)])
+def test_divergencia_se_detecta_pronto(func_str, x0):
+    exito, resultado, iteraciones = resolver('newton', func_str, x0, 1e-10, 100)
+    assert exito
+    assert not resultado['convergio']
+    assert resultado['estado'] == ESTADO_DIVERGIO
+    assert len(iteraciones) < 20
+
+def test_ciclo_se_detecta_pronto():
+    # x^3 - 2x + 2 desde 0: Newton alterna entre 0 y 1
+    exito, resultado, iteraciones = resolver('newton', "x^3 - 2x + 2", 0.0, 1e-10, 100)
+    assert exito
+    assert not resultado['convergio']
+    assert resultado['estado'] == ESTADO_CICLO
+    assert len(iteraciones) < 10
+
+# Corridas que salen lejos o vagan con pasos largos antes de converger: no es estancamiento ni divergencia
+RECORRIDOS_LARGOS = [
+    ("cos(x) - x", -3.0, 0.7390851332151607),
+    ("cos(x) - x", -5.0, 0.7390851332151607),
+    ("sin(x) - x/2", 7.0, -1.895494267033981),
+    ("x^10 - 1", -0.3, -1.0),
+    ("x^10 - 1", 0.2, 1.0),
+    ("x^10 - 1", 0.5, 1.0),
+    ("x^20 - 1", 0.5, 1.0),
+]
+
+@pytest.mark.parametrize("detectar_multiplicidad", [True, False])
+@pytest.mark.parametrize("func_str, x0, raiz", RECORRIDOS_LARGOS)
+def test_recorrido_largo_newton(func_str, x0, raiz, detectar_multiplicidad):
+    exito, resultado, _ = recolectar_iteraciones(iterar_newton_raphson(
+        func_str, x0, 1e-10, 1000, detectar_multiplicidad=detectar_multiplicidad))
+    assert exito
+    assert resultado['estado'] == ESTADO_CONVERGIO
+    assert resultado['raiz'] == pytest.approx(raiz, rel=1e-9)
+
+@pytest.mark.parametrize("metodo", ['steffensen', 'aitken'])
+@pytest.mark.parametrize("func_str, x0, raiz", [
+    ("x^10 - 1", -0.3, -1.0),
+    ("x^10 - 1", 0.2, 1.0),
+    ("x^10 - 1", 0.5, 1.0),
+])
+def test_recorrido_largo_steffensen(metodo, func_str, x0, raiz):
+    exito, resultado, _ = resolver(metodo, func_str, x0, 1e-10, 1000)
+    assert exito
+    assert resultado['estado'] == ESTADO_CONVERGIO
+    assert resultado['raiz'] == pytest.approx(raiz, rel=1e-9)
+
+@pytest.mark.parametrize("metodo", ['newton', 'steffensen', 'aitken'])
+def test_estancamiento(metodo):
+    # Sin raíz real: los iterados rebotan cerca de x = 5 y |f| no baja de 1e-6
+    exito, resultado, iteraciones = resolver(metodo, "(x - 5)^2 + 0.000001", 5.1, 1e-10, 1000)
+    assert exito
+    assert resultado['estado'] == ESTADO_ESTANCADO
+    assert len(iteraciones) < 100
+    assert resultado['raiz'] == pytest.approx(5.0, abs=1e-3)
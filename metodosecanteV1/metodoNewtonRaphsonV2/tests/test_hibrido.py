@@ -0,0 +1,48 @@
+"""Newton-Raphson protegido con intervalo de cambio de signo"""
+
+import math
+
+import pytest
+
+from corpus import CORPUS, comprobar_raiz
+from metodo_hibrido import ejecutar_newton_protegido, buscar_intervalo, PASO_NEWTON
+from matematicas import compilar_funcion
+
+@pytest.mark.parametrize("func_str, x0, raiz", CORPUS)
+def test_corpus(func_str, x0, raiz):
+    comprobar_raiz('protegido', func_str, x0, raiz)
+
+def test_newton_puro_diverge_protegido_no():
+    # atan(x) desde 1.5: Newton se aleja, el intervalo lo obliga a volver
+    exito, resultado, iteraciones = ejecutar_newton_protegido("atan(x)", 1.5, 1e-10, 100)
+    assert exito and resultado['convergio']
+    assert resultado['raiz'] == pytest.approx(0, abs=1e-10)
+    assert any(fila['paso'] != PASO_NEWTON for fila in iteraciones)
+
+def test_intervalo_inicial():
+    exito, resultado, iteraciones = ejecutar_newton_protegido("x^3 - x - 2", 5.0, 1e-10, 100, a=1, b=2)
+    assert exito and resultado['convergio']
+    assert resultado['raiz'] == pytest.approx(1.5213797068045676)
+    # El intervalo nunca se abandona
+    assert all(1 <= fila['xn_nuevo'] <= 2 for fila in iteraciones)
+
+def test_intervalo_sin_cambio_de_signo():
+    exito, mensaje, _ = ejecutar_newton_protegido("x^2 + 1", 0.5, 1e-10, 100, a=-1, b=1)
+    assert not exito and "signos opuestos" in mensaje
+
+@pytest.mark.parametrize("func_str, x0, a, b", [("tan(x)", 1.5, 1, 2), ("1/(x - 0.3)", 1, 0, 1)])
+def test_polo_no_es_raiz(func_str, x0, a, b):
+    exito, mensaje, _ = ejecutar_newton_protegido(func_str, x0, 1e-10, 100, a=a, b=b)
+    assert not exito and "discontinuidad" in mensaje
+
+def test_derivada_cero_en_la_raiz():
+    exito, resultado, _ = ejecutar_newton_protegido("x^2", 0.0, 1e-10, 100)
+    assert exito and resultado['convergio'] and resultado['raiz'] == 0
+
+def test_buscar_intervalo():
+    a, fa, b, fb, _ = buscar_intervalo(compilar_funcion("x - 10"), 0.0)
+    assert a <= 10 <= b and fa * fb <= 0
+    assert len(buscar_intervalo(compilar_funcion("x^2 + 1"), 0.0)) == 2
+    # Fuera del dominio a un lado: sigue buscando
+    a, _, b, _, _ = buscar_intervalo(compilar_funcion("ln(x) - 1"), 0.5)
+    assert a <= math.e <= b
@@ -0,0 +1,38 @@
+"""Historial de iteraciones por columnas"""
+
+import math
+
+import numpy as np
+import pytest
+
+from historial import HistorialIteraciones
+from solucionadores import METODOS, iterar_solucion, resolver
+
+def normalizar(registros):
+    """Registros comparables con ==: NaN (orden sin estimar) pasa a None"""
+    return [{clave: None if isinstance(valor, float) and math.isnan(valor) else valor
+             for clave, valor in registro.items()} for registro in registros]
+
+@pytest.mark.parametrize("metodo", list(METODOS))
+def test_historial_igual_a_los_registros(metodo):
+    registros = list(iterar_solucion(metodo, "x^3 - x - 2", 1.5, 1e-10, 100))
+    exito, _, historial = resolver(metodo, "x^3 - x - 2", 1.5, 1e-10, 100)
+    assert exito
+    assert isinstance(historial, HistorialIteraciones)
+    assert normalizar(historial) == normalizar(registros)
+    assert normalizar(historial.a_dicts()) == normalizar(registros)
+
+def test_historial_por_columnas():
+    historial = HistorialIteraciones()
+    for i in range(100):
+        historial.agregar({'iteracion': i + 1, 'xn': i / 2, 'nota': None if i % 2 else 'par'})
+    assert len(historial) == 100
+    assert historial[3]['xn'] == 1.5
+    assert historial[-1]['iteracion'] == 100
+    assert historial[1]['nota'] is None and historial[0]['nota'] == 'par'
+    np.testing.assert_array_equal(historial.columna('iteracion'), np.arange(1, 101))
+    assert HistorialIteraciones.desde_registros(historial.a_dicts()).a_dicts() == historial.a_dicts()
+
+def test_historial_ensancha_columnas():
+    historial = HistorialIteraciones([{'x': 1}, {'x': 2.5}, {'x': 'texto'}])
+    assert [fila['x'] for fila in historial] == [1, 2.5, 'texto']
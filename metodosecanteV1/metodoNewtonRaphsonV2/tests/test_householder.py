@@ -0,0 +1,39 @@
+"""Iteraciones de Halley y Householder con derivadas simbólicas de orden superior"""
+
+import pytest
+
+from corpus import CORPUS, comprobar_raiz
+from metodo_householder import ejecutar_metodo_householder, paso_householder
+from matematicas import obtener_expresion
+from solucionadores import resolver
+
+@pytest.mark.parametrize("metodo", ['halley', 'householder'])
+@pytest.mark.parametrize("func_str, x0, raiz", CORPUS)
+def test_corpus(metodo, func_str, x0, raiz):
+    comprobar_raiz(metodo, func_str, x0, raiz)
+
+@pytest.mark.parametrize("func_str, x0, raiz", CORPUS)
+def test_menos_iteraciones_que_newton(func_str, x0, raiz):
+    _, newton = comprobar_raiz('newton', func_str, x0, raiz)
+    _, halley = comprobar_raiz('halley', func_str, x0, raiz)
+    _, householder = comprobar_raiz('householder', func_str, x0, raiz)
+    assert len(householder) <= len(halley) <= len(newton)
+
+def test_paso_de_orden_uno_es_newton():
+    assert paso_householder(1, 2.0, 4.0) == (2.0, 4.0)
+
+def test_derivadas_fusionadas():
+    # f = x^3: (f, f', f'', f''') en x = 2
+    assert obtener_expresion("x^3").fusionada_de_orden(3)(2.0) == pytest.approx((8, 12, 12, 6))
+
+def test_sin_derivadas_simbolicas_usa_newton():
+    exito, resultado, _ = ejecutar_metodo_householder("floor(x) + x - 2.5", 1.7, 1e-10, 100)
+    assert exito and resultado['convergio']
+    assert resultado['raiz'] == pytest.approx(1.5, abs=1e-8)
+
+@pytest.mark.parametrize("metodo", ['halley', 'householder'])
+@pytest.mark.parametrize("func_str, x0", [("root(x, 3) - 1", -2.0), ("x^x - 2", -0.3)])
+def test_funcion_compleja_fuera_del_dominio(metodo, func_str, x0):
+    exito, mensaje, iteraciones = resolver(metodo, func_str, x0, 1e-10, 100)
+    assert not exito
+    assert "no es real" in mensaje and iteraciones == []
@@ -0,0 +1,53 @@
+"""Aritmética de intervalos: las cotas deben contener todos los valores de f en [a, b]"""
+
+import numpy as np
+import pytest
+
+from analizador import parsear
+from matematicas import evaluar_funcion_vectorizada
+from intervalos import evaluar_intervalo, puede_tener_raiz, regiones_con_raiz, acotar_rango
+
+EXPRESIONES = [
+    "x^3 - x - 2",
+    "sin(x) - x/2",
+    "exp(x) - 2*x - 1",
+    "x*sin(x) - 1",
+    "cos(x)^2 + sin(3x)",
+    "sqrt(x+4) - ln(x+5)",
+    "abs(x-1) - tanh(x)",
+    "x^4 - 3x^2 + 1",
+]
+
+@pytest.mark.parametrize("func_str", EXPRESIONES)
+@pytest.mark.parametrize("a, b", [(-3.0, -1.0), (-0.5, 0.5), (0.1, 2.9), (-3.0, 3.0)])
+def test_cota_contiene_los_valores(func_str, a, b):
+    cota = evaluar_intervalo(parsear(func_str), a, b)
+    y = evaluar_funcion_vectorizada(func_str, np.linspace(a, b, 501))
+    y = y[np.isfinite(y)]
+    assert cota is not None
+    assert cota.inf <= y.min() and y.max() <= cota.sup
+
+def test_descarta_intervalos_sin_raiz():
+    arbol = parsear("x^2 + 1")
+    assert not puede_tener_raiz(arbol, -10, 10)
+    assert puede_tener_raiz(parsear("x^2 - 1"), 0, 2)
+
+def test_polo_no_es_raiz():
+    # 1/x cambia de signo en 0 pero no tiene raíz
+    assert not puede_tener_raiz(parsear("1/x"), -1, 1)
+    assert regiones_con_raiz(parsear("1/x"), -1, 1) == []
+
+def test_fuera_del_dominio():
+    assert evaluar_intervalo(parsear("ln(x)"), -3, -1) is None
+
+def test_regiones_cubren_las_raices():
+    raices = [-1.0, 0.5, 2.0]
+    regiones = regiones_con_raiz(parsear("(x+1)(x-0.5)(x-2)"), -4, 4, max_evaluaciones=256)
+    for raiz in raices:
+        assert any(inicio <= raiz <= fin for inicio, fin in regiones), raiz
+    assert sum(fin - inicio for inicio, fin in regiones) < 4
+
+def test_acotar_rango():
+    y_min, y_max = acotar_rango(parsear("sin(x)"), 0, 2 * np.pi)
+    assert y_min <= -1 and y_max >= 1
+    assert y_min > -1.5 and y_max < 1.5
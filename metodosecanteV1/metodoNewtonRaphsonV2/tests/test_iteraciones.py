@@ -0,0 +1,51 @@
+"""Contratos de los generadores iterar_* y cancelación"""
+
+import threading
+
+import pytest
+
+from iteraciones import Cancelacion, ErrorIteracion, recolectar_iteraciones
+from solucionadores import METODOS, iterar_solucion
+
+@pytest.mark.parametrize("metodo", list(METODOS))
+def test_generador_entrega_registros_y_retorna_resultado(metodo):
+    generador = iterar_solucion(metodo, "cos(x) - x", 1.0, 1e-10, 100)
+    registros = []
+    while True:
+        try:
+            registros.append(next(generador))
+        except StopIteration as fin:
+            resultado = fin.value
+            break
+    assert resultado['convergio']
+    assert resultado['metodo'] == metodo
+    assert registros[-1]['iteracion'] == resultado['iteracion']
+    assert [r['iteracion'] for r in registros] == list(range(1, len(registros) + 1))
+
+def test_sin_guardar_no_acumula():
+    exito, resultado, historial = recolectar_iteraciones(
+        iterar_solucion('newton', "cos(x) - x", 1.0, 1e-10, 100), guardar=False)
+    assert exito and resultado['convergio']
+    assert len(historial) == 0
+
+def test_cancelacion():
+    cancelacion = Cancelacion()
+    cancelacion.cancelar()
+    exito, mensaje, historial = recolectar_iteraciones(
+        iterar_solucion('newton', "cos(x) - x", 1.0, 1e-10, 100, cancelacion=cancelacion))
+    assert not exito
+    assert "cancelado" in mensaje
+    assert historial == []
+
+def test_cancelacion_desde_otro_hilo():
+    cancelacion = Cancelacion()
+    hilo = threading.Thread(target=cancelacion.cancelar)
+    hilo.start()
+    hilo.join()
+    assert cancelacion.cancelada
+
+def test_error_del_metodo():
+    def fallido():
+        yield {'iteracion': 1}
+        raise ErrorIteracion("Error: Derivada cero.")
+    assert recolectar_iteraciones(fallido()) == (False, "Error: Derivada cero.", [])
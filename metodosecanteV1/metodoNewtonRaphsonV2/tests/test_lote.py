@@ -0,0 +1,50 @@
+"""Solución de muchas ecuaciones en un pool de procesos"""
+
+import pytest
+
+from lote import resolver_lote
+
+PROBLEMAS = [
+    ('x^3 - x - 2', 1.5),
+    {'funcion': 'cos(x) - x', 'x0': 1, 'tolerancia': 1e-12},
+    ('ln(x', 1),
+    ('e^x - 3', 1.0, 1e-10, 100, 'secante'),
+] + [('sin(x) - x/2', 1 + i / 10) for i in range(40)]
+
+def por_indice(resultados):
+    return {respuesta['indice']: respuesta for respuesta in resultados}
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_un_resultado_por_problema(workers):
+    resultados = por_indice(resolver_lote(PROBLEMAS, workers=workers, tiempo_limite=5))
+    assert sorted(resultados) == list(range(len(PROBLEMAS)))
+    assert resultados[0]['resultado']['raiz'] == pytest.approx(1.5213797068045676)
+    assert resultados[1]['resultado']['raiz'] == pytest.approx(0.7390851332151607)
+    assert resultados[3]['metodo'] == 'secante'
+    assert all(resultados[i]['exito'] for i in range(4, len(PROBLEMAS)))
+
+def test_el_error_solo_afecta_a_su_problema():
+    resultados = por_indice(resolver_lote(PROBLEMAS[:4], workers=2))
+    assert not resultados[2]['exito']
+    assert isinstance(resultados[2]['resultado'], str)
+    assert resultados[1]['exito'] and resultados[3]['exito']
+
+def test_tiempo_limite_por_problema():
+    # Sin convergencia posible y con muchas iteraciones: lo corta el tiempo límite
+    resultados = por_indice(resolver_lote([('x^2 + 1', 0.5, 1e-12, 10**8, 'secante'), ('x - 1', 0)],
+                                          workers=1, tiempo_limite=0.2))
+    assert not resultados[0]['exito']
+    assert resultados[1]['exito']
+
+def test_iteraciones_opcionales():
+    respuesta, = resolver_lote([('cos(x) - x', 1.0)], workers=1, incluir_iteraciones=True)
+    assert len(respuesta['iteraciones_data']) == respuesta['num_iteraciones'] > 0
+
+def test_metodo_invalido_se_rechaza_antes():
+    with pytest.raises(ValueError):
+        list(resolver_lote([('x - 1', 0, 1e-10, 50, 'biseccion')]))
+
+def test_dejar_de_iterar():
+    generador = resolver_lote(PROBLEMAS, workers=2)
+    next(generador)
+    generador.close()
@@ -0,0 +1,40 @@
+"""Newton-Raphson desde muchos puntos iniciales a la vez (carriles vectorizados)"""
+
+import math
+
+import numpy as np
+import pytest
+
+from metodo_newton_raphson import ejecutar_metodo_newton_raphson, ejecutar_newton_multiarranque
+
+def test_encuentra_las_raices_distintas():
+    exito, resultado, carriles = ejecutar_newton_multiarranque("x^3 - x", [-2, -0.3, 0.3, 2], 1e-12, 50)
+    assert exito, resultado
+    np.testing.assert_allclose(resultado['raices'], [-1, 0, 1], atol=1e-12)
+    assert resultado['convergio'].all()
+    assert [carril['x0'] for carril in carriles] == [-2, -0.3, 0.3, 2]
+
+def test_carriles_iguales_a_newton_escalar():
+    x0s = np.linspace(0.5, 3, 11)
+    exito, resultado, _ = ejecutar_newton_multiarranque("cos(x) - x/3", x0s, 1e-12, 50)
+    assert exito
+    for x0, raiz in zip(x0s, resultado['x']):
+        _, escalar, _ = ejecutar_metodo_newton_raphson("cos(x) - x/3", x0, 1e-12, 50)
+        assert raiz == pytest.approx(escalar['raiz'], rel=1e-10)
+
+def test_estados_por_carril():
+    # ln(x) desde x0 = -1 cae fuera del dominio; NaN no llega a iterar
+    exito, resultado, carriles = ejecutar_newton_multiarranque("ln(x) - 1", [2.0, -1.0, math.nan], 1e-12, 50)
+    assert exito
+    assert [carril['estado'] for carril in carriles] == ['convergio', 'fuera_de_dominio', 'fuera_de_dominio']
+    assert carriles[0]['raiz'] == pytest.approx(math.e)
+    assert carriles[2]['iteraciones'] == 0
+
+def test_derivada_cero():
+    exito, resultado, carriles = ejecutar_newton_multiarranque("x^2 - 1", [0.0, 3.0], 1e-12, 50)
+    assert exito
+    assert carriles[0]['estado'] == 'derivada_cero'
+    assert resultado['raices'] == pytest.approx([1.0])
+
+def test_error_de_sintaxis():
+    assert ejecutar_newton_multiarranque("x +* 2", [1.0], 1e-12, 50)[0] is False
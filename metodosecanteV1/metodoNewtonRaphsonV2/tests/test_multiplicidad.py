@@ -0,0 +1,59 @@
+"""Newton con detección de multiplicidad: orden empírico, m estimada y cambio de variante"""
+
+import math
+
+import pytest
+
+from iteraciones import recolectar_iteraciones
+from metodo_newton_raphson import estimar_convergencia, ejecutar_metodo_newton_raphson, iterar_newton_raphson
+
+def newton(func_str, x0, detectar_multiplicidad=True, max_iter=200):
+    return recolectar_iteraciones(iterar_newton_raphson(func_str, x0, 1e-10, max_iter,
+                                                        detectar_multiplicidad=detectar_multiplicidad))
+
+@pytest.mark.parametrize("razon, razon_anterior, factor, orden, multiplicidad", [
+    (0.5, 0.5, 1, 1.0, 2.0),        # Raíz doble: el error se reduce a la mitad
+    (2 / 3, 2 / 3, 1, 1.0, 3.0),
+    (1e-6, 1e-3, 1, 2.0, 1.0),      # Convergencia cuadrática
+    (0.5, 0.5, 2, 1.0, 4.0),        # Newton modificado con m = 2 en una raíz cuádruple
+])
+def test_estimar_convergencia(razon, razon_anterior, factor, orden, multiplicidad):
+    assert estimar_convergencia(razon, razon_anterior, factor) == pytest.approx((orden, multiplicidad), rel=1e-5)
+
+def test_estimar_convergencia_sin_datos():
+    orden, multiplicidad = estimar_convergencia(1.5, math.nan)
+    assert math.isnan(orden) and math.isnan(multiplicidad)
+
+@pytest.mark.parametrize("func_str, x0, raiz, variante, factor", [
+    ("sin(x)^2", 1.0, 0.0, 'modificado', 2),
+    ("x^2*(x - 3)", 0.5, 0.0, 'modificado', 2),
+    ("(x - 2)^5", 3.0, 2.0, 'modificado', 5),
+    ("(x - 1)^3*(x + 2)", 3.0, 1.0, 'cociente', 1),
+    ("abs(x - 1)^2.5", 2.0, 1.0, 'cociente', 1),  # m no entera: Newton sobre f / f'
+])
+def test_raiz_multiple(func_str, x0, raiz, variante, factor):
+    exito, resultado, iteraciones = newton(func_str, x0)
+    assert exito and resultado['convergio']
+    assert resultado['raiz'] == pytest.approx(raiz, abs=1e-8)
+    assert (iteraciones[-1]['variante'], iteraciones[-1]['factor']) == (variante, factor)
+    # Sin la detección, Newton converge linealmente y necesita muchas más iteraciones
+    _, sin_detectar, _ = newton(func_str, x0, detectar_multiplicidad=False)
+    assert resultado['iteracion'] * 2 < sin_detectar['iteracion']
+
+@pytest.mark.parametrize("func_str, x0, raiz", [
+    ("x^3 - x - 2", 1.5, 1.5213797068045676),
+    # Lejos de sus raíces x^20 - 1 parece una raíz de multiplicidad 20: el paso modificado
+    # que eso sugiere se deshace y se sigue con Newton
+    ("x^20 - 1", 2.0, 1.0),
+])
+def test_raiz_simple_sigue_con_newton(func_str, x0, raiz):
+    exito, resultado, iteraciones = newton(func_str, x0)
+    assert exito and resultado['convergio']
+    assert resultado['raiz'] == pytest.approx(raiz, rel=1e-12)
+    assert iteraciones[-1]['variante'] == 'newton'
+
+@pytest.mark.parametrize("func_str, x0", [("root(x, 3) - 1", -2.0), ("x^x - 2", -0.3)])
+def test_funcion_compleja_fuera_del_dominio(func_str, x0):
+    exito, mensaje, iteraciones = ejecutar_metodo_newton_raphson(func_str, x0, 1e-10, 100)
+    assert not exito
+    assert "no es real" in mensaje and iteraciones == []
@@ -0,0 +1,63 @@
+"""Polinomios: coeficientes, forma de Horner solo para la forma expandida y raíces múltiples"""
+
+import pytest
+
+from analizador import parsear
+from matematicas import obtener_expresion
+from polinomios import coeficientes_polinomio, en_forma_expandida, raices_reales
+from solucionadores import resolver
+
+def raices(func_str):
+    return raices_reales(coeficientes_polinomio(parsear(func_str)))
+
+@pytest.mark.parametrize("func_str, coeficientes", [
+    ("x^3 - 2x - 5", [1, 0, -2, -5]),
+    ("(x - 2)^2*(x + 1)", [1, -3, 0, 4]),
+    ("2x + 1", [2, 1]),
+])
+def test_coeficientes(func_str, coeficientes):
+    assert list(coeficientes_polinomio(parsear(func_str))) == pytest.approx(coeficientes)
+
+def test_no_polinomios():
+    assert coeficientes_polinomio(parsear("sin(x)")) is None
+    assert coeficientes_polinomio(parsear("x^0.5")) is None
+    assert coeficientes_polinomio(parsear("3")) is None  # Grado 0: sin raíces que buscar
+
+@pytest.mark.parametrize("func_str, expandida", [
+    ("x^3 - 2x - 5", True),
+    ("3x^12 - x^4/2 + 1", True),
+    ("(x - 1)^20", False),
+    ("(x - 2)^2*(x + 1)", False),
+])
+def test_forma_expandida(func_str, expandida):
+    assert en_forma_expandida(parsear(func_str)) == expandida
+    assert obtener_expresion(func_str).horner == expandida
+
+@pytest.mark.parametrize("func_str, x, valor", [
+    ("(x - 1)^20", 1.1, 1e-20),
+    ("(x - 1)^10", 1.01, 1e-20),
+    ("(x - 1)^7*(x + 2)", 0.9, -2.9e-7),
+])
+def test_factorizado_se_evalua_con_su_arbol(func_str, x, valor):
+    # Horner sobre los coeficientes expandidos solo da ruido de redondeo cerca de la raíz
+    assert obtener_expresion(func_str).escalar(x) == pytest.approx(valor, rel=1e-10)
+
+@pytest.mark.parametrize("func_str, esperadas", [
+    ("(x - 1)^4", [1.0]),
+    ("(x - 1)^5", [1.0]),
+    ("(x - 1)^6", [1.0]),
+    ("(x - 1)^20", [1.0]),
+    ("(x - 2)^4*(x + 1)", [-1.0, 2.0]),
+    ("(x - 0.5)^7*(x^2 + 1)^3*(x - 2)", [0.5, 2.0]),
+    ("x^20 - 1", [-1.0, 1.0]),
+    ("(x - 1)*(x - 1.01)", [1.0, 1.01]),
+    ("(x^2 + 1)^2", []),
+])
+def test_raices_reales_agrupa_las_multiples(func_str, esperadas):
+    assert raices(func_str) == pytest.approx(esperadas, abs=1e-9)
+
+def test_auto_arranca_desde_la_raiz_multiple():
+    exito, resultado, _ = resolver('auto', "(x - 1)^20", 3.0, 1e-10, 100)
+    assert exito
+    assert resultado['semilla'] == pytest.approx(1.0)
+    assert resultado['raiz'] == pytest.approx(1.0, abs=1e-6)
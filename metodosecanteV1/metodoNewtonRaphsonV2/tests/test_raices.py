@@ -0,0 +1,39 @@
+"""Todas las raíces en un intervalo: barrido de la malla, pulido y depuración"""
+
+import math
+
+import numpy as np
+import pytest
+
+from raices import depurar, encontrar_todas_las_raices
+
+@pytest.mark.parametrize("func_str, a, b, raices", [
+    ("sin(x)", -7, 7, [-2 * math.pi, -math.pi, 0.0, math.pi, 2 * math.pi]),
+    ("sin(x) - x/2", -3, 3, [-1.895494267033981, 0.0, 1.895494267033981]),
+    ("exp(-x^2) - 0.5", -3, 3, [-math.sqrt(math.log(2)), math.sqrt(math.log(2))]),
+    ("ln(x) - 1", -1, 5, [math.e]),
+    ("x*sin(1/x)", 0.05, 1, [1 / (k * math.pi) for k in range(6, 0, -1)]),
+])
+def test_raices_con_cambio_de_signo(func_str, a, b, raices):
+    assert encontrar_todas_las_raices(func_str, a, b) == pytest.approx(raices, abs=1e-9)
+
+def test_raices_de_multiplicidad_par():
+    # cos(x)^2 toca el eje sin cambiar de signo
+    assert encontrar_todas_las_raices("cos(x)^2", 0, 7) == pytest.approx([math.pi / 2, 3 * math.pi / 2], abs=1e-6)
+
+@pytest.mark.parametrize("func_str, a, b, raices", [
+    ("tan(x)", -4, 4, [-math.pi, 0.0, math.pi]),
+    ("floor(x) - 0.5", -2, 2, []),
+    ("1/x", -1, 1, []),
+])
+def test_excluye_polos_y_saltos(func_str, a, b, raices):
+    assert encontrar_todas_las_raices(func_str, a, b) == pytest.approx(raices, abs=1e-9)
+
+def test_ordenadas_y_sin_duplicados():
+    raices = encontrar_todas_las_raices("sin(5x)", -3, 3)
+    assert raices == sorted(raices)
+    assert np.all(np.diff(raices) > 0.5)
+    assert raices == pytest.approx([k * math.pi / 5 for k in range(-4, 5)], abs=1e-9)
+
+def test_depurar():
+    assert list(depurar(np.array([1.0, 1.0 + 1e-13, 2.0]))) == pytest.approx([1.0, 2.0])
@@ -0,0 +1,55 @@
+"""Registro de métodos (solucionadores.py) y método de la secante"""
+
+import pytest
+
+from corpus import CORPUS, comprobar_raiz
+from metodo_secante import ejecutar_metodo_secante
+from solucionadores import METODOS, resolver, validar_metodo
+
+@pytest.mark.parametrize("func_str, x0, raiz", CORPUS)
+def test_corpus_secante(func_str, x0, raiz):
+    comprobar_raiz('secante', func_str, x0, raiz)
+
+def test_secante_una_evaluacion_por_iteracion():
+    exito, resultado, iteraciones = ejecutar_metodo_secante("cos(x) - x", 1.0, 1e-10, 100)
+    assert exito
+    assert resultado['evaluaciones'] == len(iteraciones) + 1
+    # f(xn-1) se reutiliza de la iteración anterior
+    for anterior, fila in zip(iteraciones, iteraciones[1:]):
+        assert fila['xn_anterior'] == anterior['xn']
+        assert fila['fxn_anterior'] == anterior['fxn']
+
+def test_secante_segundo_punto():
+    exito, resultado, iteraciones = ejecutar_metodo_secante("x^2 - 2", 1.0, 1e-10, 100, x1=2.0)
+    assert exito and resultado['convergio']
+    assert iteraciones[0]['xn'] == 2.0
+
+def test_secante_pendiente_cero():
+    exito, mensaje, iteraciones = ejecutar_metodo_secante("x^2 - 1", -1.0, 1e-10, 100, x1=1.0)
+    assert not exito
+    assert "pendiente" in mensaje and iteraciones == []
+
+@pytest.mark.parametrize("metodo", list(METODOS))
+def test_errores_como_tupla(metodo):
+    exito, mensaje, iteraciones = resolver(metodo, "x +* 2", 1.0, 1e-10, 100)
+    assert not exito
+    assert isinstance(mensaje, str) and mensaje
+    assert iteraciones == []
+
+@pytest.mark.parametrize("metodo", list(METODOS))
+def test_registro_completo(metodo):
+    info = METODOS[metodo]
+    assert {'nombre', 'titulo', 'ejecutar', 'formula', 'usa_derivada'} <= info.keys()
+
+def test_metodo_desconocido():
+    with pytest.raises(ValueError):
+        validar_metodo('biseccion')
+    exito, mensaje, _ = resolver('biseccion', "x - 1", 0.0, 1e-10, 100)
+    assert not exito and "desconocido" in mensaje
+
+@pytest.mark.parametrize("func_str, x0", [("root(x, 3) - 1", -2.0), ("root(x, 3) - 0.5", 0.5)])
+def test_secante_funcion_compleja_fuera_del_dominio(func_str, x0):
+    # Sin esta comprobación la secante reportaba una 'raíz' compleja (0.125 + 1e-22j)
+    exito, mensaje, iteraciones = ejecutar_metodo_secante(func_str, x0, 1e-10, 100)
+    assert not exito
+    assert "no es real" in mensaje and iteraciones == []
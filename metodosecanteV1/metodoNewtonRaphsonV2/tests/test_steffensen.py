@@ -0,0 +1,71 @@
+"""Steffensen y punto fijo con aceleración de Aitken"""
+
+import math
+
+import pytest
+
+import metodo_newton_raphson
+from matematicas import evaluar_funcion
+from solucionadores import resolver
+
+@pytest.mark.parametrize("metodo", ['steffensen', 'aitken'])
+def test_sin_convergencia_no_sondea_newton(metodo, monkeypatch):
+    # La sugerencia de reinicio sale de Newton multiarranque: no aplica a estos métodos
+    def sondeo(*argumentos):
+        raise AssertionError("sugerir_reinicio no debe llamarse")
+    monkeypatch.setattr(metodo_newton_raphson, 'sugerir_reinicio', sondeo)
+    exito, resultado, _ = resolver(metodo, "x^2 + 1", 0.5, 1e-10, 100)
+    assert exito
+    assert not resultado['convergio']
+    assert resultado['reinicio'] is None
+
+# Lejos de la raíz, con |f(x0)| grande: el punto auxiliar x0 ± f(x0) daría una pendiente inútil
+LEJOS_DE_LA_RAIZ = [
+    ("e^x - 3", 5.0, math.log(3)),
+    ("e^x - 3", 10.0, math.log(3)),
+    ("x^3 - x - 2", 10.0, 1.5213797068045676),
+    ("x^2 - 2", 100.0, math.sqrt(2)),
+]
+
+@pytest.mark.parametrize("metodo", ['steffensen', 'aitken'])
+@pytest.mark.parametrize("func_str, x0, raiz", LEJOS_DE_LA_RAIZ)
+def test_lejos_de_la_raiz(metodo, func_str, x0, raiz):
+    exito, resultado, iteraciones = resolver(metodo, func_str, x0, 1e-6, 100)
+    assert exito, resultado
+    assert resultado['convergio']
+    assert resultado['raiz'] == pytest.approx(raiz, rel=1e-6)
+    assert abs(evaluar_funcion(func_str, resultado['raiz'])) < 1e-6
+    assert len(iteraciones) < 30
+
+@pytest.mark.parametrize("metodo", ['steffensen', 'aitken'])
+def test_paso_corto_con_residuo_grande_no_converge(metodo):
+    # Sin acotar el desplazamiento: pendiente ~1e63, paso 0 y 'convergencia' en x = 5
+    exito, resultado, _ = resolver(metodo, "e^x - 3", 5.0, 1e-6, 100)
+    assert exito
+    assert resultado['raiz'] != 5.0
+    assert abs(evaluar_funcion("e^x - 3", resultado['raiz'])) < 1e-6
+
+@pytest.mark.parametrize("metodo", ['steffensen', 'aitken'])
+def test_residuo_escalado(metodo):
+    # El residuo se compara a través de la corrección |f / pendiente|: el factor 1e6 no la cambia
+    exito, resultado, _ = resolver(metodo, "1e6*(x - 1)", 3.0, 1e-10, 100)
+    assert exito and resultado['convergio']
+    assert resultado['raiz'] == pytest.approx(1.0, rel=1e-10)
+
+@pytest.mark.parametrize("metodo, func_str, x0, raiz", [
+    ('aitken', "sqrt(x) - 2", 1.0, 4.0),  # f(4 - f(xn)) redondea a f(xn) en el último paso
+    ('steffensen', "(x - 1)^3", 1.000001, 1.0),  # h = f(xn) = 1e-18: el punto auxiliar redondea a xn
+    ('aitken', "(x - 1)^3", 0.999999, 1.0),
+])
+def test_pendiente_cero_en_la_raiz(metodo, func_str, x0, raiz):
+    exito, resultado, _ = resolver(metodo, func_str, x0, 1e-10, 100)
+    assert exito, resultado
+    assert resultado['convergio']
+    assert resultado['raiz'] == pytest.approx(raiz, abs=1e-5)
+
+@pytest.mark.parametrize("metodo", ['steffensen', 'aitken'])
+@pytest.mark.parametrize("func_str, x0", [("root(x, 3) - 0.5", 0.5), ("x^x - 2", -0.3)])
+def test_funcion_compleja_fuera_del_dominio(metodo, func_str, x0):
+    exito, mensaje, iteraciones = resolver(metodo, func_str, x0, 1e-10, 100)
+    assert not exito
+    assert "no es real" in mensaje and iteraciones == []
@@ -0,0 +1,22 @@
+"""Evaluador vectorizado: mismos valores que el escalar, NaN fuera del dominio"""
+
+import math
+
+import numpy as np
+import pytest
+
+from matematicas import evaluar_funcion_vectorizada
+from valores_originales import EXPRESIONES, PUNTOS, evaluar_nuevo
+
+@pytest.mark.parametrize("func_str", EXPRESIONES)
+def test_vectorizada_igual_a_escalar(func_str):
+    y = evaluar_funcion_vectorizada(func_str, np.array(PUNTOS))
+    for x, valor in zip(PUNTOS, y):
+        esperado = evaluar_nuevo(func_str, x)
+        if esperado is None:
+            assert np.isnan(valor), (func_str, x)
+        else:
+            assert valor == pytest.approx(esperado, rel=1e-12, abs=1e-12), (func_str, x)
+
+def test_dominio_como_nan():
+    assert math.isnan(evaluar_funcion_vectorizada("ln(x)", np.array([-1.0]))[0])
@@ -0,0 +1,114 @@
+"""Valores del evaluador original (cadena de regex + eval) que comparten las pruebas de las expresiones"""
+
+from matematicas import evaluar_funcion
+
+# Expresiones típicas de la interfaz (multiplicación implícita, caracteres Unicode) y su valor
+# en PUNTOS según el evaluador original (regex + eval, baseline 4de297b); None = ValueError
+PUNTOS = [0.3, 0.7, 1.5, 2.5, 3.7, 5.2]
+ESPERADOS = {
+    'x^3 - x - 2': (-2.273, -2.357, -0.125, 11.125, 44.953, 133.40800000000002),
+    'sin(x) - x/2': (
+        0.14552020666133955, 0.29421768723769104, 0.24749498660405445,
+        -0.6515278558960435, -2.3798361409084934, -3.4834546557201533),
+    'exp(x) - 2*x - 1': (
+        -0.2501411924239968, -0.3862472925295233, 0.4816890703380645,
+        6.182493960703473, 32.0473043600674, 169.87224187515122),
+    'x*sin(x) - 1': (
+        -0.9113439380015982, -0.5490476189336163, 0.4962424799060816,
+        0.4961803602598913, -2.9603937213614255, -5.593964209744796),
+    '2pi*sin(2pix)+cos(2pix)^2': (
+        6.071155832295638, -5.880172826670584, 1.0000000000000022,
+        1.0000000000000038, -5.8801728266705835, 6.071155832295636),
+    'logb(x+20,2) + root(x+20,3) - cbrt(x)': (
+        6.401897276363232, 6.229378241146521, 6.062199395409384,
+        5.957752374675307, 5.892564745634852, 5.854668035687223),
+    '2x^2+3x-5': (-3.92, -1.9200000000000004, 4.0, 15.0, 33.480000000000004, 64.68),
+    'x(x-1)': (-0.21, -0.21000000000000002, 0.75, 3.75, 9.990000000000002, 21.840000000000003),
+    '(x+1)(x-1)': (-0.9099999999999999, -0.51, 1.25, 5.25, 12.690000000000001, 26.040000000000003),
+    '3ex': (
+        2.4464536456131407, 5.708391839763995, 12.232268228065703,
+        20.38711371344284, 30.172928295895403, 42.40519652396111),
+    '2e': (
+        5.43656365691809, 5.43656365691809, 5.43656365691809,
+        5.43656365691809, 5.43656365691809, 5.43656365691809),
+    'pix': (
+        0.9424777960769379, 2.199114857512855, 4.71238898038469,
+        7.853981633974483, 11.623892818282235, 16.336281798666924),
+    'xsin(x)': (
+        0.08865606199840186, 0.4509523810663837, 1.4962424799060816,
+        1.4961803602598913, -1.9603937213614258, -4.593964209744796),
+    'esin(x)': (
+        0.803307207709981, 1.751165232790128, 2.7114724960648,
+        1.6268159541567082, -1.4402439538924237, -2.401478736911634),
+    '2sin(x)cos(x)': (
+        0.5646424733950353, 0.9854497299884603, 0.1411200080598672,
+        -0.9589242746631386, 0.8987080958116269, -0.8278264690856536),
+    '2(x+1)': (2.6, 3.4, 5.0, 7.0, 9.4, 12.4),
+    'x2': (0.6, 1.4, 3.0, 5.0, 7.4, 10.4),
+    'sqrt(x)+ln(x)': (
+        -0.65625024682077, 0.4799850825953431, 1.6302099794997533,
+        2.497429561958345, 3.2318712258173132, 3.9290094757856577),
+    'log10(x)+log2(x)': (
+        -2.259844339446544, -0.6694751328155015, 0.7610537597768374,
+        1.7198681035594001, 2.4557269948085825, 3.0945149668885295),
+    'x²−1': (-0.91, -0.51, 1.25, 5.25, 12.690000000000001, 26.040000000000003),
+    '3×x÷2': (0.44999999999999996, 1.0499999999999998, 2.25, 3.75, 5.550000000000001, 7.800000000000001),
+    '√(x)': (
+        0.5477225575051661, 0.8366600265340756, 1.224744871391589,
+        1.5811388300841898, 1.9235384061671346, 2.280350850198276),
+    'π*x': (
+        0.9424777960769379, 2.199114857512855, 4.71238898038469,
+        7.853981633974483, 11.623892818282235, 16.336281798666924),
+    'sec(x)+csc(x)+cot(x)': (
+        7.663343107128036, 4.046971418817377, 15.21025905151928,
+        -0.9159422342142893, -1.4657985432675231, 0.47215236630267676),
+    'asin(x/10)+acos(x/10)+atan(x)': (
+        1.8622531212727638, 2.1815222911841055, 2.5535900500422257,
+        2.761086276477428, 2.877628929964089, 2.9516043656710775),
+    'sinh(x)+cosh(x)-tanh(x)': (
+        1.0585461951244124, 1.4093849303533126, 3.576540816693198,
+        11.195879662552043, 39.44852611878627, 180.272302738265),
+    'asinh(x)+acosh(x+1)+atanh(x/10)': (
+        1.0821149632835085, 1.8460122193239767, 2.912702890195987,
+        3.827491258492505, 4.636879003552216, 5.438393926342099),
+    'abs(x-2)+floor(x)+ceil(x)': (2.7, 2.3, 3.5, 5.5, 8.7, 14.2),
+    'e^x-3': (
+        -1.650141192423997, -0.9862472925295238, 1.4816890703380645,
+        9.182493960703471, 37.44730436006739, 178.27224187515117),
+    'tan(x)-x': (
+        0.00933624960962326, 0.14228838046307946, 12.601419947171719,
+        -3.24702229723866, -3.0752669247754363, -7.085641877519764),
+    'cbrt(x-4)': (
+        -1.5466803737720354, -1.4888055529538273, -1.3572088082974532,
+        -1.1447142425533319, -0.6694329500821694, 1.0626585691826111),
+    'root(x,2)-1': (
+        -0.4522774424948339, -0.16333997346592444, 0.22474487139158894,
+        0.5811388300841898, 0.9235384061671346, 1.280350850198276),
+    'exp(-x)-x': (
+        0.4408182206817179, -0.20341469620859043, -1.27686983985157,
+        -2.4179150013761013, -3.6752764735296606, -5.194483435579239),
+    'x^x-2': (
+        -1.3031546980640512, -1.220944087329551, -0.16288269291261637,
+        7.882117688026186, 124.57454621041283, 5285.098322295948),
+    '(x-1)^3': (
+        -0.3429999999999999, -0.027000000000000014, 0.125,
+        3.375, 19.683000000000003, 74.08800000000001),
+    'x*exp(-x)': (
+        0.22224546620451535, 0.34760971265398666, 0.33469524022264474,
+        0.205212496559747, 0.09147704794025574, 0.028686134987956014),
+    'cos(x)-x': (
+        0.6553364891256059, 0.06484218728448854, -1.4292627983322972,
+        -3.3011436155469336, -4.548100031710408, -4.731483328699623),
+    'sqrt(x-1)': (None, None, 0.7071067811865476, 1.224744871391589, 1.6431676725154984, 2.04939015319192),
+    '1/x-0.5': (
+        2.8333333333333335, 0.9285714285714286, 0.16666666666666663,
+        -0.09999999999999998, -0.22972972972972977, -0.3076923076923077),
+}
+EXPRESIONES = list(ESPERADOS)
+
+def evaluar_nuevo(func_str, x):
+    """Valor de func_str en x con el evaluador actual; None si está fuera del dominio"""
+    try:
+        return evaluar_funcion(func_str, x)
+    except ValueError:
+        return None